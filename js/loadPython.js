@@ -69,6 +69,12 @@ export async function loadPython() {
         from pref_voting.axioms import axioms_dict
         import io
         import contextlib
+        try:
+            from pref_voting.voting_method import WinnerCache
+            # Winning sets are shared by all the axiom checks for the same profile
+            _PV_WINNER_CACHE = WinnerCache(maxsize=4096)
+        except ImportError:
+            _PV_WINNER_CACHE = contextlib.nullcontext()
 
         _PV_CHEAP_AXIOMS = {
             "pareto_dominance",
@@ -141,6 +147,10 @@ export async function loadPython() {
             return True
 
         def _pv_check_axiom_json(axiom_key, vm_key, include_details=False):
+            with _PV_WINNER_CACHE:
+                return _pv_check_axiom(axiom_key, vm_key, include_details)
+
+        def _pv_check_axiom(axiom_key, vm_key, include_details):
             axiom = axioms_dict.get(axiom_key)
             if axiom is None:
                 return json.dumps({"applicable": False, "error": f"Unknown axiom: {axiom_key}"})
@@ -0,0 +1,41 @@
+"""
+    File: import_time.py
+    
+    Benchmark for the cold-start cost of importing the voting methods.
+
+    Run with ``python benchmarks/import_time.py``.
+"""
+
+import subprocess
+import sys
+import time
+
+IMPORT_STMT = "import pref_voting.voting_methods"
+
+COUNT_STMT = """
+import json
+num_loads = 0
+json_load = json.load
+def counting_load(*args, **kwargs):
+    global num_loads
+    num_loads += 1
+    return json_load(*args, **kwargs)
+json.load = counting_load
+import pref_voting.voting_methods
+from pref_voting.voting_methods import borda
+borda.properties
+print(num_loads)
+"""
+
+if __name__ == "__main__":
+
+    num_trials = 5
+    times = []
+    for _ in range(num_trials):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", IMPORT_STMT], check=True)
+        times.append(time.perf_counter() - start)
+    print(f"{IMPORT_STMT}: best of {num_trials} cold starts {min(times):.3f}s")
+
+    out = subprocess.run([sys.executable, "-c", COUNT_STMT], check=True, capture_output=True, text=True)
+    print(f"json.load calls during import and first properties lookup: {out.stdout.strip()}")
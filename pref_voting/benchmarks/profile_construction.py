@@ -0,0 +1,38 @@
+"""
+    File: profile_construction.py
+    
+    Benchmark for constructing a Profile from a large number of rankings.
+
+    Run with ``python benchmarks/profile_construction.py``.
+"""
+
+import time
+import numpy as np
+from pref_voting.profiles import Profile, _support
+
+def legacy_ranks_and_tally(rankings, rcounts, candidates):
+    """The per-voter/per-pair computation of the ranks and the tally that was used before the vectorized construction."""
+    ranks = np.array([[np.where(_r == c)[0][0] + 1 for c in candidates] for _r in rankings])
+    tally = np.array([[_support(ranks, rcounts, c1, c2) for c2 in candidates] for c1 in candidates])
+    return ranks, tally
+
+def random_rankings(num_voters, num_cands, seed=None):
+    rng = np.random.default_rng(seed)
+    return np.argsort(rng.random((num_voters, num_cands)), axis=1)
+
+if __name__ == "__main__":
+
+    for num_voters, num_cands in [(10_000, 20), (100_000, 20), (1_000_000, 20)]:
+        rankings = random_rankings(num_voters, num_cands, seed=0)
+
+        start = time.perf_counter()
+        prof = Profile(rankings)
+        elapsed = time.perf_counter() - start
+        print(f"Profile: {num_voters} voters, {num_cands} candidates: {elapsed:.3f}s")
+
+        if num_voters <= 10_000:
+            start = time.perf_counter()
+            _, tally = legacy_ranks_and_tally(prof._rankings, prof._rcounts, prof.candidates)
+            elapsed = time.perf_counter() - start
+            assert np.array_equal(tally, prof._tally)
+            print(f"Legacy construction: {num_voters} voters, {num_cands} candidates: {elapsed:.3f}s")
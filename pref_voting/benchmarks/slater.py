@@ -0,0 +1,23 @@
+"""
+    File: slater.py
+    
+    Benchmark for the Slater algorithms.
+
+    Run with ``python benchmarks/slater.py``.
+"""
+
+import time
+from pref_voting.generate_weighted_majority_graphs import generate_edge_ordered_tournament
+from pref_voting.c1_methods import slater
+
+if __name__ == "__main__":
+
+    for num_cands in [6, 7, 8, 10, 12, 14, 16]:
+        mg = generate_edge_ordered_tournament(num_cands)
+        # the brute force algorithm enumerates all linear orders, which is infeasible beyond 8 candidates
+        algorithms = ["dynamic_programming", "branch_and_bound"] + (["brute_force"] if num_cands <= 8 else [])
+        for algorithm in algorithms:
+            start = time.perf_counter()
+            ws = slater(mg, algorithm=algorithm)
+            elapsed = time.perf_counter() - start
+            print(f"{num_cands} candidates, {algorithm}: {elapsed:.3f}s (winners {ws})")
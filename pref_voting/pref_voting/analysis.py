@@ -10,6 +10,8 @@
 from pref_voting.generate_profiles import generate_profile
 from functools import partial
 from pathos.multiprocessing import ProcessingPool as Pool
+import inspect
+from contextlib import contextmanager
 from scipy.stats import binomtest
 
 import pandas as pd
@@ -85,16 +87,109 @@ def record_condorcet_efficiency_data(vms, num_cands, num_voters, pm, t):
         "cw_winner": {vm.name: cw is not None and [cw] == vm(prof) for vm in vms},
     }
 
+def _accepts_seed(pm):
+    """Return True if the probability model ``pm`` accepts a ``seed`` keyword argument."""
+    try:
+        params = inspect.signature(pm).parameters
+    except (TypeError, ValueError):
+        return False
+    return "seed" in params or any([p.kind == inspect.Parameter.VAR_KEYWORD for p in params.values()])
+
+def _chunk_profiles(pm, num_cands, num_voters, seed_seq, chunk_size):
+    """Generate the ``chunk_size`` profiles of a chunk, seeding each profile from the chunk's seed sequence."""
+
+    if not _accepts_seed(pm):
+        return [pm(num_cands, num_voters) for _ in range(chunk_size)]
+    rng = np.random.default_rng(seed_seq)
+    return [pm(num_cands, num_voters, seed=int(s)) for s in rng.integers(0, 2**32, size=chunk_size)]
+
+def _binomial_error(num_successes, num_trials):
+    """The width of the exact 95% confidence interval for ``num_successes`` out of ``num_trials``."""
+    if num_trials == 0:
+        return np.inf
+    binom_ci = binomtest(int(num_successes), int(num_trials)).proportion_ci(confidence_level=0.95, method='exact')
+    return binom_ci.high - binom_ci.low
+
+@contextmanager
+def _worker_pool(use_parallel, num_cpus):
+    """Yield a pool of ``num_cpus`` worker processes (or None if ``use_parallel`` is False) that is closed on exit."""
+    pool = Pool(num_cpus) if use_parallel else None
+    try:
+        yield pool
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+            pool.clear()
+
+def _run_chunks(
+    record_chunk,
+    max_num_samples,
+    seed_seq,
+    min_num_samples=0,
+    chunk_size=500,
+    is_done=None,
+    pool=None,
+    num_cpus=12):
+    """
+    Run ``record_chunk(seed_seq, chunk_size)`` over chunks of at most ``chunk_size`` samples and add up the arrays of counts it returns.  The chunks are run in waves of ``num_cpus`` chunks on ``pool`` or, if ``pool`` is None, one at a time in the current process.
+
+    Chunk ``i`` is always generated from the ``i``-th child of the seed sequence ``seed_seq`` and has the same size, and the stopping rule is checked after each chunk in order, so the result only depends on ``seed_seq`` and ``chunk_size`` (not on the number of cpus).  Sampling stops once ``max_num_samples`` samples have been drawn or, after at least ``min_num_samples`` samples, once ``is_done(counts, num_samples)`` is True.
+
+    Returns:
+        A tuple (counts, num_samples).
+    """
+
+    wave_size = num_cpus if pool is not None else 1
+
+    counts = None
+    num_samples = 0
+    done = False
+    while not done and num_samples < max_num_samples:
+        sizes = list()
+        remaining = max_num_samples - num_samples
+        while len(sizes) < wave_size and remaining > 0:
+            sizes.append(min(chunk_size, remaining))
+            remaining -= sizes[-1]
+        seeds = seed_seq.spawn(len(sizes))
+
+        if pool is not None:
+            results = pool.map(record_chunk, seeds, sizes)
+        else:
+            results = map(record_chunk, seeds, sizes)
+
+        for size, chunk_counts in zip(sizes, results):
+            counts = chunk_counts if counts is None else counts + chunk_counts
+            num_samples += size
+            if is_done is not None and num_samples >= min_num_samples and is_done(counts, num_samples):
+                done = True
+                break
+
+    return counts, num_samples
+
+def _record_condorcet_efficiency_chunk(vms, num_cands, num_voters, pm, seed_seq, chunk_size):
+    """Counts for a chunk: the number of profiles with a Condorcet winner followed by, for each voting method, the number of profiles in which it uniquely elects the Condorcet winner."""
+
+    profs = _chunk_profiles(pm, num_cands, num_voters, seed_seq, chunk_size)
+    cws = [prof.condorcet_winner() for prof in profs]
+    counts = np.zeros(len(vms) + 1, dtype=int)
+    counts[0] = sum([cw is not None for cw in cws])
+    for vm_idx, vm in enumerate(vms):
+        counts[vm_idx + 1] = sum([cw is not None and [cw] == ws for cw, ws in zip(cws, vm.batch(profs))])
+    return counts
+
 def condorcet_efficiency_data(
     vms,
     numbers_of_candidates=[3, 4, 5],
     numbers_of_voters=[4, 10, 20, 50, 100, 500, 1000],
-    prob_models = {"IC": lambda nc, nv: generate_profile(nc, nv)},
+    prob_models = {"IC": lambda nc, nv, seed=None: generate_profile(nc, nv, seed=seed)},
     min_num_samples=1000,
     max_num_samples=100_000,
     max_error=0.01,
     use_parallel=True,
     num_cpus=12,
+    chunk_size=500,
+    seed=None,
 ):
     """
     Returns a Pandas DataFrame with the Condorcet efficiency of a list of voting methods.
@@ -103,18 +198,17 @@ def condorcet_efficiency_data(
         vms (list(functions)): A list of voting methods,
         numbers_of_candidates (list(int), default = [3, 4, 5]): The numbers of candidates to check.
         numbers_of_voters (list(int), default = [5, 25, 50, 100]): The numbers of voters to check.
-        probmod (dict, default="IC"): A dictionary with keys as the names of the probability models and values as functions that generate profiles.  Each function should accept a number of candidates and a number of voters. 
+        probmod (dict, default="IC"): A dictionary with keys as the names of the probability models and values as functions that generate profiles.  Each function should accept a number of candidates and a number of voters, and optionally a ``seed`` keyword argument.
         min_num_trials (int, default=1000): The minimum number of profiles to check.
         max_num_trials (int, default=100_000): The maximum number of profiles to check.
         max_error (float, default=0.01): The maximum error to allow in the 95% confidence interval.
         use_parallel (bool, default=True): If True, then use parallel processing.
         num_cpus (int, default=12): The number of (virtual) cpus to use if using parallel processing.
+        chunk_size (int, default=500): The number of profiles generated and checked by a worker in one task.
+        seed (int, default=None): The master seed.  If the probability models accept a ``seed`` keyword argument, then the results are the same for the same seed.
 
     """
 
-    if use_parallel:
-        pool = Pool(num_cpus)
-
     data_for_df = {
          "num_candidates": [],
          "num_voters": [],
@@ -129,58 +223,47 @@ def condorcet_efficiency_data(
          "max_num_samples": list(),
          "max_error": list(),
     }
-    for pm_name, pm in prob_models.items():
-        for num_cands in numbers_of_candidates:
-            for num_voters in numbers_of_voters:
-
-                print(f"{pm_name}: {num_cands} candidates, {num_voters} voters")
-                
-                get_data = partial(
-                    record_condorcet_efficiency_data,
-                    vms,
-                    num_cands,
-                    num_voters,
-                    pm
-                )
-
-                num_samples = 0
-                error_ranges = []
-                elect_condorcet_winner = {
-                    vm.name: [] for vm in vms
-                }
-                has_condorcet_winner = []
-                while num_samples < min_num_samples or (any([(err[1] - err[0]) > max_error for err in error_ranges]) and num_samples < max_num_samples):
-                    
-                    if use_parallel:
-                        data = pool.map(get_data, range(min_num_samples))
-                    else:
-                        data = list(map(get_data, range(min_num_samples)))
-
-                    for d in data:
-                        has_condorcet_winner.append(d["has_cw"])
-                        if d["has_cw"]:
-                            for vm in vms:
-                                elect_condorcet_winner[vm.name].append(d["cw_winner"][vm.name])
-
-                    error_ranges = [binomial_confidence_interval(elect_condorcet_winner[vm.name])  if len(elect_condorcet_winner[vm.name]) > 0 else (0, np.inf) for vm in vms]
-
-                    num_samples += min_num_samples
-
-                for vm in vms:
-                    data_for_df["num_candidates"].append(num_cands)
-                    data_for_df["num_voters"].append(num_voters)
-                    data_for_df["prob_model"].append(pm_name)
-                    data_for_df["voting_method"].append(vm.name)
-                    data_for_df["condorcet_efficiency"].append(np.mean(elect_condorcet_winner[vm.name]))
-                    err_interval = binomial_confidence_interval(elect_condorcet_winner[vm.name])
-                    data_for_df["error"].append(err_interval[1] - err_interval[0])
-                    data_for_df["num_samples"].append(num_samples)
-                    data_for_df["percent_condorcet_winner"].append(np.mean(has_condorcet_winner))
-                    err_interval = binomial_confidence_interval(has_condorcet_winner)
-                    data_for_df["percent_condorcet_winner_error"].append(err_interval[1] - err_interval[0])
-                    data_for_df["min_num_samples"].append(min_num_samples)
-                    data_for_df["max_num_samples"].append(max_num_samples)
-                    data_for_df["max_error"].append(max_error)
+    # each cell of the simulation (probability model, number of candidates and number of voters) is seeded by its own child of the master seed
+    cell_seeds = iter(np.random.SeedSequence(seed).spawn(len(prob_models) * len(numbers_of_candidates) * len(numbers_of_voters)))
+    with _worker_pool(use_parallel, num_cpus) as pool:
+        for pm_name, pm in prob_models.items():
+            for num_cands in numbers_of_candidates:
+                for num_voters in numbers_of_voters:
+
+                    print(f"{pm_name}: {num_cands} candidates, {num_voters} voters")
+
+                    record_chunk = partial(
+                        _record_condorcet_efficiency_chunk,
+                        vms,
+                        num_cands,
+                        num_voters,
+                        pm
+                    )
+
+                    counts, num_samples = _run_chunks(
+                        record_chunk,
+                        max(max_num_samples, min_num_samples),
+                        next(cell_seeds),
+                        min_num_samples=min_num_samples,
+                        chunk_size=chunk_size,
+                        is_done=lambda counts, n: all([_binomial_error(c, counts[0]) <= max_error for c in counts[1:]]),
+                        pool=pool,
+                        num_cpus=num_cpus)
+
+                    num_with_cw = counts[0]
+                    for vm_idx, vm in enumerate(vms):
+                        data_for_df["num_candidates"].append(num_cands)
+                        data_for_df["num_voters"].append(num_voters)
+                        data_for_df["prob_model"].append(pm_name)
+                        data_for_df["voting_method"].append(vm.name)
+                        data_for_df["condorcet_efficiency"].append(counts[vm_idx + 1] / num_with_cw if num_with_cw > 0 else np.nan)
+                        data_for_df["error"].append(_binomial_error(counts[vm_idx + 1], num_with_cw))
+                        data_for_df["num_samples"].append(num_samples)
+                        data_for_df["percent_condorcet_winner"].append(num_with_cw / num_samples)
+                        data_for_df["percent_condorcet_winner_error"].append(_binomial_error(num_with_cw, num_samples))
+                        data_for_df["min_num_samples"].append(min_num_samples)
+                        data_for_df["max_num_samples"].append(max_num_samples)
+                        data_for_df["max_error"].append(max_error)
 
     return pd.DataFrame(data_for_df)
 
@@ -194,6 +277,18 @@ def record_num_winners_data(vms, num_cands, num_voters, probmod, probmod_param,
         "num_winners": {vm.name: len(vm(prof)) for vm in vms},
     }
 
+def _record_num_winners_chunk(vms, num_cands, num_voters, probmod, probmod_param, seed_seq, chunk_size):
+    """Counts for a chunk: the total number of winners (first row) and the number of profiles with multiple winners (second row) for each voting method."""
+
+    pm = partial(generate_profile, probmod=probmod, probmod_param=probmod_param)
+    profs = _chunk_profiles(pm, num_cands, num_voters, seed_seq, chunk_size)
+    counts = np.zeros((2, len(vms)), dtype=int)
+    for vm_idx, vm in enumerate(vms):
+        num_winners = [len(ws) for ws in vm.batch(profs)]
+        counts[0, vm_idx] = sum(num_winners)
+        counts[1, vm_idx] = sum([nw > 1 for nw in num_winners])
+    return counts
+
 def resoluteness_data(
     vms,
     numbers_of_candidates=[3, 4, 5],
@@ -203,6 +298,9 @@ def resoluteness_data(
     num_trials=10000,
     use_parallel=True,
     num_cpus=12,
+    chunk_size=500,
+    max_error=None,
+    seed=None,
 ):
     """
     Returns a Pandas DataFrame with resoluteness data for a list of voting methods.
@@ -215,6 +313,9 @@ def resoluteness_data(
         num_trials (int, default=10000): The number of profiles to check for different winning sets.
         use_parallel (bool, default=True): If True, then use parallel processing.
         num_cpus (int, default=12): The number of (virtual) cpus to use if using parallel processing.
+        chunk_size (int, default=500): The number of profiles generated and checked by a worker in one task.
+        max_error (float, default=None): If not None, stop before ``num_trials`` profiles once the 95% confidence interval for the frequency of multiple winners is at most ``max_error`` for every voting method.
+        seed (int, default=None): The master seed.  The results are the same for the same seed.
 
     """
 
@@ -222,9 +323,6 @@ def resoluteness_data(
 
     assert len(probmod_params_list) == len(probmods), "probmod_params must be a list of the same length as probmods"
 
-    if use_parallel:
-        pool = Pool(num_cpus)
-
     data_for_df = {
         "vm": list(),
         "num_cands": list(),
@@ -236,49 +334,47 @@ def resoluteness_data(
         "avg_num_winners": list(),
         "avg_percent_winners": list(),
     }
-    for probmod,probmod_param in zip(probmods, probmod_params_list):
-        for num_cands in numbers_of_candidates:
-            for num_voters in numbers_of_voters:
-
-                print(f"{num_cands} candidates, {num_voters} voters")
-                get_data = partial(
-                    record_num_winners_data,
-                    vms,
-                    num_cands,
-                    num_voters,
-                    probmod,
-                    probmod_param
-                )
-
-                if use_parallel:
-                    data = pool.map(get_data, range(num_trials))
-                else:
-                    data = list(map(get_data, range(num_trials)))
-                    
-                num_winners = {vm.name: 0 for vm in vms}
-                multiple_winners = {vm.name: 0 for vm in vms}
-
-                for d in data:
-                    for vm in vms:
-                        num_winners[vm.name] += int(d["num_winners"][vm.name])
-                        if d["num_winners"][vm.name] > 1:
-                            multiple_winners[vm.name] += 1
-
-                for vm in vms:
-                    data_for_df["vm"].append(vm.name)
-                    data_for_df["num_cands"].append(num_cands)
-                    data_for_df["num_voters"].append(num_voters)
-                    data_for_df["probmod"].append(probmod)
-                    data_for_df["probmod_param"].append(probmod_param)
-                    data_for_df["num_trials"].append(num_trials)
-                    data_for_df["freq_multiple_winners"].append(multiple_winners[vm.name] / num_trials)
-                    data_for_df["avg_num_winners"].append(
-                        num_winners[vm.name] / num_trials
-                    )
-                    data_for_df["avg_percent_winners"].append(
-                        (num_winners[vm.name] / (num_cands * num_trials))
+    # each cell of the simulation (probability model, number of candidates and number of voters) is seeded by its own child of the master seed
+    cell_seeds = iter(np.random.SeedSequence(seed).spawn(len(probmods) * len(numbers_of_candidates) * len(numbers_of_voters)))
+    with _worker_pool(use_parallel, num_cpus) as pool:
+        for probmod,probmod_param in zip(probmods, probmod_params_list):
+            for num_cands in numbers_of_candidates:
+                for num_voters in numbers_of_voters:
+
+                    print(f"{num_cands} candidates, {num_voters} voters")
+                    record_chunk = partial(
+                        _record_num_winners_chunk,
+                        vms,
+                        num_cands,
+                        num_voters,
+                        probmod,
+                        probmod_param
                     )
 
+                    counts, num_samples = _run_chunks(
+                        record_chunk,
+                        num_trials,
+                        next(cell_seeds),
+                        chunk_size=chunk_size,
+                        is_done=None if max_error is None else lambda counts, n: all([_binomial_error(c, n) <= max_error for c in counts[1]]),
+                        pool=pool,
+                        num_cpus=num_cpus)
+
+                    for vm_idx, vm in enumerate(vms):
+                        data_for_df["vm"].append(vm.name)
+                        data_for_df["num_cands"].append(num_cands)
+                        data_for_df["num_voters"].append(num_voters)
+                        data_for_df["probmod"].append(probmod)
+                        data_for_df["probmod_param"].append(probmod_param)
+                        data_for_df["num_trials"].append(num_samples)
+                        data_for_df["freq_multiple_winners"].append(counts[1, vm_idx] / num_samples)
+                        data_for_df["avg_num_winners"].append(
+                            counts[0, vm_idx] / num_samples
+                        )
+                        data_for_df["avg_percent_winners"].append(
+                            (counts[0, vm_idx] / (num_cands * num_samples))
+                        )
+
     return pd.DataFrame(data_for_df)
 
 # helper function for axiom_violations_data
@@ -296,6 +392,17 @@ def record_axiom_violation_data(
     
     return {ax.name: {vm.name: ax.has_violation(prof, vm, verbose=verbose) for vm in vms} for ax in axioms}
 
+def _record_axiom_violation_chunk(axioms, vms, num_cands, num_voters, probmod, verbose, seed_seq, chunk_size):
+    """Counts for a chunk: the number of profiles in which each voting method (column) violates each axiom (row)."""
+
+    pm = partial(generate_profile, probmod=probmod)
+    counts = np.zeros((len(axioms), len(vms)), dtype=int)
+    for prof in _chunk_profiles(pm, num_cands, num_voters, seed_seq, chunk_size):
+        for ax_idx, ax in enumerate(axioms):
+            for vm_idx, vm in enumerate(vms):
+                counts[ax_idx, vm_idx] += bool(ax.has_violation(prof, vm, verbose=verbose))
+    return counts
+
 def axiom_violations_data(
     axioms,
     vms,
@@ -306,6 +413,9 @@ def axiom_violations_data(
     verbose=False,
     use_parallel=True,
     num_cpus=12,
+    chunk_size=500,
+    max_error=None,
+    seed=None,
 ):
     """
     Returns a Pandas DataFrame with axiom violation data for a list of voting methods.
@@ -318,12 +428,12 @@ def axiom_violations_data(
         num_trials (int, default=10000): The number of profiles to check for axiom violations.
         use_parallel (bool, default=True): If True, then use parallel processing.
         num_cpus (int, default=12): The number of (virtual) cpus to use if using parallel processing.
+        chunk_size (int, default=500): The number of profiles generated and checked by a worker in one task.
+        max_error (float, default=None): If not None, stop before ``num_trials`` profiles once the 95% confidence interval for the frequency of violations is at most ``max_error`` for every axiom and voting method.
+        seed (int, default=None): The master seed.  The results are the same for the same seed.
 
     """
 
-    if use_parallel:
-        pool = Pool(num_cpus)
-
     data_for_df = {
         "axiom": list(),
         "vm": list(),
@@ -333,36 +443,43 @@ def axiom_violations_data(
         "num_trials": list(),
         "num_violations": list(),
     }
-    for probmod in probmods:
-        print(f"{probmod} probability model")
-        for num_cands in numbers_of_candidates:
-            for num_voters in numbers_of_voters:
-                #print(f"{num_cands} candidates, {num_voters} voters")
-                _verbose = verbose if not use_parallel else False
-                get_data = partial(
-                    record_axiom_violation_data,
-                    axioms,
-                    vms,
-                    num_cands,
-                    num_voters,
-                    probmod,
-                    _verbose
-                )
-
-                if use_parallel:
-                    data = pool.map(get_data, range(num_trials))
-                else:
-                    data = list(map(get_data, range(num_trials)))
-
-                for ax in axioms: 
-                    for vm in vms: 
-                        data_for_df["axiom"].append(ax.name)
-                        data_for_df["vm"].append(vm.name)
-                        data_for_df["num_cands"].append(num_cands)
-                        data_for_df["num_voters"].append(num_voters)
-                        data_for_df["probmod"].append(probmod)
-                        data_for_df["num_trials"].append(num_trials)
-                        data_for_df["num_violations"].append(sum([d[ax.name][vm.name] for d in data]))
+    # each cell of the simulation (probability model, number of candidates and number of voters) is seeded by its own child of the master seed
+    cell_seeds = iter(np.random.SeedSequence(seed).spawn(len(probmods) * len(numbers_of_candidates) * len(numbers_of_voters)))
+    with _worker_pool(use_parallel, num_cpus) as pool:
+        for probmod in probmods:
+            print(f"{probmod} probability model")
+            for num_cands in numbers_of_candidates:
+                for num_voters in numbers_of_voters:
+                    #print(f"{num_cands} candidates, {num_voters} voters")
+                    _verbose = verbose if not use_parallel else False
+                    record_chunk = partial(
+                        _record_axiom_violation_chunk,
+                        axioms,
+                        vms,
+                        num_cands,
+                        num_voters,
+                        probmod,
+                        _verbose
+                    )
+
+                    counts, num_samples = _run_chunks(
+                        record_chunk,
+                        num_trials,
+                        next(cell_seeds),
+                        chunk_size=chunk_size,
+                        is_done=None if max_error is None else lambda counts, n: all([_binomial_error(c, n) <= max_error for c in counts.flatten()]),
+                        pool=pool,
+                        num_cpus=num_cpus)
+
+                    for ax_idx, ax in enumerate(axioms):
+                        for vm_idx, vm in enumerate(vms):
+                            data_for_df["axiom"].append(ax.name)
+                            data_for_df["vm"].append(vm.name)
+                            data_for_df["num_cands"].append(num_cands)
+                            data_for_df["num_voters"].append(num_voters)
+                            data_for_df["probmod"].append(probmod)
+                            data_for_df["num_trials"].append(num_samples)
+                            data_for_df["num_violations"].append(counts[ax_idx, vm_idx])
     print("Done.")
     return pd.DataFrame(data_for_df)
 
@@ -1,5 +1,5 @@
 
-from pref_voting.profiles import Profile
+from pref_voting.profiles import Profile, ProfileDelta
 from pref_voting.profiles_with_ties import ProfileWithTies
 from pref_voting.rankings import Ranking
 from itertools import combinations, chain, permutations
@@ -14,6 +14,16 @@ def display_mg(edata):
 def list_to_string(cands, cmap): 
     return "{" + ', '.join([cmap[c] for c in cands]) + "}"
 
+def ranking_type_counts(prof):
+    """
+    Return a dictionary mapping each type of ranking in the profile to the number of voters that submitted it (the rankings of a Profile are represented as tuples).
+    """
+    counts = dict()
+    for r, c in zip(*prof.rankings_counts):
+        r = tuple(r) if isinstance(prof, Profile) else r
+        counts[r] = counts.get(r, 0) + c
+    return counts
+
 
 def swap_candidates(ranking, c1, c2):
     """
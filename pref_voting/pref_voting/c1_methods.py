@@ -10,6 +10,7 @@
 from pref_voting.voting_method import  *
 from pref_voting.helper import get_mg, get_weak_mg
 from pref_voting.margin_based_methods import distance_to_margin_graph
+from pref_voting.other_methods import _kemeny_young_dp_rankings, _kemeny_young_dp_winners, _kemeny_young_branch_and_bound_rankings
 from pref_voting.probabilistic_methods import c1_maximal_lottery
 from pref_voting.rankings import Ranking, break_ties_alphabetically
 from pref_voting.social_welfare_function import swf
@@ -20,6 +21,12 @@ import networkx as nx
 import matplotlib.pyplot as plt
 from pref_voting.voting_method_properties import ElectionTypes
 
+def _condorcet_batch(margins): 
+    """Vectorized Condorcet for an array of margin matrices of shape (num_elections, num_cands, num_cands)."""
+
+    is_cw = np.sum(margins > 0, axis=2) == margins.shape[1] - 1
+    return np.where(np.any(is_cw, axis=1, keepdims=True), is_cw, True)
+
 @vm(name = "Condorcet",
     input_types = [ElectionTypes.PROFILE, ElectionTypes.PROFILE_WITH_TIES, ElectionTypes.MAJORITY_GRAPH, ElectionTypes.MARGIN_GRAPH])
 def condorcet(edata, curr_cands = None):
@@ -67,6 +74,8 @@ def condorcet(edata, curr_cands = None):
     
     return [cond_winner] if cond_winner is not None else sorted(candidates)
 
+condorcet.set_batch_vm(_condorcet_batch)
+
 @vm(name = "Weak Condorcet",
     input_types = [ElectionTypes.PROFILE, ElectionTypes.PROFILE_WITH_TIES, ElectionTypes.MAJORITY_GRAPH, ElectionTypes.MARGIN_GRAPH])
 def weak_condorcet(edata, curr_cands = None):
@@ -94,6 +103,12 @@ def weak_condorcet(edata, curr_cands = None):
     
     return weak_cond_winners if weak_cond_winners is not None else sorted(candidates)
 
+def _copeland_batch(margins): 
+    """Vectorized Copeland for an array of margin matrices of shape (num_elections, num_cands, num_cands)."""
+
+    scores = np.sum(np.sign(margins), axis=2)
+    return scores == scores.max(axis=1, keepdims=True)
+
 @vm(name = "Copeland",
     input_types = [ElectionTypes.PROFILE, ElectionTypes.PROFILE_WITH_TIES, ElectionTypes.MAJORITY_GRAPH, ElectionTypes.MARGIN_GRAPH])
 def copeland(edata, curr_cands = None):
@@ -144,6 +159,8 @@ def copeland(edata, curr_cands = None):
     max_score = max(c_scores.values())
     return sorted([c for c in c_scores.keys() if c_scores[c] == max_score])
 
+copeland.set_batch_vm(_copeland_batch)
+
 @swf(name = "Copeland ranking")
 def copeland_ranking(edata, curr_cands=None, local=True, tie_breaking=None):
     """The SWF that ranks candidates by their Copeland scores. If local is True, then the Copeland scores are computed with respect to the profile restricted to curr_cands. Otherwise, the Copeland scores are computed with respect to the entire profile.
@@ -712,14 +729,58 @@ def is_subsequence(x, y):
     it = iter(y)
     return all(any(c == ch for c in it) for ch in x)
 
+def _banks_maximal_chains(mg, top = None):
+    """Generate the maximal chains of the majority graph ``mg`` (as tuples listed from the maximum element down), optionally only those whose maximum element is ``top``.
+
+    Chains are grown directly along the majority graph: a chain is only extended by a candidate that is majority preferred by every member of the chain.  When no such candidate is left, the chain is maximal unless some other candidate can be inserted into it, i.e., unless some candidate is majority preferred by an initial segment of the chain and is majority preferred to the remaining members of the chain.
+    """
+    nodes = list(mg.nodes)
+    idx = {c: i for i, c in enumerate(nodes)}
+    succ = [0] * len(nodes)
+    pred = [0] * len(nodes)
+    for c1, c2 in mg.edges:
+        succ[idx[c1]] |= 1 << idx[c2]
+        pred[idx[c2]] |= 1 << idx[c1]
+    all_mask = (1 << len(nodes)) - 1
+
+    def is_maximal(prefix_masks):
+        chain_mask = prefix_masks[-1]
+        others = all_mask & ~chain_mask
+        while others:
+            x = (others & -others).bit_length() - 1
+            others &= others - 1
+            if (pred[x] | succ[x]) & chain_mask == chain_mask and pred[x] & chain_mask in prefix_masks:
+                return False
+        return True
+
+    def grow(chain, prefix_masks, extensions):
+        # prefix_masks[i] is the set of the first i members of the chain
+        if not extensions:
+            if is_maximal(prefix_masks):
+                yield tuple(nodes[i] for i in chain)
+            return
+        to_visit = extensions
+        while to_visit:
+            y = (to_visit & -to_visit).bit_length() - 1
+            to_visit &= to_visit - 1
+            chain.append(y)
+            prefix_masks.append(prefix_masks[-1] | 1 << y)
+            yield from grow(chain, prefix_masks, extensions & succ[y])
+            prefix_masks.pop()
+            chain.pop()
+
+    for t in (nodes if top is None else [top]):
+        yield from grow([idx[t]], [0, 1 << idx[t]], succ[idx[t]])
+
 @vm(name = "Banks",
     input_types = [ElectionTypes.PROFILE, ElectionTypes.PROFILE_WITH_TIES, ElectionTypes.MAJORITY_GRAPH, ElectionTypes.MARGIN_GRAPH])
-def banks(edata, curr_cands = None): 
+def banks(edata, curr_cands = None, algorithm = "chain_growth"): 
     """ Say that a *chain* in majority graph is a subset of candidates that is linearly ordered by the majority relation. Then a candidate :math:`a` if :math:`a` is the maximum element with respect to the majority relation of some maximal chain in the majority graph.
 
     Args:
         edata (Profile, ProfileWithTies, MarginGraph): Any election data that has a `margin` method. 
         curr_cands (List[int], optional): If set, then find the winners for the profile restricted to the candidates in ``curr_cands``
+        algorithm (str, optional): The algorithm to use.  Options are "chain_growth" (the default) and "brute_force".  The "chain_growth" algorithm grows chains along the majority graph, only extending a chain by candidates majority dispreferred to every member of the chain, and checks maximality of a chain locally by testing whether some other candidate can be inserted into it.  The "brute_force" algorithm enumerates all sequences of candidates, keeps those that are chains and filters for the maximal ones.
 
     Returns: 
         A sorted list of candidates
@@ -752,6 +813,12 @@ def banks(edata, curr_cands = None):
     """
 
     mg = get_mg(edata, curr_cands = curr_cands)
+
+    if algorithm == "chain_growth": 
+        return sorted([c for c in mg.nodes if next(_banks_maximal_chains(mg, top = c), None) is not None])
+    elif algorithm != "brute_force": 
+        raise ValueError("Invalid algorithm specified.")
+
     trans_paths = list()
     for s in seqs(mg.nodes):
         if nx.algorithms.simple_paths.is_simple_path(mg, s):
@@ -772,12 +839,13 @@ def banks(edata, curr_cands = None):
     
     return sorted(list(set([p[0] for p in maximal_paths])))
 
-def banks_with_explanation(edata, curr_cands = None): 
+def banks_with_explanation(edata, curr_cands = None, algorithm = "chain_growth"): 
     """Return the Banks winners and the list of maximal chains in the majority graph. 
 
     Args:
         edata (Profile, ProfileWithTies, MarginGraph): Any election data that has a `margin` method. 
         curr_cands (List[int], optional): If set, then find the winners for the profile restricted to the candidates in ``curr_cands``
+        algorithm (str, optional): The algorithm to use.  Options are "chain_growth" (the default) and "brute_force".  The "chain_growth" algorithm grows chains along the majority graph, only extending a chain by candidates majority dispreferred to every member of the chain, and checks maximality of a chain locally by testing whether some other candidate can be inserted into it.  The "brute_force" algorithm enumerates all sequences of candidates, keeps those that are chains and filters for the maximal ones.
 
     Returns: 
         A sorted list of candidates
@@ -819,6 +887,14 @@ def banks_with_explanation(edata, curr_cands = None):
     """
 
     mg = get_mg(edata, curr_cands = curr_cands)
+
+    if algorithm == "chain_growth": 
+        node_idx = {c: i for i, c in enumerate(mg.nodes)}
+        maximal_paths = sorted(_banks_maximal_chains(mg), key = lambda p: (len(p), [node_idx[c] for c in p]))
+        return sorted(list(set([p[0] for p in maximal_paths]))), maximal_paths
+    elif algorithm != "brute_force": 
+        raise ValueError("Invalid algorithm specified.")
+
     trans_paths = list()
     for s in seqs(mg.nodes):
         if nx.algorithms.simple_paths.is_simple_path(mg, s):
@@ -852,13 +928,19 @@ def lin_order_to_rel(lin_order):
     return rel
 
 
-def slater_rankings(edata, curr_cands = None): 
+def _slater_weights(edata, candidates): 
+    """The matrix in which the entry for the candidates with indices i and j is 1 if candidate i is majority preferred to candidate j and 0 otherwise.  Ranking candidate i below candidate j turns around an edge of the majority graph exactly when the entry is 1, so the Slater rankings are the rankings that minimize the sum of these weights (i.e., the Kemeny-Young rankings for these weights)."""
+
+    return np.array([[int(edata.majority_prefers(c1, c2)) for c2 in candidates] for c1 in candidates], dtype=np.int64).reshape(len(candidates), len(candidates))
+
+def slater_rankings(edata, curr_cands = None, algorithm = "dynamic_programming"): 
     """
     A Slater ranking is a linear order :math:`R` of the candidates that minimizes the number of edges in the majority graph we have to turn around before we obtain :math:`R`. 
 
     Args:
         edata (Profile, ProfileWithTies, MarginGraph): Any election data that has a `margin` method. 
         curr_cands (List[int], optional): If set, then find the winners for the profile restricted to the candidates in ``curr_cands``
+        algorithm (str, optional): The algorithm to use.  Options are "dynamic_programming" (the default), "branch_and_bound" and "brute_force".  The "dynamic_programming" algorithm runs a dynamic program over subsets of the candidates, which takes time O(2^m * m^2) and memory O(2^m * m) for m candidates (for more than 20 candidates, the "branch_and_bound" algorithm is used instead).  The "branch_and_bound" algorithm searches the rankings with pruning using memory linear in m.  The "brute_force" algorithm computes the distance to the majority graph of every linear order of the candidates.
 
     Returns: 
         rankings: A list of Slater rankings.
@@ -880,6 +962,16 @@ def slater_rankings(edata, curr_cands = None):
             print(f"ranking: {sr}") 
     """
     candidates = edata.candidates if curr_cands is None else curr_cands
+
+    if algorithm == "dynamic_programming": 
+        rankings, min_dist = _kemeny_young_dp_rankings(_slater_weights(edata, candidates))
+        return [tuple(candidates[cidx] for cidx in r) for r in rankings], int(min_dist)
+    elif algorithm == "branch_and_bound": 
+        rankings, min_dist = _kemeny_young_branch_and_bound_rankings(_slater_weights(edata, candidates))
+        return [tuple(candidates[cidx] for cidx in r) for r in rankings], int(min_dist)
+    elif algorithm != "brute_force": 
+        raise ValueError("Invalid algorithm specified.")
+
     min_dist = np.inf
     
     rankings = list()
@@ -896,12 +988,13 @@ def slater_rankings(edata, curr_cands = None):
 
 @vm(name = "Slater",
     input_types = [ElectionTypes.PROFILE, ElectionTypes.PROFILE_WITH_TIES, ElectionTypes.MAJORITY_GRAPH, ElectionTypes.MARGIN_GRAPH])
-def slater(edata, curr_cands = None): 
+def slater(edata, curr_cands = None, algorithm = "dynamic_programming"): 
     """A Slater ranking is a linear order :math:`R` of the candidates that minimizes the number of edges in the majority graph we have to turn around before we obtain :math:`R`.   A candidate is a Slater winner if the candidate is the top element of some Slater ranking.
 
     Args:
         edata (Profile, ProfileWithTies, MarginGraph): Any election data that has a `margin` method. 
         curr_cands (List[int], optional): If set, then find the winners for the profile restricted to the candidates in ``curr_cands``
+        algorithm (str, optional): The algorithm used to find the Slater rankings: "dynamic_programming" (the default), "branch_and_bound" or "brute_force".  See :func:`slater_rankings`.
 
     Returns: 
         A sorted list of candidates
@@ -932,7 +1025,11 @@ def slater(edata, curr_cands = None):
         slater.display(mg)
 
     """    
-    rankings, dist = slater_rankings(edata, curr_cands = curr_cands)
+    if algorithm == "dynamic_programming": 
+        candidates = edata.candidates if curr_cands is None else curr_cands
+        return sorted([candidates[cidx] for cidx in _kemeny_young_dp_winners(_slater_weights(edata, candidates))])
+
+    rankings, dist = slater_rankings(edata, curr_cands = curr_cands, algorithm = algorithm)
     
     return sorted(list(set([r[0] for r in rankings])))
 
@@ -41,10 +41,7 @@ def generate_utility_profile_uniform(num_candidates, num_voters, num_profiles =
 
     cand_utils = np.random.uniform(size=(num_profiles, num_voters, num_candidates))
 
-    uprofs = [UtilityProfile([{c: cand_utils[pidx][v][c] 
-                               for c in range(num_candidates)} 
-                               for v in range(num_voters)]) 
-                               for pidx in range(num_profiles)]
+    uprofs = [UtilityProfile.from_array(cand_utils[pidx]) for pidx in range(num_profiles)]
     
     return uprofs if num_profiles > 1 else uprofs[0]
 
@@ -65,22 +62,13 @@ def generate_utility_profile_normal(num_candidates, num_voters, std = 0.1, norma
     mean_utilities = {c: np.random.uniform(0, 1) for c in range(num_candidates)}
     cand_utils = {c: np.random.normal(mean_utilities[c], std, size=(num_profiles, num_voters)) for c in range(num_candidates)}
     
+    cand_utils = np.stack([cand_utils[c] for c in range(num_candidates)], axis=-1)
+    uprofs = [UtilityProfile.from_array(cand_utils[pidx]) for pidx in range(num_profiles)]
+
     if normalize == "range": 
-        uprofs = [UtilityProfile([{c: cand_utils[c][pidx][vidx] 
-                                   for c in range(num_candidates)} 
-                                   for vidx in range(num_voters)]).normalize_by_range() 
-                                   for pidx in range(num_profiles)]
+        uprofs = [uprof.normalize_by_range() for uprof in uprofs]
     elif normalize == "score":
-        uprofs = [UtilityProfile([{c: cand_utils[c][pidx][vidx] 
-                                   for c in range(num_candidates)} 
-                                   for vidx in range(num_voters)]).normalize_by_standard_score() 
-                                   for pidx in range(num_profiles)]
-    else: # do not normalize
-        uprofs = [UtilityProfile([{c: cand_utils[c][pidx][vidx] 
-                                   for c in range(num_candidates)} 
-                                   for vidx in range(num_voters)]) 
-                                   for pidx in range(num_profiles)]
-
+        uprofs = [uprof.normalize_by_standard_score() for uprof in uprofs]
 
     return uprofs if num_profiles > 1 else uprofs[0]
 utility_functions = {
@@ -139,22 +127,19 @@ def generate_spatial_utility_profile(num_cands,
     mean = [0] * num_dims  # mean is 0 for each dimension
     cov = np.diag([1] * num_dims)  # diagonal covariance
 
-    _utility_fnc = utility_functions[utility_function]["func"]
+    utility_fnc = utility_functions[utility_function]["func"]
 
     if utility_functions[utility_function]["param"] is not None or utility_function_param is not None: 
         util_parm = utility_function_param  if utility_function_param is not None else utility_functions[utility_function]["param"]
-        utility_fnc = partial(_utility_fnc, util_parm)
+        util_params = (util_parm,)
 
     else: 
-        utility_fnc = _utility_fnc
+        util_params = ()
 
     # sample candidate/voter positions using a multivariate normal distribution
     cand_positions = np.random.multivariate_normal(np.array(mean), cov, num_cands)
     voter_positions = np.random.multivariate_normal(np.array(mean), cov, num_voters)
 
-    utilities = [{c: utility_fnc(v_pos, c_pos)  for c, c_pos in enumerate(cand_positions)} 
-                 for _, v_pos in enumerate(voter_positions)]
-
-    return UtilityProfile(utilities)
+    return UtilityProfile.from_array(utility_matrix(utility_fnc, voter_positions, cand_positions, *util_params))
 
 
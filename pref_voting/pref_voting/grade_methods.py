@@ -103,11 +103,12 @@ def star(gprofile, curr_cands=None):
     winners = list()
     for c1, c2 in all_runoff_pairs: 
         
-        if gprofile.margin(c1,c2) > 0:
+        margin = gprofile.margin(c1,c2)
+        if margin > 0:
             winners.append(c1)
-        elif gprofile.margin(c1,c2) < 0:
+        elif margin < 0:
             winners.append(c2)
-        elif gprofile.margin(c1,c2) == 0:
+        elif margin == 0:
             winners.append(c1)
             winners.append(c2)
     
@@ -13,6 +13,7 @@ import numpy as np
 from tabulate import tabulate
 from pref_voting.mappings import Grade, _Mapping
 from pref_voting.profiles_with_ties import ProfileWithTies
+from pref_voting.rankings import Ranking
 
 class GradeProfile(object):
     """An anonymous profile of (truncated) grades.  
@@ -78,24 +79,90 @@ class GradeProfile(object):
 
         self.use_grade_order = grade_order is not None
 
-        self.compare_function = lambda v1, v2: (v1 > v2) - (v2 > v1) if grade_order is None else lambda v1, v2: (grade_order.index(v1) < grade_order.index(v2)) - (grade_order.index(v2) < grade_order.index(v1))
+        if grade_order is None: 
+            self.compare_function = lambda v1, v2: (v1 > v2) - (v2 > v1)
+        else: 
+            self.compare_function = lambda v1, v2: (grade_order.index(v1) < grade_order.index(v2)) - (grade_order.index(v2) < grade_order.index(v1))
 
         self.gmap = gmap if gmap is not None else {g: str(g) for g in self.grades}
         """The candidate map is a dictionary associating an alternative with the name used when displaying a alternative."""
 
-        self._grades = [
-            Grade(g_map, self.grades, candidates=self.candidates, cmap=self.cmap, gmap=self.gmap, compare_function=self.compare_function)
-            if type(g_map) == dict
-            else Grade(g_map.as_dict(), self.grades, candidates=self.candidates, cmap=self.cmap, gmap=self.gmap, compare_function=self.compare_function)
-            for g_map in grade_maps
-        ]
-        """The list of grades in the Profile (each utility is a :class:`Utility` object). 
-        """
         self.gcounts = [1] * len(grade_maps) if gcounts is None else list(gcounts)
 
         self.num_voters = np.sum(self.gcounts)
         """The number of voters in the profile. """
 
+        self._grade_maps = [g_map if type(g_map) == dict else g_map.as_dict() for g_map in grade_maps]
+        self._grade_objects = None
+
+        # The grades are stored as an array with one row for each grade function and one column for each 
+        # candidate.  Each entry is the position of the grade in the order of the grades, counting up 
+        # from the lowest grade (so that higher grades have larger entries), or -1 if the candidate is 
+        # not assigned a grade.
+        grade_rank = {g: len(self.grade_order) - 1 - gidx for gidx, g in enumerate(self.grade_order)}
+        cidx = {c: i for i, c in enumerate(self.candidates)}
+        rows, cols, ranks = list(), list(), list()
+        for gidx, g_map in enumerate(self._grade_maps):
+            for c, g in g_map.items():
+                assert g in grade_rank, f"All the grades in the grade map {g_map} must be in the grades {self.grades}"
+                rows.append(gidx)
+                cols.append(cidx[c])
+                ranks.append(grade_rank[g])
+        self._ranks = np.full((len(self._grade_maps), len(self.candidates)), -1, dtype=int)
+        self._ranks[rows, cols] = ranks
+        self._gcounts = np.asarray(self.gcounts)
+        self._grades_by_rank = self.grade_order[::-1]
+        self._rank_counts = None
+
+    @property
+    def _grades(self):
+        """The list of grades in the Profile (each grade is a :class:`Grade` object).  The :class:`Grade` objects are only created when they are first needed."""
+
+        if self._grade_objects is None: 
+            if self._grade_maps is None: 
+                self._grade_maps = [{c: self._grades_by_rank[r] for c, r in zip(self.candidates, rs) if r >= 0} 
+                                    for rs in self._ranks.tolist()]
+            self._grade_objects = [
+                Grade(g_map, self.grades, candidates=self.candidates, cmap=self.cmap, gmap=self.gmap, compare_function=self.compare_function)
+                for g_map in self._grade_maps
+            ]
+        return self._grade_objects
+
+    @classmethod
+    def from_array(cls, grades_array, grades, gcounts=None, candidates=None, cmap=None, gmap=None, grade_order=None):
+        """
+        Returns a profile of grades from an array of numerical grades with one row for each grade function and one column for each candidate.  An entry ``np.nan`` means that the candidate is not assigned a grade.
+
+        Args:
+            grades_array (numpy array): The grades, with shape (num_grade_functions, num_cands).
+            grades (list): The grades in the profile.
+            gcounts (list[int], optional): The number of voters associated with each row.  If not provided, each row is submitted by 1 voter.
+            candidates (list, optional): The candidates corresponding to the columns.  If not provided, the candidates are 0, 1, ..., num_cands - 1.
+            cmap (dict, optional): Dictionary mapping candidates to candidate names.
+            gmap (dict, optional): Dictionary mapping grades to grade names.
+            grade_order (list, optional): The order of the grades, from largest to smallest.
+        """
+        grades_array = np.asarray(grades_array, dtype=float)
+        candidates = list(range(grades_array.shape[1])) if candidates is None else list(candidates)
+
+        assert gcounts is None or len(grades_array) == len(gcounts), "The number of grades much be the same as the number of gcounts"
+
+        gprof = cls([], grades, candidates=candidates, cmap=cmap, gmap=gmap, grade_order=grade_order)
+
+        # the columns are stored in the order of the (sorted) candidates
+        grades_array = grades_array[:, [candidates.index(c) for c in gprof.candidates]]
+        ranks = np.full(grades_array.shape, -1, dtype=int)
+        for r, g in enumerate(gprof._grades_by_rank):
+            ranks[grades_array == g] = r
+        assert np.all((ranks >= 0) | np.isnan(grades_array)), f"All the grades must be in the grades {grades}"
+
+        gprof.gcounts = [1] * len(grades_array) if gcounts is None else list(gcounts)
+        gprof.num_voters = np.sum(gprof.gcounts)
+        gprof._gcounts = np.asarray(gprof.gcounts)
+        gprof._ranks = ranks
+        gprof._grade_maps = None
+        return gprof
+
     @property
     def grades_counts(self):
         """Returns the grade and the counts of each grade."""
@@ -111,10 +178,33 @@ class GradeProfile(object):
             gs += [g] * c
         return gs
 
+    def _grade_column(self, c):
+        """Return the positions in the order of the grades of the grades assigned to ``c`` and the number of voters associated with each of them."""
+
+        graded = self._ranks[:, self.candidates.index(c)] >= 0
+        return self._ranks[graded, self.candidates.index(c)], self._gcounts[graded]
+
+    def _grade_values(self, ranks):
+        """Return the grades at the positions ``ranks`` in the order of the grades."""
+
+        return np.array(self._grades_by_rank)[ranks]
+
+    def _rank_count_table(self):
+        """Return an array whose entry for a candidate and a position in the order of the grades is the number of voters that assign the candidate that grade."""
+
+        if self._rank_counts is None:
+            num_ranks = len(self.grade_order)
+            cols = np.broadcast_to(np.arange(self.num_cands), self._ranks.shape)
+            counts = np.broadcast_to(self._gcounts[:, np.newaxis], self._ranks.shape)
+            graded = self._ranks >= 0
+            self._rank_counts = np.zeros((self.num_cands, num_ranks), dtype=int)
+            np.add.at(self._rank_counts, (cols[graded], self._ranks[graded]), counts[graded])
+        return self._rank_counts
+
     def has_grade(self, c):
         """Return True if ``c`` is assigned a grade by at least one voter."""
 
-        return any([g.has_grade(c) for g in self._grades])
+        return c in self.candidates and bool(np.any(self._ranks[:, self.candidates.index(c)] >= 0))
 
     @property
     def num_cands(self):
@@ -125,10 +215,17 @@ class GradeProfile(object):
         """
         Return the margin of ``c1`` over ``c2``.  If ``c1`` is not assigned a grade by any voter, return None.
         """
-        if use_extended: 
-            return np.sum([num for g,num in zip(*self.grades_counts) if g.extended_strict_pref(c1, c2)]) - np.sum([num for g,num in zip(*self.grades_counts) if g.extended_strict_pref(c2, c1)])
+        ranks1 = self._ranks[:, self.candidates.index(c1)]
+        ranks2 = self._ranks[:, self.candidates.index(c2)]
+        if not use_extended: 
+            # only compare the candidates when both are assigned a grade
+            both_graded = (ranks1 >= 0) & (ranks2 >= 0)
+            ranks1 = ranks1[both_graded]
+            ranks2 = ranks2[both_graded]
+            counts = self._gcounts[both_graded]
         else: 
-            return np.sum([num for g,num in zip(*self.grades_counts) if g.strict_pref(c1, c2)]) - np.sum([num for g,num in zip(*self.grades_counts) if g.strict_pref(c2, c1)])
+            counts = self._gcounts
+        return np.sum(counts[ranks1 > ranks2]) - np.sum(counts[ranks2 > ranks1])
 
     def proportion(self, cand, grade):
         """
@@ -136,55 +233,64 @@ class GradeProfile(object):
 
         Note that ``grade`` could be None, in which case the proportion of voters that do not assign ``cand`` a grade is returned.
         """
-        return np.sum([num for g,num in zip(*self.grades_counts) if g(cand) == grade]) / self.num_voters
+        ranks = self._ranks[:, self.candidates.index(cand)]
+        if grade is None:
+            return np.sum(self._gcounts[ranks < 0]) / self.num_voters
+        return np.sum(self._gcounts[ranks >= 0][self._grade_values(ranks[ranks >= 0]) == grade]) / self.num_voters
 
     def sum(self, c): 
         """Return the sum of the grades of ``c``.  If ``c`` is not assigned a grade by any voter, return None."""
 
         assert self.can_sum_grades, "The grades in the profile cannot be summed."
 
-        return np.sum([g(c) * num for g,num in zip(*self.grades_counts) if g.has_grade(c)]) if self.has_grade(c) else None
+        if not self.has_grade(c):
+            return None
+        ranks, counts = self._grade_column(c)
+        return np.sum(self._grade_values(ranks) * counts)
     
     def avg(self, c): 
         """Return the average of the grades of ``c``.  If ``c`` is not assigned a grade by any voter, return None."""
 
         assert self.can_sum_grades, "The grades in the profile cannot be summed."
 
-        return np.mean([g(c) for g in self.grade_functions if g.has_grade(c)]) if self.has_grade(c) else None
+        if not self.has_grade(c):
+            return None
+        ranks, counts = self._grade_column(c)
+        return np.mean(np.repeat(self._grade_values(ranks), counts))
     
     def max(self, c): 
         """Return the maximum of the grade of ``c``.  If ``c`` is not assigned a grade by any voter, return None."""
 
-        grades_for_c = [-1 * self.grade_order.index(g(c)) for g in self._grades if g.has_grade(c)] if self.use_grade_order else [g(c) for g in self._grades if g.has_grade(c)]
-
-        return (self.grade_order[-1 * max(grades_for_c)] if self.use_grade_order else max(grades_for_c)) if self.has_grade(c) else None
+        return self._grades_by_rank[np.max(self._grade_column(c)[0])] if self.has_grade(c) else None
     
     def min(self, c): 
         """Return the minimum of the grades of ``c``.  If ``c`` is not assigned a grade by any voter, return None."""
 
-        grades_for_c = [-1 * self.grade_order.index(g(c)) for g in self._grades if g.has_grade(c)] if self.use_grade_order else [g(c) for g in self._grades if g.has_grade(c)]
-
-        return (self.grade_order[-1 * min(grades_for_c)] if self.use_grade_order else min(grades_for_c)) if self.has_grade(c) else None
+        return self._grades_by_rank[np.min(self._grade_column(c)[0])] if self.has_grade(c) else None
     
     def median(self, c, use_lower=True, use_average=False): 
         """Return the median of the grades of ``c``.  If ``c`` is not assigned a grade by any voter, return None."""
 
-        grades_for_c = [-1 * self.grade_order.index(g(c)) for g in self.grade_functions if g.has_grade(c)] if self.use_grade_order else [g(c) for g in self.grade_functions if g.has_grade(c)]
+        if not self.has_grade(c):
+            return None
 
-        sorted_grades_for_c = sorted(grades_for_c)
-        num_grades = len(sorted_grades_for_c)
+        # the grades of the voters that grade c, sorted from the lowest to the highest grade, 
+        # are given by the cumulative number of voters assigning each grade
+        cum_counts = np.cumsum(self._rank_count_table()[self.candidates.index(c)])
+        num_grades = cum_counts[-1]
         median_idx = num_grades // 2
         if num_grades % 2 == 0:
-            median_grades = sorted_grades_for_c[median_idx - 1:median_idx + 1]
+            median_positions = [median_idx - 1, median_idx]
         else:
-            median_grades = [sorted_grades_for_c[median_idx]]
+            median_positions = [median_idx]
+        median_grades = [self._grades_by_rank[np.searchsorted(cum_counts, pos, side="right")] for pos in median_positions]
 
         if use_lower:
-            return (self.grade_order[-1 * median_grades[0]] if self.use_grade_order else median_grades[0]) if self.has_grade(c) else None
+            return median_grades[0]
         elif use_average:
-            return (np.average([self.grade_order[-1 * m] for m in median_grades]) if self.use_grade_order else np.average(median_grades)) if self.has_grade(c) else None
+            return np.average(median_grades)
         else:
-            return ([self.grade_order[-1 * m] for m in median_grades] if self.use_grade_order else median_grades) if self.has_grade(c) else None
+            return median_grades
 
     def sum_grade_function(self):
         """Return the sum grade function of the profile."""
@@ -224,11 +330,8 @@ class GradeProfile(object):
         assert cand in self.candidates, f"{cand} is not a candidate in the profile."
         assert grade in self.grades, f"{grade} is not a grade in the profile."
 
-        num_with_higher_grade = 0
-        for g,num in zip(*self.grades_counts):
-            if self.compare_function(g(cand),grade) == 0: 
-                num_with_higher_grade += num
-        return num_with_higher_grade / self.num_voters
+        grade_rank = len(self.grade_order) - 1 - self.grade_order.index(grade)
+        return self._rank_count_table()[self.candidates.index(cand), grade_rank] / self.num_voters
 
 
     def proportion_with_higher_grade(self, cand, grade):
@@ -239,11 +342,8 @@ class GradeProfile(object):
         assert cand in self.candidates, f"{cand} is not a candidate in the profile."
         assert grade in self.grades, f"{grade} is not a grade in the profile."
 
-        num_with_higher_grade = 0
-        for g,num in zip(*self.grades_counts):
-            if self.compare_function(g(cand),grade) == 1: 
-                num_with_higher_grade += num
-        return num_with_higher_grade / self.num_voters
+        grade_rank = len(self.grade_order) - 1 - self.grade_order.index(grade)
+        return np.sum(self._rank_count_table()[self.candidates.index(cand), grade_rank + 1:]) / self.num_voters
 
 
     def proportion_with_lower_grade(self, cand, grade):
@@ -254,12 +354,8 @@ class GradeProfile(object):
         assert cand in self.candidates, f"{cand} is not a candidate in the profile."
         assert grade in self.grades, f"{grade} is not a grade in the profile."
 
-
-        num_with_lower_grade = 0
-        for g,num in zip(*self.grades_counts):
-            if self.compare_function(g(cand),grade) == -1: 
-                num_with_lower_grade += num
-        return num_with_lower_grade / self.num_voters
+        grade_rank = len(self.grade_order) - 1 - self.grade_order.index(grade)
+        return np.sum(self._rank_count_table()[self.candidates.index(cand), :grade_rank]) / self.num_voters
 
     def approval_scores(self): 
         """
@@ -274,8 +370,18 @@ class GradeProfile(object):
     def to_ranking_profile(self): 
         """Return a ranking profile (a :class:ProfileWithTies) corresponding to the profile."""
 
+        # sort each grade function from the highest to the lowest grade (candidates without a grade come last) 
+        # and rank the candidates by the number of distinct grades above them
+        order = np.argsort(-self._ranks, axis=1, kind="stable")
+        sorted_grade_ranks = np.take_along_axis(self._ranks, order, axis=1)
+        sorted_ranks = np.ones(self._ranks.shape, dtype=int)
+        sorted_ranks[:, 1:] += np.cumsum(sorted_grade_ranks[:, 1:] != sorted_grade_ranks[:, :-1], axis=1)
+        ranks = np.empty_like(sorted_ranks)
+        np.put_along_axis(ranks, order, sorted_ranks, axis=1)
+
         return ProfileWithTies(
-            [g.ranking() for g in self._grades],
+            [Ranking({c: r for c, r, grade_rank in zip(self.candidates, rs, grade_ranks) if grade_rank >= 0}) 
+             for rs, grade_ranks in zip(ranks.tolist(), self._ranks.tolist())],
             rcounts = self.gcounts,
             candidates = self.candidates, 
             cmap = self.cmap
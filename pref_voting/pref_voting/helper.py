@@ -145,10 +145,17 @@ def create_election(ranking_list,
         return Profile(ranking_list)
     
 
+def _bits(mask):
+    """Generate the positions of the bits that are set in the integer ``mask``, from lowest to highest."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
 class SPO(object):
     """A strict partial order class due to Jobst Heitzig.
     
-    The strict partial order P as a binary relation is encoded as a 2d numpy array.  The predecessors and successors of each object are precomputed.  The add method adds a new pair to the relation and computes the transitive closure.
+    The strict partial order P is stored as bitsets: for each object, an integer whose bits are the successors of the object and an integer whose bits are its predecessors.  The add method adds a new pair to the relation and computes the transitive closure by updating the bitsets of the predecessors of the first object and of the successors of the second object.
 
     Args:
         n (int): The number of objects.
@@ -159,47 +166,65 @@ class SPO(object):
     """The number of objects"""
     objects = None
     """The list of objects"""
-    P = None
-    """The strict partial ordering P as a binary relation encoded as a 2d numpy array"""
-    preds = None
-    """The list of predecessors of each object"""
-    succs = None
-    """The list of successors of each object"""
+    succ_masks = None
+    """The successors of each object, as a bitset"""
+    pred_masks = None
+    """The predecessors of each object, as a bitset"""
 
     def __init__(self, n):
         self.n = n
         self.objects = list(range(n))
-        self.P = np.zeros((n, n), dtype=bool)
-        self.preds = [[] for _ in range(n)]
-        self.succs = [[] for _ in range(n)]
+        self.succ_masks = [0] * n
+        self.pred_masks = [0] * n
 
     def add(self, a, b):
         """add a P b and all transitive consequences"""
-        if not self.P[a][b]:
-            self.P[a][b] = True
-            self.preds[b].append(a)
-            self.succs[a].append(b)
-            for c in self.preds[a]:
-                self._register(c, b)
-                for d in self.succs[b]:
-                    self._register(c, d)
-            for d in self.succs[b]:
-                self._register(a, d)
+        if not (self.succ_masks[a] >> b) & 1:
+            above = self.pred_masks[a] | (1 << a)
+            below = self.succ_masks[b] | (1 << b)
+            for c in _bits(above):
+                self.succ_masks[c] |= below
+            for d in _bits(below):
+                self.pred_masks[d] |= above
+
+    def holds(self, a, b):
+        """return True if a P b"""
+        return bool((self.succ_masks[a] >> b) & 1)
+
+    def copy(self):
+        """return a copy of the SPO"""
+        spo = SPO.__new__(SPO)
+        spo.n = self.n
+        spo.objects = self.objects
+        spo.succ_masks = list(self.succ_masks)
+        spo.pred_masks = list(self.pred_masks)
+        return spo
 
     def initial_elements(self):
         """return the initial elements of P (those without predecessors))"""
-        return [i for i in self.objects if len(self.preds[i]) == 0]    
+        return [i for i in self.objects if self.pred_masks[i] == 0]    
+
+    @property
+    def P(self):
+        """The strict partial ordering P as a binary relation encoded as a 2d numpy array"""
+        return self.to_numpy()
+
+    @property
+    def preds(self):
+        """The list of predecessors of each object"""
+        return [list(_bits(m)) for m in self.pred_masks]
 
-    def _register(self, a, b):
-        """register that a P b, without forming the transitive closure"""
-        if not self.P[a][b]:
-            self.P[a][b] = True
-            self.preds[b].append(a)
-            self.succs[a].append(b)
+    @property
+    def succs(self):
+        """The list of successors of each object"""
+        return [list(_bits(m)) for m in self.succ_masks]
 
     def to_numpy(self):
         """Return the partial order matrix P as a numpy array."""
-        return self.P
+        P = np.zeros((self.n, self.n), dtype=bool)
+        for a, m in enumerate(self.succ_masks):
+            P[a, list(_bits(m))] = True
+        return P
     
     def to_networkx(self, cmap=None):
         """Convert the SPO to a networkx DiGraph.
@@ -221,11 +246,10 @@ class SPO(object):
         # Add nodes with labels
         G.add_nodes_from(node_labels.values())
 
-        # Add edges based on the partial order matrix
+        # Add edges based on the partial order
         for a in range(self.n):
-            for b in range(self.n):
-                if self.P[a][b]:
-                    G.add_edge(node_labels[a], node_labels[b])
+            for b in _bits(self.succ_masks[a]):
+                G.add_edge(node_labels[a], node_labels[b])
 
         return G
     
@@ -241,10 +265,10 @@ class SPO(object):
             cmap (dict): A dictionary mapping each number to a candidate name. If None, the identity map is used.
         """
         # Check if the SPO is a strict linear order
+        all_objects = (1 << self.n) - 1
         for i in range(self.n):
-            for j in range(i + 1, self.n):
-                if not (self.P[i][j] or self.P[j][i]):
-                    return None  # i and j are not comparable
+            if (self.succ_masks[i] | self.pred_masks[i] | (1 << i)) != all_objects:
+                return None  # i is not comparable with some object
 
         # Create the linear order list by topologically sorting the nodes
         linear_order = []
@@ -253,7 +277,7 @@ class SPO(object):
         def visit(node):
             if not visited[node]:
                 visited[node] = True
-                for successor in self.succs[node]:
+                for successor in _bits(self.succ_masks[node]):
                     visit(successor)
                 linear_order.append(node)
 
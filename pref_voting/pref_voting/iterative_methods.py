@@ -7,65 +7,275 @@
     Implementations of iterative voting methods.
 '''
 from pref_voting.voting_method import  *
-from pref_voting.voting_method import _num_rank_last, _num_rank_first
-from pref_voting.profiles import  _borda_score, _find_updated_profile
 from pref_voting.margin_based_methods import split_cycle, minimax_scores
 from pref_voting.c1_methods import top_cycle, gocha 
 from pref_voting.rankings import Ranking
 from pref_voting.social_welfare_function import swf
 import copy
 from itertools import permutations, product
+from collections import OrderedDict
 import numpy as np
 from pref_voting.voting_method_properties import ElectionTypes
 from pref_voting.profiles import Profile
 from pref_voting.profiles_with_ties import ProfileWithTies
 
+class _EliminationState(object):
+    """
+    The state of a profile of linear orders while candidates are iteratively eliminated.  
+
+    For each ranking, the positions of the highest-ranked and lowest-ranked candidates that have not been eliminated are stored, and the plurality scores, last-place scores and Borda scores of the remaining candidates are kept up to date as candidates are eliminated.  Eliminating a candidate only moves the pointers of the rankings in which that candidate is currently ranked first (or last), and the Borda scores are updated by subtracting the columns of the tally for the eliminated candidates.  Each kind of score is only computed once it is first requested. 
+
+    Args:
+        profile (Profile): An anonymous profile of linear orders on a set of candidates
+        curr_cands (List[int], optional): The candidates that have not been eliminated.  The default is all the candidates in the profile.
+
+    """
+    def __init__(self, profile, curr_cands = None): 
+
+        self.profile = profile
+        self.candidates = profile.candidates if curr_cands is None else list(curr_cands)
+        self.rankings = profile._rankings
+        self.rcounts = profile._rcounts
+        self.is_remaining = np.zeros(profile.num_cands, dtype=bool)
+        self.is_remaining[self.candidates] = True
+        self.num_remaining = int(np.sum(self.is_remaining))
+
+        # positions of the top and bottom remaining candidates in each ranking, the voters grouped by their current top and bottom candidates, and the scores
+        self._top = None
+        self._top_voters = None
+        self._plurality = None
+        self._bottom = None
+        self._bottom_voters = None
+        self._last_place = None
+        self._borda = None
+
+    def copy(self): 
+        """Return a copy of the state that can be updated independently of this one."""
+
+        state = copy.copy(self)
+        state.is_remaining = self.is_remaining.copy()
+        for attr in ["_top", "_plurality", "_bottom", "_last_place", "_borda"]: 
+            if getattr(self, attr) is not None: 
+                setattr(state, attr, getattr(self, attr).copy())
+        for attr in ["_top_voters", "_bottom_voters"]: 
+            if getattr(self, attr) is not None: 
+                setattr(state, attr, list(getattr(self, attr)))
+        return state
+
+    def remaining_candidates(self): 
+        """The candidates that have not been eliminated, in the order of ``curr_cands``."""
+
+        return [c for c in self.candidates if self.is_remaining[c]]
+
+    def remaining_key(self): 
+        """The bitmask of the candidates that have not been eliminated."""
+
+        return int.from_bytes(np.packbits(self.is_remaining, bitorder="little").tobytes(), "little")
+
+    def _group_voters(self, voters, cands): 
+        """Split the voters into a list of arrays indexed by the candidates in cands."""
+
+        order = np.argsort(cands, kind="stable")
+        bounds = np.searchsorted(cands[order], np.arange(self.is_remaining.shape[0] + 1))
+        return [voters[order[bounds[c]:bounds[c+1]]] for c in range(self.is_remaining.shape[0])]
+
+    def _init_pointers(self, from_top): 
+
+        num_voters = self.rankings.shape[0]
+        is_remaining = self.is_remaining[self.rankings]
+        if from_top: 
+            pointers = np.argmax(is_remaining, axis=1)
+        else:
+            pointers = self.rankings.shape[1] - 1 - np.argmax(is_remaining[:, ::-1], axis=1)
+        cands = self.rankings[np.arange(num_voters), pointers]
+
+        scores = np.zeros(self.is_remaining.shape[0], dtype=self.rcounts.dtype)
+        if self.num_remaining > 0:
+            np.add.at(scores, cands, self.rcounts)
+        return pointers, self._group_voters(np.arange(num_voters), cands), scores
+
+    def _update_pointers(self, pointers, grouped_voters, scores, cands_to_remove, step): 
+
+        voters = np.concatenate([grouped_voters[c] for c in cands_to_remove])
+        for c in cands_to_remove: 
+            grouped_voters[c] = voters[:0]
+            scores[c] = 0
+        if self.num_remaining == 0 or voters.shape[0] == 0:
+            return 
+
+        # move the pointers of the affected voters until they reach a remaining candidate
+        to_move = np.arange(voters.shape[0])
+        while to_move.shape[0] > 0: 
+            pointers[voters[to_move]] += step
+            to_move = to_move[~self.is_remaining[self.rankings[voters[to_move], pointers[voters[to_move]]]]]
+
+        new_cands = self.rankings[voters, pointers[voters]]
+        np.add.at(scores, new_cands, self.rcounts[voters])
+        for c, new_voters in enumerate(self._group_voters(voters, new_cands)): 
+            if new_voters.shape[0] > 0: 
+                grouped_voters[c] = np.concatenate((grouped_voters[c], new_voters))
+
+    def eliminate(self, cands_to_remove): 
+        """Eliminate the candidates in ``cands_to_remove`` and update the scores that have been computed."""
+
+        cands_to_remove = [c for c in cands_to_remove if self.is_remaining[c]]
+        if len(cands_to_remove) == 0: 
+            return
+        self.is_remaining[cands_to_remove] = False
+        self.num_remaining -= len(cands_to_remove)
+
+        if self._borda is not None: 
+            self._borda -= self.profile._tally[:, cands_to_remove].sum(axis=1)
+        if self._top is not None: 
+            self._update_pointers(self._top, self._top_voters, self._plurality, cands_to_remove, 1)
+        if self._bottom is not None: 
+            self._update_pointers(self._bottom, self._bottom_voters, self._last_place, cands_to_remove, -1)
+
+    def plurality_scores(self): 
+        """The number of voters that rank each remaining candidate first among the remaining candidates."""
+
+        if self._top is None: 
+            self._top, self._top_voters, self._plurality = self._init_pointers(True)
+        return {c: self._plurality[c] for c in self.remaining_candidates()}
+
+    def last_place_scores(self): 
+        """The number of voters that rank each remaining candidate last among the remaining candidates."""
+
+        if self._bottom is None: 
+            self._bottom, self._bottom_voters, self._last_place = self._init_pointers(False)
+        return {c: self._last_place[c] for c in self.remaining_candidates()}
+
+    def borda_scores(self): 
+        """The Borda scores of the remaining candidates in the profile restricted to the remaining candidates."""
+
+        if self._borda is None: 
+            self._borda = self.profile._tally[:, self.is_remaining].sum(axis=1)
+        return {c: self._borda[c] for c in self.remaining_candidates()}
+
+    def majority_winners(self): 
+        """The remaining candidates ranked first by a strict majority of voters among the remaining candidates."""
+
+        strict_maj_size = self.profile.strict_maj_size()
+        return [c for c, score in self.plurality_scores().items() if score >= strict_maj_size]
+
+    def condorcet_winner(self): 
+        """The Condorcet winner in the profile restricted to the remaining candidates if one exists, otherwise None."""
+
+        cands = self.remaining_candidates()
+        tally = self.profile._tally[np.ix_(cands, cands)]
+        is_cw = np.sum(tally > tally.T, axis=1) == len(cands) - 1
+        return cands[int(np.argmax(is_cw))] if np.any(is_cw) else None
+
+_last_put_search_stats = dict()
+
+def put_search_stats():
+    """Return statistics about the most recent search of a method using parallel-universe tie-breaking (PUT): the name of the method, the number of sub-elections that were solved (``states_visited``) and the number of times the winners of a sub-election were found in the cache (``cache_hits``).
+
+    :Example: 
+
+    .. exec_code:: 
+
+        from pref_voting.profiles import Profile
+        from pref_voting.iterative_methods import instant_runoff_put, put_search_stats
+        
+        prof = Profile([[0, 1, 2, 3], [1, 2, 3, 0], [2, 3, 0, 1], [3, 0, 1, 2]])
+
+        instant_runoff_put.display(prof)
+        print(put_search_stats())
+
+    """
+    return dict(_last_put_search_stats)
+
+class _PUTSearch(object):
+    """
+    A memoized search over the elimination orders of a method using parallel-universe tie-breaking (PUT).  The winners of each sub-election are cached using the bitmask of the remaining candidates as the key, so each sub-election is solved once, no matter how many elimination orders lead to it.
+
+    Args:
+        name (str): The name of the method, used in the statistics reported by :func:`put_search_stats`.
+        put_step (function): A function that accepts an _EliminationState and returns the winners if the sub-election is decided without eliminating another candidate (otherwise None), together with the candidates that may be eliminated next.  The function may eliminate candidates from the state that are eliminated first in every elimination order. 
+        max_cache_size (int, optional): The maximum number of sub-elections in the cache.  When the cache is full, the least recently used sub-election is discarded.
+
+    """
+    def __init__(self, name, put_step, max_cache_size = 2 ** 16): 
+
+        self.name = name
+        self.put_step = put_step
+        self.max_cache_size = max_cache_size
+        self.cache = OrderedDict()
+        self.states_visited = 0
+        self.cache_hits = 0
+
+    def winners(self, state): 
+        """Return the winners in the sub-election given by the state."""
+
+        key = state.remaining_key()
+        if key in self.cache: 
+            self.cache_hits += 1
+            self.cache.move_to_end(key)
+            return self.cache[key]
+
+        self.states_visited += 1
+        winners, cands_to_remove = self.put_step(state)
+        if winners is None: 
+            winners = set()
+            for cand_to_remove in cands_to_remove:
+                new_state = state.copy()
+                new_state.eliminate([cand_to_remove])
+                winners.update(self.winners(new_state))
+            winners = sorted(winners)
+
+        self.cache[key] = winners
+        if len(self.cache) > self.max_cache_size: 
+            self.cache.popitem(last=False)
+        return winners
+
+    def run(self, state): 
+        """Return the winners in the election given by the state and record the statistics of the search."""
+
+        winners = self.winners(state)
+        _last_put_search_stats.clear()
+        _last_put_search_stats.update({"method": self.name, 
+                                       "states_visited": self.states_visited, 
+                                       "cache_hits": self.cache_hits})
+        return winners
+
 def _instant_runoff_basic(profile,curr_cands = None):
     "The basic implementation of instant runoff"
-    # need the total number of all candidates in a profile to check when all candidates have been removed   
-    num_cands = profile.num_cands 
-    candidates = profile.candidates if curr_cands is None else curr_cands
-    cands_to_ignore = np.empty(0) if curr_cands is None else np.array([c for c in profile.candidates if c not in curr_cands])
-
-    strict_maj_size = profile.strict_maj_size()
-    
-    rs, rcounts = profile.rankings_counts # get all the ranking data
+    state = _EliminationState(profile, curr_cands = curr_cands)
 
-    winners = [c for c in candidates 
-               if _num_rank_first(rs, rcounts, cands_to_ignore, c) >= strict_maj_size]
+    winners = state.majority_winners()
 
     while len(winners) == 0:
-        plurality_scores = {c: _num_rank_first(rs, rcounts, cands_to_ignore, c) for c in candidates 
-                            if  not isin(cands_to_ignore,c)}  
+        plurality_scores = state.plurality_scores()
         min_plurality_score = min(plurality_scores.values())
-        lowest_first_place_votes = np.array([c for c in plurality_scores.keys() 
-                                             if  plurality_scores[c] == min_plurality_score])
+        lowest_first_place_votes = [c for c in plurality_scores.keys() 
+                                    if  plurality_scores[c] == min_plurality_score]
 
         # remove cands with lowest plurality score
-        cands_to_ignore = np.concatenate((cands_to_ignore, lowest_first_place_votes), axis=None)
-        if len(cands_to_ignore) == num_cands: # removed all of the candidates 
+        state.eliminate(lowest_first_place_votes)
+        if state.num_remaining == 0: # removed all of the candidates 
             winners = sorted(lowest_first_place_votes)
         else:
-            winners = [c for c in candidates 
-                       if not isin(cands_to_ignore,c) and _num_rank_first(rs, rcounts, cands_to_ignore, c) >= strict_maj_size]
+            winners = state.majority_winners()
      
     return sorted(winners)
 
+
 def _instant_runoff_recursive(profile, curr_cands = None):
-    "A recursive implementation of instant runoff"
-    candidates = curr_cands if curr_cands is not None else profile.candidates
-    cands_to_ignore = np.array([c for c in profile.candidates if c not in candidates])
-    rs, rcounts = profile.rankings_counts # get all the ranking data
-    plurality_scores = {c: _num_rank_first(rs, rcounts, cands_to_ignore, c) for c in candidates if not isin(cands_to_ignore,c)}  
-    min_plurality_score = min(plurality_scores.values())
-    lowest_first_place_votes = np.array([c for c in plurality_scores.keys() 
-                                            if  plurality_scores[c] == min_plurality_score])
+    "The implementation of instant runoff for the 'recursive' algorithm option, which is kept for API compatibility but now runs iteratively on an _EliminationState"
+    state = _EliminationState(profile, curr_cands = curr_cands)
 
-    if len(lowest_first_place_votes) == len(candidates):
-        return sorted(lowest_first_place_votes)
-    
-    else:
-        return _instant_runoff_recursive(profile, [c for c in candidates if c not in lowest_first_place_votes])
+    # remove the candidates with the fewest first-place votes until all remaining candidates are tied
+    while True:
+        plurality_scores = state.plurality_scores()
+        min_plurality_score = min(plurality_scores.values())
+        lowest_first_place_votes = [c for c in plurality_scores.keys() 
+                                    if  plurality_scores[c] == min_plurality_score]
+
+        if len(lowest_first_place_votes) == state.num_remaining:
+            return sorted(lowest_first_place_votes)
+
+        state.eliminate(lowest_first_place_votes)
 
 
 def _instant_runoff_for_truncated_linear_orders(profile, curr_cands = None, threshold = None, hide_warnings = True): 
@@ -236,24 +446,24 @@ def instant_runoff_ranking(profile, curr_cands = None):
     """
     
     candidates = curr_cands if curr_cands is not None else profile.candidates
-    cands_to_ignore = np.array([c for c in profile.candidates if c not in candidates])
-    rs, rcounts = profile.rankings_counts # get all the ranking data
-    plurality_scores = {c: _num_rank_first(rs, rcounts, cands_to_ignore, c) for c in candidates if not isin(cands_to_ignore,c)}  
-    min_plurality_score = min(plurality_scores.values())
-    lowest_first_place_votes = np.array([c for c in plurality_scores.keys() 
-                                            if  plurality_scores[c] == min_plurality_score])
-    
-    if len(lowest_first_place_votes) == len(candidates):
-        full_tie = Ranking({c:0 for c in candidates})
-        return full_tie
-    
-    else:
-        rec_ranking = instant_runoff_ranking(profile, [c for c in candidates if c not in lowest_first_place_votes])
-        max_rank = max(rec_ranking.ranks)
-        rec_ranking_dict = rec_ranking.rmap
-        ranking = Ranking({c: rec_ranking_dict[c] if not isin(lowest_first_place_votes,c) else max_rank+1 for c in candidates})
+    state = _EliminationState(profile, curr_cands = candidates)
 
-        return ranking
+    # the rank of a candidate is the number of rounds of elimination after the candidate is eliminated
+    elims_list = list()
+    while True:
+        plurality_scores = state.plurality_scores()
+        min_plurality_score = min(plurality_scores.values())
+        lowest_first_place_votes = [c for c in plurality_scores.keys() 
+                                    if  plurality_scores[c] == min_plurality_score]
+        elims_list.append(lowest_first_place_votes)
+
+        if len(lowest_first_place_votes) == state.num_remaining:
+            break
+        state.eliminate(lowest_first_place_votes)
+
+    ranks = {c: len(elims_list) - 1 - round_idx for round_idx, cands in enumerate(elims_list) for c in cands}
+
+    return Ranking({c: ranks[c] for c in candidates})
 
 @vm(name = "Instant Runoff TB",
     input_types=[ElectionTypes.PROFILE])
@@ -290,24 +500,15 @@ def instant_runoff_tb(profile, curr_cands = None, tie_breaker = None):
     # the tie_breaker is any linear order (i.e., list) of the candidates
     tb = tie_breaker if tie_breaker is not None else list(range(profile.num_cands))
     
-    # need the total number of all candidates in a profile to check when all candidates have been removed   
-    num_cands = profile.num_cands 
-    
-    candidates = profile.candidates if curr_cands is None else curr_cands
-    cands_to_ignore = np.empty(0) if curr_cands is None else np.array([c for c in profile.candidates if c not in curr_cands])
-
-    strict_maj_size = profile.strict_maj_size()
+    state = _EliminationState(profile, curr_cands = curr_cands)
     
-    rs, rcounts = profile.rankings_counts # get all the ranking data
-    
-    winners = [c for c in candidates 
-               if _num_rank_first(rs, rcounts, cands_to_ignore, c) >= strict_maj_size]
+    winners = state.majority_winners()
 
     while len(winners) == 0:
-        plurality_scores = {c: _num_rank_first(rs, rcounts, cands_to_ignore, c) for c in candidates if not isin(cands_to_ignore,c)}  
+        plurality_scores = state.plurality_scores()
         min_plurality_score = min(plurality_scores.values())
-        lowest_first_place_votes = np.array([c for c in plurality_scores.keys() 
-                                             if plurality_scores[c] == min_plurality_score])
+        lowest_first_place_votes = [c for c in plurality_scores.keys() 
+                                    if plurality_scores[c] == min_plurality_score]
         
         cand_to_remove = lowest_first_place_votes[0]
         for c in lowest_first_place_votes[1:]: 
@@ -315,12 +516,11 @@ def instant_runoff_tb(profile, curr_cands = None, tie_breaker = None):
                 cand_to_remove = c
 
         # remove cands with lowest plurality winners
-        cands_to_ignore = np.concatenate((cands_to_ignore, cand_to_remove), axis=None)
-        if len(cands_to_ignore) == num_cands: #all the candidates where removed
+        state.eliminate([cand_to_remove])
+        if state.num_remaining == 0: #all the candidates where removed
             winners = sorted(lowest_first_place_votes)
         else:
-            winners = [c for c in candidates 
-                       if not isin(cands_to_ignore,c) and _num_rank_first(rs, rcounts, cands_to_ignore, c) >= strict_maj_size]
+            winners = state.majority_winners()
      
     return sorted(winners)
 
@@ -370,35 +570,31 @@ def instant_runoff_put(profile, curr_cands = None):
 
     """
     
-    candidates = profile.candidates if curr_cands is None else curr_cands 
+    return _PUTSearch("Instant Runoff PUT", _instant_runoff_put_step).run(_EliminationState(profile, curr_cands = curr_cands))
 
-    plurality_scores = profile.plurality_scores(candidates)
+def _instant_runoff_put_step(state):
+    "One step of Instant Runoff PUT: the majority winner, if there is one, otherwise the candidates with the fewest first-place votes."
+
+    plurality_scores = state.plurality_scores()
 
-    strict_maj_size = profile.strict_maj_size()
-    majority_winner = [cand for cand, score in plurality_scores.items() if score >= strict_maj_size]
+    majority_winner = state.majority_winners()
 
     if len(majority_winner) > 0:
-        return majority_winner
-    
-    original_num_cands = len(candidates)
+        return majority_winner, []
     
     # immediately eliminate candidates with plurality score 0
     # this is safe, because every elimination order will eliminate all these candidates first (in some order)
-    candidates = [cand for cand in candidates if plurality_scores[cand] > 0]
-    if len(candidates) < original_num_cands:
+    cands_with_no_votes = [cand for cand, score in plurality_scores.items() if score == 0]
+    if len(cands_with_no_votes) > 0:
         # if we removed some candidates, we need to update the plurality scores
-        plurality_scores = profile.plurality_scores(candidates)
+        state.eliminate(cands_with_no_votes)
+        plurality_scores = state.plurality_scores()
 
     # plurality losers
     worst_score = min(plurality_scores.values())
     cands_to_remove = [cand for cand, value in plurality_scores.items() if value == worst_score]
     
-    winners = []
-    for cand_to_remove in cands_to_remove:
-        new_winners = instant_runoff_put(profile, curr_cands = [c for c in candidates if not c == cand_to_remove])
-        winners = winners + new_winners
-    
-    return sorted(set(winners))
+    return None, cands_to_remove
 
 
 # Create some aliases for instant runoff
@@ -456,37 +652,25 @@ def instant_runoff_with_explanation(profile, curr_cands = None):
         print(f"order of elimination: {exp}")
 
     """
-    # need the total number of all candidates in a profile to check when all candidates have been removed   
-    num_cands = profile.num_cands 
-    
-    candidates = profile.candidates if curr_cands is None else curr_cands
-    cands_to_ignore = np.empty(0) if curr_cands is None else np.array([c for c in profile.candidates if c not in curr_cands])
-
-    strict_maj_size = profile.strict_maj_size()
-    
-    rs, rcounts = profile.rankings_counts # get all the ranking data
-    
+    state = _EliminationState(profile, curr_cands = curr_cands)
 
-    winners = [c for c in candidates 
-               if _num_rank_first(rs, rcounts, cands_to_ignore, c) >= strict_maj_size]
+    winners = state.majority_winners()
     elims_list = list()
 
     while len(winners) == 0:
-        plurality_scores = {c: _num_rank_first(rs, rcounts, cands_to_ignore, c) for c in candidates 
-                            if  not isin(cands_to_ignore,c)}  
+        plurality_scores = state.plurality_scores()
         min_plurality_score = min(plurality_scores.values())
-        lowest_first_place_votes = np.array([c for c in plurality_scores.keys() 
-                                             if  plurality_scores[c] == min_plurality_score])
+        lowest_first_place_votes = [c for c in plurality_scores.keys() 
+                                    if  plurality_scores[c] == min_plurality_score]
 
         elims_list.append(list(lowest_first_place_votes))
 
         # remove cands with lowest plurality winners
-        cands_to_ignore = np.concatenate((cands_to_ignore, lowest_first_place_votes), axis=None)
-        if len(cands_to_ignore) == num_cands: # removed all of the candidates 
+        state.eliminate(lowest_first_place_votes)
+        if state.num_remaining == 0: # removed all of the candidates 
             winners = sorted(lowest_first_place_votes)
         else:
-            winners = [c for c in candidates 
-                       if not isin(cands_to_ignore,c) and _num_rank_first(rs, rcounts, cands_to_ignore, c) >= strict_maj_size]
+            winners = state.majority_winners()
      
     return sorted(winners), elims_list
 
@@ -705,12 +889,16 @@ def bottom_two_runoff_instant_runoff_put(profile, curr_cands = None):
     Returns: 
         A sorted list of candidates
     """
-    candidates = profile.candidates if curr_cands is None else curr_cands 
 
-    if len(candidates) == 1:
-        return candidates
+    return _PUTSearch("Bottom-Two-Runoff Instant Runoff PUT", _bottom_two_runoff_instant_runoff_put_step).run(_EliminationState(profile, curr_cands = curr_cands))
 
-    plurality_scores = profile.plurality_scores(candidates)
+def _bottom_two_runoff_instant_runoff_put_step(state):
+    "One step of BTR-IRV PUT: the remaining candidate, if there is only one, otherwise the candidates that lose a head-to-head match between candidates with the lowest two plurality scores."
+
+    if state.num_remaining == 1:
+        return state.remaining_candidates(), []
+
+    plurality_scores = state.plurality_scores()
     worst_score = min(plurality_scores.values())
     cands_with_lowest_plurality_score = [cand for cand, value in plurality_scores.items() if value == worst_score]
 
@@ -720,19 +908,16 @@ def bottom_two_runoff_instant_runoff_put(profile, curr_cands = None):
         second_lowest_plurality_score = sorted(plurality_scores.values())[1]
         cands_with_second_lowest_plurality_score = [cand for cand, value in plurality_scores.items() if value == second_lowest_plurality_score]
     
-    winners = []
+    cands_to_remove = []
 
     for c1 in cands_with_lowest_plurality_score:
         for c2 in cands_with_second_lowest_plurality_score:
             if c1 != c2:
-                if profile.margin(c1,c2) <= 0:
-                    additional_winners = bottom_two_runoff_instant_runoff_put(profile, curr_cands = [c for c in candidates if not c == c1])
-                else:
-                    additional_winners = bottom_two_runoff_instant_runoff_put(profile, curr_cands = [c for c in candidates if not c == c2])
-                
-                winners = winners + additional_winners
+                cand_to_remove = c1 if state.profile.margin(c1,c2) <= 0 else c2
+                if cand_to_remove not in cands_to_remove:
+                    cands_to_remove.append(cand_to_remove)
     
-    return sorted(set(winners))
+    return None, cands_to_remove
     
 
 @vm(name = "Plurality with Runoff PUT",
@@ -877,35 +1062,24 @@ def coombs(profile, curr_cands = None):
 
     """   
 
-    # need the total number of all candidates in a profile to check when all candidates have been removed   
-    num_cands = profile.num_cands 
+    state = _EliminationState(profile, curr_cands = curr_cands)
     
-    candidates = profile.candidates if curr_cands is None else curr_cands
-    cands_to_ignore = np.empty(0) if curr_cands is None else np.array([c for c in profile.candidates if c not in curr_cands])
-
-    strict_maj_size = profile.strict_maj_size()
-    
-    rs, rcounts = profile.rankings_counts # get all the ranking data
-    
-    winners = [c for c in candidates 
-               if _num_rank_first(rs, rcounts, cands_to_ignore, c) >= strict_maj_size]
+    winners = state.majority_winners()
 
     while len(winners) == 0:
         
-        last_place_scores = {c: _num_rank_last(rs, rcounts, cands_to_ignore, c) for c in candidates 
-                             if not isin(cands_to_ignore,c)}  
+        last_place_scores = state.last_place_scores()
         max_last_place_score = max(last_place_scores.values())
-        greatest_last_place_votes = np.array([c for c in last_place_scores.keys() 
-                                              if  last_place_scores[c] == max_last_place_score])
+        greatest_last_place_votes = [c for c in last_place_scores.keys() 
+                                     if  last_place_scores[c] == max_last_place_score]
 
         # remove candidates ranked last by the greatest number of voters
-        cands_to_ignore = np.concatenate((cands_to_ignore, greatest_last_place_votes), axis=None)
+        state.eliminate(greatest_last_place_votes)
         
-        if len(cands_to_ignore) == num_cands: # removed all candidates 
+        if state.num_remaining == 0: # removed all candidates 
             winners = list(greatest_last_place_votes)
         else:
-            winners = [c for c in candidates 
-                       if not isin(cands_to_ignore,c) and _num_rank_first(rs, rcounts, cands_to_ignore, c) >= strict_maj_size]
+            winners = state.majority_winners()
 
     return sorted(winners)
 
@@ -945,21 +1119,13 @@ def coombs_tb(profile, curr_cands = None, tie_breaker=None):
     # the tie_breaker is any linear order (i.e., list) of the candidates
     tb = tie_breaker if tie_breaker is not None else list(range(profile.num_cands))
 
-    num_cands = profile.num_cands   
-    candidates = profile.candidates if curr_cands is None else curr_cands
-    cands_to_ignore = np.empty(0) if curr_cands is None else np.array([c for c in profile.candidates if c not in curr_cands])
+    state = _EliminationState(profile, curr_cands = curr_cands)
 
-    strict_maj_size = profile.strict_maj_size()
-    
-    rs, rcounts = profile.rankings_counts # get all the ranking data
-
-    winners = [c for c in candidates 
-               if _num_rank_first(rs, rcounts, cands_to_ignore, c) >= strict_maj_size]
+    winners = state.majority_winners()
 
     while len(winners) == 0:
         
-        last_place_scores = {c: _num_rank_last(rs, rcounts, cands_to_ignore, c) for c in candidates 
-                             if not isin(cands_to_ignore,c)}  
+        last_place_scores = state.last_place_scores()
         max_last_place_score = max(last_place_scores.values())
         greatest_last_place_votes = [c for c in last_place_scores.keys() if last_place_scores[c] == max_last_place_score]
 
@@ -970,13 +1136,12 @@ def coombs_tb(profile, curr_cands = None, tie_breaker=None):
                 cand_to_remove = c
         
         # remove candidates ranked last by the greatest number of voters
-        cands_to_ignore = np.concatenate((cands_to_ignore, np.array([cand_to_remove])), axis=None)
+        state.eliminate([cand_to_remove])
         
-        if len(cands_to_ignore) == num_cands:
+        if state.num_remaining == 0:
             winners = list(greatest_last_place_votes)
         else:
-            winners = [c for c in candidates 
-                       if not isin(cands_to_ignore,c) and _num_rank_first(rs, rcounts, cands_to_ignore, c) >= strict_maj_size]
+            winners = state.majority_winners()
 
     return sorted(winners)
 
@@ -1023,27 +1188,21 @@ def coombs_put(profile, curr_cands = None):
         coombs_put.display(prof)
     """
 
-    candidates = profile.candidates if curr_cands is None else curr_cands 
-    cands_to_ignore = np.empty(0) if curr_cands is None else np.array([c for c in profile.candidates if c not in curr_cands])
+    return _PUTSearch("Coombs PUT", _coombs_put_step).run(_EliminationState(profile, curr_cands = curr_cands))
 
-    strict_maj_size = profile.strict_maj_size()
-    majority_winner = [cand for cand, value in profile.plurality_scores(candidates).items() if value >= strict_maj_size]
+def _coombs_put_step(state):
+    "One step of Coombs PUT: the majority winner, if there is one, otherwise the candidates with the most last-place votes."
+
+    majority_winner = state.majority_winners()
 
     if len(majority_winner) > 0:
-        return majority_winner
-    
-    rs, rcounts = profile.rankings_counts # get all the ranking data
+        return majority_winner, []
     
-    last_place_scores = {c: _num_rank_last(rs, rcounts, cands_to_ignore, c) for c in candidates}  
+    last_place_scores = state.last_place_scores()
     max_last_place_score = max(last_place_scores.values())
     cands_to_remove = [c for c in last_place_scores.keys() if last_place_scores[c] == max_last_place_score]
 
-    winners = []
-    for cand_to_remove in cands_to_remove:
-        new_winners = coombs_put(profile, curr_cands = [c for c in candidates if not c == cand_to_remove])
-        winners = winners + new_winners
-    
-    return sorted(set(winners))
+    return None, cands_to_remove
 
 def coombs_with_explanation(profile, curr_cands = None):
     """
@@ -1080,36 +1239,26 @@ def coombs_with_explanation(profile, curr_cands = None):
 
 
     """
-    num_cands = profile.num_cands 
+    state = _EliminationState(profile, curr_cands = curr_cands)
     
-    candidates = profile.candidates if curr_cands is None else curr_cands
-    cands_to_ignore = np.empty(0) if curr_cands is None else np.array([c for c in profile.candidates if c not in curr_cands])
-
-    strict_maj_size = profile.strict_maj_size()
-    
-    rs, rcounts = profile.rankings_counts # get all the ranking data
-    
-    winners = [c for c in candidates 
-               if _num_rank_first(rs, rcounts, cands_to_ignore, c) >= strict_maj_size]
+    winners = state.majority_winners()
 
     elims_list = list()
     while len(winners) == 0:
         
-        last_place_scores = {c: _num_rank_last(rs, rcounts, cands_to_ignore, c) for c in candidates 
-                             if not isin(cands_to_ignore,c)}  
+        last_place_scores = state.last_place_scores()
         max_last_place_score = max(last_place_scores.values())
-        greatest_last_place_votes = np.array([c for c in last_place_scores.keys() 
-                                              if  last_place_scores[c] == max_last_place_score])
+        greatest_last_place_votes = [c for c in last_place_scores.keys() 
+                                     if  last_place_scores[c] == max_last_place_score]
 
         elims_list.append(list(greatest_last_place_votes))
         # remove candidates ranked last by the greatest number of voters
-        cands_to_ignore = np.concatenate((cands_to_ignore, greatest_last_place_votes), axis=None)
+        state.eliminate(greatest_last_place_votes)
         
-        if len(cands_to_ignore) == num_cands:
+        if state.num_remaining == 0:
             winners = list(greatest_last_place_votes)
         else:
-            winners = [c for c in candidates 
-                       if not isin(cands_to_ignore,c) and _num_rank_first(rs, rcounts, cands_to_ignore, c) >= strict_maj_size]
+            winners = state.majority_winners()
 
     return sorted(winners), elims_list
 
@@ -1144,41 +1293,21 @@ def baldwin(profile, curr_cands = None):
         prof.display()
         baldwin.display(prof)
     """
-    all_num_cands = profile.num_cands  
-    candidates = profile.candidates if curr_cands is None else curr_cands
-    rcounts = profile._rcounts # get all the ranking data
-    rankings = profile._rankings if curr_cands is None else _find_updated_profile(profile._rankings, np.array([c for c in profile.candidates if c not in candidates]), all_num_cands)
-    num_cands = len(candidates)
-    cands_to_ignore = np.empty(0) 
-    borda_scores = {c: _borda_score(rankings, rcounts, len(candidates), c) for c in candidates}
+    state = _EliminationState(profile, curr_cands = curr_cands)
 
-    min_borda_score = min(list(borda_scores.values()))
-    last_place_borda_scores = [c for c in candidates 
-                               if c in borda_scores.keys() and borda_scores[c] == min_borda_score]
-      
-    cands_to_ignore = np.concatenate((cands_to_ignore, last_place_borda_scores), axis=None)
-    
     winners = list()
-    if cands_to_ignore.shape[0] ==  num_cands: # all candidates have lowest Borda score
-        winners = sorted(last_place_borda_scores)
-    else: # remove the candidates with lowest Borda score
-        num_cands = len(candidates)
-        updated_rankings = _find_updated_profile(rankings, cands_to_ignore, num_cands)
-        
     while len(winners) == 0:
-        borda_scores = {c: _borda_score(updated_rankings, rcounts, num_cands - cands_to_ignore.shape[0], c) for c in candidates if not isin(cands_to_ignore, c)}
+        borda_scores = state.borda_scores()
                 
         min_borda_score = min(borda_scores.values())
         last_place_borda_scores = [c for c in borda_scores.keys() if borda_scores[c] == min_borda_score]
         
-        cands_to_ignore = np.concatenate((cands_to_ignore, last_place_borda_scores), axis=None)
+        state.eliminate(last_place_borda_scores)
                 
-        if cands_to_ignore.shape[0] == num_cands: # removed all remaining candidates
+        if state.num_remaining == 0: # removed all remaining candidates
             winners = sorted(last_place_borda_scores)
-        elif num_cands - cands_to_ignore.shape[0] ==  1: # only one candidate remains
-            winners = sorted([c for c in candidates if c not in cands_to_ignore])
-        else: 
-            updated_rankings = _find_updated_profile(rankings, cands_to_ignore, num_cands)
+        elif state.num_remaining ==  1: # only one candidate remains
+            winners = state.remaining_candidates()
     return sorted(winners)
 
 @vm(name = "Baldwin TB",
@@ -1220,34 +1349,11 @@ def baldwin_tb(profile, curr_cands = None, tie_breaker=None):
     if len(profile.candidates) <= 1:
         return sorted(profile.candidates)
 
-    all_num_cands = profile.num_cands  
-    candidates = profile.candidates if curr_cands is None else curr_cands
-    rcounts = profile._rcounts # get all the ranking data
-    rankings = profile._rankings if curr_cands is None else _find_updated_profile(profile._rankings, np.array([c for c in profile.candidates if c not in candidates]), all_num_cands)
-    num_cands = len(candidates)
-    cands_to_ignore = np.empty(0) 
-    borda_scores = {c: _borda_score(rankings, rcounts, num_cands, c) for c in candidates}
+    state = _EliminationState(profile, curr_cands = curr_cands)
 
-    min_borda_score = min(list(borda_scores.values()))
-    last_place_borda_scores = [c for c in candidates 
-                               if c in borda_scores.keys() and borda_scores[c] == min_borda_score]
-            
-    cand_to_remove = last_place_borda_scores[0]
-    for c in last_place_borda_scores[1:]: 
-        if tb.index(c) < tb.index(cand_to_remove):
-            cand_to_remove = c
-    cands_to_ignore = np.concatenate((cands_to_ignore, np.array([cand_to_remove])), axis=None)
-    
     winners = list()
-    if cands_to_ignore.shape[0] ==  all_num_cands: # all candidates have lowest Borda score
-        winners = sorted(last_place_borda_scores)
-    else: # remove the candidates with lowest Borda score
-        num_cands = len(candidates)
-        updated_rankings = _find_updated_profile(rankings, cands_to_ignore, num_cands)
-        
     while len(winners) == 0:
-        borda_scores = {c: _borda_score(updated_rankings, rcounts, num_cands - cands_to_ignore.shape[0], c) 
-                        for c in candidates if not isin(cands_to_ignore, c)}
+        borda_scores = state.borda_scores()
                 
         min_borda_score = min(borda_scores.values())
         last_place_borda_scores = [c for c in borda_scores.keys() if borda_scores[c] == min_borda_score]
@@ -1258,14 +1364,12 @@ def baldwin_tb(profile, curr_cands = None, tie_breaker=None):
             if tb.index(c) < tb.index(cand_to_remove):
                 cand_to_remove = c
         
-        cands_to_ignore = np.concatenate((cands_to_ignore, np.array([cand_to_remove])), axis=None)
+        state.eliminate([cand_to_remove])
                 
-        if cands_to_ignore.shape[0] == num_cands: # removed all remaining candidates
+        if state.num_remaining == 0: # removed all remaining candidates
             winners = sorted(last_place_borda_scores)
-        elif num_cands - cands_to_ignore.shape[0] ==  1: # only one candidate remains
-            winners = sorted([c for c in candidates if c not in cands_to_ignore])
-        else: 
-            updated_rankings = _find_updated_profile(rankings, cands_to_ignore, num_cands)
+        elif state.num_remaining ==  1: # only one candidate remains
+            winners = state.remaining_candidates()
     return sorted(winners)
 
 @vm(name = "Baldwin PUT",
@@ -1308,28 +1412,20 @@ def baldwin_put(profile, curr_cands=None):
         baldwin_put.display(prof)
     """
 
-    num_original_cands = len(profile.candidates)
-    candidates = profile.candidates if curr_cands is None else curr_cands 
-    
-    if len(candidates) == 1:
-        return candidates
-    
-    cands_to_ignore = np.empty(0) if curr_cands is None else np.array([c for c in profile.candidates if c not in curr_cands])
-    
-    rankings, rcounts = profile.rankings_counts # get all the ranking data
-    updated_rankings = _find_updated_profile(rankings, cands_to_ignore, num_original_cands)
+    return _PUTSearch("Baldwin PUT", _baldwin_put_step).run(_EliminationState(profile, curr_cands = curr_cands))
+
+def _baldwin_put_step(state):
+    "One step of Baldwin PUT: the remaining candidate, if there is only one, otherwise the candidates with the lowest Borda score."
 
-    borda_scores = {c: _borda_score(updated_rankings, rcounts, num_original_cands - cands_to_ignore.shape[0], c) for c in candidates if not isin(cands_to_ignore, c)}
+    if state.num_remaining == 1:
+        return state.remaining_candidates(), []
+    
+    borda_scores = state.borda_scores()
     min_borda_score = min(list(borda_scores.values()))
     
-    cands_to_remove = [c for c in candidates if c in borda_scores.keys() and borda_scores[c] == min_borda_score]
+    cands_to_remove = [c for c in borda_scores.keys() if borda_scores[c] == min_borda_score]
 
-    winners = []
-    for cand_to_remove in cands_to_remove:
-        new_winners = baldwin_put(profile, curr_cands = [c for c in candidates if not c == cand_to_remove])
-        winners = winners + new_winners
-    
-    return sorted(set(winners))
+    return None, cands_to_remove
 
 
 def baldwin_with_explanation(profile, curr_cands = None):
@@ -1366,47 +1462,34 @@ def baldwin_with_explanation(profile, curr_cands = None):
 
     """
 
-    all_num_cands = profile.num_cands   
-    candidates = profile.candidates if curr_cands is None else curr_cands
+    state = _EliminationState(profile, curr_cands = curr_cands)
     elims_list = list()
-        
-    rcounts = profile._rcounts # get all the ranking data
-    rankings = profile._rankings if curr_cands is None else _find_updated_profile(profile._rankings, np.array([c for c in profile.candidates if c not in curr_cands]), all_num_cands)
-    
-    cands_to_ignore = np.empty(0) if curr_cands is None else np.array([c for c in profile.candidates if c not in curr_cands])
 
-    borda_scores = {c: _borda_score(rankings, rcounts, len(candidates), c) for c in candidates}
+    borda_scores = state.borda_scores()
 
     min_borda_score = min(list(borda_scores.values()))
     
-    last_place_borda_scores = [c for c in candidates 
-                               if c in borda_scores.keys() and borda_scores[c] == min_borda_score]
+    last_place_borda_scores = [c for c in borda_scores.keys() if borda_scores[c] == min_borda_score]
     elims_list.append([last_place_borda_scores, borda_scores])
-    cands_to_ignore = np.concatenate((cands_to_ignore, np.array(last_place_borda_scores)), axis=None)
+    state.eliminate(last_place_borda_scores)
     
     winners = list()
-    if cands_to_ignore.shape[0] ==  all_num_cands: # all candidates have lowest Borda score
+    if state.num_remaining == 0: # all candidates have lowest Borda score
         winners = sorted(last_place_borda_scores)
-    else: # remove the candidates with lowest Borda score
-        num_cands = len(candidates)
-        updated_rankings = _find_updated_profile(rankings, cands_to_ignore, num_cands)
         
     while len(winners) == 0:
-        borda_scores = {c: _borda_score(updated_rankings, rcounts, num_cands - cands_to_ignore.shape[0], c) 
-                        for c in candidates if not isin(cands_to_ignore, c)}
+        borda_scores = state.borda_scores()
                 
         min_borda_score = min(borda_scores.values())
         last_place_borda_scores = [c for c in borda_scores.keys() if borda_scores[c] == min_borda_score]
         elims_list.append([last_place_borda_scores, borda_scores])
         
-        cands_to_ignore = np.concatenate((cands_to_ignore, np.array(last_place_borda_scores)), axis=None)
+        state.eliminate(last_place_borda_scores)
                 
-        if cands_to_ignore.shape[0] == all_num_cands: # removed all remaining candidates
+        if state.num_remaining == 0: # removed all remaining candidates
             winners = sorted(last_place_borda_scores)
-        elif num_cands - cands_to_ignore.shape[0] ==  1: # only one candidate remains
-            winners = sorted([c for c in candidates if c not in cands_to_ignore])
-        else: 
-            updated_rankings = _find_updated_profile(rankings, cands_to_ignore, num_cands)
+        elif state.num_remaining ==  1: # only one candidate remains
+            winners = state.remaining_candidates()
     return sorted(winners), elims_list
 
 @vm(name = "Strict Nanson",
@@ -1442,41 +1525,22 @@ def strict_nanson(profile, curr_cands = None):
         strict_nanson.display(prof)
     """
     
-    all_num_cands = profile.num_cands   
-    candidates = profile.candidates if curr_cands is None else curr_cands
-        
-    rcounts = profile._rcounts # get all the ranking data
-    rankings = profile._rankings if curr_cands is None else _find_updated_profile(profile._rankings, np.array([c for c in profile.candidates if c not in curr_cands]), all_num_cands)
-    cands_to_ignore = np.empty(0)
+    state = _EliminationState(profile, curr_cands = curr_cands)
 
-    borda_scores = {c: _borda_score(rankings, rcounts, len(candidates), c) for c in candidates}
-    
-    avg_borda_score = np.mean(list(borda_scores.values()))
-    below_borda_avg_candidates = np.array([c for c in borda_scores.keys() if borda_scores[c] < avg_borda_score])
-    
-    cands_to_ignore = np.concatenate((cands_to_ignore, below_borda_avg_candidates), axis=None)
     winners = list()
-    if cands_to_ignore.shape[0] == all_num_cands:  # all candidates have same Borda score
-        winners = sorted(candidates)
-    else: 
-        num_cands = len(candidates)
-        updated_rankings = _find_updated_profile(rankings, cands_to_ignore, num_cands)
     while len(winners) == 0: 
         
-        borda_scores = {c: _borda_score(updated_rankings, rcounts, num_cands - cands_to_ignore.shape[0], c) 
-                        for c in candidates if not isin(cands_to_ignore, c)}
+        borda_scores = state.borda_scores()
         
-        avg_borda_scores = np.mean(list(borda_scores.values()))
+        avg_borda_score = np.mean(list(borda_scores.values()))
     
-        below_borda_avg_candidates = np.array([c for c in borda_scores.keys() 
-                                               if borda_scores[c] < avg_borda_scores])
+        below_borda_avg_candidates = [c for c in borda_scores.keys() 
+                                      if borda_scores[c] < avg_borda_score]
         
-        cands_to_ignore = np.concatenate((cands_to_ignore, below_borda_avg_candidates), axis=None)
+        state.eliminate(below_borda_avg_candidates)
                 
-        if (below_borda_avg_candidates.shape[0] == 0) or ((all_num_cands - cands_to_ignore.shape[0]) == 1):
-            winners = sorted([c for c in candidates if c not in cands_to_ignore])
-        else:
-            updated_rankings = _find_updated_profile(rankings, cands_to_ignore, num_cands)
+        if len(below_borda_avg_candidates) == 0 or state.num_remaining == 1:
+            winners = sorted(state.remaining_candidates())
             
     return winners
 
@@ -1505,51 +1569,38 @@ def strict_nanson_with_explanation(profile, curr_cands = None):
         print(strict_nanson_with_explanation(prof))
     """
 
-    all_num_cands = profile.num_cands   
     candidates = profile.candidates if curr_cands is None else curr_cands
-    
-    rcounts = profile._rcounts # get all the ranking data
-    rankings = profile._rankings if curr_cands is None else _find_updated_profile(profile._rankings, np.array([c for c in profile.candidates if c not in curr_cands]), all_num_cands)
-    cands_to_ignore = np.empty(0)
+    state = _EliminationState(profile, curr_cands = curr_cands)
     elim_list = list()
     
-    borda_scores = {c: _borda_score(rankings, rcounts, len(candidates), c) for c in candidates}
+    borda_scores = state.borda_scores()
     
     avg_borda_score = np.mean(list(borda_scores.values()))
     below_borda_avg_candidates = [c for c in borda_scores.keys() if borda_scores[c] < avg_borda_score]
     
-    cands_to_ignore = np.concatenate((cands_to_ignore, np.array(below_borda_avg_candidates)), axis=None)
+    state.eliminate(below_borda_avg_candidates)
+    elim_list.append({"avg_borda_score": avg_borda_score, 
+                      "elim_cands": below_borda_avg_candidates,
+                      "borda_scores": borda_scores})
     winners = list()
-    if cands_to_ignore.shape[0] == all_num_cands:  # all candidates have same Borda score
-        elim_list.append({"avg_borda_score": avg_borda_score, 
-                          "elim_cands": below_borda_avg_candidates,
-                          "borda_scores": borda_scores})
+    if state.num_remaining == 0:  # all candidates have same Borda score
         winners = sorted(candidates)
-    else: 
-        num_cands = len(candidates)
-        elim_list.append({"avg_borda_score": avg_borda_score, 
-                          "elim_cands": below_borda_avg_candidates,
-                          "borda_scores": borda_scores})
-        updated_rankings = _find_updated_profile(rankings, cands_to_ignore, num_cands)
     while len(winners) == 0: 
         
-        borda_scores = {c: _borda_score(updated_rankings, rcounts, num_cands - cands_to_ignore.shape[0], c) 
-                        for c in candidates if not isin(cands_to_ignore, c)}
+        borda_scores = state.borda_scores()
         
         avg_borda_score = np.mean(list(borda_scores.values()))
     
         below_borda_avg_candidates = [c for c in borda_scores.keys() 
                                       if borda_scores[c] < avg_borda_score]
         
-        cands_to_ignore = np.concatenate((cands_to_ignore, np.array(below_borda_avg_candidates)), axis=None)
+        state.eliminate(below_borda_avg_candidates)
         elim_list.append({"avg_borda_score": avg_borda_score, 
                           "elim_cands": below_borda_avg_candidates,
                           "borda_scores": borda_scores})
                 
-        if (len(below_borda_avg_candidates) == 0) or ((all_num_cands - cands_to_ignore.shape[0]) == 1):
-            winners = sorted([c for c in candidates if c not in cands_to_ignore])
-        else:
-            updated_rankings = _find_updated_profile(rankings, cands_to_ignore, num_cands)
+        if len(below_borda_avg_candidates) == 0 or state.num_remaining == 1:
+            winners = sorted(state.remaining_candidates())
             
     return winners, elim_list
 
@@ -1587,50 +1638,24 @@ def weak_nanson(profile, curr_cands = None):
 
     """
 
-    all_num_cands = profile.num_cands   
-    candidates = profile.candidates if curr_cands is None else curr_cands
-        
-    rcounts = profile._rcounts # get all the ranking data
-    rankings = profile._rankings if curr_cands is None else _find_updated_profile(profile._rankings, np.array([c for c in profile.candidates if c not in curr_cands]), all_num_cands)
-    
-    cands_to_ignore = np.empty(0) if curr_cands is None else np.array([c for c in profile.candidates if c not in curr_cands])
-
-    borda_scores = {c: _borda_score(rankings, rcounts, len(candidates), c) for c in candidates}
-
-    avg_borda_score = np.mean(list(borda_scores.values()))
+    state = _EliminationState(profile, curr_cands = curr_cands)
 
-    below_borda_avg_candidates = np.array([c for c in borda_scores.keys() if borda_scores[c] <= avg_borda_score])
-    
-    cands_to_ignore = np.concatenate((cands_to_ignore, below_borda_avg_candidates), axis=None)
-    
     winners = list()
-    if cands_to_ignore.shape[0] == all_num_cands:  # all candidates have same Borda score
-        winners = sorted(candidates)
-    elif all_num_cands - cands_to_ignore.shape[0]  == 1: # one candidate remains
-        winners = [c for c in candidates if not isin(cands_to_ignore, c)]
-    else: 
-        num_cands = len(candidates)
-        updated_rankings = _find_updated_profile(rankings, cands_to_ignore, num_cands)
-        
     while len(winners) == 0: 
         
-        borda_scores = {c: _borda_score(updated_rankings, rcounts, num_cands - cands_to_ignore.shape[0], c) 
-                        for c in candidates if not isin(cands_to_ignore, c)}
-        
+        borda_scores = state.borda_scores()
 
         avg_borda_score = np.mean(list(borda_scores.values()))
 
-        below_borda_avg_candidates = np.array([c for c in borda_scores.keys() 
-                                               if borda_scores[c] <= avg_borda_score])
+        below_borda_avg_candidates = [c for c in borda_scores.keys() 
+                                      if borda_scores[c] <= avg_borda_score]
         
-        cands_to_ignore = np.concatenate((cands_to_ignore, below_borda_avg_candidates), axis=None)
+        state.eliminate(below_borda_avg_candidates)
         
-        if cands_to_ignore.shape[0] == all_num_cands:  # all remaining candidates have been removed
+        if state.num_remaining == 0:  # all remaining candidates have been removed
             winners = sorted(below_borda_avg_candidates)
-        elif all_num_cands - cands_to_ignore.shape[0]  == 1: # one candidate remains
-            winners = [c for c in candidates if not isin(cands_to_ignore, c)]
-        else:
-            updated_rankings = _find_updated_profile(rankings, cands_to_ignore, num_cands)
+        elif state.num_remaining == 1: # one candidate remains
+            winners = state.remaining_candidates()
             
     return winners
 
@@ -1660,61 +1685,28 @@ def weak_nanson_with_explanation(profile, curr_cands = None):
         print(weak_nanson_with_explanation(prof))
         
     """
-    all_num_cands = profile.num_cands   
-    candidates = profile.candidates if curr_cands is None else curr_cands
-        
-    rcounts = profile._rcounts # get all the ranking data
-    rankings = profile._rankings if curr_cands is None else _find_updated_profile(profile._rankings, np.array([c for c in profile.candidates if c not in curr_cands]), all_num_cands)
-    cands_to_ignore = np.empty(0) if curr_cands is None else np.array([c for c in profile.candidates if c not in curr_cands])
+    state = _EliminationState(profile, curr_cands = curr_cands)
     elim_list = list()
-    
-    borda_scores = {c: _borda_score(rankings, rcounts, len(candidates), c) for c in candidates}
-    
-    avg_borda_score = np.mean(list(borda_scores.values()))
-    below_borda_avg_candidates = [c for c in borda_scores.keys() 
-                                  if borda_scores[c] <= avg_borda_score]
-    
-    cands_to_ignore = np.concatenate((cands_to_ignore, np.array(below_borda_avg_candidates)), axis=None)
-    winners = list()
-    if cands_to_ignore.shape[0] == all_num_cands:  # all candidates have same Borda score
-        elim_list.append({"avg_borda_score": avg_borda_score, 
-                          "elim_cands": below_borda_avg_candidates,
-                          "borda_scores": borda_scores})
-        winners = sorted(candidates)
-    elif all_num_cands - cands_to_ignore.shape[0]  == 1: # one candidate remains
-        elim_list.append({"avg_borda_score": avg_borda_score, 
-                          "elim_cands": below_borda_avg_candidates,
-                          "borda_scores": borda_scores})
-        winners = [c for c in candidates if not isin(cands_to_ignore, c)]
-    else: 
-        num_cands = len(candidates)
-        elim_list.append({"avg_borda_score": avg_borda_score, 
-                          "elim_cands": below_borda_avg_candidates,
-                          "borda_scores": borda_scores})
-        updated_rankings = _find_updated_profile(rankings, cands_to_ignore, num_cands)
-        
 
+    winners = list()
     while len(winners) == 0: 
         
-        borda_scores = {c: _borda_score(updated_rankings, rcounts, num_cands - cands_to_ignore.shape[0], c) 
-                        for c in candidates if not isin(cands_to_ignore, c)}
+        borda_scores = state.borda_scores()
         
         avg_borda_score = np.mean(list(borda_scores.values()))
     
         below_borda_avg_candidates = [c for c in borda_scores.keys() 
                                       if borda_scores[c] <= avg_borda_score]
         
-        cands_to_ignore = np.concatenate((cands_to_ignore, np.array(below_borda_avg_candidates)), axis=None)
+        state.eliminate(below_borda_avg_candidates)
         elim_list.append({"avg_borda_score": avg_borda_score, 
                           "elim_cands": below_borda_avg_candidates,
                           "borda_scores": borda_scores})
                 
-        if cands_to_ignore.shape[0] == all_num_cands:  # all remaining candidates have been removed
+        if state.num_remaining == 0:  # all remaining candidates have been removed
             winners = sorted(below_borda_avg_candidates)
-        elif all_num_cands - cands_to_ignore.shape[0]  == 1: # one candidate remains
-            winners = [c for c in candidates if not isin(cands_to_ignore, c)]
-        else:
-            updated_rankings = _find_updated_profile(rankings, cands_to_ignore, num_cands)
+        elif state.num_remaining == 1: # one candidate remains
+            winners = state.remaining_candidates()
             
     return winners, elim_list
 
@@ -1859,31 +1851,24 @@ def benham(profile, curr_cands = None):
 
     """
 
-    # need the total number of all candidates in a profile to check when all candidates have been removed   
-    num_cands = profile.num_cands 
-    
-    candidates = profile.candidates if curr_cands is None else curr_cands
-    cands_to_ignore = np.empty(0) if curr_cands is None else np.array([c for c in profile.candidates if c not in curr_cands])
+    state = _EliminationState(profile, curr_cands = curr_cands)
 
-    cw = profile.condorcet_winner(curr_cands = [c for c in profile.candidates if not isin(cands_to_ignore, c)])
+    cw = state.condorcet_winner()
     
     winners = [cw] if cw is not None else list()
     
-    rs, rcounts = profile.rankings_counts # get all the ranking data
-    
     while len(winners) == 0:
-        plurality_scores = {c: _num_rank_first(rs, rcounts, cands_to_ignore, c) for c in candidates 
-                            if  not isin(cands_to_ignore,c)}  
+        plurality_scores = state.plurality_scores()
         min_plurality_score = min(plurality_scores.values())
-        lowest_first_place_votes = np.array([c for c in plurality_scores.keys() 
-                                             if  plurality_scores[c] == min_plurality_score])
+        lowest_first_place_votes = [c for c in plurality_scores.keys() 
+                                    if  plurality_scores[c] == min_plurality_score]
 
         # remove cands with lowest plurality score
-        cands_to_ignore = np.concatenate((cands_to_ignore, lowest_first_place_votes), axis=None)
-        if len(cands_to_ignore) == num_cands: # removed all of the candidates 
+        state.eliminate(lowest_first_place_votes)
+        if state.num_remaining == 0: # removed all of the candidates 
             winners = sorted(lowest_first_place_votes)
         else:
-            cw = profile.condorcet_winner([c for c in profile.candidates if not isin(cands_to_ignore, c)])
+            cw = state.condorcet_winner()
             if cw is not None: 
                 winners = [cw]
 
@@ -1907,23 +1892,17 @@ def benham_tb(profile, curr_cands = None, tie_breaker = None):
     # the tie_breaker is any linear order (i.e., list) of the candidates
     tb = tie_breaker if tie_breaker is not None else list(range(profile.num_cands))
     
-    # need the total number of all candidates in a profile to check when all candidates have been removed   
-    num_cands = profile.num_cands 
-    
-    candidates = profile.candidates if curr_cands is None else curr_cands
-    cands_to_ignore = np.empty(0) if curr_cands is None else np.array([c for c in profile.candidates if c not in curr_cands])
-
-    rs, rcounts = profile.rankings_counts # get all the ranking data
+    state = _EliminationState(profile, curr_cands = curr_cands)
     
-    cw = profile.condorcet_winner(curr_cands = [c for c in profile.candidates if not isin(cands_to_ignore, c)])
+    cw = state.condorcet_winner()
 
     winners = [cw] if cw is not None else list()
     
     while len(winners) == 0:
-        plurality_scores = {c: _num_rank_first(rs, rcounts, cands_to_ignore, c) for c in candidates if not isin(cands_to_ignore,c)}  
+        plurality_scores = state.plurality_scores()
         min_plurality_score = min(plurality_scores.values())
-        lowest_first_place_votes = np.array([c for c in plurality_scores.keys() 
-                                             if plurality_scores[c] == min_plurality_score])
+        lowest_first_place_votes = [c for c in plurality_scores.keys() 
+                                    if plurality_scores[c] == min_plurality_score]
         
         cand_to_remove = lowest_first_place_votes[0]
         for c in lowest_first_place_votes[1:]: 
@@ -1931,11 +1910,11 @@ def benham_tb(profile, curr_cands = None, tie_breaker = None):
                 cand_to_remove = c
 
         # remove cands with lowest plurality winners
-        cands_to_ignore = np.concatenate((cands_to_ignore, cand_to_remove), axis=None)
-        if len(cands_to_ignore) == num_cands: #all the candidates where removed
+        state.eliminate([cand_to_remove])
+        if state.num_remaining == 0: #all the candidates where removed
             winners = sorted(lowest_first_place_votes)
         else:
-            cw = profile.condorcet_winner(curr_cands = [c for c in profile.candidates if not isin(cands_to_ignore, c)])
+            cw = state.condorcet_winner()
             if cw is not None: 
                 winners = [cw]
     return sorted(winners)
@@ -1957,23 +1936,22 @@ def benham_put(profile, curr_cands = None):
         This will take a long time on profiles with many candidates having the same plurality scores.
 
     """
-    candidates = profile.candidates if curr_cands is None else curr_cands 
 
-    cw = profile.condorcet_winner(candidates)
+    return _PUTSearch("Benham PUT", _benham_put_step).run(_EliminationState(profile, curr_cands = curr_cands))
+
+def _benham_put_step(state):
+    "One step of Benham PUT: the Condorcet winner, if there is one, otherwise the candidates with the fewest first-place votes."
+
+    cw = state.condorcet_winner()
     if cw is not None:
-        return [cw]
+        return [cw], []
     
-    plurality_scores = profile.plurality_scores(candidates)
+    plurality_scores = state.plurality_scores()
     worst_score = min(plurality_scores.values())
 
     cands_to_remove = [cand for cand, value in plurality_scores.items() if value == worst_score]
     
-    winners = []
-    for cand_to_remove in cands_to_remove:
-        new_winners = benham_put(profile, curr_cands = [c for c in candidates if not c == cand_to_remove])
-        winners = winners + new_winners
-    
-    return sorted(set(winners))
+    return None, cands_to_remove
 
 def iterated(vm):
     """Iteratively restrict the set of candidates to the vm winners until reaching a fixpoint.
@@ -2032,11 +2010,9 @@ def tideman_alternative(vm):
     return VotingMethod(_ta, name=f"Tideman Alternative {vm.name}")
 
 tideman_alternative_smith = tideman_alternative(top_cycle)
-tideman_alternative_smith.load_properties()
 tideman_alternative_smith.input_types = [ElectionTypes.PROFILE]
 
 tideman_alternative_gocha = tideman_alternative(gocha)
-tideman_alternative_gocha.load_properties()
 tideman_alternative_gocha.input_types = [ElectionTypes.PROFILE]
 
 def tideman_alternative_put(vm):
@@ -2076,11 +2052,9 @@ def tideman_alternative_put(vm):
 
 
 tideman_alternative_smith_put = tideman_alternative_put(top_cycle)
-tideman_alternative_smith_put.load_properties()
 tideman_alternative_smith_put.input_types = [ElectionTypes.PROFILE]
 
 tideman_alternative_gocha_put = tideman_alternative_put(gocha)
-tideman_alternative_gocha_put.load_properties()
 tideman_alternative_gocha_put.input_types = [ElectionTypes.PROFILE]
 
 
@@ -2108,41 +2082,35 @@ def woodall(profile, curr_cands = None):
            
     """
 
-    # need the total number of all candidates in a profile to check when all candidates have been removed   
-    
     candidates = profile.candidates if curr_cands is None else curr_cands
-    cands_to_ignore = np.empty(0) if curr_cands is None else np.array([c for c in profile.candidates if c not in curr_cands])
 
     s_set = top_cycle(profile, curr_cands=candidates)
 
     if len(s_set) == 1:
         return s_set
     
-    rs, rcounts = profile.rankings_counts # get all the ranking data
+    state = _EliminationState(profile, curr_cands = candidates)
     
     winners = []
 
     while len(winners) == 0:
-        plurality_scores = {c: _num_rank_first(rs, rcounts, cands_to_ignore, c) 
-                            for c in candidates if  not isin(cands_to_ignore,c)}  
+        plurality_scores = state.plurality_scores()
         min_plurality_score = min(plurality_scores.values())
-        lowest_first_place_votes = np.array([c for c in plurality_scores.keys() 
-                                             if  plurality_scores[c] == min_plurality_score])
+        lowest_first_place_votes = [c for c in plurality_scores.keys() 
+                                    if  plurality_scores[c] == min_plurality_score]
 
-        remaining_cands_in_smith_set = [c for c in candidates if not isin(cands_to_ignore,c) and isin(np.array(s_set), c)]
+        remaining_cands_in_smith_set = [c for c in state.remaining_candidates() if c in s_set]
 
         # remove cands with lowest plurality score
-        new_cands_to_ignore = np.concatenate((cands_to_ignore, lowest_first_place_votes), axis=None)
+        state.eliminate(lowest_first_place_votes)
         
-        new_remaining_cands_in_smith_set = [c for c in candidates if not isin(new_cands_to_ignore,c) and isin(np.array(s_set), c)]
+        new_remaining_cands_in_smith_set = [c for c in state.remaining_candidates() if c in s_set]
 
         if len(new_remaining_cands_in_smith_set) == 0: 
             winners = remaining_cands_in_smith_set
         
         if len(new_remaining_cands_in_smith_set) == 1:
             winners = new_remaining_cands_in_smith_set 
-     
-        cands_to_ignore = new_cands_to_ignore
 
     return sorted(winners)
 
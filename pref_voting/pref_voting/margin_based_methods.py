@@ -15,9 +15,13 @@ import math
 from itertools import product, permutations, combinations, chain
 import networkx as nx
 from pref_voting.voting_method_properties import ElectionTypes
-import multiprocessing as mp
-from multiprocessing import Pool
-from functools import partial
+import warnings
+
+def _minimax_batch(margins): 
+    """Vectorized Minimax for an array of margin matrices of shape (num_elections, num_cands, num_cands)."""
+
+    scores = np.maximum(margins.max(axis=1), 0)
+    return scores == scores.min(axis=1, keepdims=True)
 
 @vm(name = "Minimax",
     input_types=[ElectionTypes.PROFILE, ElectionTypes.PROFILE_WITH_TIES, ElectionTypes.MARGIN_GRAPH]
@@ -72,6 +76,8 @@ def minimax(edata, curr_cands = None, strength_function = None):
     return sorted([c for c in candidates if scores[c] == min_score])
 
 
+minimax.set_batch_vm(_minimax_batch)
+
 @vm(name = "Minimax (Support)",
     input_types=[ElectionTypes.PROFILE, ElectionTypes.PROFILE_WITH_TIES]
     )
@@ -237,6 +243,21 @@ def maximal_elements(g):
     return [n for n in g.nodes if g.in_degree(n) == 0]
 
 
+def _majority_strength_matrix(edata, curr_cands = None, strength_function = None): 
+    """Return a numpy array whose entry in row ``i`` and column ``j`` is the strength of the ``i``-th candidate over the ``j``-th candidate (in the order of ``curr_cands``, or of the candidates of ``edata`` if ``curr_cands`` is None) if the former is majority preferred to the latter, and -np.inf otherwise."""
+
+    margins, _ = edata.strength_matrix(curr_cands = curr_cands)
+    strengths = margins if strength_function is None else edata.strength_matrix(curr_cands = curr_cands, strength_function = strength_function)[0]
+    return np.where(margins > 0, strengths, -np.inf)
+
+def _widest_paths(strengths): 
+    """Return the strengths of the strongest paths between any two candidates for a strength matrix, or an array of strength matrices of shape (..., num_cands, num_cands), where a missing edge has strength -np.inf and the diagonal is -np.inf.  This is the Floyd-Warshall algorithm where the updates for each intermediate candidate are done for all pairs (and all the matrices) at once."""
+
+    paths = strengths.copy()
+    for k in range(paths.shape[-1]): 
+        paths = np.maximum(paths, np.minimum(paths[..., :, k, None], paths[..., None, k, :]))
+    return paths
+
 def _beat_path_basic(edata, 
                      curr_cands = None, 
                      strength_function = None): 
@@ -289,27 +310,11 @@ def _beat_path_floyd_warshall(
     """
 
     candidates = edata.candidates if curr_cands is None else curr_cands    
-    strength_function = edata.margin if strength_function is None else strength_function
-        
-    s_matrix = [[-np.inf for _ in candidates] for _ in candidates]
-    for c1_idx, c1 in enumerate(candidates):
-        for c2_idx, c2 in enumerate(candidates):
-            if (edata.majority_prefers(c1, c2) or c1 == c2):
-                s_matrix[c1_idx][c2_idx] = strength_function(c1, c2) 
-    strength = list(map(lambda i : list(map(lambda j : j , i)) , s_matrix))
-    for i_idx, i in enumerate(candidates):         
-        for j_idx, j in enumerate(candidates): 
-            if i!= j:
-                for k_idx, k in enumerate(candidates): 
-                    if i!= k and j != k:
-                        strength[j_idx][k_idx] = max(strength[j_idx][k_idx], min(strength[j_idx][i_idx],strength[i_idx][k_idx]))
-    winners = {i:True for i in candidates}
-    for i_idx, i in enumerate(candidates): 
-        for j_idx, j in enumerate(candidates):
-            if i!=j:
-                if strength[j_idx][i_idx] > strength[i_idx][j_idx]:
-                    winners[i] = False
-    return sorted([c for c in candidates if winners[c]])
+
+    paths = _widest_paths(_majority_strength_matrix(edata, curr_cands = curr_cands, strength_function = strength_function))
+    # i is a winner when no j has a stronger path to i than i has to j
+    is_winner = ~np.any(paths.T > paths, axis=1)
+    return sorted([c for c_idx, c in enumerate(candidates) if is_winner[c_idx]])
 
 def _schwartz_sequential_dropping(edata, curr_cands = None, strength_function = None):
 
@@ -348,6 +353,12 @@ def _schwartz_sequential_dropping(edata, curr_cands = None, strength_function =
         new_mg = MarginGraph(schwartz,[(c,d, strength_function(c,d)) for c in schwartz for d in schwartz if strength_function(c,d) > min_schwartz_strength])
         return _schwartz_sequential_dropping(new_mg, schwartz)
 
+def _beat_path_batch(margins): 
+    """Vectorized Beat Path for an array of margin matrices of shape (num_elections, num_cands, num_cands)."""
+
+    paths = _widest_paths(np.where(margins > 0, margins, -np.inf))
+    return ~np.any(np.swapaxes(paths, 1, 2) > paths, axis=2)
+
 @vm(name="Beat Path",
     input_types=[ElectionTypes.PROFILE, ElectionTypes.PROFILE_WITH_TIES, ElectionTypes.MARGIN_GRAPH])
 def beat_path(
@@ -410,6 +421,8 @@ def beat_path(
     else:
         raise ValueError("Invalid algorithm specified.")
 
+beat_path.set_batch_vm(_beat_path_batch)
+
 def beat_path_defeat(edata, curr_cands = None, strength_function = None):   
     """Returns the defeat relation for Beat Path. 
     
@@ -434,29 +447,18 @@ def beat_path_defeat(edata, curr_cands = None, strength_function = None):
     """
 
     candidates = edata.candidates if curr_cands is None else curr_cands    
+
     strength_function = edata.margin if strength_function is None else strength_function
-        
-    s_matrix = [[-np.inf for _ in candidates] for _ in candidates]
-    for c1_idx, c1 in enumerate(candidates):
-        for c2_idx, c2 in enumerate(candidates):
-            if (edata.majority_prefers(c1, c2) or c1 == c2):
-                s_matrix[c1_idx][c2_idx] = strength_function(c1, c2) 
-    strength = list(map(lambda i : list(map(lambda j : j , i)) , s_matrix))
-    for i_idx, i in enumerate(candidates):         
-        for j_idx, j in enumerate(candidates): 
-            if i!= j:
-                for k_idx, k in enumerate(candidates): 
-                    if i!= k and j != k:
-                        strength[j_idx][k_idx] = max(strength[j_idx][k_idx], min(strength[j_idx][i_idx],strength[i_idx][k_idx]))
+    s_matrix = _majority_strength_matrix(edata, curr_cands = curr_cands, strength_function = strength_function)
+    paths = _widest_paths(s_matrix)
 
     defeat_graph = nx.DiGraph()
     defeat_graph.add_nodes_from(candidates)
     
-    for i_idx, i in enumerate(candidates): 
-        for j_idx, j in enumerate(candidates):
-            if i!=j:
-                if strength[j_idx][i_idx] > strength[i_idx][j_idx]:
-                    defeat_graph.add_weighted_edges_from([(j,i,s_matrix[j_idx][i_idx])])
+    for j_idx, i_idx in zip(*np.nonzero(paths.T < paths)): 
+        j, i = candidates[j_idx], candidates[i_idx]
+        # j may defeat i without being majority preferred to i, in which case the weight is -np.inf
+        defeat_graph.add_weighted_edges_from([(j, i, strength_function(j, i) if s_matrix[j_idx][i_idx] > -np.inf else -np.inf)])
 
     return defeat_graph
 
@@ -480,62 +482,28 @@ def has_strong_path(A, source, target, k):
 
     return dfs(source)
 
+def _split_cycle_defeat_matrix(s_matrix): 
+    """Return the boolean matrix whose entry in row ``i`` and column ``j`` is True when the ``i``-th candidate Split Cycle defeats the ``j``-th candidate, given a strength matrix (or an array of strength matrices of shape (..., num_cands, num_cands)) with -np.inf where there is no majority edge. 
+    
+    The bottleneck of the strongest cycle through each edge is found for all edges at once from the strongest paths: i defeats j when the strength of i over j is greater than the strength of the strongest path from j back to i. 
+    """
+
+    return s_matrix > np.swapaxes(_widest_paths(s_matrix), -1, -2)
+
 def _split_cycle_basic(
         edata, 
         curr_cands = None, 
         strength_function = None):
-    """An implementation of Split Cycle based on the mathematical definition.   
+    """An implementation of Split Cycle based on the mathematical definition: the candidate ``a`` is defeated by ``b`` when the strength of ``b`` over ``a`` is greater than the strength of ``a`` over ``b`` and there is no path from ``a`` to ``b`` (through such edges) whose edges all have strength at least that of ``b`` over ``a``.   
     """
-    strength_matrix, cand_to_cindex = edata.strength_matrix(curr_cands = curr_cands, strength_function=strength_function)
+    strength_matrix, _ = edata.strength_matrix(curr_cands = curr_cands, strength_function=strength_function)
 
     candidates = edata.candidates if curr_cands is None else curr_cands  
 
-    strength_function = edata.margin if strength_function is None else strength_function 
-
-    potential_winners = set(candidates)
-
-    for a in candidates:
-        for b in candidates:
-            if strength_function(b, a) > strength_function(a, b) and not has_strong_path(strength_matrix, cand_to_cindex(a), cand_to_cindex(b), strength_function(b,a)):
-                potential_winners.discard(a)
-                break
+    s_matrix = np.where(strength_matrix > strength_matrix.T, strength_matrix, -np.inf)
+    is_winner = ~np.any(_split_cycle_defeat_matrix(s_matrix), axis=0)
 
-    return sorted(potential_winners)
-
-def _is_cand_split_cycle_defeated(a, strength_matrix):
-
-    for b in range(strength_matrix.shape[0]):
-        if strength_matrix[b][a] > strength_matrix[a][b] and not has_strong_path(strength_matrix, a,  b, strength_matrix[b][a]):
-            return True
-    return False
-
-
-def batch(iterable, n=1):
-    l = len(iterable)
-    for ndx in range(0, l, n):
-        yield iterable[ndx:min(ndx + n, l)]
-
-def process_batch_of_candidates(batch, strength_matrix):
-    results = []
-    for candidate in batch:
-        result = _is_cand_split_cycle_defeated(candidate, strength_matrix)
-        results.append(result)
-    return results
-
-def _split_cycle_basic_parallel(strength_matrix, num_cpus=4):
-
-    num_cands = strength_matrix.shape[0]
-    cands = list(range(num_cands))
-    batch_size = num_cands // num_cpus + (num_cands % num_cpus > 0)
-    candidate_batches = list(batch(cands, batch_size))
-    with Pool(num_cpus) as pool:
-        batch_args = [(batch, strength_matrix) 
-        for batch in candidate_batches]
-        results = pool.starmap(process_batch_of_candidates, batch_args)
-    # Flatten the list of results
-    sc_defeat_data = [item for sublist in results for item in sublist]
-
-    return sorted([c for c in cands if not sc_defeat_data[c]])
+    return sorted([c for c_idx, c in enumerate(candidates) if is_winner[c_idx]])
 
 def _split_cycle_floyd_warshall(
         edata, 
@@ -548,33 +516,15 @@ def _split_cycle_floyd_warshall(
     """
 
     candidates = edata.candidates if curr_cands is None else curr_cands    
-    strength_function = edata.margin if strength_function is None else strength_function 
- 
-    weak_condorcet_winners = {c:True for c in candidates}
-    s_matrix = [[-np.inf for _ in candidates] for _ in candidates]
-    
-    # initialize the s_matrix
-    for c1_idx, c1 in enumerate(candidates):
-        for c2_idx, c2 in enumerate(candidates):
-            if (edata.majority_prefers(c1, c2) or c1 == c2):
-                s_matrix[c1_idx][c2_idx] = strength_function(c1, c2) 
-                weak_condorcet_winners[c2] = weak_condorcet_winners[c2] and (c1 == c2) # Weak Condorcet winners are Split Cycle winners
-    
-    strength = list(map(lambda i : list(map(lambda j : j , i)) , s_matrix))
-    for i_idx, i in enumerate(candidates): 
-        for j_idx, j in enumerate(candidates):
-            if i!= j:
-                if not weak_condorcet_winners[j]: # weak Condorcet winners are Split Cycle winners
-                    for k_idx, k in enumerate(candidates): 
-                        if i != k and j != k:
-                            strength[j_idx][k_idx] = max(strength[j_idx][k_idx], min(strength[j_idx][i_idx],strength[i_idx][k_idx]))
-    winners = {i:True for i in candidates}
-    for i_idx, i in enumerate(candidates):
-        for j_idx, j in enumerate(candidates):
-            if i != j:
-                if s_matrix[j_idx][i_idx] > strength[i_idx][j_idx]: # the main difference with Beat Path
-                    winners[i] = False
-    return sorted([c for c in candidates if winners[c]])
+
+    s_matrix = _majority_strength_matrix(edata, curr_cands = curr_cands, strength_function = strength_function)
+    is_winner = ~np.any(_split_cycle_defeat_matrix(s_matrix), axis=0)
+    return sorted([c for c_idx, c in enumerate(candidates) if is_winner[c_idx]])
+
+def _split_cycle_batch(margins): 
+    """Vectorized Split Cycle for an array of margin matrices of shape (num_elections, num_cands, num_cands)."""
+
+    return ~np.any(_split_cycle_defeat_matrix(np.where(margins > 0, margins, -np.inf)), axis=1)
 
 @vm(name="Split Cycle",
     input_types=[ElectionTypes.PROFILE, ElectionTypes.PROFILE_WITH_TIES, ElectionTypes.MARGIN_GRAPH])
@@ -583,7 +533,7 @@ def split_cycle(
     curr_cands=None, 
     strength_function=None,
     algorithm='basic',
-    num_cpus=4):
+    num_cpus=None):
 
     """A **majority cycle** is a sequence :math:`x_1, \ldots ,x_n` of distinct candidates with :math:`x_1=x_n` such that for :math:`1 \leq k \leq n-1`,  :math:`x_k` is majority preferred to :math:`x_{k+1}`.  The Split Cycle winners are determined as follows:  
     
@@ -597,7 +547,8 @@ def split_cycle(
         edata (Profile, ProfileWithTies, MarginGraph): Any election data that has a `margin` method. 
         curr_cands (List[int], optional): If set, then find the winners for the profile restricted to the candidates in ``curr_cands``
         strength_function (function, optional): The strength function to be used to calculate the strength of a path.   The default is the margin method of ``edata``.   This only matters when the ballots are not linear orders. 
-        algorithm (str): Specify which algorithm to use.  Options are 'basic' (the default) and 'floyd_warshall'.
+        algorithm (str): Specify which algorithm to use.  Options are 'basic' (the default) and 'floyd_warshall'.  Both compute the defeats for all the majority edges in a single pass over the strength matrix; 'basic_parallel' is accepted as an alias of 'basic'.
+        num_cpus (int, optional): Deprecated and ignored, since no algorithm uses multiple processes.
 
     Returns: 
         A sorted list of candidates. 
@@ -632,20 +583,21 @@ def split_cycle(
         split_cycle.display(mg, algorithm='floyd_warshall')
     """
     
+    if num_cpus is not None:
+        warnings.warn("The num_cpus parameter of split_cycle is deprecated and ignored: Split Cycle no longer uses multiple processes.", DeprecationWarning, stacklevel=2)
+
     if algorithm == 'basic':
         return _split_cycle_basic(edata, curr_cands = curr_cands, strength_function = strength_function)
     elif algorithm == 'floyd_warshall':
         return _split_cycle_floyd_warshall(edata, curr_cands = curr_cands, strength_function = strength_function)
-    elif algorithm == 'basic_parallel':
-        curr_cands = edata.candidates if curr_cands is None else curr_cands
-        strength_matrix, cand_to_cindex = edata.strength_matrix(curr_cands = curr_cands, strength_function=strength_function)
-        cindx_to_cand = {cand_to_cindex(c):c for c in curr_cands}
-        sc_ws = _split_cycle_basic_parallel(strength_matrix,num_cpus=num_cpus)
-        return sorted([cindx_to_cand[c] for c in sc_ws])
+    elif algorithm == 'basic_parallel': # kept for backwards compatibility, the basic algorithm no longer needs multiple processes
+        return _split_cycle_basic(edata, curr_cands = curr_cands, strength_function = strength_function)
     else:
         raise ValueError("Invalid algorithm specified.")
 
 
+split_cycle.set_batch_vm(_split_cycle_batch)
+
 def split_cycle_defeat(edata, curr_cands = None, strength_function = None):   
     """
     Returns the Split Cycle defeat relation. 
@@ -672,35 +624,16 @@ def split_cycle_defeat(edata, curr_cands = None, strength_function = None):
     """
 
     candidates = edata.candidates if curr_cands is None else curr_cands    
-    strength_function = edata.margin if strength_function is None else strength_function 
- 
-    weak_condorcet_winners = {c:True for c in candidates}
-    s_matrix = [[-np.inf for _ in candidates] for _ in candidates]
-    
-    # initialize the s_matrix
-    for c1_idx, c1 in enumerate(candidates):
-        for c2_idx, c2 in enumerate(candidates):
-            if (edata.majority_prefers(c1, c2) or c1 == c2):
-                s_matrix[c1_idx][c2_idx] = strength_function(c1, c2) 
-                weak_condorcet_winners[c2] = weak_condorcet_winners[c2] and (c1 == c2) # weak Condorcet winners are Split Cycle winners
-    
-    strength = list(map(lambda i : list(map(lambda j : j , i)) , s_matrix))
-    for i_idx, i in enumerate(candidates): 
-        for j_idx, j in enumerate(candidates):
-            if i!= j:
-                if not weak_condorcet_winners[j]: # weak Condorcet winners are Split Cycle winners
-                    for k_idx, k in enumerate(candidates): 
-                        if i != k and j != k:
-                            strength[j_idx][k_idx] = max(strength[j_idx][k_idx], min(strength[j_idx][i_idx],strength[i_idx][k_idx]))
+
+    strength_function = edata.margin if strength_function is None else strength_function
+    s_matrix = _majority_strength_matrix(edata, curr_cands = curr_cands, strength_function = strength_function)
  
     defeat_graph = nx.DiGraph()
     defeat_graph.add_nodes_from(candidates)
 
-    for i_idx, i in enumerate(candidates):
-        for j_idx, j in enumerate(candidates):
-            if i != j:
-                if s_matrix[j_idx][i_idx] > strength[i_idx][j_idx]: # the main difference with Beat Path
-                    defeat_graph.add_weighted_edges_from([(j,i,s_matrix[j_idx][i_idx])])
+    for j_idx, i_idx in zip(*np.nonzero(_split_cycle_defeat_matrix(s_matrix))):
+        j, i = candidates[j_idx], candidates[i_idx]
+        defeat_graph.add_weighted_edges_from([(j, i, strength_function(j, i))])
                 
     return defeat_graph
 
@@ -845,7 +778,7 @@ def _ranked_pairs_basic(
                 edges = flatten(tb)
                 rp_defeat = SPO(len(candidates))
                 for e0,e1,s in edges: 
-                    if not rp_defeat.P[cand_to_cidx[e1]][cand_to_cidx[e0]]:
+                    if not rp_defeat.holds(cand_to_cidx[e1], cand_to_cidx[e0]):
                         rp_defeat.add(cand_to_cidx[e0],cand_to_cidx[e1])
                 winners.append(cidx_to_cand[rp_defeat.initial_elements()[0]])
         else: 
@@ -853,6 +786,93 @@ def _ranked_pairs_basic(
     return sorted(list(set(winners)))
 
 
+def _ranked_pairs_locked_states(num_cands, sorted_edges, track_edges = False): 
+    """Find all the states that the Ranked Pairs procedure can end in, for any tie-breaking of the edges. 
+
+    Rather than replaying the procedure for every permutation of every group of equally strong edges, the search explores the distinct states reachable within each group, where a state is the transitive closure of the edges locked in so far (and the set of locked edges if ``track_edges`` is True) together with the edges of the group that remain to be processed.  Different orderings of a group that reach the same state are only explored once.
+
+    Args:
+        num_cands (int): The number of candidates. 
+        sorted_edges (List[List[Tuple[int, int]]]): The groups of equally strong edges (pairs of candidate indices), from strongest to weakest. 
+        track_edges (bool, default=False): If True, also record which edges are locked in. 
+
+    Returns: 
+        A list of pairs ``(spo, locked)``, one for each distinct final state, where ``spo`` is the SPO of the locked edges and ``locked`` is the frozenset of locked edges (None if ``track_edges`` is False). 
+
+    """
+    states = {(tuple([0] * num_cands), frozenset() if track_edges else None): SPO(num_cands)}
+    for group in sorted_edges: 
+        next_states = dict()
+        seen = set()
+        to_visit = [(spo, locked, group) for (_, locked), spo in states.items()]
+        while len(to_visit) > 0: 
+            spo, locked, remaining = to_visit.pop()
+            # an edge whose reverse is already locked in is skipped and an edge that is already implied is locked in, no matter when it is processed
+            open_edges = list()
+            for a, b in remaining: 
+                if spo.holds(b, a): 
+                    continue
+                elif spo.holds(a, b): 
+                    if track_edges: 
+                        locked = locked | {(a, b)}
+                else: 
+                    open_edges.append((a, b))
+            spo_key = tuple(spo.succ_masks)
+            state = (spo_key, locked, frozenset(open_edges))
+            if state in seen: 
+                continue
+            seen.add(state)
+            if len(open_edges) == 0: 
+                next_states[(spo_key, locked)] = spo
+            for a, b in open_edges: 
+                new_spo = spo.copy()
+                new_spo.add(a, b)
+                to_visit.append((new_spo, 
+                                 locked | {(a, b)} if track_edges else None, 
+                                 [e for e in open_edges if e != (a, b)]))
+        states = next_states
+    return [(spo, locked) for (_, locked), spo in states.items()]
+
+def _ranked_pairs_edge_groups(edata, candidates, strength_function): 
+    """Return the groups of equally strong majority (or tied) edges, as pairs of candidate indices, from strongest to weakest."""
+    cand_to_cidx = {c: cidx for cidx, c in enumerate(candidates)}  
+    w_edges = [(c1, c2, strength_function(c1, c2)) for c1 in candidates for c2 in candidates 
+               if c1 != c2 and (edata.majority_prefers(c1, c2) or edata.is_tied(c1, c2))]
+    strengths = sorted(list(set([e[2] for e in w_edges])), reverse=True)
+    return [[(cand_to_cidx[e[0]], cand_to_cidx[e[1]]) for e in w_edges if e[2] == s] for s in strengths]
+
+def _ranked_pairs_state_search(
+    edata, 
+    curr_cands = None, 
+    strength_function = None):   
+    """An implementation of Ranked Pairs that searches over the distinct states of the Ranked Pairs procedure rather than over all tie-breaking orderings of the edges (see ``_ranked_pairs_locked_states``). 
+
+    Args:
+        edata (Profile, ProfileWithTies, MarginGraph): Any election data that has a `margin` method. 
+        curr_cands (List[int], optional): If set, then find the winners for the profile restricted to the candidates in ``curr_cands``
+
+    Returns: 
+        A sorted list of candidates. 
+
+    """
+    candidates = edata.candidates if curr_cands is None else curr_cands 
+    strength_function = edata.margin if strength_function is None else strength_function    
+
+    cw = edata.condorcet_winner(curr_cands=curr_cands)
+    # Ranked Pairs is Condorcet consistent, so simply return the Condorcet winner if exists
+    if cw is not None: 
+        return [cw]
+
+    sorted_edges = _ranked_pairs_edge_groups(edata, candidates, strength_function)
+    if len(sorted_edges) == 0: 
+        return sorted(candidates)
+
+    winners = list()
+    for spo, _ in _ranked_pairs_locked_states(len(candidates), sorted_edges): 
+        winners.append(candidates[spo.initial_elements()[0]])
+    return sorted(list(set(winners)))
+
+
 @vm(name="Ranked Pairs",
     input_types=[ElectionTypes.PROFILE, ElectionTypes.PROFILE_WITH_TIES, ElectionTypes.MARGIN_GRAPH])
 def ranked_pairs(
@@ -870,7 +890,7 @@ def ranked_pairs(
         edata (Profile, ProfileWithTies, MarginGraph): Any election data that has a `margin` method. 
         curr_cands (List[int], optional): If set, then find the winners for the profile restricted to the candidates in ``curr_cands``
         strength_function (function, optional): The strength function to be used to calculate the strength of a path.   The default is the margin method of ``edata``.   This only matters when the ballots are not linear orders. 
-        algorithm (str, optional): Specify which algorithm to use.  Options are 'basic' (the default) and 'from_stacks'.
+        algorithm (str, optional): Specify which algorithm to use.  Options are 'basic' (the default), 'from_stacks' and 'state_search'.  The 'state_search' algorithm only explores the distinct states of the procedure, so it is much faster than 'basic' when there are many ties between the strengths of the edges.
 
     Returns: 
         A sorted list of candidates. 
@@ -893,6 +913,7 @@ def ranked_pairs(
         ranked_pairs.display(mg)
         ranked_pairs.display(mg, algorithm='basic') 
         ranked_pairs.display(mg, algorithm='from_stacks')    
+        ranked_pairs.display(mg, algorithm='state_search')    
 
 
     .. exec_code:: 
@@ -906,6 +927,7 @@ def ranked_pairs(
         ranked_pairs.display(mg)
         ranked_pairs.display(mg, algorithm='basic')
         ranked_pairs.display(mg, algorithm='from_stacks')
+        ranked_pairs.display(mg, algorithm='state_search')
 
     """
 
@@ -913,6 +935,8 @@ def ranked_pairs(
         return _ranked_pairs_basic(edata, curr_cands = curr_cands, strength_function = strength_function)
     elif algorithm == 'from_stacks':
         return _ranked_pairs_from_stacks(edata, curr_cands = curr_cands)
+    elif algorithm == 'state_search':
+        return _ranked_pairs_state_search(edata, curr_cands = curr_cands, strength_function = strength_function)
     else:
         raise ValueError("Invalid algorithm specified.")
 
@@ -989,7 +1013,7 @@ def ranked_pairs_with_test(
                 edges = flatten(tb)
                 rp_defeat = SPO(len(candidates))
                 for e0,e1,s in edges: 
-                    if not rp_defeat.P[cand_to_cidx[e1]][cand_to_cidx[e0]]:
+                    if not rp_defeat.holds(cand_to_cidx[e1], cand_to_cidx[e0]):
                         rp_defeat.add(cand_to_cidx[e0],cand_to_cidx[e1])
                 winners.append(cidx_to_cand[rp_defeat.initial_elements()[0]])
     return sorted(list(set(winners)))
@@ -1001,7 +1025,7 @@ def ranked_pairs_defeats(edata, curr_cands = None, strength_function = None, add
     If add_reverse_of_removed_edges is True, we add the reverse of any majority edge that is removed during the Ranked Pairs algorithm. Otherwise, we do not add the reverse of any majority edge that is removed.
 
     .. important::
-        Unlike the other functions that return a single defeat relation, this returns a list of defeat relations. 
+        Unlike the other functions that return a single defeat relation, this returns a list of defeat relations, one for each distinct outcome of the Ranked Pairs algorithm over all tie-breakings of the edges. 
         
     Args:
         edata (Profile, ProfileWithTies, MarginGraph): Any election data that has a `margin` method. 
@@ -1037,21 +1061,15 @@ def ranked_pairs_defeats(edata, curr_cands = None, strength_function = None, add
     candidates = edata.candidates if curr_cands is None else curr_cands    
     strength_function = edata.margin if strength_function is None else strength_function    
 
-    w_edges = [(c1, c2, strength_function(c1, c2)) for c1 in candidates for c2 in candidates if c1 != c2 and (edata.majority_prefers(c1, c2) or edata.is_tied(c1, c2))]         
-    strengths = sorted(list(set([e[2] for e in w_edges])), reverse=True)
-    sorted_edges = [[e for e in w_edges if e[2] == s] for s in strengths]
-    tbs = product(*[permutations(edges) for edges in sorted_edges])
+    sorted_edges = _ranked_pairs_edge_groups(edata, candidates, strength_function)
     rp_defeats = list()
-    for tb in tbs:
-        edges = flatten(tb)
+    for _, locked in sorted(_ranked_pairs_locked_states(len(candidates), sorted_edges, track_edges = True), key = lambda state: sorted(state[1])):
         rp_defeat = nx.DiGraph() 
-        for e in edges: 
-            rp_defeat.add_edge(e[0], e[1])
-            if does_create_cycle(rp_defeat, e):
-                rp_defeat.remove_edge(e[0], e[1])
-                if add_reverse_of_removed_edges:
-                    rp_defeat.add_edge(e[1], e[0])
-
+        for a, b in flatten(sorted_edges): 
+            if (a, b) in locked: 
+                rp_defeat.add_edge(candidates[a], candidates[b])
+            elif add_reverse_of_removed_edges:
+                rp_defeat.add_edge(candidates[b], candidates[a])
         rp_defeats.append(rp_defeat)
     return rp_defeats
 
@@ -1121,7 +1139,7 @@ def ranked_pairs_tb(
             # break ties using the lexicographic ordering on tuples given tb_ranking
             sorted_edges = sorted(edges, key = lambda e: (tb_ranking.index(e[0]), tb_ranking.index(e[1])), reverse=False)
             for e0,e1,s in sorted_edges: 
-                if not rp_defeat.P[cand_to_cidx[e1]][cand_to_cidx[e0]]:
+                if not rp_defeat.holds(cand_to_cidx[e1], cand_to_cidx[e0]):
                     rp_defeat.add(cand_to_cidx[e0],cand_to_cidx[e1])
         winners.append(cidx_to_cand[rp_defeat.initial_elements()[0]])
 
@@ -1208,7 +1226,7 @@ def ranked_pairs_defeat_tb(edata, curr_cands = None, tie_breaker = None, strengt
         # break ties using the lexicographic ordering on tuples given tb_ranking
         sorted_edges = sorted(edges, key = lambda e: (tb_ranking.index(e[0]), tb_ranking.index(e[1])), reverse=False)
         for e0,e1,s in sorted_edges: 
-            if not rp_defeat.P[cand_to_cidx[e1]][cand_to_cidx[e0]]:
+            if not rp_defeat.holds(cand_to_cidx[e1], cand_to_cidx[e0]):
                 rp_defeat.add(cand_to_cidx[e0],cand_to_cidx[e1])
 
     if return_list:
@@ -1264,7 +1282,7 @@ def river(edata, curr_cands = None, strength_function = None):
             edges = flatten(tb)
             rv_defeat = SPO(len(candidates))
             for e0,e1,s in edges: 
-                if not rv_defeat.P[cand_to_cidx[e1]][cand_to_cidx[e0]] and len(rv_defeat.preds[cand_to_cidx[e1]]) == 0:
+                if not rv_defeat.holds(cand_to_cidx[e1], cand_to_cidx[e0]) and rv_defeat.pred_masks[cand_to_cidx[e1]] == 0:
                     rv_defeat.add(cand_to_cidx[e0],cand_to_cidx[e1])
             winners.append(cidx_to_cand[rv_defeat.initial_elements()[0]])
 
@@ -1354,7 +1372,7 @@ def river_with_test(edata, curr_cands = None, strength_function = None):
                 edges = flatten(tb)
                 rv_defeat = SPO(len(candidates))
                 for e0,e1,s in edges: 
-                    if not rv_defeat.P[cand_to_cidx[e1]][cand_to_cidx[e0]] and len(rv_defeat.preds[cand_to_cidx[e1]]) == 0:
+                    if not rv_defeat.holds(cand_to_cidx[e1], cand_to_cidx[e0]) and rv_defeat.pred_masks[cand_to_cidx[e1]] == 0:
                         rv_defeat.add(cand_to_cidx[e0],cand_to_cidx[e1])
                 winners.append(cidx_to_cand[rv_defeat.initial_elements()[0]])
     return sorted(list(set(winners)))
@@ -1399,7 +1417,7 @@ def river_tb(edata, curr_cands = None, tie_breaker = None, strength_function = N
             # break ties using the lexicographic ordering on tuples given tb_ranking
             sorted_edges = sorted(edges, key = lambda e: (tb_ranking.index(e[0]), tb_ranking.index(e[1])), reverse=False)
             for e0,e1,s in sorted_edges: 
-                if not rv_defeat.P[cand_to_cidx[e1]][cand_to_cidx[e0]] and len(rv_defeat.preds[cand_to_cidx[e1]]) == 0:
+                if not rv_defeat.holds(cand_to_cidx[e1], cand_to_cidx[e0]) and rv_defeat.pred_masks[cand_to_cidx[e1]] == 0:
                     rv_defeat.add(cand_to_cidx[e0],cand_to_cidx[e1])
         winners.append(cidx_to_cand[rv_defeat.initial_elements()[0]])
     return sorted(list(set(winners)))
@@ -1735,62 +1753,108 @@ def simple_stable_voting_with_explanation(
         raise ValueError("Invalid algorithm specified.")
 
 # Stable Voting
-def _stable_voting(edata,
-                   curr_cands,
-                   strength_function,
-                   sorted_matches,
-                   mem_sv_winners,
-                   terminate_early,
-                   favor_weak_condorcet_winners):
-    '''
-    Determine the Stable Voting winners for the profile while keeping track of the winners in any subprofiles checked during computation.
+_last_stable_voting_stats = dict()
 
-    If terminate_early is True, then the algorithm will terminate early if there is only one undefeated candidate.
+def stable_voting_stats():
+    """Return statistics about the most recent computation of the Stable Voting winners: the number of sub-elections whose winners were computed (``states_visited``), the number of times the winners of a sub-election were found in the cache (``cache_hits``), and the number of sub-elections whose undefeated candidates were computed (``undefeated_sets_computed``).
 
-    If favor_weak_condorcet_winners is True, then if there are weak Condorcet winners, the algorithm will only consider pairs (A,B) where A is a weak Condorcet winner.
-    '''
+    :Example: 
 
-    sv_winners = list()
+    .. exec_code::
 
-    if len(curr_cands) == 1:
-        mem_sv_winners[tuple(curr_cands)] = curr_cands
-        return curr_cands, mem_sv_winners
-    
-    if favor_weak_condorcet_winners and len(edata.weak_condorcet_winner(curr_cands=curr_cands)) > 0:
-        undefeated_candidates = edata.weak_condorcet_winner(curr_cands=curr_cands)
-    else:
-        undefeated_candidates = split_cycle(edata, curr_cands=curr_cands, strength_function=strength_function)
+        from pref_voting.weighted_majority_graphs import MarginGraph
+        from pref_voting.margin_based_methods import stable_voting, stable_voting_stats
 
-    # Early termination if there is only one undefeated candidate
-    if terminate_early and len(undefeated_candidates) == 1:
-        mem_sv_winners[tuple(undefeated_candidates)] = undefeated_candidates
-        return undefeated_candidates, mem_sv_winners
+        mg = MarginGraph([0, 1, 2, 3], [(0, 2, 3), (1, 0, 5), (2, 1, 5), (2, 3, 1), (3, 0, 3), (3, 1, 1)])
 
-    margin_witnessing_win = -math.inf
+        stable_voting.display(mg, algorithm='basic')
+        print(stable_voting_stats())
 
-    for a, b, s in sorted_matches:
-        if s < margin_witnessing_win:
-            break
-        if a in undefeated_candidates and a not in sv_winners:
-            cands_minus_b = [c for c in curr_cands if c != b]
-            cands_minus_b_key = tuple(sorted(cands_minus_b))
-            if cands_minus_b_key not in mem_sv_winners:
-                ws, mem_sv_winners = _stable_voting(edata,
-                                                    curr_cands=cands_minus_b,
-                                                    strength_function=strength_function,
-                                                    sorted_matches=[(x, y, s) for x, y, s in sorted_matches if x != b and y != b],
-                                                    mem_sv_winners=mem_sv_winners,
-                                                    terminate_early=terminate_early,
-                                                    favor_weak_condorcet_winners=favor_weak_condorcet_winners
-                                                    )
-                mem_sv_winners[cands_minus_b_key] = ws
-            else:
-                ws = mem_sv_winners[cands_minus_b_key]
-            if a in ws:
-                sv_winners.append(a)
-                margin_witnessing_win = s
+    """
+    return dict(_last_stable_voting_stats)
 
-    return sv_winners, mem_sv_winners
+class _StableVotingSearch(object):
+    """
+    A memoized search for the Stable Voting winners.  Sub-elections are identified by the bitmask of the indices of their candidates and their winners are cached, so the undefeated candidates of each sub-election are computed at most once.  The strength matrix and the matches sorted by strength are computed once for the whole election, and each sub-election filters the matches by index.
+
+    Args:
+        edata (Profile, ProfileWithTies, MarginGraph): Any election data that has a `margin` method.
+        candidates (List[int]): The candidates in the election.
+        strength_function (function, optional): The strength function to be used.  The default is the margin method of ``edata``.
+        terminate_early (bool): If True, a sub-election with only one undefeated candidate is won by that candidate.
+        favor_weak_condorcet_winners (bool): If True, then if there are weak Condorcet winners in a sub-election, only they are treated as undefeated.
+
+    """
+    def __init__(self, edata, candidates, strength_function, terminate_early, favor_weak_condorcet_winners): 
+
+        self.candidates = candidates
+        self.terminate_early = terminate_early
+        self.favor_weak_condorcet_winners = favor_weak_condorcet_winners
+        self.margins, _ = edata.strength_matrix(curr_cands = candidates)
+        self.strengths = self.margins if strength_function is None else edata.strength_matrix(curr_cands = candidates, strength_function = strength_function)[0]
+
+        strengths = self.strengths.tolist()
+        matches = [(a, b, strengths[a][b]) for a in range(len(candidates)) for b in range(len(candidates)) if a != b]
+        self.sorted_matches = sorted(matches, reverse=True, key=lambda m: m[2])
+
+        self.winners_cache = dict()
+        self.states_visited = 0
+        self.cache_hits = 0
+        self.undefeated_sets_computed = 0
+
+    def undefeated(self, cands_key): 
+        """Return the set of the indices of the undefeated candidates (according to Split Cycle, or the weak Condorcet winners if favor_weak_condorcet_winners is True and there are any) in the sub-election given by the bitmask ``cands_key``."""
+
+        self.undefeated_sets_computed += 1
+        cidxs = [cidx for cidx in range(len(self.candidates)) if (cands_key >> cidx) & 1]
+        undefeated = list()
+        if self.favor_weak_condorcet_winners: 
+            is_weak_cw = ~np.any(self.margins[np.ix_(cidxs, cidxs)] > 0, axis=0)
+            undefeated = [cidx for cidx, is_wcw in zip(cidxs, is_weak_cw) if is_wcw]
+        if len(undefeated) == 0: 
+            strengths = self.strengths[np.ix_(cidxs, cidxs)]
+            is_undefeated = ~np.any(_split_cycle_defeat_matrix(np.where(strengths > strengths.T, strengths, -np.inf)), axis=0)
+            undefeated = [cidx for cidx, is_u in zip(cidxs, is_undefeated) if is_u]
+
+        return set(undefeated)
+
+    def winners(self, cands_key): 
+        """Return the list of the indices of the Stable Voting winners in the sub-election given by the bitmask ``cands_key``."""
+
+        if cands_key in self.winners_cache: 
+            self.cache_hits += 1
+            return self.winners_cache[cands_key]
+
+        self.states_visited += 1
+        if cands_key & (cands_key - 1) == 0: # only one candidate
+            sv_winners = [cands_key.bit_length() - 1]
+        else: 
+            undefeated = self.undefeated(cands_key)
+            if self.terminate_early and len(undefeated) == 1: 
+                sv_winners = list(undefeated)
+            else: 
+                sv_winners = list()
+                margin_witnessing_win = -math.inf
+                for a, b, s in self.sorted_matches:
+                    if s < margin_witnessing_win:
+                        break
+                    if (cands_key >> a) & 1 and (cands_key >> b) & 1 and a in undefeated and a not in sv_winners: 
+                        if a in self.winners(cands_key & ~(1 << b)): 
+                            sv_winners.append(a)
+                            margin_witnessing_win = s
+
+        self.winners_cache[cands_key] = sv_winners
+        return sv_winners
+
+    def run(self): 
+        """Return the sorted list of Stable Voting winners and record the statistics of the search."""
+
+        winners = self.winners((1 << len(self.candidates)) - 1) if len(self.candidates) > 0 else []
+        _last_stable_voting_stats.clear()
+        _last_stable_voting_stats.update({"states_visited": self.states_visited, 
+                                          "cache_hits": self.cache_hits, 
+                                          "undefeated_sets_computed": self.undefeated_sets_computed})
+        return sorted([self.candidates[cidx] for cidx in winners])
 
 def _stable_voting_with_condorcet_check(
     edata,
@@ -1816,21 +1880,12 @@ def _stable_voting_with_condorcet_check(
         return [cw]
     else:
         curr_cands = edata.candidates if curr_cands is None else curr_cands
-        strength_function = edata.margin if strength_function is None else strength_function
-
-        matches = [(a, b, strength_function(a, b))
-                   for a in curr_cands for b in curr_cands if a != b]
-        sorted_matches = sorted(matches, reverse=True, key=lambda m: m[2])
-
-        winners, _ = _stable_voting(edata,
-                                    curr_cands=curr_cands,
-                                    strength_function=strength_function,
-                                    sorted_matches=sorted_matches,
-                                    mem_sv_winners={},
-                                    terminate_early=terminate_early,
-                                    favor_weak_condorcet_winners=favor_weak_condorcet_winners
-                                    )
-        return sorted(winners)
+
+        return _StableVotingSearch(edata, 
+                                   curr_cands, 
+                                   strength_function, 
+                                   terminate_early = terminate_early, 
+                                   favor_weak_condorcet_winners = favor_weak_condorcet_winners).run()
 
 def _stable_voting_basic(
     edata,
@@ -1851,21 +1906,12 @@ def _stable_voting_basic(
     """
 
     curr_cands = edata.candidates if curr_cands is None else curr_cands
-    strength_function = edata.margin if strength_function is None else strength_function
 
-    matches = [(a, b, strength_function(a, b))
-               for a in curr_cands for b in curr_cands if a != b]
-    sorted_matches = sorted(matches, reverse=True, key=lambda m: m[2])
-
-    winners, _ = _stable_voting(edata,
-                                curr_cands=curr_cands,
-                                strength_function=strength_function,
-                                sorted_matches=sorted_matches,
-                                mem_sv_winners={},
-                                terminate_early=terminate_early,
-                                favor_weak_condorcet_winners=favor_weak_condorcet_winners
-                                )
-    return sorted(winners)
+    return _StableVotingSearch(edata, 
+                               curr_cands, 
+                               strength_function, 
+                               terminate_early = terminate_early, 
+                               favor_weak_condorcet_winners = favor_weak_condorcet_winners).run()
 
 @vm(name="Stable Voting",
     input_types=[ElectionTypes.PROFILE, ElectionTypes.PROFILE_WITH_TIES, ElectionTypes.MARGIN_GRAPH])
@@ -194,7 +194,6 @@ def has_monotonicity_violation(profile, vm, verbose = False, violation_type = "L
         rankings = _rankings
 
     rcounts = list(_rcounts)
-    old_rankings = copy.deepcopy(rankings)
 
     ws = vm(profile)
 
@@ -219,16 +218,7 @@ def has_monotonicity_violation(profile, vm, verbose = False, violation_type = "L
                     for n in range(1, ranks_above_w+1):
 
                         new_ranking = n_rank_lift(r, w, n)
-                        new_rankings = old_rankings + [new_ranking]
-                        new_rcounts  = copy.deepcopy(rcounts + [1])
-                        new_rcounts[r_idx] -= 1
-
-                        if isinstance(profile, Profile):
-                            new_prof = Profile(new_rankings, new_rcounts)
-                        if isinstance(profile, ProfileWithTies):
-                            new_prof = ProfileWithTies(new_rankings, new_rcounts)
-                            if profile.using_extended_strict_preference:
-                                new_prof.use_extended_strict_preference()
+                        new_prof = profile.apply_delta(ProfileDelta().replace(rankings[r_idx], new_ranking))
 
                         new_ws = vm(new_prof)
                         
@@ -290,16 +280,7 @@ def has_monotonicity_violation(profile, vm, verbose = False, violation_type = "L
                         for n in range(1, ranks_below_l+1):
                             
                             new_ranking = n_rank_drop(r, l, n)
-                            new_rankings = old_rankings + [new_ranking]
-                            new_rcounts  = copy.deepcopy(rcounts + [1])
-                            new_rcounts[r_idx] -= 1
-
-                            if isinstance(profile, Profile):
-                                new_prof = Profile(new_rankings, new_rcounts)
-                            if isinstance(profile, ProfileWithTies):
-                                new_prof = ProfileWithTies(new_rankings, new_rcounts)
-                                if profile.using_extended_strict_preference:
-                                    new_prof.use_extended_strict_preference()
+                            new_prof = profile.apply_delta(ProfileDelta().replace(rankings[r_idx], new_ranking))
 
                             new_ws = vm(new_prof)
 
@@ -339,16 +320,7 @@ def has_monotonicity_violation(profile, vm, verbose = False, violation_type = "L
                             ranks_below_l = ranks_below(r, l)
 
                         new_ranking = one_rank_drop(r, l)
-                        new_rankings = old_rankings + [new_ranking]
-                        new_rcounts  = copy.deepcopy(rcounts + [1])
-                        new_rcounts[r_idx] -= 1
-
-                        if isinstance(profile, Profile):
-                            new_prof = Profile(new_rankings, new_rcounts)
-                        if isinstance(profile, ProfileWithTies):
-                            new_prof = ProfileWithTies(new_rankings, new_rcounts)
-                            if profile.using_extended_strict_preference:
-                                new_prof.use_extended_strict_preference()
+                        new_prof = profile.apply_delta(ProfileDelta().replace(rankings[r_idx], new_ranking))
 
                         new_ws = vm(new_prof)
                         if l in new_ws and len(new_ws) < len(ws): 
@@ -403,7 +375,6 @@ def find_all_monotonicity_violations(profile, vm, verbose = False, violation_typ
         rankings = _rankings
 
     rcounts = list(_rcounts)
-    old_rankings = copy.deepcopy(rankings)
 
     ws = vm(profile)
     witnesses = list()
@@ -428,16 +399,7 @@ def find_all_monotonicity_violations(profile, vm, verbose = False, violation_typ
 
                     for n in range(1, ranks_above_w+1):
                         new_ranking = n_rank_lift(r, w, n)
-                        new_rankings = old_rankings + [new_ranking]
-                        new_rcounts  = copy.deepcopy(rcounts + [1])
-                        new_rcounts[r_idx] -= 1
-
-                        if isinstance(profile, Profile):
-                            new_prof = Profile(new_rankings, new_rcounts)
-                        if isinstance(profile, ProfileWithTies):
-                            new_prof = ProfileWithTies(new_rankings, new_rcounts)
-                            if profile.using_extended_strict_preference:
-                                new_prof.use_extended_strict_preference()
+                        new_prof = profile.apply_delta(ProfileDelta().replace(rankings[r_idx], new_ranking))
 
                         new_ws = vm(new_prof)
 
@@ -500,16 +462,7 @@ def find_all_monotonicity_violations(profile, vm, verbose = False, violation_typ
 
                         for n in range(1, ranks_below_l+1):
                             new_ranking = n_rank_drop(r, l, n)
-                            new_rankings = old_rankings + [new_ranking]
-                            new_rcounts  = copy.deepcopy(rcounts + [1])
-                            new_rcounts[r_idx] -= 1
-
-                            if isinstance(profile, Profile):
-                                new_prof = Profile(new_rankings, new_rcounts)
-                            if isinstance(profile, ProfileWithTies):
-                                new_prof = ProfileWithTies(new_rankings, new_rcounts)
-                                if profile.using_extended_strict_preference:
-                                    new_prof.use_extended_strict_preference()
+                            new_prof = profile.apply_delta(ProfileDelta().replace(rankings[r_idx], new_ranking))
 
                             new_ws = vm(new_prof)
 
@@ -551,16 +504,7 @@ def find_all_monotonicity_violations(profile, vm, verbose = False, violation_typ
 
                         for n in range(1, ranks_below_l+1):
                             new_ranking = n_rank_drop(r, l, n)
-                            new_rankings = old_rankings + [new_ranking]
-                            new_rcounts  = copy.deepcopy(rcounts + [1])
-                            new_rcounts[r_idx] -= 1
-
-                            if isinstance(profile, Profile):
-                                new_prof = Profile(new_rankings, new_rcounts)
-                            if isinstance(profile, ProfileWithTies):
-                                new_prof = ProfileWithTies(new_rankings, new_rcounts)
-                                if profile.using_extended_strict_preference:
-                                    new_prof.use_extended_strict_preference()
+                            new_prof = profile.apply_delta(ProfileDelta().replace(rankings[r_idx], new_ranking))
 
                             new_ws = vm(new_prof)
 
@@ -622,7 +566,6 @@ def has_positive_responsiveness_violation(profile, vm, verbose = False, violatio
         rankings = _rankings
 
     rcounts = list(_rcounts)
-    old_rankings = copy.deepcopy(rankings)
 
     ws = vm(profile)
 
@@ -647,16 +590,7 @@ def has_positive_responsiveness_violation(profile, vm, verbose = False, violatio
                     for n in range(1, ranks_above_w+1):
 
                         new_ranking = n_rank_lift(r, w, n)
-                        new_rankings = old_rankings + [new_ranking]
-                        new_rcounts  = copy.deepcopy(rcounts + [1])
-                        new_rcounts[r_idx] -= 1
-
-                        if isinstance(profile, Profile):
-                            new_prof = Profile(new_rankings, new_rcounts)
-                        if isinstance(profile, ProfileWithTies):
-                            new_prof = ProfileWithTies(new_rankings, new_rcounts)
-                            if profile.using_extended_strict_preference:
-                                new_prof.use_extended_strict_preference()
+                        new_prof = profile.apply_delta(ProfileDelta().replace(rankings[r_idx], new_ranking))
 
                         new_ws = vm(new_prof)
                         
@@ -700,16 +634,7 @@ def has_positive_responsiveness_violation(profile, vm, verbose = False, violatio
                         for n in range(1, ranks_below_l+1):
                             
                             new_ranking = n_rank_drop(r, l, n)
-                            new_rankings = old_rankings + [new_ranking]
-                            new_rcounts  = copy.deepcopy(rcounts + [1])
-                            new_rcounts[r_idx] -= 1
-
-                            if isinstance(profile, Profile):
-                                new_prof = Profile(new_rankings, new_rcounts)
-                            if isinstance(profile, ProfileWithTies):
-                                new_prof = ProfileWithTies(new_rankings, new_rcounts)
-                                if profile.using_extended_strict_preference:
-                                    new_prof.use_extended_strict_preference()
+                            new_prof = profile.apply_delta(ProfileDelta().replace(rankings[r_idx], new_ranking))
 
                             new_ws = vm(new_prof)
 
@@ -764,7 +689,6 @@ def find_all_positive_responsiveness_violations(profile, vm, verbose = False, vi
         rankings = _rankings
 
     rcounts = list(_rcounts)
-    old_rankings = copy.deepcopy(rankings)
 
     witnesses = list()
     ws = vm(profile)
@@ -789,16 +713,7 @@ def find_all_positive_responsiveness_violations(profile, vm, verbose = False, vi
 
                     for n in range(1, ranks_above_w+1):
                         new_ranking = n_rank_lift(r, w, n)
-                        new_rankings = old_rankings + [new_ranking]
-                        new_rcounts  = copy.deepcopy(rcounts + [1])
-                        new_rcounts[r_idx] -= 1
-
-                        if isinstance(profile, Profile):
-                            new_prof = Profile(new_rankings, new_rcounts)
-                        if isinstance(profile, ProfileWithTies):
-                            new_prof = ProfileWithTies(new_rankings, new_rcounts)
-                            if profile.using_extended_strict_preference:
-                                new_prof.use_extended_strict_preference()
+                        new_prof = profile.apply_delta(ProfileDelta().replace(rankings[r_idx], new_ranking))
 
                         new_ws = vm(new_prof)
 
@@ -843,16 +758,7 @@ def find_all_positive_responsiveness_violations(profile, vm, verbose = False, vi
 
                         for n in range(1, ranks_below_l+1):
                             new_ranking = n_rank_drop(r, l, n)
-                            new_rankings = old_rankings + [new_ranking]
-                            new_rcounts  = copy.deepcopy(rcounts + [1])
-                            new_rcounts[r_idx] -= 1
-
-                            if isinstance(profile, Profile):    
-                                new_prof = Profile(new_rankings, new_rcounts)
-                            if isinstance(profile, ProfileWithTies):
-                                new_prof = ProfileWithTies(new_rankings, new_rcounts)
-                                if profile.using_extended_strict_preference:
-                                    new_prof.use_extended_strict_preference()
+                            new_prof = profile.apply_delta(ProfileDelta().replace(rankings[r_idx], new_ranking))
 
                             new_ws = vm(new_prof)
 
@@ -946,7 +852,6 @@ def has_weak_positive_responsiveness_violation(profile, vm, verbose = False, vio
         rankings = _rankings
 
     rcounts = list(_rcounts)
-    old_rankings = copy.deepcopy(rankings)
 
     ws = vm(profile)
 
@@ -963,17 +868,7 @@ def has_weak_positive_responsiveness_violation(profile, vm, verbose = False, vio
                 if r[-1] == w and not r[0] == w:
                     old_ranking = copy.deepcopy(r)
                     new_ranking = lift_to_first(r, w)
-                    new_rankings = old_rankings + [new_ranking]
-                    new_rcounts  = copy.deepcopy(rcounts + [1])
-                    new_rcounts[r_idx] -= 1
-
-                    if isinstance(profile, Profile):
-                        new_prof = Profile(new_rankings, new_rcounts)
-                    
-                    if isinstance(profile, ProfileWithTies):
-                        new_prof = ProfileWithTies(new_rankings, new_rcounts)
-                        if profile.using_extended_strict_preference:
-                            new_prof.use_extended_strict_preference()
+                    new_prof = profile.apply_delta(ProfileDelta().replace(rankings[r_idx], new_ranking))
 
                     new_ws = vm(new_prof)
 
@@ -1006,16 +901,7 @@ def has_weak_positive_responsiveness_violation(profile, vm, verbose = False, vio
                     if r[0] == l and not r[-1] == l:
                         old_ranking = copy.deepcopy(r)
                         new_ranking = drop_to_last(r, l)
-                        new_rankings = old_rankings + [new_ranking]
-                        new_rcounts  = copy.deepcopy(rcounts + [1])
-                        new_rcounts[r_idx] -= 1
-
-                        if isinstance(profile, Profile):
-                            new_prof = Profile(new_rankings, new_rcounts)
-                        if isinstance(profile, ProfileWithTies):
-                            new_prof = ProfileWithTies(new_rankings, new_rcounts)
-                            if profile.using_extended_strict_preference:
-                                new_prof.use_extended_strict_preference()
+                        new_prof = profile.apply_delta(ProfileDelta().replace(rankings[r_idx], new_ranking))
 
                         new_ws = vm(new_prof)
 
@@ -1062,7 +948,6 @@ def find_all_weak_positive_responsiveness_violations(profile, vm, verbose = Fals
         rankings = _rankings
 
     rcounts = list(_rcounts)
-    old_rankings = copy.deepcopy(rankings)
 
     ws = vm(profile)
     witnesses = list()
@@ -1080,16 +965,7 @@ def find_all_weak_positive_responsiveness_violations(profile, vm, verbose = Fals
                 if r[-1] == w and not r[0] == w:
                     old_ranking = copy.deepcopy(r)
                     new_ranking = lift_to_first(r, w)
-                    new_rankings = old_rankings + [new_ranking]
-                    new_rcounts  = copy.deepcopy(rcounts + [1])
-                    new_rcounts[r_idx] -= 1
-
-                    if isinstance(profile, Profile):
-                        new_prof = Profile(new_rankings, new_rcounts)
-                    if isinstance(profile, ProfileWithTies):
-                        new_prof = ProfileWithTies(new_rankings, new_rcounts)
-                        if profile.using_extended_strict_preference:
-                            new_prof.use_extended_strict_preference()
+                    new_prof = profile.apply_delta(ProfileDelta().replace(rankings[r_idx], new_ranking))
 
                     new_ws = vm(new_prof)
 
@@ -1122,17 +998,7 @@ def find_all_weak_positive_responsiveness_violations(profile, vm, verbose = Fals
                     if r[0] == l and not r[-1] == l:
                         old_ranking = copy.deepcopy(r)
                         new_ranking = drop_to_last(r, l)
-                        new_rankings = old_rankings + [new_ranking]
-                        new_rcounts  = copy.deepcopy(rcounts + [1])
-                        new_rcounts[r_idx] -= 1
-
-                        if isinstance(profile, Profile):
-                            new_prof = Profile(new_rankings, new_rcounts)
-
-                        if isinstance(profile, ProfileWithTies):
-                            new_prof = ProfileWithTies(new_rankings, new_rcounts)
-                            if profile.using_extended_strict_preference:
-                                new_prof.use_extended_strict_preference()
+                        new_prof = profile.apply_delta(ProfileDelta().replace(rankings[r_idx], new_ranking))
 
                         new_ws = vm(new_prof)
 
@@ -133,6 +133,122 @@ def kendalltau_dist_for_rankings_with_ties(
     return tau
 
 
+def _kemeny_young_weights(weights):
+    """Convert the matrix of weights to an integer array if all weights are integers (otherwise to a float array) and return it together with the tolerance used when comparing costs of rankings."""
+
+    weights = np.array(weights, dtype=np.float64)
+    if np.all(np.mod(weights, 1) == 0):
+        return weights.astype(np.int64), 0
+    return weights, 1e-9 * (np.abs(weights).sum() + 1)
+
+# The largest number of candidates for which the dynamic program over subsets of candidates is used.  The dynamic program 
+# stores O(2^m * m) costs (about 170MB for 20 candidates), so for more candidates the branch and bound search is used instead.
+_SUBSET_DP_MAX_CANDS = 20
+
+def _kemeny_young_subset_costs(weights): 
+    """Dynamic program over subsets of candidates for Kemeny-Young rankings, where ``weights[c][d]`` is the cost of ranking ``c`` below ``d``.  The candidates are the indices of ``weights``.
+
+    Returns ``costs`` and ``cand_costs``, arrays indexed by subsets of candidates (represented as bitmasks): ``costs[S]`` is the minimal cost of a ranking of the candidates in ``S`` and ``cand_costs[c][S]`` is the cost of ranking ``c`` below all the candidates in ``S``.  The running time is O(2^m * m^2) and the memory is O(2^m * m), where m is the number of candidates. 
+    """
+    num_cands = len(weights)
+    num_subsets = 1 << num_cands
+    dtype = weights.dtype
+    max_cost = np.iinfo(np.int64).max // 2 if np.issubdtype(dtype, np.integer) else np.inf
+
+    cand_costs = np.zeros((num_cands, num_subsets), dtype=dtype)
+    subset_sizes = np.zeros(num_subsets, dtype=np.int64)
+    for c in range(num_cands): 
+        cand_costs[:, 1 << c:1 << (c + 1)] = cand_costs[:, :1 << c] + weights[:, c][:, np.newaxis]
+        subset_sizes[1 << c:1 << (c + 1)] = subset_sizes[:1 << c] + 1
+
+    # process the subsets in order of size, so that the cost of every subset of S is known before S is processed
+    subsets_by_size = np.argsort(subset_sizes, kind='stable')
+    size_boundaries = np.cumsum(np.bincount(subset_sizes, minlength=num_cands + 1))
+
+    costs = np.full(num_subsets, max_cost, dtype=dtype)
+    costs[0] = 0
+    for size in range(1, num_cands + 1): 
+        subsets = subsets_by_size[size_boundaries[size - 1]:size_boundaries[size]]
+        best_costs = np.full(len(subsets), max_cost, dtype=dtype)
+        for c in range(num_cands): 
+            contains_c = (subsets >> c) & 1 == 1
+            # rank c last among the candidates in the subset
+            subsets_without_c = subsets[contains_c] ^ (1 << c)
+            best_costs[contains_c] = np.minimum(best_costs[contains_c], costs[subsets_without_c] + cand_costs[c, subsets_without_c])
+        costs[subsets] = best_costs
+
+    return costs, cand_costs
+
+def _kemeny_young_dp_rankings(weights, tolerance = 0): 
+    """Returns all the rankings (tuples of indices of ``weights``) with minimal cost and the minimal cost, using the dynamic program over subsets of candidates.  If there are more than ``_SUBSET_DP_MAX_CANDS`` candidates, the branch and bound search is used instead.
+    """
+    num_cands = len(weights)
+    if num_cands > _SUBSET_DP_MAX_CANDS:
+        return _kemeny_young_branch_and_bound_rankings(weights, tolerance = tolerance)
+    costs, cand_costs = _kemeny_young_subset_costs(weights)
+
+    rankings = list()
+    def extend_ranking(subset, lower_ranking):
+        if subset == 0:
+            rankings.append(lower_ranking)
+            return
+        for c in range(num_cands):
+            if (subset >> c) & 1 and abs(costs[subset ^ (1 << c)] + cand_costs[c, subset ^ (1 << c)] - costs[subset]) <= tolerance:
+                extend_ranking(subset ^ (1 << c), (c,) + lower_ranking)
+
+    extend_ranking((1 << num_cands) - 1, tuple())
+    return sorted(rankings), costs[-1]
+
+def _kemeny_young_dp_winners(weights, tolerance = 0): 
+    """Returns the indices of ``weights`` that are ranked first in some ranking with minimal cost, using the dynamic program over subsets of candidates.  
+    
+    A candidate ``c`` is ranked first in a ranking with minimal cost when the cost of ranking ``c`` above all other candidates plus the minimal cost of a ranking of the other candidates is the minimal cost.  If there are more than ``_SUBSET_DP_MAX_CANDS`` candidates, the branch and bound search is used instead.
+    """
+    num_cands = len(weights)
+    if num_cands > _SUBSET_DP_MAX_CANDS:
+        rankings, _ = _kemeny_young_branch_and_bound_rankings(weights, tolerance = tolerance)
+        return sorted(set(r[0] for r in rankings))
+    costs, _ = _kemeny_young_subset_costs(weights)
+    all_cands = (1 << num_cands) - 1
+    return [c for c in range(num_cands) 
+            if abs(weights[:, c].sum() - weights[c, c] + costs[all_cands ^ (1 << c)] - costs[all_cands]) <= tolerance]
+
+def _kemeny_young_branch_and_bound_rankings(weights, tolerance = 0): 
+    """Returns all the rankings (tuples of indices of ``weights``) with minimal cost and the minimal cost, using a depth-first branch and bound search that builds rankings from the top.  This uses memory linear in the number of candidates, so it can be used when there are too many candidates for the dynamic program over subsets. 
+
+    A partial ranking is pruned when its cost plus a lower bound for ranking the remaining candidates (for each pair of remaining candidates, the smaller of the two costs of ranking one below the other) exceeds the best cost found so far, or when swapping the last two candidates of the partial ranking decreases the cost (no ranking with minimal cost ranks an adjacent pair in that order). 
+    """
+    num_cands = len(weights)
+    min_weights = np.minimum(weights, weights.T)
+    np.fill_diagonal(min_weights, 0)
+
+    # rank first the candidates that are cheapest to rank above the other candidates to find rankings with small costs early
+    cands_by_cost = [int(c) for c in np.argsort(weights.sum(axis=0) - weights.sum(axis=1), kind='stable')]
+    initial_cost = sum(weights[cands_by_cost[j], cands_by_cost[i]] for i in range(num_cands) for j in range(i + 1, num_cands))
+
+    best = {"cost": initial_cost, "rankings": list()}
+
+    def search(ranking, remaining, cost, lower_bound):
+        if len(remaining) == 0:
+            if cost < best["cost"] - tolerance:
+                best["cost"] = cost
+                best["rankings"] = [tuple(ranking)]
+            elif cost <= best["cost"] + tolerance:
+                best["rankings"].append(tuple(ranking))
+            return
+        for c in remaining:
+            if len(ranking) > 0 and weights[c, ranking[-1]] > weights[ranking[-1], c] + tolerance:
+                continue
+            new_remaining = [d for d in remaining if d != c]
+            new_cost = cost + weights[new_remaining, c].sum()
+            new_lower_bound = lower_bound - min_weights[c, new_remaining].sum()
+            if new_cost + new_lower_bound > best["cost"] + tolerance:
+                continue
+            search(ranking + [c], new_remaining, new_cost, new_lower_bound)
+
+    search([], cands_by_cost, 0, min_weights.sum() / 2)
+    return sorted(best["rankings"]), best["cost"]
+
 def _kemeny_young_rankings(rankings, rcounts, candidates): 
     
     rankings_dist = dict()
@@ -145,13 +261,14 @@ def _kemeny_young_rankings(rankings, rcounts, candidates):
     
     return lin_orders, min_dist
 
-def kemeny_young_rankings(profile, curr_cands = None): 
+def kemeny_young_rankings(profile, curr_cands = None, algorithm = "dynamic_programming"): 
     """
     A Kemeny-Young ranking is a ranking that minimizes the sum of the Kendall tau distances to the voters' rankings.  
     
     Args:
         profile (Profile): An anonymous profile of linear orders on a set of candidates
         curr_cands (List[int], optional): If set, then find the winners for the profile restricted to the candidates in ``curr_cands``
+        algorithm (str, optional): The algorithm to use.  Options are "dynamic_programming", "branch_and_bound" and "Kendall tau".  The "dynamic_programming" algorithm (the default) runs a dynamic program over subsets of the candidates on the pairwise supports, which takes time O(2^m * m^2) and memory O(2^m * m) for m candidates (for more than 20 candidates, the "branch_and_bound" algorithm is used instead).  The "branch_and_bound" algorithm searches the rankings with pruning using memory linear in m, so it can be used for larger numbers of candidates.  The "Kendall tau" algorithm sums the Kendall tau distances to the voters' rankings for every ranking of the candidates.
 
     Returns: 
         rankings: A list of Kemeny-Young rankings.
@@ -180,21 +297,35 @@ def kemeny_young_rankings(profile, curr_cands = None):
                 print(f"ranking: {kyr}")
 
     """
+    if algorithm not in ["dynamic_programming", "branch_and_bound", "Kendall tau"]:
+        raise ValueError("Invalid algorithm specified.")
+
     candidates = profile.candidates if curr_cands is None else curr_cands
-    
-    rankings = profile._rankings if curr_cands is None else _find_updated_profile(profile._rankings, np.array([c for c in profile.candidates if c not in curr_cands]),  profile.num_cands)
-    return _kemeny_young_rankings(list(rankings), list(profile._rcounts), candidates)
+
+    if algorithm == "Kendall tau":
+        rankings = profile._rankings if curr_cands is None else _find_updated_profile(profile._rankings, np.array([c for c in profile.candidates if c not in curr_cands]),  profile.num_cands)
+        return _kemeny_young_rankings(list(rankings), list(profile._rcounts), candidates)
+
+    # the Kendall tau distance of a ranking to the profile is the sum over the pairs of candidates of the number of voters that rank the lower candidate above the higher candidate
+    weights, tolerance = _kemeny_young_weights([[profile.support(c1, c2) for c2 in candidates] for c1 in candidates])
+
+    if algorithm == "dynamic_programming":
+        ky_rankings, min_dist = _kemeny_young_dp_rankings(weights, tolerance = tolerance)
+    elif algorithm == "branch_and_bound":
+        ky_rankings, min_dist = _kemeny_young_branch_and_bound_rankings(weights, tolerance = tolerance)
+
+    return [tuple(candidates[cidx] for cidx in r) for r in ky_rankings], int(min_dist) if tolerance == 0 else float(min_dist)
 
 
 @vm(name = "Kemeny-Young",
     input_types = [ElectionTypes.PROFILE,ElectionTypes.PROFILE_WITH_TIES,  ElectionTypes.MARGIN_GRAPH])
-def kemeny_young(edata, curr_cands = None, algorithm = "marginal"): 
+def kemeny_young(edata, curr_cands = None, algorithm = "dynamic_programming"): 
     """A Kemeny-Young ranking is a ranking that maximizes the sum of the margins of pairs of candidates in the ranking. Equivalently, a Kemeny-Young ranking is a ranking that minimizes the sum of the Kendall tau distances to the voters' rankings. The Kemeny-Young winners are the candidates that are ranked first by some Kemeny-Young ranking.
 
     Args:
         edata (Profile, ProfileWithTies, MarginGraph): Any election data that has a `margin` method.
         curr_cands (List[int], optional): If set, then find the winners for the profile restricted to the candidates in ``curr_cands``
-        algorithm (str, optional): The algorithm to use.  Options are "marginal" and "Kendall tau". If "marginal" is used, then the Kemeny-Young rankings are computed by finding the sum of the margins of each pair of candidates in the ranking.  If "Kendall tau" is used, then the Kemeny-Young rankings are computed by summing the Kendall tau distances to the voters' rankings.  Default is "marginal".
+        algorithm (str, optional): The algorithm to use.  Options are "dynamic_programming", "branch_and_bound", "marginal" and "Kendall tau". If "dynamic_programming" is used (the default), then the Kemeny-Young rankings are computed with a dynamic program over subsets of the candidates on the margins, which takes time O(2^m * m^2) and memory O(2^m * m) for m candidates (for more than 20 candidates, "branch_and_bound" is used instead).  If "branch_and_bound" is used, then the Kemeny-Young rankings are found by searching the rankings with pruning using memory linear in m.  If "marginal" is used, then the Kemeny-Young rankings are computed by finding the sum of the margins of each pair of candidates in every ranking.  If "Kendall tau" is used, then the Kemeny-Young rankings are computed by summing the Kendall tau distances to the voters' rankings for every ranking.
 
     Returns: 
         A sorted list of candidates
@@ -223,10 +354,20 @@ def kemeny_young(edata, curr_cands = None, algorithm = "marginal"):
             kemeny_young.display(prof2)
 
     """
-    assert algorithm in ["marginal", "Kendall tau"], "Algorithm must be either 'marginal' or 'Kendall tau'."
+    assert algorithm in ["dynamic_programming", "branch_and_bound", "marginal", "Kendall tau"], "Algorithm must be one of 'dynamic_programming', 'branch_and_bound', 'marginal' or 'Kendall tau'."
 
     candidates = edata.candidates if curr_cands is None else curr_cands
 
+    if algorithm in ["dynamic_programming", "branch_and_bound"]:
+        # ranking c below d costs the margin of c over d, so the rankings with minimal cost maximize the sum of the margins
+        weights, tolerance = _kemeny_young_weights([[edata.margin(c1, c2) for c2 in candidates] for c1 in candidates])
+
+        if algorithm == "dynamic_programming":
+            return sorted([candidates[cidx] for cidx in _kemeny_young_dp_winners(weights, tolerance = tolerance)])
+        
+        ky_rankings, _ = _kemeny_young_branch_and_bound_rankings(weights, tolerance = tolerance)
+        return sorted(list(set([candidates[r[0]] for r in ky_rankings])))
+
     if isinstance(edata, MarginGraph) or isinstance(edata,ProfileWithTies):
         algorithm = "marginal"
 
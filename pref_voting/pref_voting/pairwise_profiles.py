@@ -161,6 +161,14 @@ class PairwiseBallot:
         """
         self.add_comparison({c1, c2}, {c1})
 
+    def _revealed_preferences(self):
+        """Return the pairs of candidates ``(c1, c2)`` such that ``c1`` is strictly preferred to ``c2`` and the pairs such that ``c1`` and ``c2`` are indifferent (each indifferent pair is listed in both orders)."""
+
+        weak_prefs = {(c1, c2) for menu, choice in self._comparisons for c1 in choice for c2 in menu if c1 != c2}
+        strict_prefs = [(c1, c2) for c1, c2 in weak_prefs if (c2, c1) not in weak_prefs]
+        indiffs = [(c1, c2) for c1, c2 in weak_prefs if (c2, c1) in weak_prefs]
+        return strict_prefs, indiffs
+
     def is_transitive(self, cands): 
         """Return True of the comparisons is transitive on the set cands of candidates"""
 
@@ -329,23 +337,97 @@ class PairwiseProfile:
         
         self._rcounts = rcounts if rcounts is not None else [1] * len(pairwise_comparisons)
 
-        self._tally = np.array([[np.sum([count for pc, count in zip(self._pairwise_comparisons, self._rcounts) if pc.strict_pref(c1, c2)]) for c2 in self.candidates] for c1 in self.candidates])
+        # the comparisons are stored as (winner, loser, count) triples and (candidate, candidate, count) indifference triples  
+        # with the candidates given by their indices
+        comparisons, indiffs = list(), list()
+        for pc, count in zip(self._pairwise_comparisons, self._rcounts):
+            strict_prefs, pc_indiffs = pc._revealed_preferences()
+            comparisons += [(self.cand_to_cidx[c1], self.cand_to_cidx[c2], count) 
+                            for c1, c2 in strict_prefs if c1 in self.cand_to_cidx and c2 in self.cand_to_cidx]
+            indiffs += [(self.cand_to_cidx[c1], self.cand_to_cidx[c2], count) 
+                        for c1, c2 in pc_indiffs if c1 in self.cand_to_cidx and c2 in self.cand_to_cidx and self.cand_to_cidx[c1] < self.cand_to_cidx[c2]]
+        self._set_comparisons(comparisons, indiffs)
         
         self.cmap = cmap if cmap is not None else {c: str(c) for c in self.candidates}
                 
         self.num_voters = np.sum(self._rcounts)
         """The number of voters in the election."""
 
+    @classmethod
+    def from_comparisons(cls, comparisons, counts=None, ties=None, candidates=None, cmap=None):
+        """
+        Returns a profile in which each voter makes a single pairwise comparison.  This is much faster than creating a :class:`PairwiseBallot` for each comparison when there are many comparisons.
+
+        Args:
+            comparisons (list or numpy array): List of pairs ``(c1, c2)`` where ``c1`` is chosen over ``c2``.
+            counts (list, optional): The number of voters making each comparison.  Defaults to 1 for each comparison.
+            ties (list, optional): List of booleans where ``ties[i]`` is True if the voters making the ``i``-th comparison are indifferent between the two candidates.  Defaults to no ties.
+            candidates (list or set, optional): List of candidates.  Defaults to the candidates in the comparisons.
+            cmap (dict, optional): Mapping of candidates to their names. Defaults to None.
+        """
+        comparisons = np.asarray(comparisons)
+        if comparisons.ndim != 2 or comparisons.shape[1] != 2:
+            raise ValueError("Each comparison should be a pair of candidates.")
+        if np.any(comparisons[:, 0] == comparisons[:, 1]):
+            raise ValueError("Each comparison should be between two different candidates.")
+
+        if candidates is None:
+            cands, cidxs = np.unique(comparisons, return_inverse=True)
+            candidates = cands.tolist()
+            cidxs = cidxs.reshape(comparisons.shape)
+        else:
+            cands = np.array(sorted(list(candidates)))
+            cidxs = np.minimum(np.searchsorted(cands, comparisons), len(cands) - 1)
+            if not np.all(cands[cidxs] == comparisons):
+                raise ValueError("All the candidates in the comparisons must be in the candidates.")
+
+        counts = [1] * len(comparisons) if counts is None else list(counts)
+        ties = np.zeros(len(comparisons), dtype=bool) if ties is None else np.asarray(ties, dtype=bool)
+
+        prof = cls([], candidates=candidates, cmap=cmap)
+        prof._pairwise_comparisons = None
+        prof._rcounts = counts
+        prof._comparison_ties = ties
+        counts = np.asarray(counts)
+        prof._set_comparisons(
+            np.column_stack([cidxs[~ties], counts[~ties]]), 
+            np.column_stack([np.sort(cidxs[ties], axis=1), counts[ties]]))
+        prof.num_voters = np.sum(counts)
+        return prof
+
+    def _set_comparisons(self, comparisons, indiffs):
+        """Store the (winner, loser, count) triples ``comparisons`` and the indifference triples ``indiffs`` and compute the tally of the profile."""
+
+        self._comparison_triples = np.array(comparisons).reshape(-1, 3)
+        self._indiff_triples = np.array(indiffs).reshape(-1, 3)
+
+        num_cands = len(self.candidates)
+        self._tally = np.zeros((num_cands, num_cands), dtype=self._comparison_triples.dtype if len(self._comparison_triples) > 0 else int)
+        np.add.at(self._tally, (self._comparison_triples[:, 0].astype(int), self._comparison_triples[:, 1].astype(int)), self._comparison_triples[:, 2])
+
+    @property
+    def _ballots(self):
+        """The list of PairwiseBallot instances, created from the comparisons when the profile is created with :meth:`from_comparisons`."""
+        if self._pairwise_comparisons is None:
+            indiff_idx = iter(self._indiff_triples[:, :2].astype(int).tolist())
+            comp_idx = iter(self._comparison_triples[:, :2].astype(int).tolist())
+            ballots = list()
+            for is_tie in self._comparison_ties.tolist():
+                c1, c2 = [self.cidx_to_cand[cidx] for cidx in (next(indiff_idx) if is_tie else next(comp_idx))]
+                ballots.append(PairwiseBallot([({c1, c2}, {c1, c2} if is_tie else {c1})], candidates=self.candidates, cmap=self.cmap))
+            self._pairwise_comparisons = ballots
+        return self._pairwise_comparisons
+
     @property
     def comparisons_counts(self):
         """Returns the submitted rankings and the list of counts."""
-        return self._pairwise_comparisons, self._rcounts
+        return self._ballots, self._rcounts
 
     @property
     def pairwise_comparisons(self): 
         """Returns a list of all pairwise comparisons"""
 
-        return [comp for compidx,comp in enumerate(self._pairwise_comparisons) 
+        return [comp for compidx,comp in enumerate(self._ballots) 
                 for _ in range(self._rcounts[compidx])]
 
     def support(self, c1, c2):
@@ -408,7 +490,9 @@ class PairwiseProfile:
             list: List of candidates that are majority preferred to `cand`.
         """        
         candidates = self.candidates if curr_cands is None else curr_cands
-        return [c for c in candidates if self.majority_prefers(c, cand)]
+        cidx = self.cand_to_cidx[cand]
+        margins = self._tally[:, cidx] - self._tally[cidx, :]
+        return [c for c in candidates if margins[self.cand_to_cidx[c]] > 0]
 
     def dominates(self, cand, curr_cands=None): 
         """Returns the list of candidates that `cand` is majority preferred to in the profile restricted to `curr_cands`.
@@ -421,7 +505,9 @@ class PairwiseProfile:
             list: List of candidates that `cand` is majority preferred to.
         """
         candidates = self.candidates if curr_cands is None else curr_cands
-        return [c for c in candidates if self.majority_prefers(cand, c)]
+        cidx = self.cand_to_cidx[cand]
+        margins = self._tally[cidx, :] - self._tally[:, cidx]
+        return [c for c in candidates if margins[self.cand_to_cidx[c]] > 0]
     
     def copeland_scores(self, curr_cands=None, scores=(1, 0, -1)):
         """The Copeland scores in the profile restricted to the candidates in `curr_cands`.
@@ -545,6 +631,6 @@ class PairwiseProfile:
             PairwiseProfile: The combined profile.
         """
         assert self.candidates == other_prof.candidates, "The two profiles must have the same candidates"
-        combined_comparisons = self._pairwise_comparisons + other_prof._pairwise_comparisons
+        combined_comparisons = self._ballots + other_prof._ballots
         combined_rcounts = self._rcounts + other_prof._rcounts
         return PairwiseProfile(combined_comparisons, rcounts=combined_rcounts, candidates=self.candidates)
@@ -68,6 +68,49 @@ def _support(ranks, rcounts, c1, c2):
     num_rank_c1_over_c2 = np.multiply(diffs, rcounts) # mutliply by the number of each ranking
     return np.sum(num_rank_c1_over_c2)
 
+def _ranks_from_rankings(rankings):
+    """For each ranking, the rank of each candidate (starting at 1).  Since each ranking is a permutation of the candidates, the ranks are the inverse permutation, which is computed with a single argsort.
+
+    Parameters
+    ----------
+    rankings:  2d numpy array
+        list of linear orderings of the candidates  
+    """
+    return np.argsort(rankings, axis=1) + 1
+
+def _tally_from_ranks(ranks, rcounts, other_ranks=None, max_chunk_entries=2**17):
+    """The 2d array where the c1,c2 entry is the number of voters that rank candidate c1 over candidate c2.  
+    
+    The pairwise comparisons are computed by broadcasting the ranks of each voter against themselves and weighting the result by ``rcounts``.  To bound memory usage, the rankings are processed in chunks of at most ``max_chunk_entries`` pairwise comparisons. 
+
+    Parameters
+    ----------
+    ranks:  2d numpy array
+        for each ranking, the rank of each candidate
+    rcounts:   1d numpy array
+        list of number of voters for each ranking
+    other_ranks:  2d numpy array, optional
+        if provided, the c1,c2 entry counts the voters for which the rank of c1 in ``ranks`` is smaller than the rank of c2 in ``other_ranks``
+    max_chunk_entries: int
+        the maximum number of pairwise comparisons computed at once
+    """
+    other_ranks = ranks if other_ranks is None else other_ranks
+    num_rankings, num_cands = ranks.shape
+    rcounts = np.asarray(rcounts)
+
+    # the matrix product is done in floating point (so that BLAS is used), which is exact for integer counts below 2**53
+    weights = rcounts.astype(np.float64)
+    tally = np.zeros(num_cands * num_cands, dtype=np.float64)
+    chunk_size = max(1, max_chunk_entries // max(1, num_cands * num_cands))
+    for start in range(0, num_rankings, chunk_size):
+        _ranks = ranks[start:start + chunk_size]
+        _other_ranks = other_ranks[start:start + chunk_size]
+        above = (_ranks[:, :, np.newaxis] < _other_ranks[:, np.newaxis, :]).reshape(_ranks.shape[0], num_cands * num_cands)
+        tally += weights[start:start + chunk_size] @ above
+
+    tally = tally.reshape(num_cands, num_cands)
+    return np.rint(tally).astype(np.int64) if np.issubdtype(rcounts.dtype, np.integer) else tally
+
 # @jit(nopython=True, fastmath=True)
 def _margin(tally, c1, c2): 
     """The margin of c1 over c2: the number of voters that rank c1 over c2 minus 
@@ -147,6 +190,59 @@ def _find_updated_profile(rankings, cands_to_ignore, num_cands):
 # Profiles
 # #######
 
+class ProfileDelta(object):
+    r"""A change to the ballots of a profile: some number of copies of a ranking are added to or removed from the profile.  A ProfileDelta is applied to a :class:`Profile` or a :class:`ProfileWithTies` with their ``apply_delta`` method, which returns the perturbed profile by updating the counts of the rankings and the tally of the original profile rather than recomputing the tally from all the ballots.
+
+    The methods ``add``, ``remove`` and ``replace`` return the ProfileDelta, so the changes can be chained. 
+
+    :Example:
+
+    .. exec_code::
+
+        from pref_voting.profiles import Profile, ProfileDelta
+        prof = Profile([[0, 1, 2], [1, 2, 0], [2, 0, 1]], [2, 3, 1])
+        prof.display()
+        new_prof = prof.apply_delta(ProfileDelta().replace((1, 2, 0), (2, 1, 0)))
+        new_prof.display()
+        new_prof = prof.apply_delta(ProfileDelta().remove((1, 2, 0), 2).add((0, 2, 1)))
+        new_prof.display()
+    """
+
+    def __init__(self): 
+        """constructor method"""
+
+        self.changes = list()
+        """The list of pairs ``(ranking, num)``, where ``num`` is the number of copies of ``ranking`` that are added (or removed, if ``num`` is negative)."""
+
+    def add(self, ranking, num = 1): 
+        """Add ``num`` copies of ``ranking``."""
+        self.changes.append((ranking, num))
+        return self
+
+    def remove(self, ranking, num = 1): 
+        """Remove ``num`` copies of ``ranking``."""
+        self.changes.append((ranking, -num))
+        return self
+
+    def replace(self, old_ranking, new_ranking, num = 1): 
+        """Replace ``num`` copies of ``old_ranking`` with ``new_ranking``."""
+        return self.remove(old_ranking, num).add(new_ranking, num)
+
+    def net_changes(self, key): 
+        """Returns a list of pairs ``(ranking, num)`` with one pair for each ranking in the changes (identified using ``key``), where ``num`` is the total number of copies of the ranking that are added.  Rankings whose changes cancel out are dropped."""
+
+        rankings = dict()
+        nums = dict()
+        for ranking, num in self.changes: 
+            k = key(ranking)
+            rankings.setdefault(k, ranking)
+            nums[k] = nums.get(k, 0) + num
+        return [(rankings[k], num) for k, num in nums.items() if num != 0]
+
+    def __str__(self): 
+        return ", ".join([f"{'+' if num > 0 else '-'}{abs(num)} {ranking}" for ranking, num in self.changes])
+
+
 class Profile(object):
     r"""An anonymous profile of linear rankings of :math:`n` candidates.  It is assumed that the candidates are named :math:`0, 1, \ldots, n-1` and a ranking of the candidates is a list of candidate names.  For instance, the list ``[0, 2, 1]`` represents the ranking in which :math:`0` is ranked above :math:`2`, :math:`2` is ranked above :math:`1`, and :math:`0` is ranked above :math:`1`.   
 
@@ -185,20 +281,13 @@ class Profile(object):
         # linear ordering of the candidates for each voter
         self._rankings = np.array(rankings)   
         
-        assert all([all([c in self.candidates for c in r]) for r in rankings]), f"The candidates must be from the set {self.candidates}."
+        assert np.isin(self._rankings, self.candidates).all(), f"The candidates must be from the set {self.candidates}."
 
         # for number of each ranking
         self._rcounts = np.array([1]*len(rankings)) if rcounts is None else np.array(rcounts) 
         
-        # for each voter, the ranks of each candidate
-        self._ranks = np.array([[np.where(_r == c)[0][0] + 1 
-                                 for c in self.candidates] 
-                                 for  _r in self._rankings])
-        
-        # 2d array where the c,d entry is the support of c over d
-        self._tally = np.array([[_support(self._ranks, self._rcounts, c1, c2) 
-                                 for c2 in self.candidates] 
-                                 for c1 in self.candidates ])
+        # the ranks, the tally and the margins are computed on first access and then cached
+        self._clear_cache()
         
         # mapping candidates to candidate names
         self.cmap = cmap if cmap is not None else {c:str(c) for c in self.candidates}
@@ -210,6 +299,35 @@ class Profile(object):
         self.is_truncated_linear = True     
         """The profile is a (truncated) linear order profile. This is needed for compatability with the ProfileWithTies class. """
 
+    def _clear_cache(self):
+        """Remove all the cached data derived from the rankings and counts."""
+        self._cached_ranks = None
+        self._cached_tally = None
+        self._cached_margins = None
+
+    @property
+    def _ranks(self):
+        """For each voter, the ranks of each candidate (computed on first access)."""
+        if self._cached_ranks is None: 
+            self._cached_ranks = _ranks_from_rankings(self._rankings) if len(self._rankings) > 0 else np.array([])
+        return self._cached_ranks
+
+    @_ranks.setter
+    def _ranks(self, ranks):
+        self._cached_ranks = ranks
+
+    @property
+    def _tally(self):
+        """2d array where the c,d entry is the support of c over d (computed on first access)."""
+        if self._cached_tally is None: 
+            self._cached_tally = _tally_from_ranks(self._ranks, self._rcounts) if len(self._rankings) > 0 else np.array([])
+        return self._cached_tally
+
+    @_tally.setter
+    def _tally(self, tally):
+        self._cached_tally = tally
+        self._cached_margins = None
+
     @property
     def rankings_counts(self):
         """
@@ -301,8 +419,11 @@ class Profile(object):
             cindices = [cidx for cidx, _ in enumerate(curr_cands)]
             cindex_to_cand = lambda cidx: curr_cands[cidx]
             cand_to_cindex = lambda c: cindices[curr_cands.index(c)]
-            strength_function = self.margin if strength_function is None else strength_function
-            strength_matrix = np.array([[strength_function(cindex_to_cand(a_idx), cindex_to_cand(b_idx)) for b_idx in cindices] for a_idx in cindices])
+            if strength_function is None: 
+                idxs = [self.cand_to_cindex(c) for c in curr_cands]
+                strength_matrix = np.array(self.margin_matrix)[np.ix_(idxs, idxs)]
+            else: 
+                strength_matrix = np.array([[strength_function(cindex_to_cand(a_idx), cindex_to_cand(b_idx)) for b_idx in cindices] for a_idx in cindices])
         else:  
             cindices = self.cindices
             cindex_to_cand = self.cindex_to_cand
@@ -479,7 +600,9 @@ class Profile(object):
         """Returns the margin matrix of the profile: A matrix where the :math:`i, j` entry is the margin of candidate :math:`i` over candidate :math:`j`.    
         """
 
-        return [[self.margin(c1,c2) for c2 in self.candidates] for c1 in self.candidates]
+        if self._cached_margins is None: 
+            self._cached_margins = self._tally - self._tally.T if self.num_cands > 0 else np.array([])
+        return self._cached_margins.tolist()
     
     def is_uniquely_weighted(self): 
         """Returns True if the profile is uniquely weighted. 
@@ -653,6 +776,64 @@ class Profile(object):
         
         return new_prof
     
+    def apply_delta(self, delta): 
+        """Returns the profile obtained by applying the :class:`ProfileDelta` ``delta``.  Only the counts of the rankings in ``delta`` are changed.  If the tally of this profile has already been computed, the tally of the new profile is obtained by updating it with the rankings that are added or removed, so the other ballots are not processed again.
+
+        :param delta: the rankings to add and remove
+        :type delta: ProfileDelta
+        :returns: a new Profile 
+
+        .. note:: Rankings that are removed are taken from the first ranking types in the profile that match.  A ValueError is raised if the profile does not contain enough copies of a ranking that is removed.
+        """
+
+        rcounts = np.array(self._rcounts)
+        added_rankings = list()
+        added_rcounts = list()
+        changed_rankings = list()
+        changed_rcounts = list()
+        for ranking, num in delta.net_changes(key = lambda r: tuple(int(c) for c in r)): 
+            ranking = np.asarray(ranking)
+            assert ranking.shape == (self.num_cands,) and set(ranking.tolist()) == set(self.candidates), f"The ranking {ranking.tolist()} is not a ranking of the candidates {self.candidates}."
+            ridxs = np.flatnonzero((self._rankings == ranking).all(axis=1)) if len(self._rankings) > 0 else []
+            if num > 0: 
+                if len(ridxs) > 0: 
+                    rcounts[ridxs[0]] += num
+                else: 
+                    added_rankings.append(ranking)
+                    added_rcounts.append(num)
+            else: 
+                if rcounts[ridxs].sum() < -num: 
+                    raise ValueError(f"The profile does not contain {-num} copies of the ranking {ranking.tolist()}.")
+                to_remove = -num
+                for ridx in ridxs: 
+                    removed = min(rcounts[ridx], to_remove)
+                    rcounts[ridx] -= removed
+                    to_remove -= removed
+            changed_rankings.append(ranking)
+            changed_rcounts.append(num)
+
+        keep = rcounts > 0
+        new_rankings = self._rankings[keep]
+        new_rcounts = rcounts[keep]
+        if len(added_rankings) > 0: 
+            new_rankings = np.concatenate([new_rankings.reshape(-1, self.num_cands), np.array(added_rankings)])
+            new_rcounts = np.concatenate([new_rcounts, np.array(added_rcounts)])
+
+        new_prof = Profile(new_rankings, rcounts=new_rcounts, cmap=self.cmap)
+
+        if len(self._rankings) > 0 and len(new_rankings) > 0: 
+            if self._cached_tally is not None: 
+                if len(changed_rankings) > 0: 
+                    new_prof._tally = self._cached_tally + _tally_from_ranks(_ranks_from_rankings(np.array(changed_rankings)), np.array(changed_rcounts))
+                else: 
+                    new_prof._tally = self._cached_tally
+            if self._cached_ranks is not None: 
+                new_ranks = self._cached_ranks[keep]
+                if len(added_rankings) > 0: 
+                    new_ranks = np.concatenate([new_ranks, _ranks_from_rankings(np.array(added_rankings))])
+                new_prof._ranks = new_ranks
+        return new_prof
+
     def to_latex(self, cmap = None, curr_cands = None):
         """Returns a string describing the profile (restricted to ``curr_cands``) as a LaTeX table (use the provided ``cmap`` or the ``cmap`` associated with the profile).
 
@@ -836,21 +1017,18 @@ class Profile(object):
         """Return the state of the object for pickling."""
         state = self.__dict__.copy()
         # Remove derived attributes that can be recomputed
-        del state['_ranks']
-        del state['_tally']
+        for attr in ['_cached_ranks', '_cached_tally', '_cached_margins']:
+            state.pop(attr, None)
         del state['cand_to_cindex']
         del state['cindex_to_cand']
         return state
 
     def __setstate__(self, state):
         """Restore the state of the object from pickling."""
+        # Derived attributes are recomputed on first access
+        for attr in ['_ranks', '_tally']:
+            state.pop(attr, None)
         self.__dict__.update(state)
-        # Recompute derived attributes
-        self._ranks = np.array([[np.where(_r == c)[0][0] + 1 
-                                 for c in self.candidates] 
-                                 for  _r in self._rankings])
-        self._tally = np.array([[_support(self._ranks, self._rcounts, c1, c2) 
-                                 for c2 in self.candidates] 
-                                 for c1 in self.candidates ])
+        self._clear_cache()
         self.cand_to_cindex = lambda c: c
         self.cindex_to_cand = lambda i: i
@@ -10,7 +10,7 @@ from math import ceil
 import copy
 import numpy as np
 from tabulate import tabulate
-from pref_voting.profiles import Profile
+from pref_voting.profiles import Profile, _tally_from_ranks
 from pref_voting.rankings import Ranking
 from pref_voting.scoring_methods import symmetric_borda_scores
 from pref_voting.weighted_majority_graphs import (
@@ -41,6 +41,46 @@ def _num_rank_profile_with_ties(rankings, rcounts, cand, level):
             total += count
     return total
 
+def _rank_matrix_from_rankings(rankings, candidates):
+    """
+    Returns a 2d array with one row for each ranking and one column for each candidate, where the entry is the rank of the candidate in the ranking.  Candidates that are not ranked are assigned the rank ``np.inf``.
+
+    Args:
+        rankings: list of Ranking objects
+        candidates: list of candidates
+
+    Returns:
+        2d numpy array of ranks
+    """
+    cand_to_cindex = {c: cidx for cidx, c in enumerate(candidates)}
+    rank_matrix = np.full((len(rankings), len(candidates)), np.inf)
+    for ridx, ranking in enumerate(rankings):
+        for c, rank in ranking.rmap.items():
+            if c in cand_to_cindex:
+                rank_matrix[ridx, cand_to_cindex[c]] = rank
+    return rank_matrix
+
+def _supports_from_rank_matrix(rank_matrix, rcounts, extended=False):
+    """
+    Returns the 2d array where the entry for candidates with indices i and j is the number of voters that rank candidate i strictly above candidate j.
+
+    Args:
+        rank_matrix: 2d numpy array of ranks (see ``_rank_matrix_from_rankings``)
+        rcounts: list of counts for each ranking
+        extended: if True, use extended strict preference, so a ranked candidate is strictly above every unranked candidate
+
+    Returns:
+        2d numpy array of supports
+    """
+    num_rankings, num_cands = rank_matrix.shape
+    if num_rankings == 0:
+        return np.zeros((num_cands, num_cands), dtype=int)
+
+    # With strict preference, an unranked candidate is neither above nor below any candidate: 
+    # the unranked candidates get rank np.inf on the left-hand side and -np.inf on the right-hand side of the comparison.
+    other_rank_matrix = rank_matrix if extended else np.where(np.isinf(rank_matrix), -np.inf, rank_matrix)
+    return _tally_from_ranks(rank_matrix, np.asarray(rcounts), other_ranks=other_rank_matrix)
+
 def same_ranking_extended_strict_pref(ranking1, ranking2, candidates): 
     # check if ranking1 and ranking2 have the same ranking of candidates
     for c1 in candidates:
@@ -119,37 +159,44 @@ class ProfileWithTies(object):
 
         self.using_extended_strict_preference = False
         """A flag indicating whether the profile is using extended strict preferences when calculating supports, margins, etc."""
-        
+
+        # for each ranking, the rank of each candidate (np.inf if the candidate is not ranked)
+        self._rank_matrix = _rank_matrix_from_rankings(self._rankings, self.candidates)
+
         # memoize the supports
+        self._set_supports()
+
+    def _set_supports(self, tally=None):
+        """
+        Compute the supports from the rank matrix, using extended strict preferences if ``self.using_extended_strict_preference`` is True.  If ``tally`` is provided, it is used as the supports instead.
+        """
+
+        self._tally = _supports_from_rank_matrix(
+            self._rank_matrix, 
+            self.rcounts, 
+            extended=self.using_extended_strict_preference) if tally is None else tally
+        
+        tally = self._tally.tolist()
         self._supports = {
-            c1: {
-                c2: sum(
-                    n
-                    for r, n in zip(self._rankings, self.rcounts)
-                    if r.strict_pref(c1, c2)
-                )
-                for c2 in self.candidates
-            }
-            for c1 in self.candidates
+            c1: {c2: tally[c1_idx][c2_idx] for c2_idx, c2 in enumerate(self.candidates)}
+            for c1_idx, c1 in enumerate(self.candidates)
         }
 
+    def _update_rank_matrix(self):
+        """
+        Recompute the rank matrix and the supports after the rankings have been modified.
+        """
+
+        self._rank_matrix = _rank_matrix_from_rankings(self._rankings, self.candidates)
+        self._set_supports()
+
     def use_extended_strict_preference(self):
         """
         Redefine the supports so that *extended strict preferences* are used. Using extended strict preference may change the margins between candidates.
         """
 
         self.using_extended_strict_preference = True
-        self._supports = {
-            c1: {
-                c2: sum(
-                    n
-                    for r, n in zip(self._rankings, self.rcounts)
-                    if r.extended_strict_pref(c1, c2)
-                )
-                for c2 in self.candidates
-            }
-            for c1 in self.candidates
-        }
+        self._set_supports()
 
     def use_strict_preference(self):
         """
@@ -157,17 +204,25 @@ class ProfileWithTies(object):
         """
 
         self.using_extended_strict_preference = False
-        self._supports = {
-            c1: {
-                c2: sum(
-                    n
-                    for r, n in zip(self._rankings, self.rcounts)
-                    if r.strict_pref(c1, c2)
-                )
-                for c2 in self.candidates
-            }
-            for c1 in self.candidates
-        }
+        self._set_supports()
+
+    def _first_place_matrix(self, curr_cands):
+        """
+        Returns a 2d Boolean array with one row for each ranking and one column for each candidate in ``curr_cands``, where the entry is True when the candidate is ranked first among the candidates in ``curr_cands``.
+        """
+
+        rank_matrix = self._rank_matrix[:, [self.cand_to_cindex(c) for c in curr_cands]]
+        top_ranks = rank_matrix.min(axis=1, initial=np.inf)[:, np.newaxis]
+        return (rank_matrix == top_ranks) & np.isfinite(rank_matrix)
+
+    def _weighted_counts(self, indicator):
+        """
+        Returns a list with, for each column of ``indicator`` (a 2d array with one row for each ranking), the sum of the entries in the column weighted by the number of voters submitting each ranking.
+        """
+
+        rcounts = np.asarray(self.rcounts) if len(self.rcounts) > 0 else np.zeros(0, dtype=int)
+        return (rcounts @ indicator).tolist()
+
     @property 
     def rankings(self): 
         """
@@ -232,9 +287,7 @@ class ProfileWithTies(object):
     def margin_matrix(self):
         """Returns the margin matrix of the profile, where the entry at row ``i`` and column ``j`` is the margin of candidate ``i`` over candidate ``j``."""
 
-        return np.array(
-            [[self.margin(self.cindex_to_cand(c1_idx), self.cindex_to_cand(c2_idx)) for c2_idx in self.cindices] for c1_idx in self.cindices]
-        )
+        return np.array(self._tally - self._tally.T)
     
     def is_tied(self, c1, c2): 
         """Returns True if ``c1`` and ``c2`` are tied (i.e., the margin of ``c1`` over ``c2`` is 0)."""
@@ -284,8 +337,11 @@ class ProfileWithTies(object):
             cindices = [cidx for cidx, _ in enumerate(curr_cands)]
             cindex_to_cand = lambda cidx: curr_cands[cidx]
             cand_to_cindex = lambda c: cindices[curr_cands.index(c)]
-            strength_function = self.margin if strength_function is None else strength_function
-            strength_matrix = np.array([[strength_function(cindex_to_cand(a_idx), cindex_to_cand(b_idx)) for b_idx in cindices] for a_idx in cindices])
+            if strength_function is None: 
+                idxs = [self.cand_to_cindex(c) for c in curr_cands]
+                strength_matrix = np.array(self.margin_matrix)[np.ix_(idxs, idxs)]
+            else: 
+                strength_matrix = np.array([[strength_function(cindex_to_cand(a_idx), cindex_to_cand(b_idx)) for b_idx in cindices] for a_idx in cindices])
         else:  
             cindices = self.cindices
             cindex_to_cand = self.cindex_to_cand
@@ -396,21 +452,13 @@ class ProfileWithTies(object):
         if curr_cands is None:
             curr_cands = self.candidates
 
+        is_first = self._first_place_matrix(curr_cands)
+
         # Check if any voter ranks multiple candidates in first place
-        if any(len(r.first(cs=curr_cands)) > 1 for r in self._rankings):
+        if (is_first.sum(axis=1) > 1).any():
             raise ValueError("Cannot find the plurality scores unless all voters rank a unique candidate in first place.")
 
-        rankings, rcounts = self.rankings_counts
-
-        plurality_scores = {cand: 0 for cand in curr_cands}
-
-        for ranking, count in zip(rankings, rcounts):
-            first_place_candidates = ranking.first(cs=curr_cands)
-            if len(first_place_candidates) == 1:
-                cand = first_place_candidates[0]
-                plurality_scores[cand] += count
-
-        return plurality_scores
+        return dict(zip(curr_cands, self._weighted_counts(is_first)))
 
     def plurality_scores_ignoring_overvotes(self, curr_cands=None): 
         """
@@ -419,15 +467,25 @@ class ProfileWithTies(object):
 
         curr_cands = curr_cands if curr_cands is not None else self.candidates
         
-        rankings, rcounts = self.rankings_counts
-        
-        return {cand: sum([c for r, c in zip(rankings, rcounts) if len(r.cands) > 0 and [cand] == r.first(cs=curr_cands)]) for cand in curr_cands}
+        is_first = self._first_place_matrix(curr_cands)
+        is_unique_first = is_first & (is_first.sum(axis=1) == 1)[:, np.newaxis]
+
+        return dict(zip(curr_cands, self._weighted_counts(is_unique_first)))
 
     def borda_scores(self, 
                      curr_cands=None, 
                      borda_score_fnc=symmetric_borda_scores):
         
         curr_cands = self.candidates if curr_cands is None else curr_cands
+
+        if borda_score_fnc is symmetric_borda_scores: 
+            # the symmetric Borda score of a candidate is the number of (extended) strict preferences for the candidate minus the number of (extended) strict preferences against the candidate
+            extended_tally = self._tally if self.using_extended_strict_preference else _supports_from_rank_matrix(self._rank_matrix, self.rcounts, extended=True)
+            cands = [c for c in self.candidates if c in curr_cands]
+            cidxs = [self.cand_to_cindex(c) for c in cands]
+            restricted_tally = extended_tally[np.ix_(cidxs, cidxs)]
+            return dict(zip(cands, (restricted_tally.sum(axis=1) - restricted_tally.sum(axis=0)).tolist()))
+
         restricted_prof = self.remove_candidates([c for c in self.candidates if c not in curr_cands])
         return borda_score_fnc(restricted_prof)
 
@@ -449,26 +507,17 @@ class ProfileWithTies(object):
         if curr_cands is None:
             curr_cands = self.candidates
 
-        rankings, rcounts = self.rankings_counts
-
         if score_type not in {'approval', 'split'}:
             raise ValueError("Invalid score_type specified. Use 'approval' or 'split'.")
 
-        tops_scores = {cand: 0 for cand in curr_cands}
+        is_first = self._first_place_matrix(curr_cands)
 
         if score_type == 'approval':
-            for ranking, count in zip(rankings, rcounts):
-                for cand in curr_cands:
-                    if cand in ranking.first(cs=curr_cands):
-                        tops_scores[cand] += count
+            return dict(zip(curr_cands, self._weighted_counts(is_first)))
 
         elif score_type == 'split':
-            for ranking, count in zip(rankings, rcounts):
-                for cand in curr_cands:
-                    if cand in ranking.first(cs=curr_cands):
-                        tops_scores[cand] += count * 1/len(ranking.first(cs=curr_cands))
-
-        return tops_scores
+            num_first = is_first.sum(axis=1)[:, np.newaxis]
+            return dict(zip(curr_cands, self._weighted_counts(np.divide(is_first, num_first, out=np.zeros(is_first.shape), where=num_first > 0))))
         
     def remove_empty_rankings(self): 
         """
@@ -489,10 +538,7 @@ class ProfileWithTies(object):
         # update the number of voters
         self.num_voters = np.sum(self.rcounts)
         
-        if self.using_extended_strict_preference: 
-            self.use_extended_strict_preference()
-        else: 
-            self.use_strict_preference()
+        self._update_rank_matrix()
 
     def truncate_overvotes(self): 
         """Return a new profile in which all rankings with overvotes are truncated. """
@@ -507,10 +553,7 @@ class ProfileWithTies(object):
                 r.truncate_overvote()
                 report.append((old_ranking, r, c))
     
-        if self.using_extended_strict_preference: 
-            new_profile.use_extended_strict_preference()
-        else: 
-            new_profile.use_strict_preference()
+        new_profile._update_rank_matrix()
             
         return new_profile, report
 
@@ -564,6 +607,61 @@ class ProfileWithTies(object):
         new_rankings = [tuple([cand_to_cindx[c] for c in r]) for r in _new_rankings]
         return Profile(new_rankings, rcounts=rcounts, cmap=new_cmap)
 
+    def apply_delta(self, delta): 
+        """
+        Returns the profile obtained by applying the :class:`ProfileDelta` ``delta``.  Only the counts of the rankings in ``delta`` are changed, and the supports of the new profile are the supports of this profile updated with the rankings that are added or removed, so the other ballots are not processed again.  The new profile has the same candidates as this profile and uses extended strict preferences if this profile does.
+
+        Rankings that are removed are taken from the first ranking types in the profile that match.  A ValueError is raised if the profile does not contain enough copies of a ranking that is removed.
+
+        Args:
+            delta (ProfileDelta): the rankings (:class:`Ranking` objects or dictionaries) to add and remove
+
+        Returns:
+            A new ProfileWithTies
+        """
+
+        as_ranking = lambda r: Ranking(r, cmap=self.cmap) if type(r) == dict else Ranking(r.rmap, cmap=self.cmap)
+
+        rcounts = list(self.rcounts)
+        added_rankings = list()
+        added_rcounts = list()
+        changed_rankings = list()
+        changed_rcounts = list()
+        for ranking, num in delta.net_changes(key = as_ranking): 
+            ranking = as_ranking(ranking)
+            ridxs = [ridx for ridx, r in enumerate(self._rankings) if r == ranking]
+            if num > 0: 
+                if len(ridxs) > 0: 
+                    rcounts[ridxs[0]] += num
+                else: 
+                    added_rankings.append(ranking)
+                    added_rcounts.append(num)
+            else: 
+                if sum([rcounts[ridx] for ridx in ridxs]) < -num: 
+                    raise ValueError(f"The profile does not contain {-num} copies of the ranking {ranking}.")
+                to_remove = -num
+                for ridx in ridxs: 
+                    removed = min(rcounts[ridx], to_remove)
+                    rcounts[ridx] -= removed
+                    to_remove -= removed
+            changed_rankings.append(ranking)
+            changed_rcounts.append(num)
+
+        keep = [ridx for ridx, c in enumerate(rcounts) if c > 0]
+
+        new_prof = copy.copy(self)
+        new_prof._rankings = [self._rankings[ridx] for ridx in keep] + added_rankings
+        new_prof.rcounts = [rcounts[ridx] for ridx in keep] + added_rcounts
+        new_prof.num_voters = np.sum(new_prof.rcounts)
+        new_prof._rank_matrix = np.concatenate([
+            self._rank_matrix[keep].reshape(-1, self.num_cands), 
+            _rank_matrix_from_rankings(added_rankings, self.candidates)])
+        new_prof._set_supports(tally = self._tally + _supports_from_rank_matrix(
+            _rank_matrix_from_rankings(changed_rankings, self.candidates), 
+            changed_rcounts, 
+            extended=self.using_extended_strict_preference))
+        return new_prof
+
     def replace_rankings(
             self, 
             old_ranking, 
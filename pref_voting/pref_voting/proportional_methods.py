@@ -29,6 +29,8 @@ import collections
 import random
 import warnings
 
+import numpy as np
+
 from pref_voting.weighted_majority_graphs import MarginGraph
 from pref_voting.margin_based_methods import minimax
 from pref_voting.profiles_with_ties import ProfileWithTies
@@ -1025,86 +1027,143 @@ def stv_last_parcel(profile, num_seats = 2, curr_cands=None, quota_rule="nb", ti
     return sorted(winners)[:num_seats]
 
 
+# ---------- Compiled ballot tiers ----------
+
+class _BallotTiers:
+    """
+    The ballots of a profile compiled once into flat integer arrays, so that the Meek and Warren flows
+    (which are recomputed on every iteration of the keep factor/price fixpoint) do not rebuild the tiers
+    of each ranking.
+
+    Each ballot is split into tiers: the candidates at the same rank, sorted, with the tiers in rank order.
+    The entries (ballot, candidate) are grouped by the position of the tier on the ballot: the entries for
+    the t-th tier of every ballot are ``ballot_ids[offsets[t]:offsets[t + 1]]`` and
+    ``cand_ids[offsets[t]:offsets[t + 1]]``, ordered by ballot and then by candidate.  Ballots with the
+    same tiers are merged, and ballots with no ranked candidates are dropped.
+
+    Attributes:
+        candidates: List of the candidates; candidate ids are indices into this list
+        counts: Array with the number of voters submitting each ballot
+        offsets: Array with the start of the entries for each tier position (and the total number of entries)
+        ballot_ids: Array with the ballot of each entry
+        cand_ids: Array with the candidate id of each entry
+    """
+    def __init__(self, profile):
+        self.candidates = list(profile.candidates)
+        cand_to_id = {c: i for i, c in enumerate(self.candidates)}
+
+        # Ballots with the same tiers are merged
+        ballot_counts = collections.defaultdict(float)
+        rankings, rcounts = profile.rankings_counts
+        for ranking, count in zip(rankings, rcounts):
+            if count <= 0:
+                continue
+            by_rank = collections.defaultdict(list)
+            for c, r in ranking.rmap.items():
+                if r is not None:
+                    by_rank[int(r)].append(c)
+            if not by_rank:
+                continue
+            ballot_counts[tuple(tuple(sorted(by_rank[r])) for r in sorted(by_rank))] += float(count)
+
+        counts = []
+        level_ballots = []
+        level_cands = []
+        for ballot_id, (tiers, count) in enumerate(ballot_counts.items()):
+            counts.append(count)
+            for t, tier in enumerate(tiers):
+                if t == len(level_ballots):
+                    level_ballots.append([])
+                    level_cands.append([])
+                for c in tier:
+                    if c not in cand_to_id:
+                        cand_to_id[c] = len(self.candidates)
+                        self.candidates.append(c)
+                    level_ballots[t].append(ballot_id)
+                    level_cands[t].append(cand_to_id[c])
+
+        self.counts = np.array(counts, dtype=float)
+        self.offsets = np.cumsum([0] + [len(ballot_ids) for ballot_ids in level_ballots])
+        self.ballot_ids = np.array([b for ballot_ids in level_ballots for b in ballot_ids], dtype=int)
+        self.cand_ids = np.array([c for cand_ids in level_cands for c in cand_ids], dtype=int)
+
+    @property
+    def num_ballots(self):
+        return len(self.counts)
+
+    def cand_mask(self, cands):
+        """Boolean array indicating which candidate ids are in ``cands``."""
+        return np.array([c in cands for c in self.candidates], dtype=bool)
+
+    def cand_values(self, values, default):
+        """Array with the value in the dict ``values`` for each candidate id (``default`` if missing)."""
+        return np.array([values.get(c, default) for c in self.candidates], dtype=float)
+
+    def tiers(self):
+        """Yield, for each tier position, the ballot ids and candidate ids of the entries in that position."""
+        for t in range(len(self.offsets) - 1):
+            yield (self.ballot_ids[self.offsets[t]:self.offsets[t + 1]],
+                   self.cand_ids[self.offsets[t]:self.offsets[t + 1]])
+
+    def tallies_dict(self, tallies):
+        """Dict mapping each candidate to its entry in the array ``tallies`` (indexed by candidate id)."""
+        return {c: float(tallies[i]) for i, c in enumerate(self.candidates)}
+
+
 # ---------- Meek STV ----------
 # Based on Hill, Wichmann, Woodall (1987) 'Algorithm 123: Single Transferable Vote by Meek's Method'
 
-def _meek_flow_one_ballot(tiers, keep, active_candidates):
+def _meek_tally_from_profile(ballots, keep, active_candidates):
     """
-    Flow a single ballot through the Meek system.
+    Compute tallies for all candidates using Meek flow.
     
     In Meek STV:
     - Hopeful candidates have keep = 1 (keep everything, pass nothing)
     - Elected candidates have keep < 1 (keep some, pass the rest)
     - Excluded candidates have keep = 0 (keep nothing, pass everything)
     
-    The ballot flows through candidates in preference order. At each candidate c:
-    - c keeps (keep[c] * share) of the remaining weight
-    - c passes ((1 - keep[c]) * share) to the next preference
+    Each ballot flows through candidates in preference order, skipping candidates that are not
+    in the count. At each tier, the remaining weight is split equally among the candidates in the
+    count, and each such candidate c:
+    - keeps (keep[c] * share) of the remaining weight
+    - passes ((1 - keep[c]) * share) to the next preference
     
-    Args:
-        tiers: List of lists, where each inner list contains candidates at the same rank
-        keep: Dict mapping candidates to their keep factors
-        active_candidates: Set of candidates still in the count (hopeful or elected)
-    
-    Returns:
-        Tuple of (list of (candidate, amount_kept) pairs, excess weight that exhausted)
-    """
-    remaining = 1.0
-    out = []
-    for tier in tiers:
-        # Only consider candidates that are still in the count (hopeful or elected)
-        avail = [c for c in tier if c in active_candidates]
-        if not avail:
-            continue
-        share = remaining / float(len(avail))
-        spilled = 0.0
-        for c in avail:
-            k = keep.get(c, 1.0)
-            kept = k * share
-            out.append((c, kept))
-            spilled += (1.0 - k) * share
-        remaining = spilled
-        if remaining <= EPS:
-            break
-    # 'remaining' is the excess (weight that exhausted)
-    return out, remaining
-
-
-def _meek_tally_from_profile(profile, keep, active_candidates):
-    """
-    Compute tallies for all candidates using Meek flow.
+    The flow is computed one tier position at a time for all ballots at once.
     
     Args:
-        profile: ProfileWithTies object
+        ballots: _BallotTiers object (or a ProfileWithTies object, which is compiled first)
         keep: Dict mapping candidates to their keep factors
-        active_candidates: Set of candidates still in the count
+        active_candidates: Set of candidates still in the count (hopeful or elected)
     
     Returns:
         Tuple of (tallies dict, total excess weight)
     """
-    t = collections.defaultdict(float)
-    total_excess = 0.0
-    rankings, rcounts = profile.rankings_counts
-    
-    for ranking, count in zip(rankings, rcounts):
-        if count <= 0:
+    if not isinstance(ballots, _BallotTiers):
+        ballots = _BallotTiers(ballots)
+
+    active = ballots.cand_mask(active_candidates)
+    keep_factors = ballots.cand_values(keep, 1.0)
+    num_ballots = ballots.num_ballots
+
+    tallies = np.zeros(len(ballots.candidates))
+    remaining = np.ones(num_ballots)
+    for ballot_ids, cand_ids in ballots.tiers():
+        # Only consider candidates that are still in the count, on ballots that are not exhausted
+        in_flow = active[cand_ids] & (remaining[ballot_ids] > EPS)
+        ballot_ids = ballot_ids[in_flow]
+        cand_ids = cand_ids[in_flow]
+        if len(ballot_ids) == 0:
             continue
-        rmap = ranking.rmap
-        by_rank = collections.defaultdict(list)
-        for c, r in rmap.items():
-            if r is not None:
-                by_rank[int(r)].append(c)
-        tiers = []
-        for r in sorted(by_rank):
-            tiers.append(sorted(by_rank[r]))
-        
-        if tiers:
-            flow_result, excess = _meek_flow_one_ballot(tiers, keep, active_candidates)
-            for c, a in flow_result:
-                t[c] += a * float(count)
-            total_excess += excess * float(count)
-    
-    return t, total_excess
+        num_avail = np.bincount(ballot_ids, minlength=num_ballots)
+        share = remaining[ballot_ids] / num_avail[ballot_ids]
+        k = keep_factors[cand_ids]
+        tallies += np.bincount(cand_ids, weights=k * share * ballots.counts[ballot_ids], minlength=len(tallies))
+        spilled = np.bincount(ballot_ids, weights=(1.0 - k) * share, minlength=num_ballots)
+        has_avail = num_avail > 0
+        remaining[has_avail] = spilled[has_avail]
+
+    # 'remaining' is the excess (weight that exhausted)
+    return ballots.tallies_dict(tallies), float(remaining @ ballots.counts)
 
 
 @vm(name="STV-Meek", input_types=[ElectionTypes.PROFILE, ElectionTypes.PROFILE_WITH_TIES])
@@ -1161,9 +1220,13 @@ def stv_meek(profile, num_seats=2, curr_cands=None, tol=1e-10, max_iter=2000, ti
     # Calculate total weight from profile
     rankings, rcounts = profile.rankings_counts
     total_weight = sum(float(count) for count in rcounts)
+
     if total_weight <= EPS or not hopeful or num_seats <= 0:
         return []
     
+    # Compile the ballot tiers once for all the flow computations
+    ballots = _BallotTiers(profile)
+    
     safety = 0
     while len(elected) < num_seats:
         safety += 1
@@ -1178,7 +1241,7 @@ def stv_meek(profile, num_seats=2, curr_cands=None, tol=1e-10, max_iter=2000, ti
         # Iteratively adjust keep factors until convergence
         # Convergence: keep factors stabilize AND elected candidates are at quota
         for _ in range(max_iter):
-            tallies, excess = _meek_tally_from_profile(profile, keep, active)
+            tallies, excess = _meek_tally_from_profile(ballots, keep, active)
 
             # Quota = (total_votes - excess) / (k+1)
             usable = total_weight - excess
@@ -1210,7 +1273,7 @@ def stv_meek(profile, num_seats=2, curr_cands=None, tol=1e-10, max_iter=2000, ti
                 break
         
         # After convergence, check if any HOPEFUL candidate has reached quota
-        tallies, excess = _meek_tally_from_profile(profile, keep, active)
+        tallies, excess = _meek_tally_from_profile(ballots, keep, active)
         usable = total_weight - excess
         quota = usable / float(num_seats + 1) if usable > EPS else 0.0
         
@@ -1285,65 +1348,20 @@ def stv_meek(profile, num_seats=2, curr_cands=None, tol=1e-10, max_iter=2000, ti
 #   B takes min(0.5, 0.3) = 0.3, remaining = 0.2
 #   C (if hopeful) takes 0.2
 
-def _warren_flow_one_ballot(tiers, prices, elected, hopeful):
+def _warren_tally_from_profile(ballots, prices, elected, hopeful):
     """
-    Flow a single ballot through the Warren system using additive prices.
+    Compute tallies for all candidates using Warren flow.
 
     In Warren STV:
     - Elected candidates have a price p_c (portion apportioned)
     - A voter contributes min(remaining_vote, p_c) to each elected candidate in preference order
     - The remaining vote after all elected candidates goes to the first hopeful candidate
 
-    Args:
-        tiers: List of lists, where each inner list contains candidates at the same rank
-        prices: Dict mapping elected candidates to their prices
-        elected: Set of elected candidates
-        hopeful: Set of hopeful candidates
-
-    Returns:
-        Tuple of (dict mapping candidates to amounts received, excess weight that exhausted)
-    """
-    remaining = 1.0
-    contributions = collections.defaultdict(float)
-
-    for tier in tiers:
-        if remaining <= EPS:
-            break
-
-        # Process candidates in this tier
-        avail = [c for c in tier if c in elected or c in hopeful]
-        if not avail:
-            continue
-
-        # Split equally among tied candidates at this rank
-        share_per_cand = remaining / float(len(avail))
-        new_remaining = 0.0
-
-        for c in avail:
-            if c in elected:
-                # Elected candidate: take min(share, price)
-                price = prices.get(c, 1.0)
-                contribution = min(share_per_cand, price)
-                contributions[c] += contribution
-                # Remaining from this candidate's share continues to next preferences
-                new_remaining += share_per_cand - contribution
-            else:
-                # Hopeful candidate: takes all remaining share
-                contributions[c] += share_per_cand
-                # Nothing passes through hopeful candidates
-
-        remaining = new_remaining
-
-    # 'remaining' is the excess (weight that exhausted)
-    return contributions, remaining
-
-
-def _warren_tally_from_profile(profile, prices, elected, hopeful):
-    """
-    Compute tallies for all candidates using Warren flow.
+    Candidates at the same rank split the remaining vote equally. The flow is computed one tier
+    position at a time for all ballots at once.
 
     Args:
-        profile: ProfileWithTies object
+        ballots: _BallotTiers object (or a ProfileWithTies object, which is compiled first)
         prices: Dict mapping elected candidates to their prices
         elected: Set of elected candidates
         hopeful: Set of hopeful candidates
@@ -1351,32 +1369,38 @@ def _warren_tally_from_profile(profile, prices, elected, hopeful):
     Returns:
         Tuple of (tallies dict, total excess weight)
     """
-    tallies = collections.defaultdict(float)
-    total_excess = 0.0
-    rankings, rcounts = profile.rankings_counts
-
-    for ranking, count in zip(rankings, rcounts):
-        if count <= 0:
+    if not isinstance(ballots, _BallotTiers):
+        ballots = _BallotTiers(ballots)
+
+    is_elected = ballots.cand_mask(elected)
+    in_count = is_elected | ballots.cand_mask(hopeful)
+    cand_prices = ballots.cand_values(prices, 1.0)
+    num_ballots = ballots.num_ballots
+
+    tallies = np.zeros(len(ballots.candidates))
+    remaining = np.ones(num_ballots)
+    for ballot_ids, cand_ids in ballots.tiers():
+        in_flow = in_count[cand_ids] & (remaining[ballot_ids] > EPS)
+        ballot_ids = ballot_ids[in_flow]
+        cand_ids = cand_ids[in_flow]
+        if len(ballot_ids) == 0:
             continue
-        rmap = ranking.rmap
-        by_rank = collections.defaultdict(list)
-        for c, r in rmap.items():
-            if r is not None:
-                by_rank[int(r)].append(c)
-        tiers = []
-        for r in sorted(by_rank):
-            tiers.append(sorted(by_rank[r]))
-
-        if tiers:
-            contributions, excess = _warren_flow_one_ballot(tiers, prices, elected, hopeful)
-            for c, amount in contributions.items():
-                tallies[c] += amount * float(count)
-            total_excess += excess * float(count)
+        # Split equally among tied candidates at this rank
+        num_avail = np.bincount(ballot_ids, minlength=num_ballots)
+        share = remaining[ballot_ids] / num_avail[ballot_ids]
+        # Elected candidates take min(share, price) and pass the rest on; hopeful candidates take all of the share
+        cand_elected = is_elected[cand_ids]
+        contribution = np.where(cand_elected, np.minimum(share, cand_prices[cand_ids]), share)
+        tallies += np.bincount(cand_ids, weights=contribution * ballots.counts[ballot_ids], minlength=len(tallies))
+        new_remaining = np.bincount(ballot_ids, weights=np.where(cand_elected, share - contribution, 0.0), minlength=num_ballots)
+        has_avail = num_avail > 0
+        remaining[has_avail] = new_remaining[has_avail]
 
-    return tallies, total_excess
+    # 'remaining' is the excess (weight that exhausted)
+    return ballots.tallies_dict(tallies), float(remaining @ ballots.counts)
 
 
-def _warren_find_price_for_quota(profile, prices, elected, hopeful, target_cand, quota, tol=1e-10):
+def _warren_find_price_for_quota(ballots, prices, elected, hopeful, target_cand, quota, tol=1e-10):
     """
     Use binary search to find the price for target_cand that makes their tally = quota.
 
@@ -1387,7 +1411,7 @@ def _warren_find_price_for_quota(profile, prices, elected, hopeful, target_cand,
     The caller should always use the returned value.
 
     Args:
-        profile: ProfileWithTies object
+        ballots: _BallotTiers object
         prices: Current prices dict (will be modified to contain the result)
         elected: Set of elected candidates
         hopeful: Set of hopeful candidates
@@ -1403,11 +1427,11 @@ def _warren_find_price_for_quota(profile, prices, elected, hopeful, target_cand,
 
     # First check if quota is achievable
     prices[target_cand] = 1.0
-    tallies_hi, _ = _warren_tally_from_profile(profile, prices, elected, hopeful)
+    tallies_hi, _ = _warren_tally_from_profile(ballots, prices, elected, hopeful)
     max_tally = tallies_hi.get(target_cand, 0.0)
 
     prices[target_cand] = 0.0
-    tallies_lo, _ = _warren_tally_from_profile(profile, prices, elected, hopeful)
+    tallies_lo, _ = _warren_tally_from_profile(ballots, prices, elected, hopeful)
     min_tally = tallies_lo.get(target_cand, 0.0)
 
     # If quota is outside achievable range, return boundary
@@ -1423,7 +1447,7 @@ def _warren_find_price_for_quota(profile, prices, elected, hopeful, target_cand,
     for _ in range(64):  # 64 iterations gives ~1e-19 precision
         mid = 0.5 * (lo + hi)
         prices[target_cand] = mid
-        tallies, _ = _warren_tally_from_profile(profile, prices, elected, hopeful)
+        tallies, _ = _warren_tally_from_profile(ballots, prices, elected, hopeful)
         t = tallies.get(target_cand, 0.0)
 
         if abs(t - quota) < tol:
@@ -1505,9 +1529,13 @@ def stv_warren(profile, num_seats=2, curr_cands=None, tol=1e-10, max_iter=2000,
     # Calculate total weight from profile
     rankings, rcounts = profile.rankings_counts
     total_weight = sum(float(count) for count in rcounts)
+
     if total_weight <= EPS or not hopeful or num_seats <= 0:
         return []
     
+    # Compile the ballot tiers once for all the flow computations
+    ballots = _BallotTiers(profile)
+    
     safety = 0
     while len(elected) < num_seats:
         safety += 1
@@ -1520,7 +1548,7 @@ def stv_warren(profile, num_seats=2, curr_cands=None, tol=1e-10, max_iter=2000,
         # Iteratively adjust prices until convergence
         # Warren requires binary search due to the min(remaining, price) structure
         for iteration in range(max_iter):
-            tallies, excess = _warren_tally_from_profile(profile, prices, elected, hopeful)
+            tallies, excess = _warren_tally_from_profile(ballots, prices, elected, hopeful)
 
             # Quota = (total_votes - excess) / (k+1)
             usable = total_weight - excess
@@ -1537,7 +1565,7 @@ def stv_warren(profile, num_seats=2, curr_cands=None, tol=1e-10, max_iter=2000,
                 if abs(t - quota) > tol:
                     # Use binary search to find the price that achieves tally = quota
                     new_price = _warren_find_price_for_quota(
-                        profile, prices, elected, hopeful, c, quota, tol
+                        ballots, prices, elected, hopeful, c, quota, tol
                     )
                     # Always set the price (the function already set it, but be explicit)
                     prices[c] = new_price
@@ -1548,7 +1576,7 @@ def stv_warren(profile, num_seats=2, curr_cands=None, tol=1e-10, max_iter=2000,
                 break
         
         # After convergence, compute final tallies
-        tallies, excess = _warren_tally_from_profile(profile, prices, elected, hopeful)
+        tallies, excess = _warren_tally_from_profile(ballots, prices, elected, hopeful)
         usable = total_weight - excess
         quota = usable / float(num_seats + 1) if usable > EPS else 0.0
         
@@ -1572,7 +1600,7 @@ def stv_warren(profile, num_seats=2, curr_cands=None, tol=1e-10, max_iter=2000,
                     # Use binary search to find the price that achieves tally = quota
                     prices[c] = 1.0  # Start with max price
                     prices[c] = _warren_find_price_for_quota(
-                        profile, prices, elected, hopeful, c, quota, tol
+                        ballots, prices, elected, hopeful, c, quota, tol
                     )
                 else:
                     prices[c] = 1.0
@@ -2058,9 +2086,13 @@ def _stv_meek_with_elimination_order(profile, num_seats, candidates, by_order=No
     # Calculate total weight from profile
     rankings, rcounts = profile.rankings_counts
     total_weight = sum(float(count) for count in rcounts)
+
     if total_weight <= EPS or not hopeful or num_seats <= 0:
         return set(), []
 
+    # Compile the ballot tiers once for all the flow computations
+    ballots = _BallotTiers(profile)
+
     safety = 0
     while len(elected) < num_seats:
         safety += 1
@@ -2074,7 +2106,7 @@ def _stv_meek_with_elimination_order(profile, num_seats, candidates, by_order=No
 
         # Iteratively adjust keep factors until convergence
         for _ in range(max_iter):
-            tallies, excess = _meek_tally_from_profile(profile, keep, active)
+            tallies, excess = _meek_tally_from_profile(ballots, keep, active)
 
             # Quota = (total_votes - excess) / (k+1)
             usable = total_weight - excess
@@ -2101,7 +2133,7 @@ def _stv_meek_with_elimination_order(profile, num_seats, candidates, by_order=No
                 break
 
         # After convergence, check if any HOPEFUL candidate has reached quota
-        tallies, excess = _meek_tally_from_profile(profile, keep, active)
+        tallies, excess = _meek_tally_from_profile(ballots, keep, active)
         usable = total_weight - excess
         quota = usable / float(num_seats + 1) if usable > EPS else 0.0
 
@@ -2160,7 +2192,7 @@ def _stv_meek_with_elimination_order(profile, num_seats, candidates, by_order=No
     if hopeful:
         # Get final tallies for remaining hopeful candidates
         active = hopeful | elected
-        final_tallies, _ = _meek_tally_from_profile(profile, keep, active)
+        final_tallies, _ = _meek_tally_from_profile(ballots, keep, active)
         # Sort remaining hopeful by tally (lowest first = weakest first), by_order for ties
         remaining = sorted(hopeful, key=lambda c: (final_tallies.get(c, 0.0), by_order(c)))
         exclusion_order.extend(remaining)
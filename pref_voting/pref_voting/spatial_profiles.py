@@ -93,7 +93,7 @@ class SpatialProfile(object):
         Returns a utility profile corresponding to the spatial profile.  
         
         Args:
-            utility_function (callable, optional): A function that takes two vectors and returns a float. The default utility function is the quadratic utility function.
+            utility_function (callable, optional): A function that takes two vectors and returns a float. The default utility function is the quadratic utility function.  The utility functions from :mod:`pref_voting.utility_functions` are evaluated for all voters and candidates at once (see :func:`pref_voting.utility_functions.utility_matrix`).
             uncertainty_function (callable, optional): A function that models uncertainty and returns covariance parameters.
             batch (bool, optional): If True, generate positions in batches. Default is False.
             return_virtual_cand_positions (bool, optional): If True, return virtual candidate positions. Default is False.
@@ -117,21 +117,18 @@ class SpatialProfile(object):
                     positions = [np.random.multivariate_normal(self.candidate_position(c), generate_covariance(self.num_dims, *uncertainty_function(self, c, v))) for v in self.voters]
                 virtual_cand_positions[c] = positions
             
-            utility_profile = [
-                {c: utility_function(self.voter_position(v), virtual_cand_positions[c][vidx]) for c in self.candidates}
-                for vidx, v in enumerate(self.voters)
-            ]
+            v_positions = [self.voter_position(v) for v in self.voters]
+            c_positions = np.stack([np.asarray(virtual_cand_positions[c], dtype=float) for c in self.candidates], axis=1)
+            utility_profile = UtilityProfile.from_array(utility_matrix(utility_function, v_positions, c_positions), candidates=self.candidates)
             
             if return_virtual_cand_positions:
-                return UtilityProfile(utility_profile), virtual_cand_positions
+                return utility_profile, virtual_cand_positions
             else:
-                return UtilityProfile(utility_profile)
+                return utility_profile
         else:
-            utility_profile = [
-                {c: utility_function(np.array(self.voter_position(v)), np.array(self.candidate_position(c))) for c in self.candidates}
-                for v in self.voters
-            ]
-            return UtilityProfile(utility_profile)
+            v_positions = [self.voter_position(v) for v in self.voters]
+            c_positions = [self.candidate_position(c) for c in self.candidates]
+            return UtilityProfile.from_array(utility_matrix(utility_function, v_positions, c_positions), candidates=self.candidates)
     
     def add_candidate(self, candidate_positions, add_multiple_candidates = False): 
         """
@@ -48,7 +48,6 @@ def has_strategy_proofness_violation(prof, vm, set_preference = "single-winner",
 
     found_manipulator = False
 
-    ranking_tokens = prof.rankings
     ranking_types = prof.ranking_types
 
     ws = vm(prof)
@@ -61,16 +60,12 @@ def has_strategy_proofness_violation(prof, vm, set_preference = "single-winner",
     for r in ranking_types:
         if not found_manipulator:
 
-            ranking_tokens_minus_r = [r for r in ranking_tokens]
-            ranking_tokens_minus_r.remove(r)
-
             if isinstance(prof,Profile):
 
                 for new_r in permutations(prof.candidates):
                     if new_r != r and not found_manipulator:
 
-                        new_ranking_tokens = ranking_tokens_minus_r + [new_r]
-                        new_prof = Profile(new_ranking_tokens)
+                        new_prof = prof.apply_delta(ProfileDelta().replace(r, new_r))
                         new_ws = vm(new_prof)
 
                         old_winner_to_compare = None
@@ -123,9 +118,7 @@ def has_strategy_proofness_violation(prof, vm, set_preference = "single-winner",
                     new_r = Ranking(_new_r)
                     if new_r != r and not found_manipulator:
 
-                        new_ranking_tokens = ranking_tokens_minus_r + [new_r]
-                        new_prof = ProfileWithTies(new_ranking_tokens, candidates = prof.candidates)
-                        new_prof.use_extended_strict_preference()
+                        new_prof = prof.apply_delta(ProfileDelta().replace(r, new_r))
                         new_ws = vm(new_prof)
 
                         ranked_old_winners = [c for c in ws if c in r_dict.keys()]
@@ -201,7 +194,6 @@ def find_all_strategy_proofness_violations(prof, vm, set_preference = "single-wi
 
     violations = list()
 
-    ranking_tokens = prof.rankings
     ranking_types = prof.ranking_types
 
     ws = vm(prof)
@@ -211,16 +203,12 @@ def find_all_strategy_proofness_violations(prof, vm, set_preference = "single-wi
             return violations
 
     for r in ranking_types:
-        ranking_tokens_minus_r = [r for r in ranking_tokens]
-        ranking_tokens_minus_r.remove(r)
-
         if isinstance(prof,Profile):
 
             for new_r in permutations(prof.candidates):
                 if new_r != r:
 
-                    new_ranking_tokens = ranking_tokens_minus_r + [new_r]
-                    new_prof = Profile(new_ranking_tokens)
+                    new_prof = prof.apply_delta(ProfileDelta().replace(r, new_r))
                     new_ws = vm(new_prof)
 
                     old_winner_to_compare = None
@@ -273,9 +261,7 @@ def find_all_strategy_proofness_violations(prof, vm, set_preference = "single-wi
                 new_r = Ranking(_new_r)
                 if new_r != r:
 
-                    new_ranking_tokens = ranking_tokens_minus_r + [new_r]
-                    new_prof = ProfileWithTies(new_ranking_tokens, candidates = prof.candidates)
-                    new_prof.use_extended_strict_preference()
+                    new_prof = prof.apply_delta(ProfileDelta().replace(r, new_r))
                     new_ws = vm(new_prof)
 
                     ranked_old_winners = [c for c in ws if c in r_dict.keys()]
@@ -117,3 +117,75 @@ def matthews_utility(v_pos: float32[:], c_pos: float32[:]):
         
     """
     return np.dot(v_pos, c_pos) / (np.linalg.norm(v_pos) * np.linalg.norm(c_pos))
+
+## Batched utility functions
+#
+# Each of the following functions takes an array of voter positions and an array of candidate 
+# positions whose shapes broadcast against each other (the last axis is the dimension of the space) 
+# and returns the array of utilities over the remaining axes.  
+
+def _dot(v_pos, c_pos):
+    return np.sum(v_pos * c_pos, axis=-1)
+
+def _norm(pos):
+    return np.sqrt(np.sum(pos * pos, axis=-1))
+
+def _mixed_rm_utilities(v_pos, c_pos, beta = 0.5):
+    return 2 * (1-beta) * _dot(v_pos, c_pos) - beta * _norm(v_pos - c_pos) ** 2
+
+def _rm_utilities(v_pos, c_pos):
+    return _dot(v_pos, c_pos)
+
+def _linear_utilities(v_pos, c_pos):
+    return -_norm(v_pos - c_pos)
+
+def _quadratic_utilities(v_pos, c_pos):
+    return -_norm(v_pos - c_pos) ** 2
+
+def _city_block_utilities(v_pos, c_pos):
+    return -np.sum(np.abs(v_pos - c_pos), axis=-1)
+
+def _shepsle_utilities(v_pos, c_pos, kappa = 1):
+    d = _norm(v_pos - c_pos)
+    return np.exp((kappa**2 * -d**2) / 2)
+
+def _matthews_utilities(v_pos, c_pos):
+    return _dot(v_pos, c_pos) / (_norm(v_pos) * _norm(c_pos))
+
+_batched_utility_functions = {
+    mixed_rm_utility: _mixed_rm_utilities,
+    rm_utility: _rm_utilities,
+    linear_utility: _linear_utilities,
+    quadratic_utility: _quadratic_utilities,
+    city_block_utility: _city_block_utilities,
+    shepsle_utility: _shepsle_utilities,
+    matthews_utility: _matthews_utilities,
+}
+
+def utility_matrix(utility_function, v_positions, c_positions, *params):
+    """
+    Return the utilities of all candidates to all voters as an array with one row for each voter and one column for each candidate.  
+
+    For the utility functions defined in this module, the utilities are computed for all voters and candidates at once by broadcasting.  Any other utility function is called on each pair of a voter position and a candidate position.
+
+    Args:
+        utility_function (callable): A utility function taking the position of a voter, the position of a candidate and the optional ``params``.
+        v_positions (numpy array): The positions of the voters, with shape (num_voters, num_dims).
+        c_positions (numpy array): The positions of the candidates, either with shape (num_cands, num_dims) or, if each voter has their own (e.g., perceived) positions of the candidates, with shape (num_voters, num_cands, num_dims).
+        params: Additional parameters of the utility function (e.g., ``beta`` for :func:`mixed_rm_utility`).
+
+    Returns:
+        numpy array: The utilities, with shape (num_voters, num_cands).
+    """
+    v_positions = np.asarray(v_positions, dtype=float)
+    c_positions = np.asarray(c_positions, dtype=float)
+
+    if c_positions.ndim == 2:
+        c_positions = np.broadcast_to(c_positions, (len(v_positions),) + c_positions.shape)
+
+    batched_utility_function = _batched_utility_functions.get(utility_function)
+    if batched_utility_function is not None: 
+        return batched_utility_function(v_positions[:, np.newaxis, :], c_positions, *params)
+
+    return np.array([[utility_function(v_pos, c_pos, *params) for c_pos in c_poss] 
+                     for v_pos, c_poss in zip(v_positions, c_positions)], dtype=float).reshape(c_positions.shape[:2])
@@ -52,8 +52,8 @@ def relative_utilitarian_ranking(uprof, curr_cands=None):
 
     curr_cands = curr_cands if curr_cands is not None else uprof.domain
 
-    rel_utils = [u.normalize_by_range() for u in uprof.utilities]
-    sums = {c:np.sum([u(c) for u in rel_utils if u(c) is not None]) for c in curr_cands}
+    rel_uprof = uprof.normalize_by_range()
+    sums = {c:np.sum(np.repeat(*rel_uprof._util_column(c))) for c in curr_cands}
     sorted_sums = sorted(list(set(sums.values())), reverse=True)
     return Ranking({x: uidx+1 for uidx, u in enumerate(sorted_sums) 
                     for x in curr_cands if sums[x] == u})
@@ -108,7 +108,7 @@ def lexicographic_maximin_ranking(uprof, curr_cands=None):
 
     curr_cands = curr_cands if curr_cands is not None else uprof.domain
 
-    utils = {x: tuple(sorted([u(x) for u in uprof.utilities if u(x) is not None])) for x in curr_cands}
+    utils = {x: tuple(np.sort(np.repeat(*uprof._util_column(x))).tolist()) for x in curr_cands}
     assert len(list(set([len(us) for us in utils.values()]))) == 1, "Not all the items have the same number of utilities."
     sorted_utils = sorted(list(set(utils.values())), reverse=True)
     return Ranking({x: idx+1 
@@ -143,10 +143,14 @@ def nash_ranking(uprof, sq=None, curr_cands=None):
 
     sq = curr_cands[0] if sq is None else sq
 
-    items_to_rank = list(set([x for x in curr_cands if all([u(x) > u(sq) 
-                                                            for u in uprof.utilities])] + [sq]))
+    # the utilities of each voter (every voter must assign a utility to every item)
+    assert np.all(uprof._defined[:, [uprof.domain.index(x) for x in list(curr_cands) + [sq]]]), "Every voter must assign a utility to the status quo and to every candidate."
+    utils = np.repeat(uprof._utils, uprof._ucounts, axis=0)
+    sq_utils = utils[:, uprof.domain.index(sq)]
+
+    items_to_rank = list(set([x for x in curr_cands if np.all(utils[:, uprof.domain.index(x)] > sq_utils)] + [sq]))
     
-    nash_utils = {x: np.prod([u(x) - u(sq) for u in uprof.utilities]) 
+    nash_utils = {x: np.prod(utils[:, uprof.domain.index(x)] - sq_utils) 
                   for x in items_to_rank}
     sorted_nash_utils = sorted(list(set(nash_utils.values())), reverse=True)
     
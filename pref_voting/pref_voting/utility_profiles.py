@@ -28,6 +28,14 @@ from pref_voting.grade_profiles import GradeProfile
 import warnings
 warnings.simplefilter(action='ignore', category=FutureWarning)
 
+def _counts_array(ucounts):
+    """Return the array of the counts ``ucounts``, each of which must be a non-negative integer."""
+
+    counts = np.asarray(ucounts)
+    int_counts = counts.astype(int)
+    assert np.array_equal(int_counts, counts) and np.all(int_counts >= 0), f"The ucounts must be non-negative integers, not {list(ucounts)}"
+    return int_counts
+
 class UtilityProfile(object):
     """An anonymous profile of (truncated) utilities.  
 
@@ -58,33 +66,74 @@ class UtilityProfile(object):
             ucounts
         ), "The number of utilities much be the same as the number of ucounts"
 
-        _domain = domain if domain is not None else []
+        _domain = set(domain) if domain is not None else set()
+        util_maps = list()
         for u in utilities:
             if isinstance(u, dict):
-                _domain += [x for x in u.keys() if x not in _domain]
+                _domain.update(u.keys())
+                util_maps.append(u)
             elif isinstance(u, Utility):
-                _domain += [x for x in u.domain if x not in _domain]
+                _domain.update(u.domain)
+                util_maps.append(u.as_dict())
 
-        self.domain = sorted(list(set(_domain)))
+        self.domain = sorted(list(_domain))
         """The domain of the profile. """
 
         self.cmap = cmap if cmap is not None else {c: str(c) for c in self.domain}
         """The candidate map is a dictionary associating an alternative with the name used when displaying a alternative."""
 
-        self._utilities = [
-            Utility(u, domain = self.domain, cmap=self.cmap)
-            if type(u) == dict
-            else Utility(u.as_dict(), domain=self.domain, cmap=self.cmap)
-            for u in utilities
-        ]
-        """The list of utilities in the Profile (each utility is a :class:`Utility` object). 
-        """
-
         self.ucounts = [1] * len(utilities) if ucounts is None else list(ucounts)
 
         self.num_voters = np.sum(self.ucounts)
         """The number of voters in the profile. """
 
+        # The utilities are stored as an array with one row for each utility and one column for each 
+        # alternative in the domain, together with a mask of the entries that are assigned a utility.  
+        cidx = {c: i for i, c in enumerate(self.domain)}
+        rows, cols, vals = list(), list(), list()
+        for uidx, u in enumerate(util_maps):
+            for c, v in u.items():
+                if v is not None:
+                    rows.append(uidx)
+                    cols.append(cidx[c])
+                    vals.append(v)
+        self._utils = np.full((len(util_maps), len(self.domain)), np.nan)
+        self._defined = np.zeros((len(util_maps), len(self.domain)), dtype=bool)
+        self._utils[rows, cols] = vals
+        self._defined[rows, cols] = True
+        self._ucounts = _counts_array(self.ucounts)
+
+        self._util_maps = util_maps
+        self._utility_objects = None
+
+    @classmethod
+    def _from_arrays(cls, utils, defined, ucounts, domain, cmap):
+        """Return the profile with the array of utilities ``utils`` in which the entries in the mask ``defined`` are assigned a utility."""
+
+        uprof = cls.__new__(cls)
+        uprof.domain = domain
+        uprof.cmap = cmap
+        uprof.ucounts = list(ucounts)
+        uprof.num_voters = np.sum(uprof.ucounts)
+        uprof._utils = np.where(defined, utils, np.nan)
+        uprof._defined = defined
+        uprof._ucounts = _counts_array(uprof.ucounts)
+        uprof._util_maps = None
+        uprof._utility_objects = None
+        return uprof
+
+    @property
+    def _utilities(self):
+        """The list of utilities in the Profile (each utility is a :class:`Utility` object).  The :class:`Utility` objects are only created when they are first needed."""
+
+        if self._utility_objects is None: 
+            util_maps = self._util_maps
+            if util_maps is None: 
+                util_maps = [{c: v for c, v, d in zip(self.domain, u, defined) if d} 
+                             for u, defined in zip(self._utils.tolist(), self._defined.tolist())]
+            self._utility_objects = [Utility(u, domain=self.domain, cmap=self.cmap) for u in util_maps]
+        return self._utility_objects
+
     @property
     def candidates(self): 
         """Return the candidates in the profile."""
@@ -110,45 +159,68 @@ class UtilityProfile(object):
             us += [u] * c
         return us
 
+    def _util_column(self, x):
+        """Return the utilities assigned to ``x`` and the number of voters associated with each of them."""
+
+        xidx = self.domain.index(x)
+        defined = self._defined[:, xidx]
+        return self._utils[defined, xidx], self._ucounts[defined]
 
     def normalize_by_range(self): 
         """Return a profile in which each utility is normalized by range."""
         
-        return UtilityProfile([
-            u.normalize_by_range() for u in self._utilities
-        ], ucounts = self.ucounts, domain = self.domain, cmap=self.cmap)
+        with np.errstate(invalid="ignore"):
+            max_utils = np.max(np.where(self._defined, self._utils, -np.inf), axis=1, keepdims=True, initial=-np.inf)
+            min_utils = np.min(np.where(self._defined, self._utils, np.inf), axis=1, keepdims=True, initial=np.inf)
+            util_ranges = max_utils - min_utils
+            constant = util_ranges == 0
+            normalized_utils = np.where(constant, 0.0, (self._utils - min_utils) / np.where(constant, 1, util_ranges))
+
+        return UtilityProfile._from_arrays(normalized_utils, self._defined, self.ucounts, self.domain, self.cmap)
     
     def normalize_by_standard_score(self):
         """Return a profile in which each utility is normalized by standard scores.
         """
-        return UtilityProfile([
-            u.normalize_by_standard_score() for u in self._utilities
-        ], ucounts = self.ucounts, domain = self.domain, cmap=self.cmap)
+
+        num_utils = np.sum(self._defined, axis=1, keepdims=True)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean_utils = np.sum(np.where(self._defined, self._utils, 0.0), axis=1, keepdims=True) / num_utils
+            deviations = np.where(self._defined, self._utils - mean_utils, 0.0)
+            std_dev_utils = np.sqrt(np.sum(deviations * deviations, axis=1, keepdims=True) / num_utils)
+            normalized_utils = (self._utils - mean_utils) / std_dev_utils
+
+        return UtilityProfile._from_arrays(normalized_utils, self._defined, self.ucounts, self.domain, self.cmap)
 
     def has_utility(self, x):
         """Return True if ``x`` is assigned a utility by at least one voter."""
 
-        return any([u.has_utility(x) for u in self._utilities])
+        return x in self.domain and bool(np.any(self._defined[:, self.domain.index(x)]))
 
     def util_sum(self, x): 
         """Return the sum of the utilities of ``x``.  If ``x`` is not assigned a utility by any voter, return None."""
 
-        return np.sum([u(x) * c for u,c in zip(*self.utilities_counts) if u.has_utility(x)]) if self.has_utility(x) else None
+        if not self.has_utility(x):
+            return None
+        utils, counts = self._util_column(x)
+        return np.sum(utils * counts)
     
     def util_avg(self, x): 
         """Return the sum of the utilities of ``x``.  If ``x`` is not assigned a utility by any voter, return None."""
 
-        return np.average([u(x) * c for u,c in zip(*self.utilities_counts) if u.has_utility(x)]) if self.has_utility(x) else None
+        if not self.has_utility(x):
+            return None
+        utils, counts = self._util_column(x)
+        return np.average(utils * counts)
     
     def util_max(self, x): 
         """Return the maximum of the utilities of ``x``.  If ``x`` is not assigned a utility by any voter, return None."""
 
-        return max([u(x)  for u in self._utilities if u.has_utility(x)]) if self.has_utility(x) else None
+        return np.max(self._util_column(x)[0]) if self.has_utility(x) else None
     
     def util_min(self, x): 
         """Return the minimum of the utilities of ``x``.  If ``x`` is not assigned a utility by any voter, return None."""
 
-        return min([u(x)  for u in self._utilities if u.has_utility(x)]) if self.has_utility(x) else None
+        return np.min(self._util_column(x)[0]) if self.has_utility(x) else None
 
     def sum_utility_function(self):
         """Return the sum utility function of the profile."""
@@ -165,7 +237,7 @@ class UtilityProfile(object):
 
         return Utility(
             {
-                x: np.average([u(x) for u in self.utilities])
+                x: np.average(np.repeat(*self._util_column(x)))
                 for x in self.domain
             },
             domain=self.domain,
@@ -174,8 +246,19 @@ class UtilityProfile(object):
     def to_ranking_profile(self): 
         """Return a ranking profile (a :class:ProfileWithTies) corresponding to the profile."""
 
+        # sort each utility from the highest to the lowest utility (alternatives without a utility come last) 
+        # and rank the alternatives by the number of distinct utilities above them
+        utils = np.where(self._defined, self._utils, -np.inf)
+        order = np.argsort(-utils, axis=1, kind="stable")
+        sorted_utils = np.take_along_axis(utils, order, axis=1)
+        sorted_ranks = np.ones(utils.shape, dtype=int)
+        sorted_ranks[:, 1:] += np.cumsum(sorted_utils[:, 1:] != sorted_utils[:, :-1], axis=1)
+        ranks = np.empty_like(sorted_ranks)
+        np.put_along_axis(ranks, order, sorted_ranks, axis=1)
+
         return ProfileWithTies(
-            [u.ranking() for u in self._utilities],
+            [Ranking({c: r for c, r, d in zip(self.domain, rs, defined) if d}) 
+             for rs, defined in zip(ranks.tolist(), self._defined.tolist())],
             rcounts = self.ucounts,
             candidates = self.domain, 
             cmap = self.cmap
@@ -241,6 +324,34 @@ class UtilityProfile(object):
             "cmap": self.cmap
         }
     
+    @classmethod
+    def from_array(cls, utilities, ucounts=None, candidates=None, cmap=None): 
+        """
+        Returns a profile of utilities from an array with one row for each utility and one column for each candidate.  An entry ``np.nan`` means that the candidate is not assigned a utility.
+
+        Args:
+            utilities (numpy array): The utilities, with shape (num_utilities, num_cands).
+            ucounts (list[int], optional): The number of voters associated with each row.  If not provided, each row is submitted by 1 voter.
+            candidates (list, optional): The candidates corresponding to the columns.  If not provided, the candidates are 0, 1, ..., num_cands - 1.
+            cmap (dict, optional): Dictionary mapping candidates to candidate names.
+        """
+        utilities = np.asarray(utilities, dtype=float)
+        candidates = list(range(utilities.shape[1])) if candidates is None else list(candidates)
+
+        assert ucounts is None or len(utilities) == len(ucounts), "The number of utilities much be the same as the number of ucounts"
+
+        # the columns are stored in the order of the (sorted) domain
+        cols = sorted(range(len(candidates)), key=lambda cidx: candidates[cidx])
+        utilities = utilities[:, cols]
+        domain = [candidates[cidx] for cidx in cols]
+
+        return cls._from_arrays(
+            utilities, 
+            ~np.isnan(utilities), 
+            [1] * len(utilities) if ucounts is None else ucounts, 
+            domain, 
+            cmap if cmap is not None else {c: str(c) for c in domain})
+
     @classmethod
     def from_json(cls, uprof_json): 
         """
@@ -309,14 +420,7 @@ class UtilityProfile(object):
 
     def __setstate__(self, state):
         # Restore essential data
-        self.domain = state['domain']
-        self.cmap = state['cmap']
-        self.ucounts = state['ucounts']
-
-        self._utilities = [Utility(u_dict, domain=self.domain, cmap=self.cmap) 
-                           for u_dict in state['utilities']]
-
-        self.num_voters = sum(self.ucounts)
+        self.__init__(state['utilities'], ucounts=state['ucounts'], domain=state['domain'], cmap=state['cmap'])
 
 def write_utility_profiles_to_json(uprofs, filename):
     """Write a list of utility profiles to a json file."""
@@ -410,6 +410,46 @@ def is_convex_set(S,L):
             return True
     return False
 
+def _common_interval_clone_sets(type_counts):
+    """
+    Return the nonsingleton proper subsets of the candidates that are intervals of every ranking type in ``type_counts``, as slices of the first ranking type.
+
+    A convex sublist S of the first ranking is an interval of a ranking r exactly when the positions of S in r span |S| places.  For each start of S, the minimum and maximum positions of the growing sublist are computed for all ranking types at once.
+    """
+
+    types = list(type_counts.keys())
+    first_ranking = types[0]
+    num_cands = len(first_ranking)
+
+    # positions[t, c] is the position of candidate c in the ranking type t
+    positions = np.argsort(np.array(types), axis=1)
+
+    clone_sets = list()
+    for i in range(num_cands - 1):
+        pos = positions[:, list(first_ranking[i:])]
+        spans = np.maximum.accumulate(pos, axis=1) - np.minimum.accumulate(pos, axis=1)
+        is_interval = np.all(spans == np.arange(num_cands - i), axis=0)
+        for j in range(i + 2, num_cands + 1):
+            if j - i < num_cands and is_interval[j - i - 1]:
+                clone_sets.append(first_ranking[i:j])
+    return clone_sets
+
+def _interval_support(type_counts, cands):
+    """
+    Return a dictionary mapping each nonsingleton proper subset of ``cands`` (as a bitmask over the indices of ``cands``) that is an interval of some ranking type to the number of voters whose ranking has the subset as an interval.
+    """
+
+    cidx = {c: i for i, c in enumerate(cands)}
+    num_cands = len(cands)
+    support = dict()
+    for r, count in type_counts.items():
+        for i in range(num_cands - 1):
+            mask = 1 << cidx[r[i]]
+            for j in range(i + 1, num_cands - (i == 0)):
+                mask |= 1 << cidx[r[j]]
+                support[mask] = support.get(mask, 0) + count
+    return support
+
 def tideman_clone_sets(prof, epsilon=0):
     """
     Given a profile, returns all sets of clones according to Tideman's definition,
@@ -420,6 +460,13 @@ def tideman_clone_sets(prof, epsilon=0):
     
     If epsilon > 0, then at most epsilon voters are allowed to rank some candidates 
     outside of the "clone" set in between two candidates in the "clone" set.
+
+    The rankings are grouped into ranking types.  If epsilon=0, the sets of clones are 
+    the convex sublists of the first ranking that are intervals of every ranking type.  
+    If epsilon > 0, a set of clones must be an interval of the rankings of at least 
+    num_voters - epsilon voters, so (when epsilon < num_voters) the only candidates are 
+    the intervals of the ranking types, each weighted by the number of voters whose 
+    ranking has it as an interval.
     
     Args:
         prof (Profile): the election data.
@@ -430,46 +477,24 @@ def tideman_clone_sets(prof, epsilon=0):
         List of clone sets (each clone set is a list of candidates).
     """
     
-    rankings = prof.rankings
+    type_counts = ranking_type_counts(prof)
     cands = prof.candidates
     
     if epsilon == 0:
-        # Use the efficient original algorithm when epsilon=0
-        # Start with convex sublists of the first ranking
-        first_ranking = rankings[0]
-        
-        _clone_sets = convex_nonsingleton_proper_sublists(first_ranking)
-        clone_sets = list(_clone_sets)
-        
-        for clone_set in _clone_sets:
-            for r in rankings[1:]:
-                if not is_convex_set(set(clone_set), r):
-                    clone_sets.remove(clone_set)
-                    break
-        
-        return clone_sets
+        return _common_interval_clone_sets(type_counts)
     
+    elif epsilon >= prof.num_voters:
+        # every subset is a set of clones
+        return [list(subset) for subset in powerset(cands) if 1 < len(subset) < len(cands)]
+
     else:
-        # When epsilon > 0, we need to consider all possible subsets
-        # because the first ranking could be one of the deviating rankings
-        clone_sets = []
-        
-        for subset in powerset(cands):
-            if len(subset) <= 1 or len(subset) == len(cands):
-                continue
-            
-            # Count how many rankings have this subset as non-convex
-            non_convex_count = 0
-            for r in rankings:
-                if not is_convex_set(set(subset), r):
-                    non_convex_count += 1
-                    if non_convex_count > epsilon:
-                        break
-            
-            if non_convex_count <= epsilon:
-                clone_sets.append(list(subset))
-        
-        return clone_sets
+        cidx = {c: i for i, c in enumerate(cands)}
+        support = _interval_support(type_counts, cands)
+        clone_sets = [[c for c in cands if mask >> cidx[c] & 1] 
+                      for mask, num in support.items() if prof.num_voters - num <= epsilon]
+
+        # list the clone sets in the order of powerset(cands)
+        return sorted(clone_sets, key=lambda clone_set: (len(clone_set), [cidx[c] for c in clone_set]))
 
 def marginal_clone_sets(edata, epsilon=0):
     """Given a profile or margin graph, returns all sets of "marginal clones": a set C of candidates is a set of marginal clones if for any c,d in C and x not in C, |margin(c,x) - margin(d,x)| <= epsilon."""
@@ -536,6 +561,8 @@ def has_independence_of_clones_violation(prof, vm, clone_def="Tideman", epsilon=
     if clone_def == "Marginal":
         clone_sets = marginal_clone_sets(prof, epsilon)
 
+    ws = vm(prof)
+
     for clone_set in clone_sets:
         
         non_clones = [n for n in prof.candidates if n not in clone_set]
@@ -543,54 +570,55 @@ def has_independence_of_clones_violation(prof, vm, clone_def="Tideman", epsilon=
         for c in clone_set:
 
             cands_without_c = [d for d in prof.candidates if d != c]
+            ws_without_c = vm(prof, curr_cands=cands_without_c)
 
             for n in non_clones:
 
                 if conditions_to_check == "all" or conditions_to_check == "NCIC":
 
-                    if n in vm(prof) and not n in vm(prof, curr_cands=cands_without_c):
+                    if n in ws and not n in ws_without_c:
                         if verbose:
                             print("Non-clone choice is not independent of clones:")
                             prof.display()
                             print(prof.description())
                             print("Clone set:", clone_set)
-                            print(f"{vm.name} winners in full profile: {vm(prof)}")
-                            print(f"{vm.name} winners without clone {c}: {vm(prof, curr_cands=cands_without_c)}")
+                            print(f"{vm.name} winners in full profile: {ws}")
+                            print(f"{vm.name} winners without clone {c}: {ws_without_c}")
                             print(f"The non-clone {n} wins with the clone {c} included but loses when the clone is removed.")
                         return True
                     
-                    if n not in vm(prof) and n in vm(prof, curr_cands=cands_without_c):
+                    if n not in ws and n in ws_without_c:
                         if verbose:
                             print("Non-clone choice is not independent of clones:")
                             prof.display()
                             print(prof.description())
                             print("Clone set:", clone_set)
-                            print(f"{vm.name} winners in full profile: {vm(prof)}")
-                            print(f"{vm.name} winners without clone {c}: {vm(prof, curr_cands=cands_without_c)}")
+                            print(f"{vm.name} winners in full profile: {ws}")
+                            print(f"{vm.name} winners without clone {c}: {ws_without_c}")
                             print(f"The non-clone {n} loses with the clone {c} included but wins when the clone is removed.")
                         return True
                     
             if conditions_to_check == "all" or conditions_to_check == "CIC":
 
-                if len([c for c in vm(prof) if c in clone_set]) > 0 and len([c for c in vm(prof, cands_without_c) if c in clone_set]) == 0:
+                if len([c for c in ws if c in clone_set]) > 0 and len([c for c in ws_without_c if c in clone_set]) == 0:
                     if verbose:
                         print("Clone choice is not independent of clones:")
                         prof.display()
                         print(prof.description())
                         print("Clone set:", clone_set)
-                        print(f"{vm.name} winners in full profile: {vm(prof)}")
-                        print(f"{vm.name} winners without clone {c}: {vm(prof, curr_cands=cands_without_c)}")
+                        print(f"{vm.name} winners in full profile: {ws}")
+                        print(f"{vm.name} winners without clone {c}: {ws_without_c}")
                         print(f"A clone wins with the clone {c} included but no clone wins when {c} is removed.")
                     return True
                 
-                if len([c for c in vm(prof) if c in clone_set]) == 0 and len([c for c in vm(prof, cands_without_c) if c in clone_set]) > 0:
+                if len([c for c in ws if c in clone_set]) == 0 and len([c for c in ws_without_c if c in clone_set]) > 0:
                     if verbose:
                         print("Clone choice is not independent of clones:")
                         prof.display()
                         print(prof.description())
                         print("Clone set:", clone_set)
-                        print(f"{vm.name} winners in full profile: {vm(prof)}")
-                        print(f"{vm.name} winners without clone {c}: {vm(prof, curr_cands=cands_without_c)}")
+                        print(f"{vm.name} winners in full profile: {ws}")
+                        print(f"{vm.name} winners without clone {c}: {ws_without_c}")
                         print(f"No clone wins with the clone {c} included but a clone wins when {c} is removed.")
                     return True
     
@@ -630,6 +658,8 @@ def find_all_independence_of_clones_violations(prof, vm, clone_def="Tideman", ep
 
     violations = list()
 
+    ws = vm(prof)
+
     for clone_set in clone_sets:
         
         non_clones = [n for n in prof.candidates if n not in clone_set]
@@ -637,58 +667,59 @@ def find_all_independence_of_clones_violations(prof, vm, clone_def="Tideman", ep
         for c in clone_set:
 
             cands_without_c = [d for d in prof.candidates if d != c]
+            ws_without_c = vm(prof, curr_cands=cands_without_c)
 
             for n in non_clones:
 
                 if conditions_to_check == "all" or conditions_to_check == "NCIC":
 
-                    if n in vm(prof) and not n in vm(prof, curr_cands=cands_without_c):
+                    if n in ws and not n in ws_without_c:
                         violations.append((clone_set, c, n))
                         if verbose:
                             print("Non-clone choice is not independent of clones:")
                             prof.display()
                             print(prof.description())
                             print("Clone set:", clone_set)
-                            print(f"{vm.name} winners in full profile: {vm(prof)}")
-                            print(f"{vm.name} winners without clone {c}: {vm(prof, curr_cands=cands_without_c)}")
+                            print(f"{vm.name} winners in full profile: {ws}")
+                            print(f"{vm.name} winners without clone {c}: {ws_without_c}")
                             print(f"The non-clone {n} wins with the clone {c} included but loses when the clone is removed.")
                             print("")
                     
-                    if n not in vm(prof) and n in vm(prof, curr_cands=cands_without_c):
+                    if n not in ws and n in ws_without_c:
                         violations.append((clone_set, c, n))
                         if verbose:
                             print("Non-clone choice is not independent of clones:")
                             prof.display()
                             print(prof.description())
                             print("Clone set:", clone_set)
-                            print(f"{vm.name} winners in full profile: {vm(prof)}")
-                            print(f"{vm.name} winners without clone {c}: {vm(prof, curr_cands=cands_without_c)}")
+                            print(f"{vm.name} winners in full profile: {ws}")
+                            print(f"{vm.name} winners without clone {c}: {ws_without_c}")
                             print(f"The non-clone {n} loses with the clone {c} included but wins when the clone is removed.")
                             print("")
                     
             if conditions_to_check == "all" or conditions_to_check == "CIC":
 
-                if len([c for c in vm(prof) if c in clone_set]) > 0 and len([c for c in vm(prof, cands_without_c) if c in clone_set]) == 0:
+                if len([c for c in ws if c in clone_set]) > 0 and len([c for c in ws_without_c if c in clone_set]) == 0:
                     violations.append((clone_set, c))
                     if verbose:
                         print("Clone choice is not independent of clones:")
                         prof.display()
                         print(prof.description())
                         print("Clone set:", clone_set)
-                        print(f"{vm.name} winners in full profile: {vm(prof)}")
-                        print(f"{vm.name} winners without clone {c}: {vm(prof, curr_cands=cands_without_c)}")
+                        print(f"{vm.name} winners in full profile: {ws}")
+                        print(f"{vm.name} winners without clone {c}: {ws_without_c}")
                         print(f"A clone wins with the clone {c} included but no clone wins when {c} is removed.")
                         print("")
 
-                if len([c for c in vm(prof) if c in clone_set]) == 0 and len([c for c in vm(prof, cands_without_c) if c in clone_set]) > 0:
+                if len([c for c in ws if c in clone_set]) == 0 and len([c for c in ws_without_c if c in clone_set]) > 0:
                     violations.append((clone_set, c))
                     if verbose:
                         print("Clone choice is not independent of clones:")
                         prof.display()
                         print(prof.description())
                         print("Clone set:", clone_set)
-                        print(f"{vm.name} winners in full profile: {vm(prof)}")
-                        print(f"{vm.name} winners without clone {c}: {vm(prof, curr_cands=cands_without_c)}")
+                        print(f"{vm.name} winners in full profile: {ws}")
+                        print(f"{vm.name} winners without clone {c}: {ws_without_c}")
                         print(f"No clone wins with the clone {c} included but a clone wins when {c} is removed.")
                         print("")
 
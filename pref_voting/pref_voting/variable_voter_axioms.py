@@ -13,65 +13,89 @@ from itertools import product, combinations, permutations
 from pref_voting.helper import weak_orders
 from pref_voting.rankings import Ranking
 from pref_voting.generate_profiles import strict_weak_orders
+from pref_voting.profiles import _ranks_from_rankings, _tally_from_ranks
 
-def divide_electorate(prof):
-    """Given a Profile or ProfileWithTies object, yield all possible ways to divide the electorate into two nonempty electorates."""
+def _electorate_splits(counts, num_samples=None, seed=None):
+    """Given the number of voters submitting each ranking type, yield the number of voters of each type in the first electorate, for divisions of the electorate into two nonempty electorates.  
 
-    R, C = prof.rankings_counts
+    The count vectors are generated one at a time.  Since a division into electorates with counts C1 and C2 is the same as the division into C2 and C1, only the division in which C1 is lexicographically at most C2 is yielded.  If ``num_samples`` is not None, then ``num_samples`` divisions are drawn uniformly at random (with replacement) instead of enumerating all of them."""
 
-    ranges = [range(count+1) for count in C]
+    counts = np.asarray(counts)
+    num_voters = counts.sum()
 
-    # For each combination of divisions
-    for division in product(*ranges):
-        C1 = np.array(division)
+    if num_voters < 2:
+        return
+
+    if num_samples is not None:
+        rng = np.random.default_rng(seed)
+        num_sampled = 0
+        while num_sampled < num_samples:
+            C1 = rng.integers(0, counts + 1)
+            if 0 < C1.sum() < num_voters:
+                num_sampled += 1
+                C2 = counts - C1
+                yield C1 if tuple(C1) <= tuple(C2) else C2
+        return
+
+    def half_splits(idx):
+        # yield the count vectors for the types from idx onwards that are lexicographically at most their complement
+        if idx == len(counts):
+            yield ()
+            return
+        for c in range(counts[idx] // 2 + 1):
+            if 2 * c < counts[idx]:
+                for rest in product(*[range(count + 1) for count in counts[idx + 1:]]):
+                    yield (c,) + rest
+            else:
+                for rest in half_splits(idx + 1):
+                    yield (c,) + rest
+
+    for C1 in half_splits(0):
+        C1 = np.array(C1, dtype=int)
+        if 0 < C1.sum() < num_voters:
+            yield C1
+
+def divide_electorate(prof, num_samples=None, seed=None):
+    """Given a Profile or ProfileWithTies object, yield all possible ways to divide the electorate into two nonempty electorates.  
+    
+    Voters submitting the same ranking are interchangeable, so divisions are enumerated by the number of voters of each ranking type in the first electorate, and each unordered division is yielded once.  For a Profile, the tally of the first electorate is computed from the counts and the tally of the second electorate is the tally of ``prof`` minus the tally of the first, so the ballots are not tallied again.  If ``num_samples`` is not None, then ``num_samples`` random divisions are yielded (see :func:`_electorate_splits`)."""
+
+    type_counts = ranking_type_counts(prof)
+    R = list(type_counts.keys())
+    C = np.array(list(type_counts.values()))
+
+    if isinstance(prof, Profile):
+        R = np.array(R)
+        ranks = _ranks_from_rankings(R)
+        tally = prof._tally
+
+    for C1 in _electorate_splits(C, num_samples=num_samples, seed=seed):
         C2 = C - C1
 
-        # We will filter out rankings where the count is zero
         nonzero_indices_C1 = np.nonzero(C1)[0]
         nonzero_indices_C2 = np.nonzero(C2)[0]
 
-        # Only yield if both electorates have at least one voter
-        if nonzero_indices_C1.size > 0 and nonzero_indices_C2.size > 0:
+        if isinstance(prof, Profile):
+            prof1 = Profile(R[nonzero_indices_C1], rcounts = C1[nonzero_indices_C1], cmap = prof.cmap)
+            prof2 = Profile(R[nonzero_indices_C2], rcounts = C2[nonzero_indices_C2], cmap = prof.cmap)
+            prof1._tally = _tally_from_ranks(ranks[nonzero_indices_C1], C1[nonzero_indices_C1])
+            prof2._tally = tally - prof1._tally
 
-            if isinstance(prof, Profile):
-                rankings1 = R[nonzero_indices_C1].tolist()
-                rankings2 = R[nonzero_indices_C2].tolist()
-            else:  # ProfileWithTies
-                rankings1 = [R[i] for i in nonzero_indices_C1]
-                rankings2 = [R[i] for i in nonzero_indices_C2]
-            
-            counts1 = C1[nonzero_indices_C1].tolist()
-            counts2 = C2[nonzero_indices_C2].tolist()
-
-            # Convert rankings to comparable format for ordering check
-            if isinstance(prof, Profile):
-                comparable1 = rankings1
-                comparable2 = rankings2
-            else:  # ProfileWithTies - convert Ranking objects to tuples for comparison
-                comparable1 = [tuple(r.rmap) for r in rankings1]
-                comparable2 = [tuple(r.rmap) for r in rankings2]
-            
-            if comparable1 <= comparable2: # This prevents yielding both prof1, prof2 and later on prof2, prof1, unless they are equal
+        if isinstance(prof, ProfileWithTies):
+            prof1 = ProfileWithTies([R[i] for i in nonzero_indices_C1], rcounts = C1[nonzero_indices_C1].tolist(), cmap = prof.cmap)
+            prof2 = ProfileWithTies([R[i] for i in nonzero_indices_C2], rcounts = C2[nonzero_indices_C2].tolist(), cmap = prof.cmap)
 
-                if isinstance(prof,Profile):
-                    prof1 = Profile(rankings1, rcounts = counts1)
-                    prof2 = Profile(rankings2, rcounts = counts2)
-                
-                if isinstance(prof,ProfileWithTies):
-                    prof1 = ProfileWithTies(rankings1, rcounts = counts1)
-                    prof2 = ProfileWithTies(rankings2, rcounts = counts2)
+            if prof.using_extended_strict_preference:
+                prof1.use_extended_strict_preference()
+                prof2.use_extended_strict_preference()
 
-                    if prof.using_extended_strict_preference:
-                        prof1.use_extended_strict_preference()
-                        prof2.use_extended_strict_preference()
-            
-                yield prof1, prof2
+        yield prof1, prof2
 
-def has_reinforcement_violation_with_undergeneration(prof, vm, verbose=False):
+def has_reinforcement_violation_with_undergeneration(prof, vm, verbose=False, num_samples=None, seed=None):
     """Returns true if there is some binary partition of the electorate such that some candidate wins in both subprofiles but not in the full profile"""
     ws = vm(prof)
 
-    for prof1, prof2 in divide_electorate(prof):
+    for prof1, prof2 in divide_electorate(prof, num_samples=num_samples, seed=seed):
         winners_in_both = [c for c in vm(prof1) if c in vm(prof2)]
         if len(winners_in_both) > 0:
             undergenerated = [c for c in winners_in_both if c not in ws]
@@ -98,13 +122,13 @@ def has_reinforcement_violation_with_undergeneration(prof, vm, verbose=False):
             
     return False
 
-def has_reinforcement_violation_with_overgeneration(prof, vm, verbose=False):
+def has_reinforcement_violation_with_overgeneration(prof, vm, verbose=False, num_samples=None, seed=None):
     """Returns true if there is some binary partition of the electorate such that some candidate wins in both subprofiles 
     but there is a winner in the full profile who is not among the winners in both subprofiles"""
 
     ws = vm(prof)
 
-    for prof1, prof2 in divide_electorate(prof):
+    for prof1, prof2 in divide_electorate(prof, num_samples=num_samples, seed=seed):
         winners_in_both = [c for c in vm(prof1) if c in vm(prof2)]
         if len(winners_in_both) > 0:
             overgenerated = [c for c in ws if c not in winners_in_both]
@@ -132,7 +156,7 @@ def has_reinforcement_violation_with_overgeneration(prof, vm, verbose=False):
     return False
 
 
-def has_reinforcement_violation(prof, vm, verbose=False):
+def has_reinforcement_violation(prof, vm, verbose=False, num_samples=None, seed=None):
     """
     Returns True if there is a binary partition of the electorate such that (i) at least one candidate wins in both subelections and either (ii) some candidate who wins in both subelections does not win in the full election or (iii) some candidate who wins in the full election does not win both subelections.
     
@@ -140,20 +164,22 @@ def has_reinforcement_violation(prof, vm, verbose=False):
         prof: a Profile or ProfileWithTies object.
         vm (VotingMethod): A voting method to test.
         verbose (bool, default=False): If a violation is found, display the violation. 
+        num_samples (int, default=None): If not None, only check this many randomly chosen partitions of the electorate instead of all of them.
+        seed (int, default=None): The seed for the random partitions when ``num_samples`` is not None.
 
     Returns: 
         Result of the test (bool): Returns True if there is a violation and False otherwise. 
 
     """
-    if has_reinforcement_violation_with_undergeneration(prof, vm, verbose):
+    if has_reinforcement_violation_with_undergeneration(prof, vm, verbose, num_samples=num_samples, seed=seed):
         return True
     
-    if has_reinforcement_violation_with_overgeneration(prof, vm, verbose):
+    if has_reinforcement_violation_with_overgeneration(prof, vm, verbose, num_samples=num_samples, seed=seed):
         return True
     
     return False
 
-def find_all_reinforcement_violations(prof, vm, verbose=False):
+def find_all_reinforcement_violations(prof, vm, verbose=False, num_samples=None, seed=None):
     """
     Returns all violations of reinforcement for a given profile and voting method.
     
@@ -161,6 +187,8 @@ def find_all_reinforcement_violations(prof, vm, verbose=False):
         prof: a Profile or ProfileWithTies object.
         vm (VotingMethod): A voting method to test.
         verbose (bool, default=False): If a violation is found, display the violation. 
+        num_samples (int, default=None): If not None, only check this many randomly chosen partitions of the electorate instead of all of them.
+        seed (int, default=None): The seed for the random partitions when ``num_samples`` is not None.
 
     Returns: 
         Two list of triples (cand,prof1,prof2) where prof1 and prof2 partition the electorate. In the first list, (cand,prof1,prof2) indicates that cand wins in both prof1 and prof2 but loses in prof. In the second list, (cand,prof1,prof2) indicates that cand wins in prof but not in both prof1 and prof2 (and there are candidates who win in both prof1 and prof2).
@@ -171,7 +199,7 @@ def find_all_reinforcement_violations(prof, vm, verbose=False):
     undergenerations = list()
     overgenerations = list()
 
-    for prof1, prof2 in divide_electorate(prof):
+    for prof1, prof2 in divide_electorate(prof, num_samples=num_samples, seed=seed):
         winners_in_both = [c for c in vm(prof1) if c in vm(prof2)]
         if len(winners_in_both) > 0:
 
@@ -277,6 +305,7 @@ def has_positive_involvement_violation(prof, vm, verbose=False, violation_type="
 
     winners = vm(prof)   
     losers = [c for c in prof.candidates if c not in winners]
+    type_counts = ranking_type_counts(prof)
 
     if require_resoluteness and len(winners) > 1:
         return False
@@ -288,22 +317,11 @@ def has_positive_involvement_violation(prof, vm, verbose=False, violation_type="
         if uniform_coalition:
             for loser in losers:
 
-                relevant_ranking_types = [r for r in prof.ranking_types if r[0] == loser and prof.rankings.count(r) >= coalition_size]
+                relevant_ranking_types = [r for r in prof.ranking_types if r[0] == loser and type_counts[r] >= coalition_size]
 
                 for r in relevant_ranking_types:
 
-                    rankings = prof.rankings
-
-                    for i in range(coalition_size):
-                        rankings.remove(r) # remove coalition_size-many tokens of the type of ranking
-
-                    if isinstance(prof,Profile):
-                        prof2 = Profile(rankings)
-
-                    if isinstance(prof,ProfileWithTies):
-                        prof2 = ProfileWithTies(rankings, candidates = prof.candidates)
-                        if prof.using_extended_strict_preference:
-                            prof2.use_extended_strict_preference()
+                    prof2 = prof.apply_delta(ProfileDelta().remove(r, coalition_size))
 
                     winners2 = vm(prof2)              
 
@@ -343,22 +361,11 @@ def has_positive_involvement_violation(prof, vm, verbose=False, violation_type="
             if check_probabilities:
                 for winner in winners:
 
-                    relevant_ranking_types = [r for r in prof.ranking_types if r[0] == winner and prof.rankings.count(r) >= coalition_size]
+                    relevant_ranking_types = [r for r in prof.ranking_types if r[0] == winner and type_counts[r] >= coalition_size]
 
                     for r in relevant_ranking_types:
 
-                        rankings = prof.rankings
-
-                        for i in range(coalition_size):
-                            rankings.remove(r) # remove coalition_size-many tokens of the type of ranking
-
-                        if isinstance(prof,Profile):
-                            prof2 = Profile(rankings)
-
-                        if isinstance(prof,ProfileWithTies):
-                            prof2 = ProfileWithTies(rankings, candidates = prof.candidates)
-                            if prof.using_extended_strict_preference:
-                                prof2.use_extended_strict_preference()
+                        prof2 = prof.apply_delta(ProfileDelta().remove(r, coalition_size))
 
                         winners2 = vm(prof2)              
 
@@ -400,23 +407,14 @@ def has_positive_involvement_violation(prof, vm, verbose=False, violation_type="
             for loser in losers:
 
                 relevant_ranking_types = [r for r in prof.ranking_types if r[0] == loser]
-                relevant_ranking_types_counts = [prof.rankings.count(r) for r in relevant_ranking_types]
+                relevant_ranking_types_counts = [type_counts[r] for r in relevant_ranking_types]
 
                 for coalition_rankings, coalition_rankings_counts in _submultisets_of_fixed_cardinality(relevant_ranking_types,relevant_ranking_types_counts,coalition_size):
                     
-                    rankings = prof.rankings
-                    
-                    for r_idx, r in enumerate(coalition_rankings):
-                        for i in range(coalition_rankings_counts[r_idx]):
-                            rankings.remove(r)
-                        
-                    if isinstance(prof,Profile):
-                        prof2 = Profile(rankings)
-
-                    if isinstance(prof,ProfileWithTies):
-                        prof2 = ProfileWithTies(rankings, candidates = prof.candidates)
-                        if prof.using_extended_strict_preference:
-                            prof2.use_extended_strict_preference()
+                    delta = ProfileDelta()
+                    for r, num in zip(coalition_rankings, coalition_rankings_counts):
+                        delta.remove(r, num)
+                    prof2 = prof.apply_delta(delta)
 
                     winners2 = vm(prof2)              
 
@@ -451,23 +449,14 @@ def has_positive_involvement_violation(prof, vm, verbose=False, violation_type="
                 for winner in winners:
 
                     relevant_ranking_types = [r for r in prof.ranking_types if r[0] == winner]
-                    relevant_ranking_types_counts = [prof.rankings.count(r) for r in relevant_ranking_types]
+                    relevant_ranking_types_counts = [type_counts[r] for r in relevant_ranking_types]
 
                     for coalition_rankings, coalition_rankings_counts in _submultisets_of_fixed_cardinality(relevant_ranking_types,relevant_ranking_types_counts,coalition_size):
                         
-                        rankings = prof.rankings
-                        
-                        for r_idx, r in enumerate(coalition_rankings):
-                            for i in range(coalition_rankings_counts[r_idx]):
-                                rankings.remove(r)
-                            
-                        if isinstance(prof,Profile):
-                            prof2 = Profile(rankings)
-
-                        if isinstance(prof,ProfileWithTies):
-                            prof2 = ProfileWithTies(rankings)
-                            if prof.using_extended_strict_preference:
-                                prof2.use_extended_strict_preference()
+                        delta = ProfileDelta()
+                        for r, num in zip(coalition_rankings, coalition_rankings_counts):
+                            delta.remove(r, num)
+                        prof2 = prof.apply_delta(delta)
 
                         winners2 = vm(prof2)              
 
@@ -527,6 +516,7 @@ def find_all_positive_involvement_violations(prof, vm, verbose=False, violation_
 
     winners = vm(prof)   
     losers = [c for c in prof.candidates if c not in winners]
+    type_counts = ranking_type_counts(prof)
 
     witnesses = list()
 
@@ -539,22 +529,11 @@ def find_all_positive_involvement_violations(prof, vm, verbose=False, violation_
     if violation_type == "Removal":
         if uniform_coalition:
             for loser in losers:
-                relevant_ranking_types = [r for r in prof.ranking_types if r[0] == loser and prof.rankings.count(r) >= coalition_size]
+                relevant_ranking_types = [r for r in prof.ranking_types if r[0] == loser and type_counts[r] >= coalition_size]
 
                 for r in relevant_ranking_types: # for each type of ranking
                         
-                    rankings = prof.rankings # copy the token rankings
-                    
-                    for i in range(coalition_size):
-                        rankings.remove(r) # remove coalition_size-many tokens of the type of ranking
-
-                    if isinstance(prof,Profile):
-                        prof2 = Profile(rankings)
-
-                    if isinstance(prof,ProfileWithTies):
-                        prof2 = ProfileWithTies(rankings, candidates = prof.candidates)
-                        if prof.using_extended_strict_preference:
-                            prof2.use_extended_strict_preference()
+                    prof2 = prof.apply_delta(ProfileDelta().remove(r, coalition_size))
 
                     winners2 = vm(prof2)
 
@@ -592,22 +571,11 @@ def find_all_positive_involvement_violations(prof, vm, verbose=False, violation_
             
             if check_probabilities:
                 for winner in winners:
-                    relevant_ranking_types = [r for r in prof.ranking_types if r[0] == winner and prof.rankings.count(r) >= coalition_size]
+                    relevant_ranking_types = [r for r in prof.ranking_types if r[0] == winner and type_counts[r] >= coalition_size]
 
                     for r in relevant_ranking_types:
                         
-                        rankings = prof.rankings
-                        
-                        for i in range(coalition_size):
-                            rankings.remove(r)
-
-                        if isinstance(prof,Profile):
-                            prof2 = Profile(rankings)
-
-                        if isinstance(prof,ProfileWithTies):
-                            prof2 = ProfileWithTies(rankings, candidates = prof.candidates)
-                            if prof.using_extended_strict_preference:
-                                prof2.use_extended_strict_preference()
+                        prof2 = prof.apply_delta(ProfileDelta().remove(r, coalition_size))
 
                         winners2 = vm(prof2)
 
@@ -647,23 +615,14 @@ def find_all_positive_involvement_violations(prof, vm, verbose=False, violation_
         if not uniform_coalition:
             for loser in losers:
                 relevant_ranking_types = [r for r in prof.ranking_types if r[0] == loser]
-                relevant_ranking_types_counts = [prof.rankings.count(r) for r in relevant_ranking_types]
+                relevant_ranking_types_counts = [type_counts[r] for r in relevant_ranking_types]
 
                 for coalition_rankings, coalition_rankings_counts in _submultisets_of_fixed_cardinality(relevant_ranking_types,relevant_ranking_types_counts,coalition_size):
                 
-                    rankings = prof.rankings
-                    
-                    for r_idx, r in enumerate(coalition_rankings):
-                        for i in range(coalition_rankings_counts[r_idx]):
-                            rankings.remove(r)
-                        
-                    if isinstance(prof,Profile):
-                        prof2 = Profile(rankings)
-
-                    if isinstance(prof,ProfileWithTies):
-                        prof2 = ProfileWithTies(rankings, candidates = prof.candidates)
-                        if prof.using_extended_strict_preference:
-                            prof2.use_extended_strict_preference()
+                    delta = ProfileDelta()
+                    for r, num in zip(coalition_rankings, coalition_rankings_counts):
+                        delta.remove(r, num)
+                    prof2 = prof.apply_delta(delta)
 
                     winners2 = vm(prof2)              
 
@@ -696,23 +655,14 @@ def find_all_positive_involvement_violations(prof, vm, verbose=False, violation_
             if check_probabilities:
                 for winner in winners:
                     relevant_ranking_types = [r for r in prof.ranking_types if r[0] == winner]
-                    relevant_ranking_types_counts = [prof.rankings.count(r) for r in relevant_ranking_types]
+                    relevant_ranking_types_counts = [type_counts[r] for r in relevant_ranking_types]
 
                     for coalition_rankings, coalition_rankings_counts in _submultisets_of_fixed_cardinality(relevant_ranking_types,relevant_ranking_types_counts,coalition_size):
                         
-                        rankings = prof.rankings
-                        
-                        for r_idx, r in enumerate(coalition_rankings):
-                            for i in range(coalition_rankings_counts[r_idx]):
-                                rankings.remove(r)
-                            
-                        if isinstance(prof,Profile):
-                            prof2 = Profile(rankings)
-
-                        if isinstance(prof,ProfileWithTies):
-                            prof2 = ProfileWithTies(rankings, candidates = prof.candidates)
-                            if prof.using_extended_strict_preference:
-                                prof2.use_extended_strict_preference()
+                        delta = ProfileDelta()
+                        for r, num in zip(coalition_rankings, coalition_rankings_counts):
+                            delta.remove(r, num)
+                        prof2 = prof.apply_delta(delta)
 
                         winners2 = vm(prof2)              
 
@@ -777,6 +727,7 @@ def has_negative_involvement_violation(prof, vm, verbose=False, violation_type="
         Result of the test (bool): Returns True if there is a violation and False otherwise."""
     
     winners = vm(prof)   
+    type_counts = ranking_type_counts(prof)
     
     if require_resoluteness and len(winners) > 1:
         return False
@@ -787,21 +738,10 @@ def has_negative_involvement_violation(prof, vm, verbose=False, violation_type="
     if violation_type == "Removal":
         if uniform_coalition:
             for winner in winners:
-                relevant_ranking_types = [r for r in prof.ranking_types if r[-1] == winner and prof.rankings.count(r) >= coalition_size]
+                relevant_ranking_types = [r for r in prof.ranking_types if r[-1] == winner and type_counts[r] >= coalition_size]
 
                 for r in relevant_ranking_types:
-                    rankings = prof.rankings.copy()
-
-                    for i in range(coalition_size):
-                        rankings.remove(r) # remove coalition_size-many tokens of the type of ranking
-
-                    if isinstance(prof, Profile):
-                        prof2 = Profile(rankings)
-
-                    if isinstance(prof, ProfileWithTies):
-                        prof2 = ProfileWithTies(rankings, candidates=prof.candidates)
-                        if prof.using_extended_strict_preference:
-                            prof2.use_extended_strict_preference()
+                    prof2 = prof.apply_delta(ProfileDelta().remove(r, coalition_size))
 
                     winners2 = vm(prof2)
 
@@ -867,23 +807,14 @@ def has_negative_involvement_violation(prof, vm, verbose=False, violation_type="
         if not uniform_coalition:
             for winner in winners:
                 relevant_ranking_types = [r for r in prof.ranking_types if r[-1] == winner]
-                relevant_ranking_types_counts = [prof.rankings.count(r) for r in relevant_ranking_types]
+                relevant_ranking_types_counts = [type_counts[r] for r in relevant_ranking_types]
 
                 for coalition_rankings, coalition_rankings_counts in _submultisets_of_fixed_cardinality(relevant_ranking_types, relevant_ranking_types_counts, coalition_size):
                     
-                    rankings = prof.rankings.copy()
-                    
-                    for r_idx, r in enumerate(coalition_rankings):
-                        for i in range(coalition_rankings_counts[r_idx]):
-                            rankings.remove(r)
-                        
-                    if isinstance(prof, Profile):
-                        prof2 = Profile(rankings)
-
-                    if isinstance(prof, ProfileWithTies):
-                        prof2 = ProfileWithTies(rankings, candidates=prof.candidates)
-                        if prof.using_extended_strict_preference:
-                            prof2.use_extended_strict_preference()
+                    delta = ProfileDelta()
+                    for r, num in zip(coalition_rankings, coalition_rankings_counts):
+                        delta.remove(r, num)
+                    prof2 = prof.apply_delta(delta)
 
                     winners2 = vm(prof2)              
 
@@ -967,6 +898,7 @@ def find_all_negative_involvement_violations(prof, vm, verbose=False, violation_
     """
     
     winners = vm(prof)   
+    type_counts = ranking_type_counts(prof)
     
     witnesses = list()
 
@@ -979,21 +911,10 @@ def find_all_negative_involvement_violations(prof, vm, verbose=False, violation_
     if violation_type == "Removal":
         if uniform_coalition:
             for winner in winners:
-                relevant_ranking_types = [r for r in prof.ranking_types if r[-1] == winner and prof.rankings.count(r) >= coalition_size]
+                relevant_ranking_types = [r for r in prof.ranking_types if r[-1] == winner and type_counts[r] >= coalition_size]
 
                 for r in relevant_ranking_types:
-                    rankings = prof.rankings.copy()
-
-                    for i in range(coalition_size):
-                        rankings.remove(r) # remove coalition_size-many tokens of the type of ranking
-
-                    if isinstance(prof, Profile):
-                        prof2 = Profile(rankings)
-
-                    if isinstance(prof, ProfileWithTies):
-                        prof2 = ProfileWithTies(rankings, candidates=prof.candidates)
-                        if prof.using_extended_strict_preference:
-                            prof2.use_extended_strict_preference()
+                    prof2 = prof.apply_delta(ProfileDelta().remove(r, coalition_size))
 
                     winners2 = vm(prof2)
 
@@ -1059,23 +980,14 @@ def find_all_negative_involvement_violations(prof, vm, verbose=False, violation_
         if not uniform_coalition:
             for winner in winners:
                 relevant_ranking_types = [r for r in prof.ranking_types if r[-1] == winner]
-                relevant_ranking_types_counts = [prof.rankings.count(r) for r in relevant_ranking_types]
+                relevant_ranking_types_counts = [type_counts[r] for r in relevant_ranking_types]
 
                 for coalition_rankings, coalition_rankings_counts in _submultisets_of_fixed_cardinality(relevant_ranking_types, relevant_ranking_types_counts, coalition_size):
                     
-                    rankings = prof.rankings.copy()
-                    
-                    for r_idx, r in enumerate(coalition_rankings):
-                        for i in range(coalition_rankings_counts[r_idx]):
-                            rankings.remove(r)
-                        
-                    if isinstance(prof, Profile):
-                        prof2 = Profile(rankings)
-
-                    if isinstance(prof, ProfileWithTies):
-                        prof2 = ProfileWithTies(rankings, candidates=prof.candidates)
-                        if prof.using_extended_strict_preference:
-                            prof2.use_extended_strict_preference()
+                    delta = ProfileDelta()
+                    for r, num in zip(coalition_rankings, coalition_rankings_counts):
+                        delta.remove(r, num)
+                    prof2 = prof.apply_delta(delta)
 
                     winners2 = vm(prof2)              
 
@@ -1162,6 +1074,7 @@ def has_positive_negative_involvement_violation(prof, vm, verbose=False, violati
     """
     
     winners = vm(prof)   
+    type_counts = ranking_type_counts(prof)
     non_winners = [c for c in prof.candidates if c not in winners]
 
     if require_resoluteness and len(winners) > 1:
@@ -1175,21 +1088,10 @@ def has_positive_negative_involvement_violation(prof, vm, verbose=False, violati
             # Check for standard positive-negative involvement violations and Case 1 probability violations
             for favorite in non_winners:
                 for least_favorite in winners:
-                    relevant_ranking_types = [r for r in prof.ranking_types if r[0] == favorite and r[-1] == least_favorite and prof.rankings.count(r) >= coalition_size]
+                    relevant_ranking_types = [r for r in prof.ranking_types if r[0] == favorite and r[-1] == least_favorite and type_counts[r] >= coalition_size]
 
                     for r in relevant_ranking_types:
-                        rankings = prof.rankings
-
-                        for i in range(coalition_size):
-                            rankings.remove(r) # remove coalition_size-many tokens of the type of ranking
-
-                        if isinstance(prof, Profile):
-                            prof2 = Profile(rankings)
-
-                        if isinstance(prof, ProfileWithTies):
-                            prof2 = ProfileWithTies(rankings, candidates=prof.candidates)
-                            if prof.using_extended_strict_preference:
-                                prof2.use_extended_strict_preference()
+                        prof2 = prof.apply_delta(ProfileDelta().remove(r, coalition_size))
 
                         winners2 = vm(prof2)
 
@@ -1260,21 +1162,10 @@ def has_positive_negative_involvement_violation(prof, vm, verbose=False, violati
                         if favorite == least_favorite:
                             continue
                         
-                        relevant_ranking_types = [r for r in prof.ranking_types if r[0] == favorite and r[-1] == least_favorite and prof.rankings.count(r) >= coalition_size]
+                        relevant_ranking_types = [r for r in prof.ranking_types if r[0] == favorite and r[-1] == least_favorite and type_counts[r] >= coalition_size]
 
                     for r in relevant_ranking_types:
-                        rankings = prof.rankings
-
-                        for i in range(coalition_size):
-                            rankings.remove(r) # remove coalition_size-many tokens of the type of ranking
-
-                        if isinstance(prof, Profile):
-                            prof2 = Profile(rankings)
-
-                        if isinstance(prof, ProfileWithTies):
-                            prof2 = ProfileWithTies(rankings, candidates=prof.candidates)
-                            if prof.using_extended_strict_preference:
-                                prof2.use_extended_strict_preference()
+                        prof2 = prof.apply_delta(ProfileDelta().remove(r, coalition_size))
 
                         winners2 = vm(prof2)
 
@@ -1316,23 +1207,14 @@ def has_positive_negative_involvement_violation(prof, vm, verbose=False, violati
             for favorite in non_winners:
                 for least_favorite in winners:
                     relevant_ranking_types = [r for r in prof.ranking_types if r[0] == favorite and r[-1] == least_favorite]
-                    relevant_ranking_types_counts = [prof.rankings.count(r) for r in relevant_ranking_types]
+                    relevant_ranking_types_counts = [type_counts[r] for r in relevant_ranking_types]
 
                     for coalition_rankings, coalition_rankings_counts in _submultisets_of_fixed_cardinality(relevant_ranking_types, relevant_ranking_types_counts, coalition_size):
                         
-                        rankings = prof.rankings
-                        
-                        for r_idx, r in enumerate(coalition_rankings):
-                            for i in range(coalition_rankings_counts[r_idx]):
-                                rankings.remove(r)
-                            
-                        if isinstance(prof, Profile):
-                            prof2 = Profile(rankings)
-
-                        if isinstance(prof, ProfileWithTies):
-                            prof2 = ProfileWithTies(rankings, candidates=prof.candidates)
-                            if prof.using_extended_strict_preference:
-                                prof2.use_extended_strict_preference()
+                        delta = ProfileDelta()
+                        for r, num in zip(coalition_rankings, coalition_rankings_counts):
+                            delta.remove(r, num)
+                        prof2 = prof.apply_delta(delta)
 
                         winners2 = vm(prof2)              
 
@@ -1439,6 +1321,7 @@ def find_all_positive_negative_involvement_violations(prof, vm, verbose=False, v
     """
     
     winners = vm(prof)   
+    type_counts = ranking_type_counts(prof)
     non_winners = [c for c in prof.candidates if c not in winners]
     
     witnesses = list()
@@ -1454,21 +1337,10 @@ def find_all_positive_negative_involvement_violations(prof, vm, verbose=False, v
             # Check for standard positive-negative involvement violations and Case 1 probability violations
             for favorite in non_winners:
                 for least_favorite in winners:
-                    relevant_ranking_types = [r for r in prof.ranking_types if r[0] == favorite and r[-1] == least_favorite and prof.rankings.count(r) >= coalition_size]
+                    relevant_ranking_types = [r for r in prof.ranking_types if r[0] == favorite and r[-1] == least_favorite and type_counts[r] >= coalition_size]
 
                     for r in relevant_ranking_types:
-                        rankings = prof.rankings
-
-                        for i in range(coalition_size):
-                            rankings.remove(r) # remove coalition_size-many tokens of the type of ranking
-
-                        if isinstance(prof, Profile):
-                            prof2 = Profile(rankings)
-
-                        if isinstance(prof, ProfileWithTies):
-                            prof2 = ProfileWithTies(rankings, candidates=prof.candidates)
-                            if prof.using_extended_strict_preference:
-                                prof2.use_extended_strict_preference()
+                        prof2 = prof.apply_delta(ProfileDelta().remove(r, coalition_size))
 
                         winners2 = vm(prof2)
 
@@ -1539,21 +1411,10 @@ def find_all_positive_negative_involvement_violations(prof, vm, verbose=False, v
                         if favorite == least_favorite:
                             continue
                         
-                        relevant_ranking_types = [r for r in prof.ranking_types if r[0] == favorite and r[-1] == least_favorite and prof.rankings.count(r) >= coalition_size]
+                        relevant_ranking_types = [r for r in prof.ranking_types if r[0] == favorite and r[-1] == least_favorite and type_counts[r] >= coalition_size]
 
                     for r in relevant_ranking_types:
-                        rankings = prof.rankings
-
-                        for i in range(coalition_size):
-                            rankings.remove(r) # remove coalition_size-many tokens of the type of ranking
-
-                        if isinstance(prof, Profile):
-                            prof2 = Profile(rankings)
-
-                        if isinstance(prof, ProfileWithTies):
-                            prof2 = ProfileWithTies(rankings, candidates=prof.candidates)
-                            if prof.using_extended_strict_preference:
-                                prof2.use_extended_strict_preference()
+                        prof2 = prof.apply_delta(ProfileDelta().remove(r, coalition_size))
 
                         winners2 = vm(prof2)
 
@@ -1596,23 +1457,14 @@ def find_all_positive_negative_involvement_violations(prof, vm, verbose=False, v
             for favorite in non_winners:
                 for least_favorite in winners:
                     relevant_ranking_types = [r for r in prof.ranking_types if r[0] == favorite and r[-1] == least_favorite]
-                    relevant_ranking_types_counts = [prof.rankings.count(r) for r in relevant_ranking_types]
+                    relevant_ranking_types_counts = [type_counts[r] for r in relevant_ranking_types]
 
                     for coalition_rankings, coalition_rankings_counts in _submultisets_of_fixed_cardinality(relevant_ranking_types, relevant_ranking_types_counts, coalition_size):
                         
-                        rankings = prof.rankings
-                        
-                        for r_idx, r in enumerate(coalition_rankings):
-                            for i in range(coalition_rankings_counts[r_idx]):
-                                rankings.remove(r)
-                            
-                        if isinstance(prof, Profile):
-                            prof2 = Profile(rankings)
-
-                        if isinstance(prof, ProfileWithTies):
-                            prof2 = ProfileWithTies(rankings, candidates=prof.candidates)
-                            if prof.using_extended_strict_preference:
-                                prof2.use_extended_strict_preference()
+                        delta = ProfileDelta()
+                        for r, num in zip(coalition_rankings, coalition_rankings_counts):
+                            delta.remove(r, num)
+                        prof2 = prof.apply_delta(delta)
 
                         winners2 = vm(prof2)              
 
@@ -1672,23 +1524,14 @@ def find_all_positive_negative_involvement_violations(prof, vm, verbose=False, v
                             continue
                         
                         relevant_ranking_types = [r for r in prof.ranking_types if r[0] == favorite and r[-1] == least_favorite]
-                        relevant_ranking_types_counts = [prof.rankings.count(r) for r in relevant_ranking_types]
+                        relevant_ranking_types_counts = [type_counts[r] for r in relevant_ranking_types]
 
                     for coalition_rankings, coalition_rankings_counts in _submultisets_of_fixed_cardinality(relevant_ranking_types, relevant_ranking_types_counts, coalition_size):
                         
-                        rankings = prof.rankings
-                        
-                        for r_idx, r in enumerate(coalition_rankings):
-                            for i in range(coalition_rankings_counts[r_idx]):
-                                rankings.remove(r)
-                            
-                        if isinstance(prof, Profile):
-                            prof2 = Profile(rankings)
-
-                        if isinstance(prof, ProfileWithTies):
-                            prof2 = ProfileWithTies(rankings, candidates=prof.candidates)
-                            if prof.using_extended_strict_preference:
-                                prof2.use_extended_strict_preference()
+                        delta = ProfileDelta()
+                        for r, num in zip(coalition_rankings, coalition_rankings_counts):
+                            delta.remove(r, num)
+                        prof2 = prof.apply_delta(delta)
 
                         winners2 = vm(prof2)              
 
@@ -1754,16 +1597,7 @@ def has_tolerant_positive_involvement_violation(prof, vm, verbose=False, violati
         for loser in losers:
             for r in prof.ranking_types: # for each type of ranking
 
-                rankings = prof.rankings
-                rankings.remove(r) # remove the first token of the type of ranking
-                
-                if isinstance(prof, Profile):
-                    prof2 = Profile(rankings)
-                
-                if isinstance(prof, ProfileWithTies):
-                    prof2 = ProfileWithTies(rankings, candidates=prof.candidates)
-                    if prof.using_extended_strict_preference:
-                        prof2.use_extended_strict_preference()
+                prof2 = prof.apply_delta(ProfileDelta().remove(r))
                 
                 tolerant_ballot = True
 
@@ -1831,16 +1665,7 @@ def find_all_tolerant_positive_involvement_violations(prof, vm, verbose=False, v
         for loser in losers:
             for r in prof.ranking_types: # for each type of ranking
 
-                rankings = prof.rankings
-                rankings.remove(r) # remove the first token of the type of ranking
-                
-                if isinstance(prof, Profile):
-                    prof2 = Profile(rankings)
-                
-                if isinstance(prof, ProfileWithTies):
-                    prof2 = ProfileWithTies(rankings, candidates=prof.candidates)
-                    if prof.using_extended_strict_preference:
-                        prof2.use_extended_strict_preference()
+                prof2 = prof.apply_delta(ProfileDelta().remove(r))
 
                 tolerant_ballot = True
 
@@ -1915,16 +1740,16 @@ def has_bullet_vote_positive_involvement_violation(prof, vm, verbose=False, coal
     if require_resoluteness == True and len(ws) > 1:
         return False
     
-    for w in ws:
-        if isinstance(prof, Profile):
-            new_prof = ProfileWithTies([{c:c_indx+1 for c_indx, c in enumerate(r)} for r in prof.rankings] + [{w:1}] * coalition_size, candidates = prof.candidates)
-            new_prof.use_extended_strict_preference()
-            new_mg = new_prof.margin_graph()
+    # the bullet votes are added to the profile viewed as a profile of strict weak orders using extended strict preferences
+    if isinstance(prof, Profile):
+        prof_with_ties = prof.to_profile_with_ties()
+    else:
+        prof_with_ties = ProfileWithTies(prof._rankings, rcounts = prof.rcounts, candidates = prof.candidates, cmap = prof.cmap)
+    prof_with_ties.use_extended_strict_preference()
 
-        if isinstance(prof, ProfileWithTies):
-            new_prof = ProfileWithTies(prof.rankings + [{w:1}] * coalition_size, candidates = prof.candidates)
-            new_prof.use_extended_strict_preference()
-            new_mg = new_prof.margin_graph()
+    for w in ws:
+        new_prof = prof_with_ties.apply_delta(ProfileDelta().add({w:1}, coalition_size))
+        new_mg = new_prof.margin_graph()
 
         if require_uniquely_weighted == True and not new_mg.is_uniquely_weighted(): 
             continue
@@ -2005,15 +1830,16 @@ def find_all_bullet_vote_positive_involvement_violations(prof, vm, verbose=False
     
     violations = list()
 
+    # the bullet votes are added to the profile viewed as a profile of strict weak orders using extended strict preferences
+    if isinstance(prof, Profile):
+        prof_with_ties = prof.to_profile_with_ties()
+    else:
+        prof_with_ties = ProfileWithTies(prof._rankings, rcounts = prof.rcounts, candidates = prof.candidates, cmap = prof.cmap)
+    prof_with_ties.use_extended_strict_preference()
+
     for w in ws:
-        if isinstance(prof, Profile):
-            new_prof = ProfileWithTies([{c:c_indx+1 for c_indx, c in enumerate(r)} for r in prof.rankings] + [{w:1}] * coalition_size, candidates = prof.candidates)
-            new_prof.use_extended_strict_preference()
-            new_mg = new_prof.margin_graph()
-        if isinstance(prof, ProfileWithTies):
-            new_prof = ProfileWithTies(prof.rankings + [{w:1}] * coalition_size, candidates = prof.candidates)
-            new_prof.use_extended_strict_preference()
-            new_mg = new_prof.margin_graph()
+        new_prof = prof_with_ties.apply_delta(ProfileDelta().add({w:1}, coalition_size))
+        new_mg = new_prof.margin_graph()
 
         if require_uniquely_weighted == True and not new_mg.is_uniquely_weighted(): 
             continue
@@ -2091,12 +1917,14 @@ def has_semi_positive_involvement_violation(prof, vm, verbose=False):
     """
     
     if isinstance(prof, Profile):
+        # The profiles with a truncated ballot are obtained from this profile
+        prof_with_ties = prof.to_profile_with_ties()
+        prof_with_ties.use_extended_strict_preference()
+
         # For each ranking in the profile
         for r_idx, r in enumerate(prof.rankings):
             # Create a profile with this ballot removed
-            removed_ballot_rankings = prof.rankings.copy()
-            removed_ballot_rankings.pop(r_idx)
-            removed_ballot_prof = Profile(removed_ballot_rankings)
+            removed_ballot_prof = prof.apply_delta(ProfileDelta().remove(r))
             
             # Get winners when ballot is removed
             removed_ballot_winners = vm(removed_ballot_prof)
@@ -2114,15 +1942,7 @@ def has_semi_positive_involvement_violation(prof, vm, verbose=False):
                 truncated_ballot = {c: i+1 for i, c in enumerate(ranked_candidates)}
                 
                 # Create a profile with the truncated ballot
-                # Convert tuples to dictionaries for ProfileWithTies
-                converted_rankings = []
-                for ranking in removed_ballot_rankings:
-                    converted_rankings.append({c: i+1 for i, c in enumerate(ranking)})
-                
-                # Add the truncated ballot to the converted rankings
-                converted_rankings.append(truncated_ballot)
-                truncated_ballot_prof = ProfileWithTies(converted_rankings, candidates=prof.candidates)
-                truncated_ballot_prof.use_extended_strict_preference()
+                truncated_ballot_prof = prof_with_ties.apply_delta(ProfileDelta().replace({c: i+1 for i, c in enumerate(r)}, truncated_ballot))
                 
                 # Get winners when truncated ballot is added
                 truncated_ballot_winners = vm(truncated_ballot_prof)
@@ -2171,13 +1991,7 @@ def has_semi_positive_involvement_violation(prof, vm, verbose=False):
                 continue
                 
             # Create a profile with this ballot removed
-            removed_ballot_rankings = rankings.copy()
-            removed_ballot_rcounts = rcounts.copy()
-            removed_ballot_rankings.pop(r_idx)
-            removed_ballot_rcounts.pop(r_idx)
-            removed_ballot_prof = ProfileWithTies(removed_ballot_rankings, rcounts=removed_ballot_rcounts, candidates=prof.candidates)
-            if prof.using_extended_strict_preference:
-                removed_ballot_prof.use_extended_strict_preference()
+            removed_ballot_prof = prof.apply_delta(ProfileDelta().remove(r))
             
             # Get winners when ballot is removed
             removed_ballot_winners = vm(removed_ballot_prof)
@@ -2199,11 +2013,7 @@ def has_semi_positive_involvement_violation(prof, vm, verbose=False):
                 truncated_ballot = {c: r.rmap[c] for c in truncated_ranked_candidates}
                 
                 # Create a profile with the truncated ballot
-                truncated_ballot_rankings = removed_ballot_rankings + [Ranking(truncated_ballot)]
-                truncated_ballot_rcounts = removed_ballot_rcounts + [1]
-                truncated_ballot_prof = ProfileWithTies(truncated_ballot_rankings, rcounts=truncated_ballot_rcounts, candidates=prof.candidates)
-                if prof.using_extended_strict_preference:
-                    truncated_ballot_prof.use_extended_strict_preference()
+                truncated_ballot_prof = prof.apply_delta(ProfileDelta().replace(r, truncated_ballot))
                 
                 # Get winners when truncated ballot is added
                 truncated_ballot_winners = vm(truncated_ballot_prof)
@@ -2260,12 +2070,14 @@ def find_all_semi_positive_involvement_violations(prof, vm, verbose=False):
     violations = []
     
     if isinstance(prof, Profile):
+        # The profiles with a truncated ballot are obtained from this profile
+        prof_with_ties = prof.to_profile_with_ties()
+        prof_with_ties.use_extended_strict_preference()
+
         # For each ranking in the profile
         for r_idx, r in enumerate(prof.rankings):
             # Create a profile with this ballot removed
-            removed_ballot_rankings = prof.rankings.copy()
-            removed_ballot_rankings.pop(r_idx)
-            removed_ballot_prof = Profile(removed_ballot_rankings)
+            removed_ballot_prof = prof.apply_delta(ProfileDelta().remove(r))
             
             # Get winners when ballot is removed
             removed_ballot_winners = vm(removed_ballot_prof)
@@ -2283,15 +2095,7 @@ def find_all_semi_positive_involvement_violations(prof, vm, verbose=False):
                 truncated_ballot = {c: i+1 for i, c in enumerate(ranked_candidates)}
                 
                 # Create a profile with the truncated ballot
-                # Convert tuples to dictionaries for ProfileWithTies
-                converted_rankings = []
-                for ranking in removed_ballot_rankings:
-                    converted_rankings.append({c: i+1 for i, c in enumerate(ranking)})
-                
-                # Add the truncated ballot to the converted rankings
-                converted_rankings.append(truncated_ballot)
-                truncated_ballot_prof = ProfileWithTies(converted_rankings, candidates=prof.candidates)
-                truncated_ballot_prof.use_extended_strict_preference()
+                truncated_ballot_prof = prof_with_ties.apply_delta(ProfileDelta().replace({c: i+1 for i, c in enumerate(r)}, truncated_ballot))
                 
                 # Get winners when truncated ballot is added
                 truncated_ballot_winners = vm(truncated_ballot_prof)
@@ -2341,13 +2145,7 @@ def find_all_semi_positive_involvement_violations(prof, vm, verbose=False):
                 continue
                 
             # Create a profile with this ballot removed
-            removed_ballot_rankings = rankings.copy()
-            removed_ballot_rcounts = rcounts.copy()
-            removed_ballot_rankings.pop(r_idx)
-            removed_ballot_rcounts.pop(r_idx)
-            removed_ballot_prof = ProfileWithTies(removed_ballot_rankings, rcounts=removed_ballot_rcounts, candidates=prof.candidates)
-            if prof.using_extended_strict_preference:
-                removed_ballot_prof.use_extended_strict_preference()
+            removed_ballot_prof = prof.apply_delta(ProfileDelta().remove(r))
             
             # Get winners when ballot is removed
             removed_ballot_winners = vm(removed_ballot_prof)
@@ -2369,11 +2167,7 @@ def find_all_semi_positive_involvement_violations(prof, vm, verbose=False):
                 truncated_ballot = {c: r.rmap[c] for c in truncated_ranked_candidates}
                 
                 # Create a profile with the truncated ballot
-                truncated_ballot_rankings = removed_ballot_rankings + [Ranking(truncated_ballot)]
-                truncated_ballot_rcounts = removed_ballot_rcounts + [1]
-                truncated_ballot_prof = ProfileWithTies(truncated_ballot_rankings, rcounts=truncated_ballot_rcounts, candidates=prof.candidates)
-                if prof.using_extended_strict_preference:
-                    truncated_ballot_prof.use_extended_strict_preference()
+                truncated_ballot_prof = prof.apply_delta(ProfileDelta().replace(r, truncated_ballot))
                 
                 # Get winners when truncated ballot is added
                 truncated_ballot_winners = vm(truncated_ballot_prof)
@@ -2435,12 +2229,14 @@ def has_truncated_involvement_violation(prof, vm, verbose=False):
     """
     
     if isinstance(prof, Profile):
+        # The profiles with a truncated ballot are obtained from this profile
+        prof_with_ties = prof.to_profile_with_ties()
+        prof_with_ties.use_extended_strict_preference()
+
         # For each ranking in the profile
         for r_idx, r in enumerate(prof.rankings):
             # Create a profile with this ballot removed
-            removed_ballot_rankings = prof.rankings.copy()
-            removed_ballot_rankings.pop(r_idx)
-            removed_ballot_prof = Profile(removed_ballot_rankings)
+            removed_ballot_prof = prof.apply_delta(ProfileDelta().remove(r))
             
             # Get winners when ballot is removed
             removed_ballot_winners = vm(removed_ballot_prof)
@@ -2455,15 +2251,7 @@ def has_truncated_involvement_violation(prof, vm, verbose=False):
                 truncated_ballot = {c: i+1 for i, c in enumerate(ranked_candidates)}
                 
                 # Create a profile with the truncated ballot
-                # Convert tuples to dictionaries for ProfileWithTies
-                converted_rankings = []
-                for ranking in removed_ballot_rankings:
-                    converted_rankings.append({c: i+1 for i, c in enumerate(ranking)})
-                
-                # Add the truncated ballot to the converted rankings
-                converted_rankings.append(truncated_ballot)
-                truncated_ballot_prof = ProfileWithTies(converted_rankings, candidates=prof.candidates)
-                truncated_ballot_prof.use_extended_strict_preference()
+                truncated_ballot_prof = prof_with_ties.apply_delta(ProfileDelta().replace({c: i+1 for i, c in enumerate(r)}, truncated_ballot))
                 
                 # Get winners when truncated ballot is added
                 truncated_ballot_winners = vm(truncated_ballot_prof)
@@ -2511,13 +2299,7 @@ def has_truncated_involvement_violation(prof, vm, verbose=False):
                 continue
                 
             # Create a profile with this ballot removed
-            removed_ballot_rankings = rankings.copy()
-            removed_ballot_rcounts = rcounts.copy()
-            removed_ballot_rankings.pop(r_idx)
-            removed_ballot_rcounts.pop(r_idx)
-            removed_ballot_prof = ProfileWithTies(removed_ballot_rankings, rcounts=removed_ballot_rcounts, candidates=prof.candidates)
-            if prof.using_extended_strict_preference:
-                removed_ballot_prof.use_extended_strict_preference()
+            removed_ballot_prof = prof.apply_delta(ProfileDelta().remove(r))
             
             # Get winners when ballot is removed
             removed_ballot_winners = vm(removed_ballot_prof)
@@ -2536,11 +2318,7 @@ def has_truncated_involvement_violation(prof, vm, verbose=False):
                 truncated_ballot = {c: r.rmap[c] for c in truncated_ranked_candidates}
                 
                 # Create a profile with the truncated ballot
-                truncated_ballot_rankings = removed_ballot_rankings + [Ranking(truncated_ballot)]
-                truncated_ballot_rcounts = removed_ballot_rcounts + [1]
-                truncated_ballot_prof = ProfileWithTies(truncated_ballot_rankings, rcounts=truncated_ballot_rcounts, candidates=prof.candidates)
-                if prof.using_extended_strict_preference:
-                    truncated_ballot_prof.use_extended_strict_preference()
+                truncated_ballot_prof = prof.apply_delta(ProfileDelta().replace(r, truncated_ballot))
                 
                 # Get winners when truncated ballot is added
                 truncated_ballot_winners = vm(truncated_ballot_prof)
@@ -2594,12 +2372,14 @@ def find_all_truncated_involvement_violations(prof, vm, verbose=False):
     violations = []
     
     if isinstance(prof, Profile):
+        # The profiles with a truncated ballot are obtained from this profile
+        prof_with_ties = prof.to_profile_with_ties()
+        prof_with_ties.use_extended_strict_preference()
+
         # For each ranking in the profile
         for r_idx, r in enumerate(prof.rankings):
             # Create a profile with this ballot removed
-            removed_ballot_rankings = prof.rankings.copy()
-            removed_ballot_rankings.pop(r_idx)
-            removed_ballot_prof = Profile(removed_ballot_rankings)
+            removed_ballot_prof = prof.apply_delta(ProfileDelta().remove(r))
             
             # Get winners when ballot is removed
             removed_ballot_winners = vm(removed_ballot_prof)
@@ -2614,15 +2394,7 @@ def find_all_truncated_involvement_violations(prof, vm, verbose=False):
                 truncated_ballot = {c: i+1 for i, c in enumerate(ranked_candidates)}
                 
                 # Create a profile with the truncated ballot
-                # Convert tuples to dictionaries for ProfileWithTies
-                converted_rankings = []
-                for ranking in removed_ballot_rankings:
-                    converted_rankings.append({c: i+1 for i, c in enumerate(ranking)})
-                
-                # Add the truncated ballot to the converted rankings
-                converted_rankings.append(truncated_ballot)
-                truncated_ballot_prof = ProfileWithTies(converted_rankings, candidates=prof.candidates)
-                truncated_ballot_prof.use_extended_strict_preference()
+                truncated_ballot_prof = prof_with_ties.apply_delta(ProfileDelta().replace({c: i+1 for i, c in enumerate(r)}, truncated_ballot))
                 
                 # Get winners when truncated ballot is added
                 truncated_ballot_winners = vm(truncated_ballot_prof)
@@ -2666,13 +2438,7 @@ def find_all_truncated_involvement_violations(prof, vm, verbose=False):
                 continue
                 
             # Create a profile with this ballot removed
-            removed_ballot_rankings = rankings.copy()
-            removed_ballot_rcounts = rcounts.copy()
-            removed_ballot_rankings.pop(r_idx)
-            removed_ballot_rcounts.pop(r_idx)
-            removed_ballot_prof = ProfileWithTies(removed_ballot_rankings, rcounts=removed_ballot_rcounts, candidates=prof.candidates)
-            if prof.using_extended_strict_preference:
-                removed_ballot_prof.use_extended_strict_preference()
+            removed_ballot_prof = prof.apply_delta(ProfileDelta().remove(r))
             
             # Get winners when ballot is removed
             removed_ballot_winners = vm(removed_ballot_prof)
@@ -2691,11 +2457,7 @@ def find_all_truncated_involvement_violations(prof, vm, verbose=False):
                 truncated_ballot = {c: r.rmap[c] for c in truncated_ranked_candidates}
                 
                 # Create a profile with the truncated ballot
-                truncated_ballot_rankings = removed_ballot_rankings + [Ranking(truncated_ballot)]
-                truncated_ballot_rcounts = removed_ballot_rcounts + [1]
-                truncated_ballot_prof = ProfileWithTies(truncated_ballot_rankings, rcounts=truncated_ballot_rcounts, candidates=prof.candidates)
-                if prof.using_extended_strict_preference:
-                    truncated_ballot_prof.use_extended_strict_preference()
+                truncated_ballot_prof = prof.apply_delta(ProfileDelta().replace(r, truncated_ballot))
                 
                 # Get winners when truncated ballot is added
                 truncated_ballot_winners = vm(truncated_ballot_prof)
@@ -2786,19 +2548,15 @@ def has_participation_violation(prof, vm, verbose = False, violation_type = "Rem
         
         if violation_type == "Removal":
 
-            relevant_ranking_types = [r for r in prof.ranking_types if prof.rankings.count(r) >= coalition_size]
+            type_counts = ranking_type_counts(prof)
+            relevant_ranking_types = [r for r in prof.ranking_types if type_counts[r] >= coalition_size]
 
             for r in relevant_ranking_types:
                 if not found_manipulator:
 
-                    ranking_tokens = [r for r in prof.rankings]
-
-                    for i in range(coalition_size):
-                        ranking_tokens.remove(r) # remove coalition_size-many tokens of the type of ranking
-
                     if isinstance(prof,Profile):
 
-                        new_prof = Profile(ranking_tokens)
+                        new_prof = prof.apply_delta(ProfileDelta().remove(r, coalition_size))
                         new_ws = vm(new_prof)
 
                         old_winner_to_compare = None
@@ -2855,8 +2613,7 @@ def has_participation_violation(prof, vm, verbose = False, violation_type = "Rem
                     if isinstance(prof,ProfileWithTies):
                         r_dict = r.rmap
 
-                        new_prof = ProfileWithTies(ranking_tokens, candidates = prof.candidates)
-                        new_prof.use_extended_strict_preference()
+                        new_prof = prof.apply_delta(ProfileDelta().remove(r, coalition_size))
                         new_ws = vm(new_prof)
 
                         ranked_old_winners = [c for c in ws if c in r_dict.keys()]
@@ -2917,12 +2674,7 @@ def has_participation_violation(prof, vm, verbose = False, violation_type = "Rem
                 for new_r in permutations(prof.candidates):
                     if not found_manipulator:
 
-                        new_ranking_tokens = [r for r in prof.rankings]
-
-                        for i in range(coalition_size):
-                            new_ranking_tokens.append(new_r)
-
-                        new_prof = Profile(new_ranking_tokens)
+                        new_prof = prof.apply_delta(ProfileDelta().add(new_r, coalition_size))
                         new_ws = vm(new_prof)
 
                         old_winner_to_compare = None
@@ -2981,13 +2733,7 @@ def has_participation_violation(prof, vm, verbose = False, violation_type = "Rem
 
                     if not found_manipulator:
 
-                        new_ranking_tokens = [r for r in prof.rankings] 
-
-                        for i in range(coalition_size):
-                            new_ranking_tokens.append(new_r)
-
-                        new_prof = ProfileWithTies(new_ranking_tokens, candidates = prof.candidates)
-                        new_prof.use_extended_strict_preference()
+                        new_prof = prof.apply_delta(ProfileDelta().add(new_r, coalition_size))
                         new_ws = vm(new_prof)
 
                         ranked_old_winners = [c for c in ws if c in new_r_dict.keys()]
@@ -3092,17 +2838,13 @@ def find_all_participation_violations(prof, vm, verbose = False, violation_type
         
         if violation_type == "Removal":
 
-            relevant_ranking_types = [r for r in prof.ranking_types if prof.rankings.count(r) >= coalition_size]
+            type_counts = ranking_type_counts(prof)
+            relevant_ranking_types = [r for r in prof.ranking_types if type_counts[r] >= coalition_size]
 
             for r in relevant_ranking_types:
-                ranking_tokens = [r for r in prof.rankings]
-
-                for i in range(coalition_size):
-                    ranking_tokens.remove(r) # remove coalition_size-many tokens of the type of ranking
-
                 if isinstance(prof,Profile):
 
-                    new_prof = Profile(ranking_tokens)
+                    new_prof = prof.apply_delta(ProfileDelta().remove(r, coalition_size))
                     new_ws = vm(new_prof)
 
                     old_winner_to_compare = None
@@ -3160,8 +2902,7 @@ def find_all_participation_violations(prof, vm, verbose = False, violation_type
                 if isinstance(prof,ProfileWithTies):
                     r_dict = r.rmap
 
-                    new_prof = ProfileWithTies(ranking_tokens, candidates = prof.candidates)
-                    new_prof.use_extended_strict_preference()
+                    new_prof = prof.apply_delta(ProfileDelta().remove(r, coalition_size))
                     new_ws = vm(new_prof)
 
                     ranked_old_winners = [c for c in ws if c in r_dict.keys()]
@@ -3220,12 +2961,7 @@ def find_all_participation_violations(prof, vm, verbose = False, violation_type
             if isinstance(prof,Profile):
 
                 for new_r in permutations(prof.candidates):
-                    new_ranking_tokens = [r for r in prof.rankings]
-
-                    for i in range(coalition_size):
-                        new_ranking_tokens.append(new_r)
-
-                    new_prof = Profile(new_ranking_tokens)
+                    new_prof = prof.apply_delta(ProfileDelta().add(new_r, coalition_size))
                     new_ws = vm(new_prof)
 
                     old_winner_to_compare = None
@@ -3282,13 +3018,7 @@ def find_all_participation_violations(prof, vm, verbose = False, violation_type
                         new_r = Ranking(_new_r)
                         new_r_dict = new_r.rmap
     
-                        new_ranking_tokens = [r for r in prof.rankings] 
-    
-                        for i in range(coalition_size):
-                            new_ranking_tokens.append(new_r)
-    
-                        new_prof = ProfileWithTies(new_ranking_tokens, candidates = prof.candidates)
-                        new_prof.use_extended_strict_preference()
+                        new_prof = prof.apply_delta(ProfileDelta().add(new_r, coalition_size))
                         new_ws = vm(new_prof)
     
                         ranked_old_winners = [c for c in ws if c in new_r_dict.keys()]
@@ -3376,7 +3106,7 @@ def has_single_voter_resolvability_violation(prof, vm, verbose=False):
 
             if isinstance(prof,Profile):
                 for r in permutations(prof.candidates):
-                    new_prof = Profile(prof.rankings + [r])
+                    new_prof = prof.apply_delta(ProfileDelta().add(r))
                     if vm(new_prof) == [winner]:
                         found_voter_to_add = True
                         break
@@ -3384,8 +3114,7 @@ def has_single_voter_resolvability_violation(prof, vm, verbose=False):
             if isinstance(prof,ProfileWithTies):
                 for _r in weak_orders(prof.candidates):
                     r = Ranking(_r)
-                    new_prof = ProfileWithTies(prof.rankings + [r], candidates = prof.candidates)
-                    new_prof.use_extended_strict_preference()
+                    new_prof = prof.apply_delta(ProfileDelta().add(r))
                     if vm(new_prof) == [winner]:
                         found_voter_to_add = True
                         break
@@ -3442,7 +3171,7 @@ def find_all_single_voter_resolvability_violations(prof, vm, verbose=False):
 
             if isinstance(prof,Profile):
                 for r in permutations(prof.candidates):
-                    new_prof = Profile(prof.rankings + [r])
+                    new_prof = prof.apply_delta(ProfileDelta().add(r))
                     if vm(new_prof) == [winner]:
                         found_voter_to_add = True
                         break
@@ -3450,8 +3179,7 @@ def find_all_single_voter_resolvability_violations(prof, vm, verbose=False):
             if isinstance(prof,ProfileWithTies):
                 for _r in weak_orders(prof.candidates):
                     r = Ranking(_r)
-                    new_prof = ProfileWithTies(prof.rankings + [r], candidates = prof.candidates)
-                    new_prof.use_extended_strict_preference()
+                    new_prof = prof.apply_delta(ProfileDelta().add(r))
                     if vm(new_prof) == [winner]:
                         found_voter_to_add = True
                         break
@@ -3513,7 +3241,7 @@ def has_weak_single_voter_resolvability_violation(prof, vm, verbose=False):
 
             if isinstance(prof,Profile):
                 for r in permutations(prof.candidates):
-                    new_prof = Profile(prof.rankings + [r])
+                    new_prof = prof.apply_delta(ProfileDelta().add(r))
                     if vm(new_prof) == [winner]:
                         found_voter_to_add = True
                         break
@@ -3521,8 +3249,7 @@ def has_weak_single_voter_resolvability_violation(prof, vm, verbose=False):
             if isinstance(prof,ProfileWithTies):
                 for _r in weak_orders(prof.candidates):
                     r = Ranking(_r)
-                    new_prof = ProfileWithTies(prof.rankings + [r], candidates = prof.candidates)
-                    new_prof.use_extended_strict_preference()
+                    new_prof = prof.apply_delta(ProfileDelta().add(r))
                     if vm(new_prof) == [winner]:
                         found_voter_to_add = True
                         break
@@ -3582,18 +3309,12 @@ def has_neutral_reversal_violation(prof, vm, verbose=False):
             
         if isinstance(prof, Profile):
             # For Profile objects, we need to work with numpy arrays
-            pair_arr = np.array([list(ranking), list(reverse_ranking)])
-            combined_rankings = np.concatenate([prof._rankings, pair_arr], axis=0)
-            combined_rcounts = np.concatenate([prof._rcounts, [1, 1]], axis=0)
-            prof2 = Profile(combined_rankings, rcounts=combined_rcounts)
+            prof2 = prof.apply_delta(ProfileDelta().add(ranking).add(reverse_ranking))
         else:
             # For ProfileWithTies, we work with Ranking objects
             ranking_obj = Ranking({c: i for i, c in enumerate(ranking)})
             reverse_ranking_obj = Ranking({c: len(ranking)-1-i for i, c in enumerate(ranking)})
-            new_rankings = prof.rankings + [ranking_obj, reverse_ranking_obj]
-            prof2 = ProfileWithTies(new_rankings, candidates=prof.candidates)
-            if prof.using_extended_strict_preference:
-                prof2.use_extended_strict_preference()
+            prof2 = prof.apply_delta(ProfileDelta().add(ranking_obj).add(reverse_ranking_obj))
                 
         # Check if winners changed
         winners2 = vm(prof2)
@@ -3640,18 +3361,12 @@ def find_all_neutral_reversal_violations(prof, vm, verbose=False):
         # Add the ranking and its reverse to create new profile
         if isinstance(prof, Profile):
             # For Profile objects, we need to work with numpy arrays
-            pair_arr = np.array([list(ranking), list(reverse_ranking)])
-            combined_rankings = np.concatenate([prof._rankings, pair_arr], axis=0)
-            combined_rcounts = np.concatenate([prof._rcounts, [1, 1]], axis=0)
-            prof2 = Profile(combined_rankings, rcounts=combined_rcounts)
+            prof2 = prof.apply_delta(ProfileDelta().add(ranking).add(reverse_ranking))
         else:
             # For ProfileWithTies, we work with Ranking objects
             ranking_obj = Ranking({c: i for i, c in enumerate(ranking)})
             reverse_ranking_obj = Ranking({c: len(ranking)-1-i for i, c in enumerate(ranking)})
-            new_rankings = prof.rankings + [ranking_obj, reverse_ranking_obj]
-            prof2 = ProfileWithTies(new_rankings, candidates=prof.candidates)
-            if prof.using_extended_strict_preference:
-                prof2.use_extended_strict_preference()
+            prof2 = prof.apply_delta(ProfileDelta().add(ranking_obj).add(reverse_ranking_obj))
                 
         # Check if winners changed
         winners2 = vm(prof2)
@@ -3737,18 +3452,18 @@ def has_nonlinear_neutral_reversal_violation(prof, vm, verbose=False):
     """
     Return True if there is a violation of the nonlinear neutral reversal axiom for the voting method vm.  Otherwise, return False.  That is, return True if there is a strict weak order and its reverse that can be added to the profile that changes the winning set according to vm.  
     """
+    # the rankings are added to the profile viewed as a profile of strict weak orders
+    if isinstance(prof, Profile):
+        prof_with_ties = prof.to_profile_with_ties()
+    else:
+        prof_with_ties = ProfileWithTies(prof._rankings, rcounts = prof.rcounts, candidates = prof.candidates, cmap = prof.cmap)
+
     for swo in strict_weak_orders(prof.candidates):
 
         ranking = Ranking.from_indiff_list(swo)
         ranking_reverse = ranking.reverse()
 
-        if isinstance(prof, ProfileWithTies):
-            new_rankings = prof.rankings + [ranking, ranking_reverse]
-            new_prof = ProfileWithTies(new_rankings)
-
-        elif isinstance(prof, Profile):
-            new_rankings = [Ranking.from_linear_order(r) for r in prof.rankings] + [ranking, ranking_reverse]
-            new_prof = ProfileWithTies(new_rankings)
+        new_prof = prof_with_ties.apply_delta(ProfileDelta().add(ranking).add(ranking_reverse))
         
         if vm(prof) != vm(new_prof):
             if verbose:
@@ -3771,18 +3486,19 @@ def find_all_nonlinear_neutral_reversal_violations(prof, vm, verbose=False):
     """
 
     violation_swos = []
+
+    # the rankings are added to the profile viewed as a profile of strict weak orders
+    if isinstance(prof, Profile):
+        prof_with_ties = prof.to_profile_with_ties()
+    else:
+        prof_with_ties = ProfileWithTies(prof._rankings, rcounts = prof.rcounts, candidates = prof.candidates, cmap = prof.cmap)
+
     for swo in strict_weak_orders(prof.candidates):
 
         ranking = Ranking.from_indiff_list(swo)
         ranking_reverse = ranking.reverse()
 
-        if isinstance(prof, ProfileWithTies):
-            new_rankings = prof.rankings + [ranking, ranking_reverse]
-            new_prof = ProfileWithTies(new_rankings)
-
-        elif isinstance(prof, Profile):
-            new_rankings = [Ranking.from_linear_order(r) for r in prof.rankings] + [ranking, ranking_reverse]
-            new_prof = ProfileWithTies(new_rankings)
+        new_prof = prof_with_ties.apply_delta(ProfileDelta().add(ranking).add(ranking_reverse))
         
         if vm(prof) != vm(new_prof):
             if verbose:
@@ -9,6 +9,8 @@
 
 import functools
 import inspect
+import collections
+import hashlib
 import numpy as np
 import random
 import json
@@ -33,6 +35,142 @@ import importlib.resources
 import glob
 import os
 
+# Shared registry of parsed properties files, keyed by the path of the file
+_vm_properties_registry = {}
+
+def _default_properties_file():
+    return importlib.resources.files('pref_voting') / 'data' / 'voting_methods_properties.json'
+
+def _load_vm_properties(properties_file, reload=False):
+    """
+    Return the dictionary of voting method properties stored in ``properties_file``.  The file is parsed only once and the result is shared by all voting methods, unless ``reload`` is True.
+    """
+    key = str(properties_file)
+    if reload or key not in _vm_properties_registry:
+        try:
+            with open(properties_file, "r") as file:
+                vm_props = json.load(file)
+        except FileNotFoundError:
+            vm_props = {}
+        except Exception as e:
+            print(f"An error occurred while opening the properties file: {e}")
+            vm_props = {}
+        _vm_properties_registry[key] = vm_props
+    return _vm_properties_registry[key]
+
+def _accepts_algorithm(f):
+    """Return True if the function f accepts 'algorithm' as a keyword parameter."""
+    params = inspect.signature(f).parameters
+    return 'algorithm' in params and params['algorithm'].kind in [inspect.Parameter.KEYWORD_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD]
+
+def _array_bytes(a):
+    """Return the bytes of the array ``a``.  Arrays of Python objects (e.g., Fractions) are represented by the repr of their values rather than by their pointers."""
+    a = np.asarray(a)
+    if a.dtype == object:
+        return repr((a.shape, a.tolist())).encode()
+    return np.ascontiguousarray(a).tobytes()
+
+def _election_fingerprint(edata):
+    """
+    Return a short digest identifying the election ``edata`` for the winner cache, or None if the type of election is not supported.  Profiles are identified by their rankings and counts, profiles with ties by their candidates, rank matrix, counts and whether extended strict preferences are used, support graphs by their candidates and supports, and margin/majority graphs by their candidates and edges. 
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(type(edata).__name__.encode())
+    if isinstance(getattr(edata, '_rankings', None), np.ndarray) and hasattr(edata, '_rcounts'): # Profile
+        h.update(str(edata._rankings.shape).encode())
+        h.update(np.ascontiguousarray(edata._rankings).tobytes())
+        h.update(_array_bytes(edata._rcounts))
+    elif hasattr(edata, '_rank_matrix'): # ProfileWithTies
+        h.update(repr((edata.candidates, edata.using_extended_strict_preference, edata._rank_matrix.shape)).encode())
+        h.update(np.ascontiguousarray(edata._rank_matrix).tobytes())
+        h.update(_array_bytes(edata.rcounts))
+    elif hasattr(edata, 's_matrix') and hasattr(edata, 'mg'): # SupportGraph
+        h.update(repr(edata.candidates).encode())
+        h.update(_array_bytes(edata.s_matrix))
+    elif hasattr(edata, 'margin_matrix') and hasattr(edata, 'mg'): # MarginGraph
+        h.update(repr(edata.candidates).encode())
+        h.update(_array_bytes(edata.margin_matrix))
+    elif hasattr(edata, 'mg'): # MajorityGraph
+        h.update(repr((edata.candidates, sorted(edata.mg.edges))).encode())
+    else: 
+        return None
+    return h.digest()
+
+# The winner caches that are currently active (the last one is used)
+_active_winner_caches = []
+
+class WinnerCache(object): 
+    """
+    A bounded least-recently-used cache of winning sets shared by all voting methods.  The cache is opt-in: it is only used while it is active, that is, inside a ``with`` block.  While it is active, calling a voting method on an election first looks up the winning set using a key made of the voting method, a fingerprint of the election, the set of ``curr_cands`` and the keyword arguments.  This avoids recomputing the same winning sets when, for instance, several axioms are checked for the same profile. 
+
+    Args:
+        maxsize (int): The maximum number of winning sets stored. When the cache is full, the least recently used winning set is discarded.
+
+    :Example: 
+
+    .. exec_code::
+
+        from pref_voting.profiles import Profile
+        from pref_voting.voting_method import WinnerCache
+        from pref_voting.margin_based_methods import split_cycle
+        from pref_voting.axioms import condorcet_winner, smith
+
+        prof = Profile([[0, 1, 2], [1, 2, 0], [2, 0, 1]], [2, 3, 1])
+        with WinnerCache(maxsize=1024) as cache: 
+            condorcet_winner.has_violation(prof, split_cycle)
+            smith.has_violation(prof, split_cycle)
+            print(f"hits: {cache.hits}, misses: {cache.misses}")
+
+    .. warning:: The winning sets of voting methods that make random choices are also cached, so the same winning set is returned for the same election while the cache is active.  Elections are identified by their content, so an election should not be modified while the cache is active.
+    """
+    def __init__(self, maxsize=1024): 
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._winners = collections.OrderedDict()
+
+    def __enter__(self): 
+        _active_winner_caches.append(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb): 
+        _active_winner_caches.remove(self)
+        return False
+
+    def __len__(self): 
+        return len(self._winners)
+
+    def clear(self): 
+        """Remove all the winning sets from the cache and reset the number of hits and misses."""
+        self._winners.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def winners(self, vm, edata, curr_cands, kwargs): 
+        """
+        Return the winning set of ``vm`` for ``edata`` restricted to ``curr_cands`` (``vm`` is called with ``kwargs``), computing it only if it is not in the cache. 
+        """
+        fingerprint = _election_fingerprint(edata)
+        key = (vm, fingerprint, None if curr_cands is None else frozenset(curr_cands), tuple(sorted(kwargs.items())))
+        try: 
+            hash(key)
+        except TypeError: # some keyword arguments cannot be part of the key
+            fingerprint = None
+        if fingerprint is None: 
+            return vm.vm(edata, curr_cands=curr_cands, **kwargs)
+
+        if key in self._winners: 
+            self.hits += 1
+            self._winners.move_to_end(key)
+            ws = self._winners[key]
+        else: 
+            self.misses += 1
+            ws = vm.vm(edata, curr_cands=curr_cands, **kwargs)
+            self._winners[key] = ws
+            if len(self._winners) > self.maxsize: 
+                self._winners.popitem(last=False)
+        return list(ws) if isinstance(ws, list) else ws
+
 class VotingMethod(object): 
     """
     A class to add functionality to voting methods. 
@@ -56,31 +194,39 @@ class VotingMethod(object):
         # Determine the path to the properties file
         if properties_file is None:
 
-            properties_file = importlib.resources.files('pref_voting') / 'data' / 'voting_methods_properties.json'
-
-
-        # Get the properties of the voting method
-        try:
-            with open(properties_file, "r") as file:
-                vm_props = json.load(file)
-        except FileNotFoundError:
-            vm_props = {}
-        except Exception as e:
-            print(f"An error occurred while opening the properties file: {e}")
-            vm_props = {}
+            properties_file = _default_properties_file()
 
-        if name in vm_props:
-            properties = VotingMethodProperties(**vm_props[name])
-        else:
-            properties = VotingMethodProperties()
+        # The properties are looked up in the shared registry the first time they are accessed
+        self._properties = None
+        self._properties_file = properties_file
+        self._properties_name = name
 
-        self.properties = properties
         self.input_types = input_types
         self.skip_registration = skip_registration
         self.algorithm = None
+        self.batch_vm = None
 
         functools.update_wrapper(self, vm)   
 
+    @property
+    def properties(self):
+        """The properties of the voting method, looked up in the properties file on first access."""
+        if self._properties is None:
+            vm_props = _load_vm_properties(self._properties_file)
+            if self._properties_name in vm_props:
+                self._properties = VotingMethodProperties(**vm_props[self._properties_name])
+            else:
+                self._properties = VotingMethodProperties()
+        return self._properties
+
+    @properties.setter
+    def properties(self, properties):
+        self._properties = properties
+
+    @functools.cached_property
+    def _accepts_algorithm(self):
+        return _accepts_algorithm(self.vm)
+
     def __call__(self, edata, curr_cands = None, **kwargs):
         
         if (curr_cands is not None and len(curr_cands) == 0) or len(edata.candidates) == 0: 
@@ -88,10 +234,12 @@ class VotingMethod(object):
         
         # Set the algorithm from self.algorithm if it's not already provided in kwargs
         if 'algorithm' not in kwargs and self.algorithm is not None:
-            params = inspect.signature(self.vm).parameters
-            if 'algorithm' in params and params['algorithm'].kind in [inspect.Parameter.KEYWORD_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD]:
+            if self._accepts_algorithm:
                 kwargs['algorithm'] = self.algorithm
 
+        if len(_active_winner_caches) > 0: 
+            return _active_winner_caches[-1].winners(self, edata, curr_cands, kwargs)
+
         return self.vm(edata, curr_cands=curr_cands, **kwargs)
 
     def set_algorithm(self, algorithm):
@@ -101,12 +249,56 @@ class VotingMethod(object):
         Args:
             algorithm: The algorithm to set for the voting method.
         """
-        params = inspect.signature(self.vm).parameters
-        if 'algorithm' in params and params['algorithm'].kind in [inspect.Parameter.KEYWORD_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD]:
+        if self._accepts_algorithm:
             self.algorithm = algorithm
         else:
             raise ValueError(f"The method {self.name} does not accept 'algorithm' as a parameter.")
     
+    def set_batch_vm(self, batch_vm):
+        """
+        Set a vectorized implementation of the voting method used by :meth:`batch`.  
+
+        Args:
+            batch_vm: A function that accepts an array of margin matrices of shape (num_elections, num_cands, num_cands) and returns a boolean array of shape (num_elections, num_cands) marking the winners in each election.
+        """
+        self.batch_vm = batch_vm
+
+    def batch(self, edatas, curr_cands = None, **kwargs):
+        """
+        Return the winning sets of the voting method for each election in ``edatas``. 
+
+        If the voting method has a vectorized implementation (see :meth:`set_batch_vm`), no keyword arguments are given, and all the elections have the same candidates and a margin matrix, then the margin matrices are stacked into a single array and the winners of all the elections are computed at once.  Otherwise, the voting method is called on each election in turn. 
+
+        Args:
+            edatas (list): A list of elections (e.g., Profile, ProfileWithTies, MarginGraph) on the same candidates.
+            curr_cands (List[int], optional): If set, then find the winners for each election restricted to the candidates in ``curr_cands``
+
+        Returns: 
+            A list of the sorted lists of winners, one for each election.
+        """
+
+        edatas = list(edatas)
+        if len(edatas) == 0: 
+            return []
+
+        candidates = edatas[0].candidates if curr_cands is None else curr_cands
+        margins = None
+        if (self.batch_vm is not None 
+            and len(kwargs) == 0 
+            and len(candidates) > 0
+            and all([edata.candidates == edatas[0].candidates for edata in edatas])): 
+            candidates = sorted(candidates)
+            try:
+                margins = _stacked_margins(edatas, candidates)
+            except AttributeError: # some elections, such as majority graphs, do not have a margin matrix
+                margins = None
+
+        if margins is None: 
+            return [self.__call__(edata, curr_cands = curr_cands, **kwargs) for edata in edatas]
+
+        is_winner = self.batch_vm(margins)
+        return [[c for c, w in zip(candidates, ws) if w] for ws in is_winner]
+
     def choose(self, edata, curr_cands = None): 
         """
         Return a randomly chosen element from the winning set. 
@@ -158,14 +350,10 @@ class VotingMethod(object):
         
         # Determine the path to the properties file
         if filename is None:
-            filename = importlib.resources.files('pref_voting') / 'data' / 'voting_methods_properties.json'
+            filename = _default_properties_file()
         lock = FileLock(f"{filename}.lock")
         with lock:
-            try:
-                with open(filename, 'r') as file:
-                    vm_props = json.load(file)
-            except FileNotFoundError:
-                vm_props = {}
+            vm_props = _load_vm_properties(filename, reload=True)
 
             if self.name in vm_props:
                 self.properties = VotingMethodProperties(**vm_props[self.name])
@@ -197,7 +385,7 @@ class VotingMethod(object):
 
         # Determine the path to the properties file
         if filename is None:
-            filename = importlib.resources.files('pref_voting') / 'data' / 'voting_methods_properties.json'
+            filename = _default_properties_file()
 
 
         lock = FileLock(f"{filename}.lock", timeout=timeout)
@@ -213,6 +401,9 @@ class VotingMethod(object):
 
                 with open(filename, 'w') as file:
                     json.dump(vm_props, file, indent=4, sort_keys=True)
+
+                # The shared registry is now out of date for this file
+                _vm_properties_registry.pop(str(filename), None)
         except Timeout:
             print(f"Could not acquire the lock within {timeout} seconds.")
 
@@ -286,6 +477,15 @@ def vm(name=None,
                             skip_registration=skip_registration)
     return wrapper
 
+def _stacked_margins(edatas, candidates): 
+    """Return the array of shape (len(edatas), len(candidates), len(candidates)) of the margin matrices of the elections restricted to ``candidates``."""
+
+    margins = np.empty((len(edatas), len(candidates), len(candidates)))
+    for eidx, edata in enumerate(edatas): 
+        cindices = [edata.cand_to_cindex(c) for c in candidates]
+        margins[eidx] = np.asarray(edata.margin_matrix)[np.ix_(cindices, cindices)]
+    return margins
+
 def isin(arr, val):
     """compiled function testing if the value val is in the array arr
     """
@@ -523,8 +523,11 @@ class MarginGraph(MajorityGraph):
             cindices = [cidx for cidx, _ in enumerate(curr_cands)]
             cindex_to_cand = lambda cidx: curr_cands[cidx]
             cand_to_cindex = lambda c: cindices[curr_cands.index(c)]
-            strength_function = self.margin if strength_function is None else strength_function
-            strength_matrix = np.array([[strength_function(cindex_to_cand(a_idx), cindex_to_cand(b_idx)) for b_idx in cindices] for a_idx in cindices])
+            if strength_function is None: 
+                idxs = [self.cand_to_cindex(c) for c in curr_cands]
+                strength_matrix = np.array(self.margin_matrix)[np.ix_(idxs, idxs)]
+            else: 
+                strength_matrix = np.array([[strength_function(cindex_to_cand(a_idx), cindex_to_cand(b_idx)) for b_idx in cindices] for a_idx in cindices])
         else:  
             cindices = self.cindices
             cindex_to_cand = self.cindex_to_cand
@@ -0,0 +1,33 @@
+import pytest
+from pref_voting.analysis import condorcet_efficiency_data, resoluteness_data, axiom_violations_data
+from pref_voting.scoring_methods import plurality, borda
+from pref_voting.c1_methods import copeland
+from pref_voting.axioms import condorcet_winner
+
+def test_condorcet_efficiency_data_seed():
+    kwargs = dict(numbers_of_candidates=[3], numbers_of_voters=[5], min_num_samples=200, max_num_samples=1000, max_error=0.2, use_parallel=False, chunk_size=50, seed=0)
+    df1 = condorcet_efficiency_data([plurality, copeland], **kwargs)
+    df2 = condorcet_efficiency_data([plurality, copeland], **kwargs)
+    assert df1.equals(df2)
+    assert list(df1["voting_method"]) == ["Plurality", "Copeland"]
+    assert df1["condorcet_efficiency"][1] == 1.0
+    # the confidence intervals are narrow enough before max_num_samples
+    assert df1["num_samples"][0] < 1000
+
+def test_resoluteness_data_seed():
+    kwargs = dict(numbers_of_candidates=[3], numbers_of_voters=[4], num_trials=300, use_parallel=False, chunk_size=70, seed=1)
+    df1 = resoluteness_data([plurality, borda], **kwargs)
+    df2 = resoluteness_data([plurality, borda], **kwargs)
+    assert df1.equals(df2)
+    assert list(df1["num_trials"]) == [300, 300]
+    assert all([1 <= n <= 3 for n in df1["avg_num_winners"]])
+
+def test_axiom_violations_data():
+    df = axiom_violations_data([condorcet_winner], [copeland, plurality], numbers_of_candidates=[3], numbers_of_voters=[5], num_trials=100, use_parallel=False, seed=2)
+    assert list(df["num_violations"])[0] == 0
+    assert list(df["num_trials"]) == [100, 100]
+
+def test_cells_use_different_seeds():
+    # two cells with the same probability model, number of candidates and number of voters are sampled independently
+    df = resoluteness_data([plurality], numbers_of_candidates=[3], numbers_of_voters=[4], probmods=["IC", "IC"], num_trials=300, use_parallel=False, chunk_size=70, seed=1)
+    assert df["avg_num_winners"][0] != df["avg_num_winners"][1]
@@ -156,3 +156,32 @@ def test_c1_methods(
     assert voting_method(condorcet_cycle_margin) == expected['condorcet_cycle_margin']
     assert voting_method(condorcet_cycle_prof_with_ties) == expected['condorcet_cycle_prof_with_ties']
     assert voting_method(profile_single_voter) == expected['profile_single_voter']
+
+@pytest.mark.parametrize("algorithm", ["dynamic_programming", "branch_and_bound", "brute_force"])
+def test_slater_rankings(algorithm, condorcet_cycle, linear_maj_graph_0):
+    assert slater_rankings(condorcet_cycle, algorithm=algorithm) == ([(0, 1, 2), (1, 2, 0), (2, 0, 1)], 1)
+    assert slater_rankings(linear_maj_graph_0, algorithm=algorithm) == ([(0, 1, 2)], 0)
+    assert slater_rankings(linear_maj_graph_0, curr_cands=[2, 1], algorithm=algorithm) == ([(1, 2)], 0)
+    assert slater(condorcet_cycle, algorithm=algorithm) == [0, 1, 2]
+
+    mg = MarginGraph([0, 1, 2, 3], [(0, 2, 2), (0, 3, 6), (1, 0, 8), (2, 3, 4), (2, 1, 10), (3, 1, 12)])
+    assert slater_rankings(mg, algorithm=algorithm) == slater_rankings(mg, algorithm="brute_force")
+    assert slater(mg, algorithm=algorithm) == slater(mg, algorithm="brute_force")
+
+@pytest.mark.parametrize("algorithm", ["chain_growth", "brute_force"])
+def test_banks_with_explanation(algorithm, condorcet_cycle, linear_maj_graph_0):
+    assert banks_with_explanation(condorcet_cycle, algorithm=algorithm) == ([0, 1, 2], [(0, 1), (1, 2), (2, 0)])
+    assert banks_with_explanation(linear_maj_graph_0, algorithm=algorithm) == ([0], [(0, 1, 2)])
+    assert banks_with_explanation(linear_maj_graph_0, curr_cands=[2, 1], algorithm=algorithm) == ([1], [(1, 2)])
+
+    mg = MarginGraph([0, 1, 2, 3], [(0, 2, 2), (0, 3, 6), (1, 0, 8), (2, 3, 4), (2, 1, 10), (3, 1, 12)])
+    assert banks_with_explanation(mg, algorithm=algorithm) == ([0, 1, 2], [(1, 0), (0, 2, 3), (2, 3, 1)])
+    assert banks(mg, algorithm=algorithm) == [0, 1, 2]
+
+    # 3 is not majority comparable with 2, so (2, 0) is a maximal chain
+    maj_graph = MajorityGraph([0, 1, 2, 3], [(0, 1), (1, 2), (2, 0), (0, 3)])
+    assert banks_with_explanation(maj_graph, algorithm=algorithm) == ([0, 1, 2], [(0, 1), (0, 3), (1, 2), (2, 0)])
+
+def test_banks_invalid_algorithm(condorcet_cycle):
+    with pytest.raises(ValueError):
+        banks(condorcet_cycle, algorithm="unknown")
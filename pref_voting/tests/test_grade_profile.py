@@ -0,0 +1,95 @@
+from pref_voting.grade_profiles import GradeProfile
+from pref_voting.grade_methods import score_voting, approval, star, greatest_median, majority_judgement
+import numpy as np
+import pytest
+
+@pytest.fixture
+def gprof():
+    return GradeProfile([{"x": 1, "y": 3, "z": 1}, {"x": 0, "y": 2, "z": 3}, {"x": 3, "y": 0}], [0, 1, 2, 3], gcounts=[2, 3, 1])
+
+def test_init(gprof):
+    assert gprof.candidates == ["x", "y", "z"]
+    assert gprof.num_voters == 6
+    assert gprof.grades == [0, 1, 2, 3]
+    assert [g.as_dict() for g in gprof._grades] == [{"x": 1, "y": 3, "z": 1}, {"x": 0, "y": 2, "z": 3}, {"x": 3, "y": 0}]
+    assert gprof.has_grade("z") and not GradeProfile([{0: 1}], [0, 1], candidates=[0, 1]).has_grade(1)
+
+def test_aggregates(gprof):
+    assert gprof.sum("x") == 5 and gprof.sum("z") == 11
+    assert gprof.avg("y") == pytest.approx(12 / 6)
+    assert gprof.avg("z") == pytest.approx(11 / 5)
+    assert gprof.max("x") == 3 and gprof.min("x") == 0
+    assert gprof.sum_grade_function().as_dict() == {"x": 5, "y": 12, "z": 11}
+    assert GradeProfile([{0: 1}], [0, 1], candidates=[0, 1]).sum(1) is None
+
+def test_median(gprof):
+    # the grades of y are 0, 2, 2, 2, 3, 3
+    assert gprof.median("y") == 2
+    # the grades of x are 0, 0, 0, 1, 1, 3
+    assert gprof.median("x") == 0
+    assert gprof.median("x", use_lower=False, use_average=True) == pytest.approx(0.5)
+    assert gprof.median("x", use_lower=False, use_average=False) == [0, 1]
+    # the grades of z are 1, 1, 3, 3, 3
+    assert gprof.median("z") == 3
+
+def test_proportions(gprof):
+    assert gprof.proportion("x", 0) == pytest.approx(0.5)
+    assert gprof.proportion("z", None) == pytest.approx(1 / 6)
+    assert gprof.proportion_with_grade("x", 1) == pytest.approx(2 / 6)
+    assert gprof.proportion_with_higher_grade("x", 0) == pytest.approx(3 / 6)
+    assert gprof.proportion_with_lower_grade("y", 3) == pytest.approx(4 / 6)
+    # voters that do not grade a candidate are ignored
+    assert gprof.proportion_with_lower_grade("z", 3) == pytest.approx(2 / 6)
+    assert gprof.proportion_with_higher_grade("z", 1) == pytest.approx(3 / 6)
+
+def test_margin(gprof):
+    assert gprof.margin("y", "x") == 5 - 1
+    # only the voters that grade both candidates are counted
+    assert gprof.margin("x", "z") == -3
+    # a candidate without a grade is ranked below every graded candidate
+    assert gprof.margin("x", "z", use_extended=True) == 1 - 3
+
+def test_grade_order():
+    gprof = GradeProfile([{"a": "good", "b": "poor"}, {"a": "poor", "b": "fair"}], ["poor", "fair", "good"], gcounts=[2, 1], grade_order=["good", "fair", "poor"])
+    assert gprof.margin("a", "b") == 1
+    assert gprof.median("a") == "good"
+    assert gprof.proportion_with_higher_grade("b", "poor") == pytest.approx(1 / 3)
+    assert gprof.to_ranking_profile().rankings[0].rmap == {"a": 1, "b": 2}
+
+def test_from_array(gprof):
+    arr = np.array([[1, 3, 1], [0, 2, 3], [3, 0, np.nan]])
+    gprof2 = GradeProfile.from_array(arr, [0, 1, 2, 3], gcounts=[2, 3, 1], candidates=["x", "y", "z"])
+    assert gprof2.num_voters == 6
+    assert [g.as_dict() for g in gprof2._grades] == [g.as_dict() for g in gprof._grades]
+    for c in gprof.candidates:
+        assert gprof2.sum(c) == gprof.sum(c)
+        assert gprof2.median(c) == gprof.median(c)
+        for d in gprof.candidates:
+            assert gprof2.margin(c, d) == gprof.margin(c, d)
+    with pytest.raises(AssertionError):
+        GradeProfile.from_array([[0, 5]], [0, 1])
+
+def test_fractional_gcounts():
+    gprof = GradeProfile([{0: 1, 1: 0}, {0: 0, 1: 1}], [0, 1], gcounts=[0.5, 1])
+    assert gprof.sum(0) == 0.5 and gprof.sum(1) == 1
+    assert gprof.margin(0, 1) == -0.5
+    gprof2 = GradeProfile.from_array([[1, 0], [0, 1]], [0, 1], gcounts=[0.5, 1])
+    assert gprof2.sum(0) == 0.5 and gprof2.margin(0, 1) == -0.5
+
+def test_to_ranking_profile(gprof):
+    prof = gprof.to_ranking_profile()
+    assert [r.rmap for r in prof.rankings[:3]] == [{"x": 2, "y": 1, "z": 2}] * 2 + [{"x": 3, "y": 2, "z": 1}]
+    assert prof.rankings[5].rmap == {"x": 1, "y": 2}
+
+def test_grade_methods(gprof):
+    assert score_voting(gprof) == ["y"]
+    assert approval(GradeProfile([{0: 1, 1: 1}, {0: 0, 1: 1, 2: 1}], [0, 1])) == [1]
+    assert greatest_median(gprof) == ["z"]
+    assert majority_judgement(gprof) == ["z"]
+
+def test_star():
+    gprof = GradeProfile([{0: 5, 1: 4, 2: 0}, {0: 0, 1: 3, 2: 5}, {0: 1, 1: 5, 2: 4}], [0, 1, 2, 3, 4, 5], gcounts=[2, 1, 2])
+    # 1 and 2 have the largest sums of grades and 1 is graded higher than 2 by 4 of the 5 voters
+    assert gprof.sum(1) == 21 and gprof.sum(2) == 13 and gprof.sum(0) == 12
+    assert star(gprof) == [1]
+    assert star(gprof, curr_cands=[0, 2]) == [2]
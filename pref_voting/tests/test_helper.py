@@ -0,0 +1,43 @@
+from pref_voting.helper import SPO
+import numpy as np
+import pytest
+
+@pytest.fixture
+def spo():
+    P = SPO(4)
+    P.add(0, 1)
+    P.add(2, 3)
+    P.add(1, 2)
+    return P
+
+def test_spo_transitive_closure(spo):
+    assert spo.holds(0, 3)
+    assert spo.holds(1, 3)
+    assert not spo.holds(3, 0)
+    assert not spo.holds(0, 0)
+    assert spo.succs == [[1, 2, 3], [2, 3], [3], []]
+    assert spo.preds == [[], [0], [0, 1], [0, 1, 2]]
+
+def test_spo_to_numpy(spo):
+    np.testing.assert_array_equal(spo.P, np.triu(np.ones((4, 4), dtype=bool), k=1))
+
+def test_spo_copy():
+    P = SPO(3)
+    P.add(0, 1)
+    Q = P.copy()
+    Q.add(1, 2)
+    assert Q.holds(0, 2)
+    assert not P.holds(0, 2)
+    assert P.initial_elements() == [0, 2]
+    assert Q.initial_elements() == [0]
+
+def test_spo_to_list(spo):
+    assert spo.to_list() == [0, 1, 2, 3]
+    assert spo.to_list(cmap={0: "a", 1: "b", 2: "c", 3: "d"}) == ["a", "b", "c", "d"]
+    P = SPO(3)
+    P.add(0, 1)
+    assert P.to_list() is None
+
+def test_spo_to_networkx(spo):
+    G = spo.to_networkx()
+    assert sorted(G.edges) == [(0, 1), (0, 2), (0, 3), (1, 2), (1, 3), (2, 3)]
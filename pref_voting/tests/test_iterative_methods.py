@@ -320,4 +320,49 @@ def test_plurality_veto():
 
     # Test with curr_cands parameter
     prof = Profile([[0, 1, 2], [1, 0, 2], [2, 0, 1]], rcounts=[1, 1, 1])
-    assert plurality_veto(prof, curr_cands={0, 1}) == [0]
\ No newline at end of file
+    assert plurality_veto(prof, curr_cands={0, 1}) == [0]
+
+
+def test_elimination_state():
+    from pref_voting.iterative_methods import _EliminationState
+    from pref_voting.voting_method import _num_rank_first, _num_rank_last
+    from pref_voting.profiles import _borda_score, _find_updated_profile
+    prof = Profile([[0, 1, 2, 3, 4], [4, 3, 2, 1, 0], [2, 4, 0, 1, 3], [1, 0, 4, 3, 2]], rcounts=[3, 2, 2, 1])
+    rankings, rcounts = prof.rankings_counts
+    state = _EliminationState(prof, curr_cands=[0, 1, 2, 4])
+    for cands_to_remove in [[4], [0, 2], [1]]:
+        remaining = state.remaining_candidates()
+        cands_to_ignore = np.array([c for c in prof.candidates if c not in remaining])
+        updated_rankings = _find_updated_profile(rankings, cands_to_ignore, prof.num_cands)
+        assert state.plurality_scores() == {c: _num_rank_first(rankings, rcounts, cands_to_ignore, c) for c in remaining}
+        assert state.last_place_scores() == {c: _num_rank_last(rankings, rcounts, cands_to_ignore, c) for c in remaining}
+        assert state.borda_scores() == {c: _borda_score(updated_rankings, rcounts, len(remaining), c) for c in remaining}
+        assert state.condorcet_winner() == prof.condorcet_winner(remaining)
+        # eliminating candidates from a copy does not change the original state
+        new_state = state.copy()
+        new_state.eliminate(remaining)
+        assert new_state.num_remaining == 0
+        assert state.remaining_candidates() == remaining
+        state.eliminate(cands_to_remove)
+    assert state.num_remaining == 0
+
+
+def test_nanson_baldwin_curr_cands():
+    prof = Profile([[4, 0, 2, 3, 1], [0, 2, 3, 4, 1], [4, 0, 1, 3, 2]], rcounts=[2, 2, 1])
+    curr_cands = [0, 1, 2, 3]
+    restricted_prof = Profile([[0, 2, 3, 1], [0, 2, 3, 1], [0, 1, 3, 2]], rcounts=[2, 2, 1])
+    for vm in [weak_nanson, strict_nanson, baldwin]:
+        assert vm(prof, curr_cands=curr_cands) == vm(restricted_prof)
+    assert weak_nanson_with_explanation(prof, curr_cands=curr_cands) == weak_nanson_with_explanation(restricted_prof)
+    assert baldwin_with_explanation(prof, curr_cands=curr_cands) == baldwin_with_explanation(restricted_prof)
+    assert baldwin_tb(prof, curr_cands=[1]) == [1]
+
+def test_put_search_stats():
+    # every candidate is tied at every stage, so the same sub-elections are reached by many elimination orders
+    prof = Profile([[(i + j) % 5 for j in range(5)] for i in range(5)])
+    assert instant_runoff_put(prof) == [0, 1, 2, 3, 4]
+    stats = put_search_stats()
+    assert stats["method"] == "Instant Runoff PUT"
+    # each nonempty subset of the 5 candidates is solved at most once
+    assert stats["states_visited"] <= 2 ** 5 - 1
+    assert stats["cache_hits"] > 0
@@ -154,6 +154,11 @@ def test_different_algorithms_split_cycle(condorcet_cycle, linear_margin_graph_0
     assert split_cycle(linear_margin_graph_0, algorithm='floyd_warshall') == [0]
     assert split_cycle(linear_margin_graph_0, curr_cands=[1, 2], algorithm='floyd_warshall') == [1]
 
+    assert split_cycle(condorcet_cycle, algorithm='basic_parallel') == [0, 1, 2]
+    assert split_cycle(linear_margin_graph_0, curr_cands=[1, 2], algorithm='basic_parallel') == [1]
+    with pytest.warns(DeprecationWarning):
+        assert split_cycle(condorcet_cycle, algorithm='basic_parallel', num_cpus=2) == [0, 1, 2]
+
     with pytest.raises(ValueError) as exc_info:
         split_cycle(linear_margin_graph_0, algorithm='unknown')
     assert str(exc_info.value) == "Invalid algorithm specified."
@@ -184,10 +189,32 @@ def test_different_algorithms_ranked_pairs(condorcet_cycle, linear_margin_graph_
     assert ranked_pairs(linear_margin_graph_0, algorithm='from_stacks') == [0]
     assert ranked_pairs(linear_margin_graph_0, curr_cands=[1, 2], algorithm='from_stacks') == [1]
 
+    assert ranked_pairs(condorcet_cycle, algorithm='state_search') == [0, 1, 2]
+    assert ranked_pairs(condorcet_cycle, curr_cands=[0, 1], algorithm='state_search') == [0]
+    assert ranked_pairs(linear_margin_graph_0, algorithm='state_search') == [0]
+    assert ranked_pairs(linear_margin_graph_0, curr_cands=[1, 2], algorithm='state_search') == [1]
+
     with pytest.raises(ValueError) as exc_info:
         ranked_pairs(linear_margin_graph_0, algorithm='unknown')
     assert str(exc_info.value) == "Invalid algorithm specified."
 
+def test_ranked_pairs_state_search_with_ties():
+    mg = MarginGraph([0, 1, 2, 3, 4], [(0, 1, 2), (1, 2, 2), (2, 0, 2), (3, 0, 2), (1, 3, 2), (2, 3, 4), (4, 0, 2), (1, 4, 2), (4, 2, 2), (3, 4, 2)])
+    assert ranked_pairs(mg, algorithm='state_search') == ranked_pairs(mg, algorithm='basic')
+    assert ranked_pairs(mg, curr_cands=[0, 1, 3, 4], algorithm='state_search') == ranked_pairs(mg, curr_cands=[0, 1, 3, 4], algorithm='basic')
+
+    # margins of 0 give edges in both directions
+    prof = ProfileWithTies([{0: 1, 1: 1, 2: 2}, {2: 1, 0: 2}, {1: 1, 2: 2, 0: 3}])
+    assert ranked_pairs(prof, algorithm='state_search') == ranked_pairs(prof, algorithm='basic')
+
+def test_ranked_pairs_defeats(condorcet_cycle, linear_margin_graph_0):
+    # each of the 3 edges of the cycle is the one that is not locked in for some tie-breaking
+    defeats = ranked_pairs_defeats(condorcet_cycle)
+    assert sorted([sorted(d.edges) for d in defeats]) == [[(0, 1), (1, 2)], [(0, 1), (2, 0)], [(1, 2), (2, 0)]]
+    defeats = ranked_pairs_defeats(condorcet_cycle, add_reverse_of_removed_edges=True)
+    assert sorted([sorted(d.edges) for d in defeats]) == [[(0, 1), (0, 2), (1, 2)], [(0, 1), (2, 0), (2, 1)], [(1, 0), (1, 2), (2, 0)]]
+    assert [sorted(d.edges) for d in ranked_pairs_defeats(linear_margin_graph_0)] == [[(0, 1), (0, 2), (1, 2)]]
+
 
 def test_different_algorithms_simple_stable_voting(condorcet_cycle, linear_margin_graph_0):
     assert simple_stable_voting(condorcet_cycle, algorithm='basic') == [0, 1, 2]
@@ -219,3 +246,37 @@ def test_different_algorithms_stable_voting(condorcet_cycle, linear_margin_graph
     with pytest.raises(ValueError) as exc_info:
         stable_voting(linear_margin_graph_0, algorithm='unknown')
     assert str(exc_info.value) == "Invalid algorithm specified."
+
+def test_beat_path_and_split_cycle_defeats(cycle, linear_margin_graph_0):
+    mg = MarginGraph([0, 1, 2, 3], [(0, 2, 3), (1, 0, 5), (2, 1, 5), (2, 3, 1), (3, 0, 3), (3, 1, 1)])
+    assert sorted(beat_path_defeat(mg).edges(data='weight')) == [(1, 0, 5), (2, 0, -np.inf), (2, 1, 5), (3, 0, 3), (3, 1, 1), (3, 2, -np.inf)]
+    assert sorted(split_cycle_defeat(mg).edges(data='weight')) == [(1, 0, 5), (2, 1, 5), (3, 0, 3)]
+    assert sorted(split_cycle_defeat(cycle).edges(data='weight')) == [(1, 2, 3), (2, 0, 5)]
+    assert sorted(beat_path_defeat(linear_margin_graph_0, curr_cands=[1, 2]).edges(data='weight')) == [(1, 2, 11)]
+
+    for edata in [mg, cycle, linear_margin_graph_0]:
+        assert maximal_elements(beat_path_defeat(edata)) == beat_path(edata, algorithm='floyd_warshall')
+        assert maximal_elements(split_cycle_defeat(edata)) == split_cycle(edata, algorithm='floyd_warshall')
+        assert split_cycle(edata, algorithm='floyd_warshall') == split_cycle(edata, algorithm='basic')
+
+def test_split_cycle_with_strength_function():
+    prof = ProfileWithTies([{0: 1, 1: 2}, {1: 1, 2: 2, 0: 3}, {2: 1, 0: 2}, {2: 1, 0: 1, 1: 2}], candidates=[0, 1, 2, 3])
+    for curr_cands in [None, [0, 1, 2], [2, 0, 3]]:
+        for strength_function in [None, prof.support]:
+            ws = split_cycle(prof, curr_cands=curr_cands, strength_function=strength_function, algorithm='basic')
+            candidates = prof.candidates if curr_cands is None else curr_cands
+            strength_function = prof.margin if strength_function is None else strength_function
+            strength_matrix = np.array([[strength_function(a, b) for b in candidates] for a in candidates])
+            assert ws == sorted([a for a_idx, a in enumerate(candidates) 
+                                 if not any([strength_matrix[b_idx][a_idx] > strength_matrix[a_idx][b_idx] and not has_strong_path(strength_matrix, a_idx, b_idx, strength_matrix[b_idx][a_idx]) for b_idx in range(len(candidates))])])
+
+def test_stable_voting_stats():
+    mg = MarginGraph([0, 1, 2, 3], [(0, 2, 3), (1, 0, 5), (2, 1, 5), (2, 3, 1), (3, 0, 3), (3, 1, 1)])
+    assert stable_voting(mg, algorithm='basic') == [2, 3]
+    stats = stable_voting_stats()
+    assert stats["states_visited"] > 0 and stats["cache_hits"] > 0
+    assert stats["undefeated_sets_computed"] <= stats["states_visited"]
+
+    # there is no weak Condorcet winner, so Split Cycle is used to find the undefeated candidates
+    assert stable_voting(mg, algorithm='basic', favor_weak_condorcet_winners=True) == [2, 3]
+    assert stable_voting(mg, curr_cands=[0, 1, 2], favor_weak_condorcet_winners=True) == [2]
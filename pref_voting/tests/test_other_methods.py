@@ -100,4 +100,36 @@ def test_simplified_bucklin_with_explanation(condorcet_cycle, linear_profile_0):
 
 def test_kemeny_young_rankings(condorcet_cycle, linear_profile_0):
     assert kemeny_young_rankings(condorcet_cycle) == ([(0, 1, 2), (1, 2, 0), (2, 0, 1)],4)
-    assert kemeny_young_rankings(linear_profile_0) == ([(0, 1, 2)], 3)
\ No newline at end of file
+    assert kemeny_young_rankings(linear_profile_0) == ([(0, 1, 2)], 3)
+
+
+@pytest.mark.parametrize("algorithm", ["dynamic_programming", "branch_and_bound", "Kendall tau"])
+def test_kemeny_young_rankings_algorithms(algorithm, condorcet_cycle, linear_profile_0):
+    assert kemeny_young_rankings(condorcet_cycle, algorithm=algorithm) == ([(0, 1, 2), (1, 2, 0), (2, 0, 1)],4)
+    assert kemeny_young_rankings(linear_profile_0, algorithm=algorithm) == ([(0, 1, 2)], 3)
+    assert kemeny_young_rankings(linear_profile_0, curr_cands=[2, 1], algorithm=algorithm) == ([(1, 2)], 1)
+
+
+def test_kemeny_young_algorithms():
+    from pref_voting.generate_profiles import generate_profile
+    for num_cands in range(2, 7):
+        prof = generate_profile(num_cands, 5)
+        ky_ws = kemeny_young(prof, algorithm="marginal")
+        assert kemeny_young(prof, algorithm="dynamic_programming") == ky_ws
+        assert kemeny_young(prof, algorithm="branch_and_bound") == ky_ws
+        assert kemeny_young(prof.margin_graph(), algorithm="dynamic_programming") == ky_ws
+        assert kemeny_young_rankings(prof, algorithm="dynamic_programming") == kemeny_young_rankings(prof, algorithm="Kendall tau")
+        assert kemeny_young_rankings(prof, algorithm="branch_and_bound") == kemeny_young_rankings(prof, algorithm="Kendall tau")
+
+
+def test_kemeny_young_large_number_of_candidates(monkeypatch):
+    import pref_voting.other_methods as other_methods
+    from pref_voting.generate_profiles import generate_profile
+    prof = generate_profile(6, 7, seed=3)
+    ky_rankings = kemeny_young_rankings(prof)
+    ky_ws = kemeny_young(prof)
+    # with more candidates than the threshold, the dynamic program falls back to the branch and bound search
+    monkeypatch.setattr(other_methods, "_SUBSET_DP_MAX_CANDS", 4)
+    monkeypatch.setattr(other_methods, "_kemeny_young_subset_costs", None)
+    assert kemeny_young_rankings(prof) == ky_rankings
+    assert kemeny_young(prof) == ky_ws
@@ -85,3 +85,37 @@ def test_add(sample_comparisons):
     assert combined_profile.num_voters == 5
     assert combined_profile.support("A", "B") == 3
     assert combined_profile.support("B", "A") == 2
+
+def test_tally_with_larger_menus():
+    # A is chosen from {A, B, C} and B is chosen from {B, C}
+    ballot1 = PairwiseBallot([({"A", "B", "C"}, {"A"}), ({"B", "C"}, {"B"})])
+    # B is weakly preferred to C in both directions, so the voter is indifferent between B and C
+    ballot2 = PairwiseBallot([({"A", "B", "C"}, {"B", "C"})])
+    prof = PairwiseProfile([ballot1, ballot2], rcounts=[2, 3])
+    assert prof.support("A", "B") == 2 and prof.support("A", "C") == 2
+    assert prof.support("B", "C") == 2 and prof.support("C", "B") == 0
+    assert prof.support("B", "A") == 3 and prof.support("C", "A") == 3
+    assert prof.dominators("A") == ["B", "C"]
+    assert prof.dominates("B", curr_cands=["C", "A"]) == ["C", "A"]
+    assert prof._indiff_triples.tolist() == [[1, 2, 3]]
+
+def test_from_comparisons(sample_profile):
+    comparisons = [("A", "B"), ("C", "A"), ("B", "C"), ("B", "A"), ("A", "C"), ("C", "B")]
+    prof = PairwiseProfile.from_comparisons(comparisons, counts=[3, 3, 3, 2, 2, 2])
+    assert prof.candidates == ["A", "B", "C"]
+    assert prof.num_voters == 15
+    assert all(prof.support(c1, c2) == sample_profile.support(c1, c2) for c1 in prof.candidates for c2 in prof.candidates)
+    assert prof.dominators("A") == ["C"]
+
+    prof = PairwiseProfile.from_comparisons(np.array([[0, 1], [1, 2], [2, 1]]), ties=[False, True, False], candidates=[0, 1, 2, 3])
+    assert prof.candidates == [0, 1, 2, 3]
+    assert prof.margin(0, 1) == 1 and prof.margin(2, 1) == 1
+    ballots, counts = prof.comparisons_counts
+    assert [str(b) for b in ballots] == ["{0, 1} -> {0}", "{1, 2} -> {1, 2}", "{1, 2} -> {2}"]
+    assert counts == [1, 1, 1]
+    assert (prof + prof).margin(2, 1) == 2
+
+    with pytest.raises(ValueError):
+        PairwiseProfile.from_comparisons([(0, 1), (1, 4)], candidates=[0, 1, 2])
+    with pytest.raises(ValueError):
+        PairwiseProfile.from_comparisons([(0, 0)])
@@ -315,6 +315,40 @@ def test_eq(condorcet_cycle):
     prof = Profile([[1, 2, 0], [0, 1, 2], [2, 0, 1]], [1, 1, 1])
     assert prof == condorcet_cycle
 
+def test_vectorized_tally():
+    from pref_voting.generate_profiles import generate_profile
+    for num_cands in [1, 2, 3, 5, 8]:
+        prof = generate_profile(num_cands, 50)
+        ranks = np.array([[np.where(_r == c)[0][0] + 1 for c in prof.candidates] for _r in prof._rankings])
+        tally = np.array([[_support(ranks, prof._rcounts, c1, c2) for c2 in prof.candidates] for c1 in prof.candidates])
+        np.testing.assert_array_equal(prof._ranks, ranks)
+        np.testing.assert_array_equal(prof._tally, tally)
+
+    prof = Profile([[0, 1, 2], [2, 1, 0]], rcounts=[1.5, 2.0])
+    assert prof.support(0, 2) == 1.5
+    assert prof.support(2, 0) == 2.0
+
+
+def test_lazy_tally():
+    from pref_voting.scoring_methods import plurality, borda
+    prof = Profile([[0, 1, 2], [1, 2, 0], [2, 0, 1]], [2, 3, 1])
+    assert plurality(prof) == [1]
+    assert borda(prof) == [1]
+    assert prof._cached_ranks is None
+    assert prof._cached_tally is None
+
+    assert prof.margin_matrix == [[0, 0, -2], [0, 0, 4], [2, -4, 0]]
+    assert prof._cached_tally is not None
+    # each call returns a new graph, so changing a graph does not change the profile
+    mg = prof.margin_graph()
+    mg.mg.remove_node(0)
+    assert sorted(prof.margin_graph().edges) == [(1, 2, 4), (2, 0, 2)]
+
+def test_pickle_profile(condorcet_cycle):
+    import pickle
+    prof = pickle.loads(pickle.dumps(condorcet_cycle))
+    assert prof == condorcet_cycle
+    assert prof.margin_matrix == condorcet_cycle.margin_matrix
 
 def test_replace_ranking():
     prof = Profile([
@@ -365,6 +399,25 @@ def test_replace_ranking():
     assert new_prof.num_voters == prof.num_voters
     assert new_prof.candidates == prof.candidates
 
+def test_apply_delta():
+    from pref_voting.profiles import ProfileDelta
+    prof = Profile([[0, 1, 2], [1, 2, 0], [2, 0, 1]], [2, 3, 1])
+    prof.margin_matrix
+
+    delta = ProfileDelta().remove([1, 2, 0], 2).add([2, 1, 0]).replace([0, 1, 2], [1, 0, 2])
+    new_prof = prof.apply_delta(delta)
+    expected = Profile([[0, 1, 2], [1, 2, 0], [2, 0, 1], [2, 1, 0], [1, 0, 2]], [1, 1, 1, 1, 1])
+
+    assert new_prof == expected
+    assert new_prof.num_voters == 5
+    assert new_prof.margin_matrix == expected.margin_matrix
+    assert prof.num_voters == 6
+
+    assert prof.apply_delta(ProfileDelta().remove([1, 2, 0], 3).add([1, 2, 0], 3)) == prof
+
+    with pytest.raises(ValueError):
+        prof.apply_delta(ProfileDelta().remove([2, 1, 0]))
+
 # def test_isin():
 #     assert isin(np.array([1, 2, 3]), 2)
 #     assert not isin(np.array([1, 2, 3]), 4)
@@ -183,6 +183,19 @@ def test_majority_prefers(test_profile_with_ties, test_profile_with_ties2):
     assert not test_profile_with_ties2.majority_prefers(0, 1)
     assert not test_profile_with_ties2.majority_prefers(1, 0)
 
+def test_rank_matrix(test_profile_with_ties):
+    np.testing.assert_array_equal(
+        test_profile_with_ties._rank_matrix, 
+        np.array([[1, 2, np.inf], [3, 1, 2], [1, np.inf, 1]]))
+    
+    for extended in [False, True]:
+        if extended:
+            test_profile_with_ties.use_extended_strict_preference()
+        for c1 in test_profile_with_ties.candidates:
+            for c2 in test_profile_with_ties.candidates:
+                strict_pref = lambda r: r.extended_strict_pref(c1, c2) if extended else r.strict_pref(c1, c2)
+                assert test_profile_with_ties.support(c1, c2) == sum([n for r, n in zip(*test_profile_with_ties.rankings_counts) if strict_pref(r)])
+
 def test_strength_matrix(test_profile_with_ties): 
     strength_matrix, cands_to_cidx = test_profile_with_ties.strength_matrix()
     # check that two np arrays are equal
@@ -574,4 +587,38 @@ def test_replace_rankings():
     new_prof = prof.replace_rankings(r1, Ranking.from_linear_order((2, 1)), 3, use_extended_strict_preference_for_comparison=False)
     assert new_prof.candidates == prof.candidates
     assert new_prof.num_voters == prof.num_voters
-    assert new_prof == correct_new_prof
\ No newline at end of file
+    assert new_prof == correct_new_prof
+
+def test_apply_delta():
+    from pref_voting.profiles import ProfileDelta
+    prof = ProfileWithTies([
+        {0:1, 1:2},
+        {0:2},
+        {0:1, 1:1},
+        {0:1, 1:2, 2:3},
+    ],
+    rcounts=[2, 1, 1, 1])
+    prof.use_extended_strict_preference()
+
+    delta = ProfileDelta().replace({0:1, 1:2}, {2:1}).add({1:1, 2:2}, 2)
+    new_prof = prof.apply_delta(delta)
+    expected = ProfileWithTies([
+        {0:1, 1:2},
+        {0:2},
+        {0:1, 1:1},
+        {0:1, 1:2, 2:3},
+        {2:1},
+        {1:1, 2:2},
+    ],
+    rcounts=[1, 1, 1, 1, 1, 2])
+    expected.use_extended_strict_preference()
+
+    assert new_prof == expected
+    assert new_prof.using_extended_strict_preference
+    assert new_prof.num_voters == 7
+    np.testing.assert_array_equal(new_prof.margin_matrix, expected.margin_matrix)
+    assert prof.num_voters == 5
+
+    with pytest.raises(ValueError):
+        prof.apply_delta(ProfileDelta().remove({0:2}, 2))
+
@@ -786,3 +786,45 @@ def test_meek_warren_can_differ():
     # Warren gives C and D equal tallies (tie broken by index, so C wins)
     # Both end up electing C in our implementation, but for different reasons
     assert 2 in meek_result  # C definitely wins under Meek
+
+
+# ============================================================================
+# Compiled ballot tiers for Meek and Warren
+# ============================================================================
+
+def test_compiled_ballot_tiers_flows():
+    """
+    The Meek and Warren flows computed from the compiled ballot tiers.
+    Ballots: 2 x A > {B, C}, 1 x B > A, 1 x {A, C} (identical ballots are merged).
+    """
+    from pref_voting.proportional_methods import _BallotTiers, _meek_tally_from_profile, _warren_tally_from_profile
+    prof = ProfileWithTies([
+        Ranking({0: 1, 1: 2, 2: 2}),
+        Ranking({1: 1, 0: 2}),
+        Ranking({0: 1, 1: 2, 2: 2}),
+        Ranking({0: 1, 2: 1}),
+    ], candidates=[0, 1, 2])
+
+    ballots = _BallotTiers(prof)
+    assert ballots.num_ballots == 3
+    assert list(ballots.counts) == [2.0, 1.0, 1.0]
+
+    # A keeps half of what it receives; B and C are hopeful
+    tallies, excess = _meek_tally_from_profile(ballots, {0: 0.5, 1: 1.0, 2: 1.0}, {0, 1, 2})
+    assert tallies[0] == pytest.approx(2 * 0.5 + 0.25)
+    assert tallies[1] == pytest.approx(2 * 0.25 + 1.0)
+    assert tallies[2] == pytest.approx(2 * 0.25 + 0.5)
+    assert excess == pytest.approx(0.25)
+
+    # C is excluded, so A receives all of the last ballot and the rest of it exhausts
+    tallies, excess = _meek_tally_from_profile(prof, {0: 0.5, 1: 1.0, 2: 0.0}, {0, 1})
+    assert tallies[0] == pytest.approx(2 * 0.5 + 0.5)
+    assert tallies[1] == pytest.approx(2 * 0.5 + 1.0)
+    assert excess == pytest.approx(0.5)
+
+    # A is elected with price 0.25; B and C are hopeful
+    tallies, excess = _warren_tally_from_profile(ballots, {0: 0.25}, {0}, {1, 2})
+    assert tallies[0] == pytest.approx(2 * 0.25 + 0.25)
+    assert tallies[1] == pytest.approx(2 * 0.375 + 1.0)
+    assert tallies[2] == pytest.approx(2 * 0.375 + 0.5)
+    assert excess == pytest.approx(0.25)
@@ -68,6 +68,17 @@ def test_to_utility_profile_with_defined_function(sample_profile):
         return 10 * np.linalg.norm(v1 - v2)
     up = sample_profile.to_utility_profile(utility_function = util_fnc)
     assert type(up) == UtilityProfile
+    assert up.candidates == [1, 2]
+    for u, v in zip(up.utilities, [1, 2]):
+        for c in [1, 2]:
+            assert u(c) == pytest.approx(util_fnc(voter_pos[v], cand_pos[c]))
+
+def test_to_utility_profile_with_uncertainty(sample_profile):
+    np.random.seed(0)
+    up, virtual_cand_positions = sample_profile.to_utility_profile(uncertainty_function = lambda sprof, c, v: (0.1, 0.0), return_virtual_cand_positions = True)
+    for vidx, (u, v) in enumerate(zip(up.utilities, [1, 2])):
+        for c in [1, 2]:
+            assert u(c) == pytest.approx(-np.linalg.norm(voter_pos[v] - virtual_cand_positions[c][vidx]) ** 2)
 
 # Testing write method
 def test_to_string(sample_profile):
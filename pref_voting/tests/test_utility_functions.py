@@ -1,7 +1,7 @@
 import pytest
 import numpy as np
 from scipy.spatial import distance
-from pref_voting.utility_functions import mixed_rm_utility, rm_utility, linear_utility, quadratic_utility, city_block_utility, shepsle_utility, matthews_utility
+from pref_voting.utility_functions import mixed_rm_utility, rm_utility, linear_utility, quadratic_utility, city_block_utility, shepsle_utility, matthews_utility, utility_matrix
 
 
 def test_mixed_rm_utility():
@@ -46,3 +46,29 @@ def test_matthews_utility():
     c_pos = np.array([1, 1], dtype=np.float32)
     result = matthews_utility(v_pos, c_pos)
     assert isinstance(result, np.floating) or isinstance(result, float)
+
+@pytest.mark.parametrize("utility_function, params", [
+    (mixed_rm_utility, ()), 
+    (mixed_rm_utility, (0.25,)), 
+    (rm_utility, ()), 
+    (linear_utility, ()), 
+    (quadratic_utility, ()), 
+    (city_block_utility, ()), 
+    (shepsle_utility, (2.0,)), 
+    (matthews_utility, ()),
+    (lambda v_pos, c_pos: np.max(np.abs(v_pos - c_pos)), ()),
+])
+def test_utility_matrix(utility_function, params):
+    rng = np.random.default_rng(0)
+    v_positions = rng.normal(size=(5, 3))
+    c_positions = rng.normal(size=(4, 3))
+    utils = utility_matrix(utility_function, v_positions, c_positions, *params)
+    assert utils.shape == (5, 4)
+    expected = [[utility_function(v_pos, c_pos, *params) for c_pos in c_positions] for v_pos in v_positions]
+    np.testing.assert_allclose(utils, expected)
+
+    # each voter has their own positions of the candidates
+    per_voter_c_positions = rng.normal(size=(5, 4, 3))
+    utils = utility_matrix(utility_function, v_positions, per_voter_c_positions, *params)
+    expected = [[utility_function(v_pos, c_pos, *params) for c_pos in c_poss] for v_pos, c_poss in zip(v_positions, per_voter_c_positions)]
+    np.testing.assert_allclose(utils, expected)
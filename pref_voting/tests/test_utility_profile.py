@@ -0,0 +1,81 @@
+from pref_voting.utility_profiles import UtilityProfile
+from pref_voting.utility_methods import sum_utilitarian, relative_utilitarian, maximin, lexicographic_maximin, nash
+from pref_voting.mappings import Utility
+import numpy as np
+import pickle
+import pytest
+
+@pytest.fixture
+def uprof():
+    return UtilityProfile([{"x": 1, "y": 3, "z": 1}, {"x": 0, "y": -1, "z": 4}, {"x": 0.5, "y": -1}], ucounts=[2, 3, 1])
+
+def test_init(uprof):
+    assert uprof.domain == ["x", "y", "z"]
+    assert uprof.num_voters == 6
+    assert len(uprof.utilities) == 6
+    assert uprof.utilities[0].as_dict() == {"x": 1, "y": 3, "z": 1}
+    assert not uprof.utilities[5].has_utility("z")
+
+    uprof2 = UtilityProfile([Utility({0: 1.0}, domain=[0, 1])], domain=range(3))
+    assert uprof2.domain == [0, 1, 2]
+    assert uprof2.has_utility(0) and not uprof2.has_utility(1)
+
+def test_aggregates(uprof):
+    assert uprof.util_sum("x") == pytest.approx(2.5)
+    assert uprof.util_sum("z") == pytest.approx(14)
+    # the average of the utilities of each type weighted by the number of voters
+    assert uprof.util_avg("y") == pytest.approx((6 - 3 - 1) / 3)
+    assert uprof.util_max("y") == 3 and uprof.util_min("y") == -1
+    assert uprof.util_min("z") == 1
+    assert uprof.sum_utility_function().as_dict() == pytest.approx({"x": 2.5, "y": 2, "z": 14})
+
+    uprof_empty_cand = UtilityProfile([{0: 1}], domain=[0, 1])
+    assert uprof_empty_cand.util_sum(1) is None and uprof_empty_cand.util_max(1) is None
+
+def test_normalize(uprof):
+    normalized = uprof.normalize_by_range()
+    assert [u.as_dict() for u in normalized._utilities] == [{"x": 0.0, "y": 1.0, "z": 0.0}, {"x": 0.2, "y": 0.0, "z": 1.0}, {"x": 1.0, "y": 0.0}]
+    assert normalized.ucounts == [2, 3, 1]
+
+    scores = UtilityProfile([{0: 1, 1: 2, 2: 3}, {0: 5, 1: 5}]).normalize_by_standard_score()
+    assert scores._utilities[0].as_dict() == pytest.approx(Utility({0: 1, 1: 2, 2: 3}).normalize_by_standard_score().as_dict())
+
+def test_to_ranking_profile(uprof):
+    rprof = uprof.to_ranking_profile()
+    assert rprof.candidates == ["x", "y", "z"]
+    assert rprof.rcounts == [2, 3, 1]
+    assert [r.rmap for r in rprof.rankings_counts[0]] == [{"y": 1, "x": 2, "z": 2}, {"z": 1, "x": 2, "y": 3}, {"x": 1, "y": 2}]
+
+@pytest.mark.parametrize("utils", [
+    np.array([[1.0, 3.0, 1.0], [0.0, -1.0, 4.0]]),
+    np.array([[0.5, np.nan, 0.2], [0.1, 0.3, 0.3]]),
+])
+def test_from_array(utils):
+    uprof = UtilityProfile.from_array(utils, ucounts=[1, 2], candidates=["c", "a", "b"])
+    expected = UtilityProfile([{c: u for c, u in zip(["c", "a", "b"], us) if not np.isnan(u)} for us in utils], ucounts=[1, 2])
+    assert uprof.domain == expected.domain
+    assert uprof.write() == expected.write()
+    assert [r.rmap for r in uprof.to_ranking_profile().rankings] == [r.rmap for r in expected.to_ranking_profile().rankings]
+    assert pickle.loads(pickle.dumps(uprof)).write() == uprof.write()
+
+def test_utility_methods(uprof):
+    assert sum_utilitarian(uprof) == ["z"]
+    assert relative_utilitarian(uprof) == ["z"]
+    assert maximin(uprof) == ["z"]
+
+    total_uprof = UtilityProfile([{0: 1, 1: 3, 2: 2}, {0: 0, 1: 2, 2: 4}], ucounts=[2, 1])
+    # both 1 and 2 have minimum utility 2, and the second lowest utility of 1 is higher
+    assert maximin(total_uprof) == [1, 2]
+    assert lexicographic_maximin(total_uprof) == [1]
+    # the Nash products relative to the status quo 0 are 2 * 2 * 2 = 8 for 1 and 1 * 1 * 4 = 4 for 2
+    assert nash(total_uprof, sq=0) == [1]
+    # the Nash ranking is only defined when every voter assigns a utility to every candidate
+    with pytest.raises(AssertionError):
+        nash(uprof)
+
+def test_ucounts_must_be_integers():
+    with pytest.raises(AssertionError):
+        UtilityProfile([{0: 1, 1: 2}, {0: 2, 1: 1}], ucounts=[0.5, 1])
+    with pytest.raises(AssertionError):
+        UtilityProfile.from_array(np.array([[1.0, 2.0]]), ucounts=[-1])
+    assert UtilityProfile([{0: 1, 1: 2}], ucounts=[2.0]).util_sum(1) == 4
@@ -0,0 +1,32 @@
+from pref_voting.profiles import Profile
+from pref_voting.variable_candidate_axioms import tideman_clone_sets, has_independence_of_clones_violation, find_all_independence_of_clones_violations
+from pref_voting.scoring_methods import plurality
+from pref_voting.iterative_methods import instant_runoff
+import pytest
+
+@pytest.fixture
+def prof():
+    return Profile([[0, 1, 2, 3], [1, 0, 2, 3], [3, 2, 0, 1]], rcounts=[2, 2, 1])
+
+def test_tideman_clone_sets(prof):
+    assert [tuple(cs) for cs in tideman_clone_sets(prof)] == [(0, 1), (0, 1, 2), (2, 3)]
+
+    # the clone set may be a final segment of the first ranking
+    assert [tuple(cs) for cs in tideman_clone_sets(Profile([[0, 1, 2], [0, 2, 1]]))] == [(1, 2)]
+    assert tideman_clone_sets(Profile([[0, 1, 2], [1, 2, 0], [2, 0, 1]])) == []
+
+    # repeated rankings are counted by the number of voters submitting them
+    assert tideman_clone_sets(prof, epsilon=1) == [[0, 1], [2, 3], [0, 1, 2]]
+    assert tideman_clone_sets(prof, epsilon=2) == [[0, 1], [0, 2], [2, 3], [0, 1, 2], [0, 2, 3]]
+    assert sorted(tideman_clone_sets(prof, epsilon=0.5)) == sorted([list(cs) for cs in tideman_clone_sets(prof)])
+    assert len(tideman_clone_sets(prof, epsilon=5)) == 10
+
+def test_independence_of_clones(prof):
+    assert not has_independence_of_clones_violation(prof, plurality)
+    assert find_all_independence_of_clones_violations(prof, plurality) == []
+    assert find_all_independence_of_clones_violations(prof, plurality, epsilon=2) == [([0, 2], 0), ([0, 2, 3], 0)]
+
+    # removing the clone 2 makes the clone 1 a plurality winner
+    spoiler_prof = Profile([[0, 1, 2], [1, 2, 0], [2, 1, 0]], rcounts=[3, 2, 1])
+    assert has_independence_of_clones_violation(spoiler_prof, plurality)
+    assert not has_independence_of_clones_violation(spoiler_prof, instant_runoff)
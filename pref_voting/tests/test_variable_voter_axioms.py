@@ -0,0 +1,63 @@
+from pref_voting.profiles import Profile
+from pref_voting.profiles_with_ties import ProfileWithTies
+from pref_voting.variable_voter_axioms import divide_electorate, _electorate_splits, has_reinforcement_violation, find_all_reinforcement_violations
+from pref_voting.scoring_methods import plurality, borda
+from pref_voting.margin_based_methods import minimax
+from pref_voting.iterative_methods import instant_runoff
+import numpy as np
+import pytest
+
+def test_electorate_splits():
+    splits = [tuple(C1) for C1 in _electorate_splits([2, 1])]
+    # each unordered division of the electorate is generated once
+    assert sorted(splits) == [(0, 1), (1, 0)]
+
+    splits = [tuple(C1) for C1 in _electorate_splits([2, 2])]
+    assert len(splits) == len(set(splits)) == 4
+    assert all(C1 <= tuple(np.array([2, 2]) - C1) for C1 in splits)
+
+    assert list(_electorate_splits([1])) == []
+
+    sampled = list(_electorate_splits([3, 2, 4], num_samples=20, seed=0))
+    assert len(sampled) == 20
+    assert all(0 < C1.sum() < 9 for C1 in sampled)
+    assert [tuple(C1) for C1 in sampled] == [tuple(C1) for C1 in _electorate_splits([3, 2, 4], num_samples=20, seed=0)]
+
+def test_divide_electorate():
+    prof = Profile([[0, 1, 2], [1, 2, 0], [0, 1, 2], [2, 0, 1]])
+    divisions = list(divide_electorate(prof))
+    # the two voters with ranking [0, 1, 2] are interchangeable
+    assert len(divisions) == 5
+    for prof1, prof2 in divisions:
+        assert prof1.num_voters + prof2.num_voters == prof.num_voters
+        np.testing.assert_array_equal(prof1._tally, Profile(prof1._rankings, rcounts=prof1._rcounts)._tally)
+        np.testing.assert_array_equal(prof2._tally, Profile(prof2._rankings, rcounts=prof2._rcounts)._tally)
+
+    prof = ProfileWithTies([{0: 1, 1: 2}, {1: 1}, {0: 1, 1: 1, 2: 2}], rcounts=[2, 1, 1])
+    prof.use_extended_strict_preference()
+    divisions = list(divide_electorate(prof))
+    assert len(divisions) == 5
+    assert all(prof1.using_extended_strict_preference and prof2.using_extended_strict_preference for prof1, prof2 in divisions)
+
+def test_reinforcement():
+    prof = Profile([[0, 1, 2], [1, 2, 0], [2, 0, 1]], rcounts=[3, 2, 2])
+    assert not has_reinforcement_violation(prof, plurality)
+    assert not has_reinforcement_violation(prof, borda)
+    assert not has_reinforcement_violation(prof, minimax)
+    assert find_all_reinforcement_violations(prof, minimax) == ([], [])
+
+    # Instant Runoff elects 0, but 2 wins in both electorates of exactly one division
+    prof = Profile([[0, 2, 1], [1, 0, 2], [2, 0, 1]], rcounts=[3, 2, 3])
+    assert instant_runoff(prof) == [0]
+    assert has_reinforcement_violation(prof, instant_runoff)
+    undergenerations, overgenerations = find_all_reinforcement_violations(prof, instant_runoff)
+    assert overgenerations == []
+    assert len(undergenerations) == 1
+    cand, prof1, prof2 = undergenerations[0]
+    ranking_counts = lambda p: sorted((tuple(int(c) for c in r), int(n)) for r, n in zip(*p.rankings_counts))
+    assert cand == 2
+    assert ranking_counts(prof1) == [((0, 2, 1), 1), ((2, 0, 1), 1)]
+    assert ranking_counts(prof2) == [((0, 2, 1), 2), ((1, 0, 2), 2), ((2, 0, 1), 2)]
+
+    prof = Profile([[0, 1, 2, 3], [1, 3, 2, 0], [2, 0, 3, 1], [3, 2, 1, 0]], rcounts=[30, 25, 20, 15])
+    assert not has_reinforcement_violation(prof, plurality, num_samples=50, seed=0)
@@ -49,4 +49,124 @@ def test_voting_method_display(voting_method, dummy_profile, capsys):
 def test_voting_method_set_name(voting_method):
     new_name = "Updated VM"
     voting_method.set_name(new_name)
-    assert voting_method.name == new_name
\ No newline at end of file
+    assert voting_method.name == new_name
+
+def test_voting_method_properties_registry(tmp_path):
+    properties_file = tmp_path / "properties.json"
+    properties_file.write_text('{"Test VM": {"condorcet_winner": true}}')
+
+    vm1 = VotingMethod(simple_vm_method, "Test VM", properties_file=properties_file)
+    vm2 = VotingMethod(simple_vm_method, "Other VM", properties_file=properties_file)
+    assert vm1.properties["condorcet_winner"] is True
+    assert vm2.properties["condorcet_winner"] is None
+
+    # the file is parsed once and shared, so later edits are only seen after an explicit reload
+    properties_file.write_text('{"Test VM": {"condorcet_winner": false}}')
+    vm3 = VotingMethod(simple_vm_method, "Test VM", properties_file=properties_file)
+    assert vm3.properties["condorcet_winner"] is True
+    vm3.load_properties(properties_file)
+    assert vm3.properties["condorcet_winner"] is False
+
+def test_voting_method_set_algorithm(dummy_profile):
+    def vm_with_algorithm(profile, curr_cands=None, algorithm="first"):
+        return [algorithm]
+
+    vm_alg = VotingMethod(vm_with_algorithm, "Algorithm VM")
+    assert vm_alg(dummy_profile) == ["first"]
+    vm_alg.set_algorithm("second")
+    assert vm_alg(dummy_profile) == ["second"]
+    assert vm_alg(dummy_profile, algorithm="third") == ["third"]
+
+    with pytest.raises(ValueError):
+        VotingMethod(simple_vm_method, "Simple VM").set_algorithm("second")
+
+def test_voting_method_batch(dummy_profile):
+    from pref_voting.generate_profiles import generate_profile
+    from pref_voting.c1_methods import condorcet, copeland
+    from pref_voting.margin_based_methods import minimax, beat_path, split_cycle
+
+    profs = generate_profile(4, 7, num_profiles=20, seed=0)
+    for vm_ in [condorcet, copeland, minimax, beat_path, split_cycle]:
+        assert vm_.batch_vm is not None
+        assert vm_.batch(profs) == [vm_(p) for p in profs]
+        assert vm_.batch(profs, curr_cands=[3, 1, 0]) == [vm_(p, curr_cands=[3, 1, 0]) for p in profs]
+
+    # majority graphs have no margin matrix, so batch falls back to calling the method on each one
+    mgs = [p.majority_graph() for p in profs]
+    for vm_ in [condorcet, copeland]:
+        assert vm_.batch(mgs) == [vm_(mg) for mg in mgs]
+
+    simple_vm = VotingMethod(simple_vm_method, "Simple VM")
+    assert simple_vm.batch([dummy_profile, dummy_profile]) == [[0, 1, 2], [0, 1, 2]]
+    assert simple_vm.batch([dummy_profile], curr_cands=[2, 0]) == [[0, 2]]
+
+def test_winner_cache(dummy_profile):
+    from pref_voting.voting_method import WinnerCache
+    from pref_voting.profiles_with_ties import ProfileWithTies
+
+    calls = []
+    def counting_vm_method(profile, curr_cands=None, tie_breaker=None):
+        calls.append(curr_cands)
+        return simple_vm_method(profile, curr_cands=curr_cands)
+    counting_vm = VotingMethod(counting_vm_method, "Counting VM")
+
+    # the cache is only used inside the with block
+    counting_vm(dummy_profile)
+    counting_vm(dummy_profile)
+    assert len(calls) == 2
+
+    with WinnerCache(maxsize=3) as cache:
+        assert counting_vm(dummy_profile) == [0, 1, 2]
+        ws = counting_vm(Profile([[0, 1, 2]]))
+        assert ws == [0, 1, 2]
+        ws.append(3) # the cached winning set is not changed
+        assert counting_vm(dummy_profile, curr_cands=[2, 0]) == [0, 2]
+        assert counting_vm(dummy_profile, curr_cands=[0, 2]) == [0, 2]
+        assert counting_vm(dummy_profile) == [0, 1, 2]
+        assert len(calls) == 4
+        assert (cache.hits, cache.misses) == (3, 2)
+
+        # different profiles, keyword arguments and voting methods are cached separately
+        counting_vm(Profile([[1, 0, 2]]))
+        counting_vm(dummy_profile, tie_breaker=[0, 1, 2]) # unhashable arguments are not cached
+        counting_vm(dummy_profile, tie_breaker=[0, 1, 2])
+        assert len(calls) == 7
+        assert VotingMethod(counting_vm_method, "Counting VM")(dummy_profile) == [0, 1, 2]
+        assert len(calls) == 8
+        assert len(cache) == 3
+
+        # the least recently used winning set was discarded
+        counting_vm(dummy_profile, curr_cands=[0, 2])
+        assert len(calls) == 9
+
+        prof = ProfileWithTies([{0: 1, 1: 2}, {2: 1}])
+        counting_vm(prof)
+        counting_vm(prof)
+        assert len(calls) == 10
+        prof.use_extended_strict_preference()
+        counting_vm(prof)
+        assert len(calls) == 11
+
+    counting_vm(dummy_profile)
+    assert len(calls) == 12
+
+def test_winner_cache_fingerprints():
+    from fractions import Fraction
+    from pref_voting.voting_method import WinnerCache
+    from pref_voting.weighted_majority_graphs import SupportGraph
+    from pref_voting.margin_based_methods import split_cycle, beat_path
+
+    # the two support graphs have the same margins but different supports
+    sg1 = SupportGraph([0, 1, 2], [(0, 1, (10, 9)), (1, 2, (10, 9)), (2, 0, (3, 2))])
+    sg2 = SupportGraph([0, 1, 2], [(0, 1, (10, 9)), (1, 2, (3, 2)), (2, 0, (10, 9))])
+    for vm in [split_cycle, beat_path]:
+        assert vm(sg1) == [0] and vm(sg2) == [2]
+        with WinnerCache():
+            assert vm(sg1) == [0] and vm(sg2) == [2]
+
+    # profiles with counts that are Python objects are identified by the values of the counts
+    with WinnerCache() as cache:
+        split_cycle(Profile([[0, 1], [1, 0]], [Fraction(1, 2), Fraction(1, 3)]))
+        split_cycle(Profile([[0, 1], [1, 0]], [Fraction(1, 2), Fraction(1, 3)]))
+        assert split_cycle(Profile([[0, 1], [1, 0]], [Fraction(1, 2), Fraction(2, 3)])) == [1]
+        assert (cache.hits, cache.misses) == (1, 2)